@@ -0,0 +1,28 @@
+"""
+Async Page Objects
+playwright.async_api variants of LoginPage, JDPage, ClientPage and CompanyPage (and the helpers they use),
+generated from the sync page objects by utils/async_codegen.py. Edit the sync modules and regenerate:
+
+    python -m utils.async_codegen
+
+One event loop can drive many browser contexts concurrently:
+
+    import asyncio
+    from playwright.async_api import async_playwright
+    from async_pages.utils.login_helper import do_login
+    from async_pages.pages.jd_page import JDPage
+
+    async def user_flow(browser, email, password):
+        context = await browser.new_context()
+        page = await context.new_page()
+        await do_login(page, email, password)
+        jd_page = JDPage(page)
+        await jd_page.navigate_to_jd_page("174")
+        await context.close()
+
+    async def main(users):
+        async with async_playwright() as p:
+            browser = await p.chromium.launch()
+            await asyncio.gather(*(user_flow(browser, email, password) for email, password in users))
+            await browser.close()
+"""
@@ -0,0 +1,37 @@
+# Generated by utils/async_codegen.py from conftest.py - do not edit, regenerate instead
+"""
+Shared wait utilities from conftest.py
+"""
+
+import asyncio
+from playwright.async_api import Page
+
+
+async def wait_for_action_completion(page: Page, action_type: str = "general"):
+    """
+    Global utility function to wait for various actions to complete.
+    
+    Args:
+        page: Playwright page object
+        action_type: Type of action performed (signup, login, verify, etc.)
+    """
+    # Always wait for network to be idle first
+    await page.wait_for_load_state("networkidle", timeout=15000)
+    
+    # Add specific waits based on action type
+    if action_type == "signup":
+        await page.wait_for_timeout(3000)  # 3 seconds for signup success/error messages
+    elif action_type == "login":
+        await page.wait_for_timeout(2000)  # 2 seconds for login processing ONLY
+    elif action_type == "verify" or action_type == "otp":
+        await page.wait_for_timeout(4000)  # 4 seconds for verification processing
+    elif action_type == "save" or action_type == "update":
+        await page.wait_for_timeout(2500)  # 2.5 seconds for save operations
+        # Additional wait for success/error messages
+        await page.wait_for_timeout(1500)  # Extra 1.5 seconds for messages
+    elif action_type == "navigation":
+        await page.wait_for_timeout(1500)  # 1.5 seconds for navigation
+    elif action_type == "modal":
+        await page.wait_for_timeout(3000)  # 3 seconds specifically for modal appearance
+    else:
+        await page.wait_for_timeout(2000)
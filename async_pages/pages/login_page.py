@@ -0,0 +1,112 @@
+# Generated by utils/async_codegen.py from pages/login_page.py - do not edit, regenerate instead
+import asyncio
+from playwright.async_api import Page, expect
+from locators.loc_login import LoginLocators
+from async_pages.utils.enhanced_assertions import enhanced_assert_visible, enhanced_assert_not_visible
+import async_pages.utils.login_helper as login_helper
+from async_pages.utils.web_perf_collector import record_navigation
+
+class LoginPage:
+    def __init__(self, page: Page):
+        self.page = page
+        self.locators = LoginLocators(page)
+
+    async def navigate_to_landing_page(self, url: str):
+        await self.page.goto(url)
+        await record_navigation(self.page, "login")
+
+    async def click_get_started(self):
+        await self.locators.get_started_button.click()
+
+    async def fill_email(self, email: str):
+        await self.locators.email_input.fill(email)
+
+    async def fill_password(self, password: str):
+        await self.locators.password_input.fill(password)
+
+    async def click_sign_in(self):
+        await self.locators.sign_in_button.click()
+
+    async def expect_verification_required_for_login(self):
+        await enhanced_assert_visible(self.page, self.locators.verification_required_for_login, "Verification required for login should be visible")
+
+    async def expect_system_shows_email_verification_page(self):
+        await enhanced_assert_visible(self.page, self.locators.system_shows_verification_page,"System shows verification page should be visible")
+
+    async def expect_verification_page_heading(self):
+        await enhanced_assert_visible(self.page, self.locators.verification_page_heading, "Verification page heading should be visible")
+
+    async def expect_mailbox_image(self):
+        await enhanced_assert_visible(self.page, self.locators.mailbox_image, "Mailbox image should be visible")
+
+    async def expect_verification_instructions(self):
+        await enhanced_assert_visible(self.page, self.locators.verification_instructions, "Verification instructions should be visible")
+
+    async def expect_otp_input_box(self):
+        await enhanced_assert_visible(self.page, self.locators.otp_input_box, "OTP input box should be visible")
+    
+    async def expect_input_box_title(self):
+        await enhanced_assert_visible(self.page, self.locators.input_box_title, "Input box title should be visible")
+
+    async def expect_resend_otp_countdown(self):
+        await enhanced_assert_visible(self.page, self.locators.resend_otp_countdown, "Resend OTP countdown should be visible")
+
+    async def expect_verify_button(self):
+        await enhanced_assert_visible(self.page, self.locators.verify_button, "Verify button should be visible")
+
+    async def expect_resend_otp_button(self):
+        await enhanced_assert_visible(self.page, self.locators.resend_otp_button, "Resend OTP button should be visible")
+
+    async def click_resend_otp(self):
+        await self.locators.resend_otp_button.click()
+
+    async def expect_resend_otp_success_message(self):
+        await login_helper.assert_resend_otp_success_message(self.page, self.locators.resend_otp_success_message, "Resend OTP success message should be visible")
+
+    async def expect_email_required_error(self):
+        await login_helper.assert_email_required_error(self.page, self.locators.error_email_required, "Email required error should be visible")
+
+    async def expect_password_required_error(self):
+        await login_helper.assert_password_required_error(self.page, self.locators.error_password_required, "Password required error should be visible")
+
+    async def expect_public_domain_warning(self):
+        await login_helper.assert_public_domain_warning(self.page, self.locators.public_domain_warning, "Public domain warning should be visible")
+
+    async def expect_invalid_email_error(self):
+        await login_helper.assert_invalid_email_error(self.page, self.locators.error_invalid_email, "Invalid email error should be visible")
+
+    async def expect_invalid_credentials_error(self):
+        await login_helper.assert_invalid_credentials_error(self.page, self.locators.error_invalid_credentials, "Invalid credentials error should be visible")
+
+    async def expect_show_password_button(self):
+        await login_helper.assert_show_password_button(self.page, self.locators.show_password_button, "Show password button should be visible")
+
+    async def expect_hide_password_button(self):
+        await login_helper.assert_hide_password_button(self.page, self.locators.hide_password_button, "Hide password button should be visible")
+
+    async def expect_forgot_password_link(self):
+        await login_helper.assert_forgot_password_link(self.page, self.locators.forgot_password_link, "Forgot password link should be visible")
+
+    async def expect_sign_in_heading(self):
+        await login_helper.assert_sign_in_heading(self.page, self.locators.sign_in_heading, "Sign in heading should be visible")
+
+    async def expect_black_pigeon_link(self):
+        await login_helper.assert_black_pigeon_link(self.page, self.locators.black_pigeon_link, "Black pigeon link should be visible")
+
+    async def expect_sign_in_button_visible(self):
+        await login_helper.assert_sign_in_button_visible(self.page, self.locators.sign_in_button_visible, "Sign in button should be visible")
+
+    async def expect_email_label(self):
+        await login_helper.assert_email_label(self.page, self.locators.email_label, "Email label should be visible")
+
+    async def expect_password_label(self):
+        await login_helper.assert_password_label(self.page, self.locators.password_label, "Password label should be visible")
+
+    async def expect_unregistered_email_error(self):
+        await login_helper.assert_unregistered_email_error(self.page, self.locators.unregistered_email_error, "Unregistered email error should be visible")
+
+    async def expect_dont_have_account_text(self):
+        await login_helper.assert_dont_have_account_text(self.page, self.locators.dont_have_account_text, "Don't have account text should be visible")
+
+    async def expect_nonverified_email_error(self):
+        await login_helper.assert_nonverified_email_error(self.page, self.locators.nonverified_email_error, "Non-verified email error should be visible")
\ No newline at end of file
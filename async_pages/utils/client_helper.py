@@ -0,0 +1,288 @@
+# Generated by utils/async_codegen.py from utils/client_helper.py - do not edit, regenerate instead
+"""
+Client Helper Functions
+Contains helper functions and decorators for client module tests
+"""
+import asyncio
+import functools
+from playwright.async_api import Page
+from async_pages.pages.client_page import ClientPage
+from async_pages.utils.modal_tracker import wait_for_modal_closed, open_modals
+from utils.tenant_pool import current_tenant
+
+
+def _client_login_defaults(email=None, password=None, agency_id=None, area="client"):
+    """Fill missing login values from this worker's tenant (admin account, agency of `area`)."""
+    tenant = current_tenant()
+    account = tenant.account("admin")
+    return (email or account["email"], password or account["password"],
+            agency_id or tenant.agency(area)["agency_id"])
+
+
+def with_client_login(email=None, password=None, agency_id=None, navigate_to_client_page=True, area="client"):
+    """
+    Decorator that automatically handles login and navigation to client page for test functions.
+    
+    Args:
+        email (str): Email for login (default: the tenant's admin account)
+        password (str): Password for login (default: the tenant's admin password)
+        agency_id (str): Agency ID to navigate to (default: the tenant's agency of `area`)
+        navigate_to_client_page (bool): Whether to navigate to client page after login (default: True)
+        area (str): Tenant agency area used without agency_id (default: "client", kept free of clients)
+    
+    Usage:
+        @with_client_login()
+        def test_TC_01(page: Page):
+            # Test code here - page is automatically logged in and on client page
+            # Access ClientPage through page._client_page if needed
+            pass
+        
+        # In the tenant's jd agency (the one that holds clients) instead of the empty client agency
+        @with_client_login(area="jd")
+        def test_TC_02(page: Page):
+            # Test code here
+            pass
+        
+        # Without auto-navigation to client page
+        @with_client_login(navigate_to_client_page=False)
+        def test_TC_03(page: Page):
+            # Test code here - logged in but not on client page yet
+            pass
+    """
+    def decorator(test_func):
+        @functools.wraps(test_func)
+        async def wrapper(page: Page, *args, **kwargs):
+            # Initialize ClientPage
+            client_page = ClientPage(page)
+            
+            # Perform login and navigation
+            await client_page.login_and_navigate_to_agency_dashboard(
+                *_client_login_defaults(email, password, agency_id, area))
+            
+            # Navigate to client page if requested
+            if navigate_to_client_page:
+                await client_page.navigate_to_client_page()
+            
+            # Store client_page instance in page object for access in test
+            page._client_page = client_page
+            
+            # Call the test function with page (which now has _client_page attached)
+            return await test_func(page, *args, **kwargs)
+        
+        return wrapper
+    return decorator
+
+
+async def do_client_login(page: Page, email=None, password=None, agency_id=None):
+    """
+    Helper function to perform client login and navigation.
+    Returns ClientPage instance.
+    
+    Args:
+        page (Page): Playwright Page object
+        email (str): Email for login
+        password (str): Password for login
+        agency_id (str): Agency ID to navigate to
+    
+    Returns:
+        ClientPage: Initialized and logged-in ClientPage instance
+    
+    Usage:
+        def test_example(page: Page):
+            client_page = do_client_login(page)
+            client_page.navigate_to_client_page()
+            # Test code here
+    """
+    client_page = ClientPage(page)
+    await client_page.login_and_navigate_to_agency_dashboard(*_client_login_defaults(email, password, agency_id))
+    return client_page
+
+
+async def do_client_login_and_navigate(page: Page, email=None, password=None, agency_id=None):
+    """
+    Helper function to perform client login, navigate to agency dashboard, and then to client page.
+    Returns ClientPage instance.
+    
+    Args:
+        page (Page): Playwright Page object
+        email (str): Email for login
+        password (str): Password for login
+        agency_id (str): Agency ID to navigate to
+    
+    Returns:
+        ClientPage: Initialized ClientPage instance on client page
+    
+    Usage:
+        def test_example(page: Page):
+            client_page = do_client_login_and_navigate(page)
+            # Already on client page - test code here
+            client_page.expect_client_page_heading()
+    """
+    client_page = await do_client_login(page, email, password, agency_id)
+    await client_page.navigate_to_client_page()
+    return client_page
+
+
+async def verify_bulk_actions(page: Page, client_page):
+    """
+    Verify bulk action functionality after clicking bulk select checkbox.
+    Tests Delete and Add Notes buttons, their modals, and navigation display.
+    
+    Args:
+        page: Playwright Page object
+        client_page: ClientPage instance
+    
+    Usage:
+        def test_TC_22(page: Page):
+            client_page: ClientPage = page._client_page
+            client_page.click_bulk_select_checkbox()
+            time.sleep(1)
+            verify_bulk_actions(page, client_page)
+    """
+    import re
+    import time
+    from async_pages.utils.enhanced_assertions import enhanced_assert_visible
+    
+    # Dynamically detect the count from the Delete button text
+    # The button format is "Delete (X)" where X is the count
+    delete_button = page.get_by_role("button", name=re.compile(r"Delete \(\d+\)"))
+    await delete_button.wait_for(state="visible", timeout=5000)
+    button_text = await delete_button.inner_text()
+    # Extract count from "Delete (3)" format
+    count = int(button_text.split("(")[1].split(")")[0])
+    print(f"ℹ️ Detected {count} clients selected for bulk actions")
+    
+    # Assert Delete and Add Notes buttons with correct count are visible
+    await enhanced_assert_visible(page, client_page.locators.bulk_delete_button(count), f"Bulk Delete button ({count}) should be visible", "test_TC_22_bulk_delete_visible")
+    await enhanced_assert_visible(page, client_page.locators.bulk_add_notes_button(count), f"Bulk Add Notes button ({count}) should be visible", "test_TC_22_bulk_add_notes_visible")
+    
+    # Click Delete and assert modal opens
+    await client_page.click_bulk_delete_button(count)
+    await enhanced_assert_visible(page, client_page.locators.bulk_delete_modal_text, "Bulk Delete modal text should be visible", "test_TC_22_bulk_delete_modal_text")
+    await enhanced_assert_visible(page, client_page.locators.bulk_delete_modal_cancel, "Bulk Delete Cancel button should be visible", "test_TC_22_bulk_delete_cancel")
+    await enhanced_assert_visible(page, client_page.locators.bulk_delete_modal_confirm, "Bulk Delete Confirm button should be visible", "test_TC_22_bulk_delete_confirm")
+    await client_page.click_bulk_delete_modal_cancel()
+    await asyncio.sleep(1)
+    
+    # Click Add Notes and assert modal opens
+    await client_page.click_bulk_add_notes_button(count)
+    await enhanced_assert_visible(page, client_page.locators.bulk_add_notes_modal_heading(count), f"Bulk Add Notes modal heading ({count}) should be visible", "test_TC_22_bulk_add_notes_modal_heading")
+    await enhanced_assert_visible(page, client_page.locators.bulk_add_notes_modal_cancel, "Bulk Add Notes Cancel button should be visible", "test_TC_22_bulk_add_notes_cancel")
+    await enhanced_assert_visible(page, client_page.locators.bulk_add_notes_modal_save_next, "Bulk Add Notes Save & Next button should be visible", "test_TC_22_bulk_add_notes_save_next")
+    
+    # Verify note navigation display is visible (showing "1 of 10" format)
+    await enhanced_assert_visible(page, client_page.locators.note_nav(1, count), f"Note navigation display (1 of {count}) should be visible", "test_TC_22_note_nav_display")
+    await client_page.click_bulk_add_notes_modal_cancel()
+    await asyncio.sleep(1)
+
+
+async def verify_pagination_navigation(page: Page, client_page, total_pages: int):
+    """
+    Verify pagination navigation based on total page count.
+    
+    Args:
+        page (Page): Playwright page object
+        client_page: ClientPage instance
+        total_pages (int): Total number of pages
+    """
+    import time
+    
+    # If only one page exists, verify buttons are disabled
+    if total_pages == 1:
+        print(f"ℹ️ Only 1 page exists - verifying buttons are disabled")
+        await client_page.expect_previous_page_button_disabled()
+        await client_page.expect_next_page_button_disabled()
+    else:
+        # Multiple pages exist - test navigation
+        print(f"ℹ️ Multiple pages exist ({total_pages}) - testing navigation")
+        
+        # Verify previous button is disabled on first page
+        await client_page.expect_previous_page_button_disabled()
+        
+        # Click next page button to go to next page
+        await client_page.click_next_page()
+        await asyncio.sleep(2)
+        
+        # Get current page number after navigation
+        current_page = await client_page.get_current_page_number()
+        
+        # Verify now on next page
+        await client_page.expect_page_number(current_page)
+        await asyncio.sleep(2)
+        
+        # If on last page, verify forward button is disabled
+        if current_page == total_pages:
+            await client_page.expect_next_page_button_disabled()
+        
+        # Click previous page button to go back
+        await client_page.click_previous_page()
+        await asyncio.sleep(2)
+        
+        # Verify back on previous page
+        await client_page.expect_page_number(current_page - 1)
+
+
+async def select_random_clients_from_first_four(page: Page, count: int = 2):
+    """
+    Randomly select specified number of clients from the first 4 in the list.
+    
+    Args:
+        page (Page): Playwright page object
+        count (int): Number of clients to select (default: 2)
+    
+    Returns:
+        list: List of selected indices
+    """
+    import random
+    import time
+    
+    all_labels = await page.locator("label[for^='select-']").all()
+    
+    if len(all_labels) >= 4:
+        selected_indices = random.sample(range(4), count)
+        selected_indices.sort()
+        
+        for idx in selected_indices:
+            await all_labels[idx].click()
+            await asyncio.sleep(0.5)
+        
+        await asyncio.sleep(1)
+        print(f"✅ Selected {count} random clients at indices: {selected_indices}")
+        return selected_indices
+    else:
+        print(f"⚠️ Not enough clients to select {count} from first 4")
+        return []
+
+
+async def wait_for_modal_backdrop_hidden(page: Page, timeout: int = 5000):
+    """Wait for every open modal (and with it its backdrop) to close."""
+    if not await wait_for_modal_closed(page, timeout=timeout):
+        print(f"⚠️ Modal still open after {timeout}ms: {[modal['name'] for modal in await open_modals(page)]}")
+
+
+async def wait_for_bulk_delete_success(page: Page, timeout: int = 10000):
+    """Wait for bulk delete success toast message to appear."""
+    success_message = page.get_by_text("Clients deleted successfully")
+    await success_message.wait_for(state="visible", timeout=timeout)
+    return success_message
+
+
+async def select_remaining_clients_from_first_four(page: Page, already_selected_indices: list):
+    """
+    Select remaining clients from first 4 that weren't already selected.
+    
+    Args:
+        page (Page): Playwright page object
+        already_selected_indices (list): List of indices already selected
+    """
+    import time
+    
+    all_labels = await page.locator("label[for^='select-']").all()
+    remaining_indices = [i for i in range(4) if i not in already_selected_indices]
+    
+    for idx in remaining_indices:
+        await all_labels[idx].click()
+        await asyncio.sleep(0.5)
+    
+    await asyncio.sleep(1)
+    print(f"✅ Selected remaining clients at indices: {remaining_indices}")
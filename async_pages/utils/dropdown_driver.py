@@ -0,0 +1,182 @@
+# Generated by utils/async_codegen.py from utils/dropdown_driver.py - do not edit, regenerate instead
+"""
+Dropdown Driver
+One component driver for the app's custom searchable selects (and role=listbox/option dropdowns):
+open the trigger, wait for the option to be attached instead of sleeping, pick it via typeahead or
+role/text, verify the committed value, and cache each dropdown's option list per session for validation
+"""
+
+import asyncio
+import time
+from typing import Dict, List, Optional, Union
+from playwright.async_api import Page, Locator, expect
+
+OPTION_TIMEOUT = 10000      # Max wait for the option list to render after opening
+COMMIT_TIMEOUT = 3000       # Max wait for the trigger to show the selected value
+TYPEAHEAD_MIN_OPTIONS = 15  # Use the search box when a dropdown has at least this many options
+
+# Container of the app's custom select (trigger + search box + option list)
+CONTAINER_XPATH = "xpath=ancestor-or-self::*[contains(concat(' ', normalize-space(@class), ' '), ' searchable-select ')][1]"
+
+# Option list of the custom select (rendered inside the container while open)
+OPTIONS_LIST_SELECTOR = ".select-options"
+
+# Reads the option texts of an opened custom select: leaf elements of its option list
+READ_OPTIONS_SCRIPT = """
+(container) => {
+    const texts = [];
+    const list = container.querySelector('.select-options') || container;
+    list.querySelectorAll('*').forEach((el) => {
+        if (el.closest('.select-trigger') || el.children.length || el.tagName === 'INPUT') return;
+        const text = (el.textContent || '').trim();
+        if (text && el.offsetParent !== null && !texts.includes(text)) texts.push(text);
+    });
+    return texts;
+}
+"""
+
+# Option lists cached per session: {dropdown name: [option texts]}
+_option_cache: Dict[str, List[str]] = {}
+
+
+class DropdownSelectionError(Exception):
+    """Raised when a requested option is not offered by the dropdown"""
+
+
+class DropdownDriver:
+    """
+    Drives custom dropdowns on a page or inside a modal
+    """
+
+    def __init__(self, page: Page, scope: Union[Page, Locator] = None):
+        """
+        Initialize driver
+
+        Args:
+            page: Playwright page object
+            scope: Page or Locator (e.g. the open modal) that options are searched in (default: page)
+        """
+        self.page = page
+        self.scope = scope if scope is not None else page
+
+    async def _container(self, trigger: Locator) -> Optional[Locator]:
+        """The custom select container around a trigger, or None for other dropdown markup"""
+        container = trigger.locator(CONTAINER_XPATH)
+        return container if await container.count() else None
+
+    def _option(self, option_text: str, container: Optional[Locator]) -> Locator:
+        """Option locator: in the select's option list when there is one, else role=option or exact text in scope"""
+        by_role = self.scope.get_by_role("option", name=option_text, exact=True)
+        # The open option list, wherever it is rendered (only one is visible at a time)
+        in_open_list = self.scope.locator(f"{OPTIONS_LIST_SELECTOR} >> visible=true").get_by_text(option_text, exact=True)
+        if container is not None:
+            in_container = container.locator(OPTIONS_LIST_SELECTOR).get_by_text(option_text, exact=True)
+            return in_container.or_(in_open_list).or_(by_role).first
+        return by_role.or_(in_open_list).or_(self.scope.get_by_text(option_text, exact=True)).first
+
+    async def _read_options(self, container: Optional[Locator]) -> List[str]:
+        """Option texts of the opened dropdown (role=option entries, or leaf texts of the custom select)"""
+        try:
+            role_options = self.scope.get_by_role("option")
+            if await role_options.count():
+                return [text.strip() for text in await role_options.all_inner_texts() if text.strip()]
+            if container is not None:
+                return await container.evaluate(READ_OPTIONS_SCRIPT)
+        except Exception as e:
+            print(f"⚠️ Could not read dropdown options: {e}")
+        return []
+
+    async def _typeahead(self, option_text: str, container: Optional[Locator], options: List[str]) -> bool:
+        """Type into the dropdown's search box (if it has one) to narrow long option lists"""
+        if len(options) < TYPEAHEAD_MIN_OPTIONS:
+            return False
+        search_root = container if container is not None else self.scope
+        search_input = search_root.get_by_role("textbox", name="Search...")
+        if await search_input.count() and await search_input.first.is_visible():
+            await search_input.first.fill(option_text)
+            return True
+        return False
+
+    def options(self, name: str) -> List[str]:
+        """Cached option list of a dropdown (empty until it has been opened once this session)"""
+        return list(_option_cache.get(name, []))
+
+    async def select(self, trigger: Locator, option_text: str, name: str = None,
+               value_locator: Locator = None, verify: bool = True) -> bool:
+        """
+        Open a dropdown and select an option
+
+        Args:
+            trigger: Locator that opens the dropdown
+            option_text: Exact text of the option
+            name: Dropdown name used for the per-session option cache (e.g. "jd.currency")
+            value_locator: Element that shows the committed value (default: the select's trigger)
+            verify: Check that the selected value was committed
+
+        Returns:
+            bool: True when the committed value was verified (or verify=False)
+
+        Raises:
+            DropdownSelectionError: The cached option list does not contain option_text
+        """
+        start = time.time()
+        cached = _option_cache.get(name) if name else None
+        if cached and option_text not in cached:
+            raise DropdownSelectionError(f"'{option_text}' is not an option of {name}: {cached}")
+
+        await trigger.click()
+        container = await self._container(trigger)
+        option = self._option(option_text, container)
+
+        options = cached
+        if options is None:
+            # First open this session - wait for the list, then cache it for validation
+            await self.scope.get_by_role("option").or_(option).first.wait_for(state="attached", timeout=OPTION_TIMEOUT)
+            options = await self._read_options(container)
+            if name and options:
+                _option_cache[name] = options
+                if option_text not in options:
+                    await self.page.keyboard.press("Escape")
+                    raise DropdownSelectionError(f"'{option_text}' is not an option of {name}: {options}")
+
+        await self._typeahead(option_text, container, options or [])
+        await option.click(timeout=OPTION_TIMEOUT)
+
+        committed = await self.verify_committed(option_text, container, value_locator) if verify else True
+        label = name or option_text
+        if committed:
+            print(f"✅ Selected '{option_text}' ({label}) in {time.time() - start:.2f}s")
+        else:
+            print(f"⚠️ Selected '{option_text}' ({label}) but the committed value could not be verified")
+        return committed
+
+    async def choose_open_option(self, option_text: str) -> None:
+        """Select an option from a dropdown that is already open"""
+        option = self._option(option_text, None)
+        await option.click(timeout=OPTION_TIMEOUT)
+
+    async def verify_committed(self, option_text: str, container: Optional[Locator] = None,
+                         value_locator: Locator = None) -> bool:
+        """
+        Check that the dropdown committed the value: the given value element (or the custom select's trigger)
+        shows the text; for other markup, the option list has closed
+
+        Returns:
+            bool: True if the committed value was observed within COMMIT_TIMEOUT
+        """
+        try:
+            if value_locator is None and container is not None:
+                value_locator = container.locator(".select-trigger").first
+            if value_locator is not None:
+                await expect(value_locator).to_contain_text(option_text, timeout=COMMIT_TIMEOUT)
+            else:
+                await self.scope.get_by_role("option", name=option_text, exact=True).first.wait_for(
+                    state="hidden", timeout=COMMIT_TIMEOUT)
+            return True
+        except Exception:
+            return False
+
+
+def clear_option_cache():
+    """Forget all cached option lists (e.g. after test data that feeds a dropdown changed)"""
+    _option_cache.clear()
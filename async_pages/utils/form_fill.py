@@ -0,0 +1,210 @@
+# Generated by utils/async_codegen.py from utils/form_fill.py - do not edit, regenerate instead
+"""
+Form Fill Engine
+Fills a form from a declarative schema: all plain text inputs in one batched browser call (native value
+setter + input/change events so the app's controlled inputs pick the values up), then dropdowns and
+file inputs in schema order, then verifies the text values with a single read
+"""
+
+import asyncio
+import re
+import time
+from dataclasses import dataclass, field
+from typing import Callable, Dict, List, Optional, Union
+from playwright.async_api import Page, Locator
+from async_pages.utils.dropdown_driver import DropdownDriver
+
+TEXT = "text"
+SELECT = "select"
+FILE = "file"
+
+# Shared by the fill and verify scripts: resolves inputs by accessible label like get_by_role(name=...)
+_RESOLVE_JS = """
+const norm = (s) => (s || '').replace(/[*:]/g, '').replace(/\\s+/g, ' ').trim().toLowerCase();
+const labelOf = (el) => {
+    if (el.getAttribute('aria-label')) return el.getAttribute('aria-label');
+    const labelledBy = el.getAttribute('aria-labelledby');
+    if (labelledBy) {
+        const text = labelledBy.split(' ').map((id) => (document.getElementById(id) || {}).textContent || '').join(' ');
+        if (text.trim()) return text;
+    }
+    if (el.labels && el.labels.length) return el.labels[0].textContent;
+    return el.getAttribute('placeholder') || el.getAttribute('title') || '';
+};
+const inputs = Array.from(root.querySelectorAll('input, textarea')).filter(
+    (el) => !['hidden', 'file', 'checkbox', 'radio'].includes(el.type) && el.offsetParent !== null);
+const resolve = (label) => {
+    const wanted = norm(label);
+    const exact = inputs.filter((el) => norm(labelOf(el)) === wanted);
+    if (exact.length) return exact[0];
+    const partial = inputs.filter((el) => norm(labelOf(el)).includes(wanted));
+    return partial.length === 1 ? partial[0] : null;
+};
+"""
+
+FILL_SCRIPT = """
+(root, fields) => {
+""" + _RESOLVE_JS + """
+    const filled = [];
+    const unresolved = [];
+    fields.forEach(([key, label, value]) => {
+        const el = resolve(label);
+        if (!el) { unresolved.push(key); return; }
+        const proto = el.tagName === 'TEXTAREA' ? HTMLTextAreaElement.prototype : HTMLInputElement.prototype;
+        Object.getOwnPropertyDescriptor(proto, 'value').set.call(el, value);
+        el.dispatchEvent(new Event('input', { bubbles: true }));
+        el.dispatchEvent(new Event('change', { bubbles: true }));
+        el.dispatchEvent(new FocusEvent('focusout', { bubbles: true }));
+        filled.push(key);
+    });
+    return { filled, unresolved };
+}
+"""
+
+READ_SCRIPT = """
+(root, fields) => {
+""" + _RESOLVE_JS + """
+    const values = {};
+    fields.forEach(([key, label]) => {
+        const el = resolve(label);
+        values[key] = el ? el.value : null;
+    });
+    return values;
+}
+"""
+
+
+@dataclass
+class FormField:
+    """
+    One form field
+
+    Attributes:
+        name: Key in the data dictionary
+        kind: TEXT, SELECT or FILE
+        label: Accessible label of a text input (resolved in the browser for batched entry)
+        locator: Attribute name on the page's locators used for fallback fill / dropdown trigger
+        method: Page-object method called with the value (selects and files with their own logic)
+        cache_name: Dropdown option-cache name when the trigger locator is driven directly
+        batch: Whether a text field can be set with the native setter (False for date pickers etc.)
+        validate: Optional check of the value before filling (warning only - negative tests send invalid data)
+    """
+    name: str
+    kind: str = TEXT
+    label: str = None
+    locator: str = None
+    method: str = None
+    cache_name: str = None
+    batch: bool = True
+    validate: Optional[Callable[[str], bool]] = None
+
+
+@dataclass
+class FormSchema:
+    """Ordered fields of one modal/form; selects are filled in the listed order (e.g. client after company)"""
+    name: str
+    fields: List[FormField] = field(default_factory=list)
+
+    def get(self, name: str) -> Optional[FormField]:
+        """Field by data key"""
+        return next((f for f in self.fields if f.name == name), None)
+
+
+def is_number(value) -> bool:
+    """Validation helper for numeric inputs"""
+    return re.fullmatch(r"-?\d+(\.\d+)?", str(value).replace(",", "")) is not None
+
+
+def _normalize(value) -> str:
+    """Normalize values for comparison (thousand separators and surrounding spaces ignored)"""
+    text = str(value).strip()
+    return text.replace(",", "") if is_number(text) else text
+
+
+class FormFiller:
+    """
+    Fills a FormSchema on a page object (anything with .page and .locators)
+    """
+
+    def __init__(self, page_object, scope: Union[Page, Locator] = None):
+        """
+        Initialize filler
+
+        Args:
+            page_object: Page object whose locators/methods the schema refers to
+            scope: Page or Locator containing the form (e.g. the open modal; default: the page)
+        """
+        self.page_object = page_object
+        self.page: Page = getattr(page_object.locators, "page", page_object.page)
+        self.scope = scope if scope is not None else self.page
+        self.dropdowns = DropdownDriver(self.page, self.scope)
+
+    async def _evaluate(self, script: str, arg):
+        """Run a (root, arg) script against the form scope"""
+        if isinstance(self.scope, Locator):
+            return await self.scope.first.evaluate(script, arg)
+        return await self.scope.evaluate(f"(arg) => ({script})(document, arg)", arg)
+
+    async def fill(self, schema: FormSchema, data: Dict, verify: bool = True) -> Dict[str, Dict]:
+        """
+        Fill the form: batched text, then selects and files in schema order, then one verification read
+
+        Args:
+            schema: Form schema
+            data: {field name: value}; None/empty values and unknown keys are skipped
+            verify: Read back text values and report mismatches
+
+        Returns:
+            dict: {field name: {"expected", "actual"}} for text fields whose final value differs
+        """
+        start = time.time()
+        fields = [f for f in schema.fields if data.get(f.name) not in (None, "")]
+        for f in fields:
+            if f.validate and not f.validate(data[f.name]):
+                print(f"⚠️ {schema.name}: value {data[f.name]!r} for '{f.name}' does not pass validation")
+
+        batched = [f for f in fields if f.kind == TEXT and f.batch and f.label]
+        sequential = [f for f in fields if f.kind == TEXT and f not in batched]
+        if batched:
+            result = await self._evaluate(FILL_SCRIPT, [[f.name, f.label, str(data[f.name])] for f in batched])
+            unresolved = set(result["unresolved"])
+            sequential = [f for f in batched if f.name in unresolved] + sequential
+            if unresolved:
+                print(f"⚠️ {schema.name}: filling {sorted(unresolved)} one by one (label not resolved)")
+
+        for f in sequential:
+            await getattr(self.page_object.locators, f.locator).fill(str(data[f.name]))
+
+        for f in fields:
+            if f.kind == TEXT:
+                continue
+            if f.method:
+                await getattr(self.page_object, f.method)(data[f.name])
+            elif f.kind == SELECT:
+                await self.dropdowns.select(getattr(self.page_object.locators, f.locator), data[f.name], name=f.cache_name)
+            else:
+                await getattr(self.page_object.locators, f.locator).set_input_files(data[f.name])
+
+        mismatches = await self.verify(schema, data) if verify else {}
+        print(f"⚡ Filled {schema.name} ({len(fields)} fields, {len(batched)} batched) in {time.time() - start:.2f}s")
+        return mismatches
+
+    async def verify(self, schema: FormSchema, data: Dict) -> Dict[str, Dict]:
+        """
+        Read all text values of the form in one call and compare them with the data
+
+        Returns:
+            dict: {field name: {"expected", "actual"}} for mismatching fields
+        """
+        text_fields = [f for f in schema.fields if f.kind == TEXT and f.label and data.get(f.name) not in (None, "")]
+        if not text_fields:
+            return {}
+        actual = await self._evaluate(READ_SCRIPT, [[f.name, f.label] for f in text_fields])
+        mismatches = {}
+        for f in text_fields:
+            value = actual.get(f.name)
+            if value is not None and _normalize(value) != _normalize(data[f.name]):
+                mismatches[f.name] = {"expected": data[f.name], "actual": value}
+        if mismatches:
+            print(f"⚠️ {schema.name}: final form values differ: {mismatches}")
+        return mismatches
@@ -0,0 +1,101 @@
+# Generated by utils/async_codegen.py from utils/login_helper.py - do not edit, regenerate instead
+import asyncio
+from playwright.async_api import Page, expect
+from utils.config import BASE_URL
+from async_pages.conftest_utils import wait_for_action_completion
+from async_pages.utils.enhanced_assertions import enhanced_assert_visible, enhanced_assert_not_visible
+
+async def do_login(page: Page, email: str, password: str):
+    from async_pages.pages.login_page import LoginPage
+    login_page = LoginPage(page)
+    await login_page.navigate_to_landing_page(BASE_URL + "/login")
+    # login_page.click_get_started()
+    if email:
+        await login_page.fill_email(email)
+    if password:
+        await login_page.fill_password(password)
+    await login_page.click_sign_in()
+    await wait_for_action_completion(page, "login")  # Just wait for login action to complete
+    return login_page
+
+# Enhanced assertion functions for login
+async def assert_verification_required_for_login(page: Page, locator, message: str):
+    await enhanced_assert_visible(page, locator, message)
+
+async def assert_system_shows_email_verification_page(page: Page, locator, message: str):
+    await enhanced_assert_visible(page, locator, message)
+
+async def assert_verification_page_heading(page: Page, locator, message: str):
+    await enhanced_assert_visible(page, locator, message)
+
+async def assert_mailbox_image(page: Page, locator, message: str):
+    await enhanced_assert_visible(page, locator, message)
+
+async def assert_verification_instructions(page: Page, locator, message: str):
+    await enhanced_assert_visible(page, locator, message)
+
+async def assert_otp_input_box(page: Page, locator, message: str):
+    await enhanced_assert_visible(page, locator, message)
+
+async def assert_input_box_title(page: Page, locator, message: str):
+    await enhanced_assert_visible(page, locator, message)
+
+async def assert_resend_otp_countdown(page: Page, locator, message: str):
+    await enhanced_assert_visible(page, locator, message)
+
+async def assert_verify_button(page: Page, locator, message: str):
+    await enhanced_assert_visible(page, locator, message)
+
+async def assert_resend_otp_button(page: Page, locator, message: str):
+    await enhanced_assert_visible(page, locator, message)
+
+async def assert_resend_otp_success_message(page: Page, locator, message: str):
+    await enhanced_assert_visible(page, locator, message)
+
+async def assert_email_required_error(page: Page, locator, message: str):
+    await enhanced_assert_visible(page, locator, message)
+
+async def assert_password_required_error(page: Page, locator, message: str):
+    await enhanced_assert_visible(page, locator, message)
+
+async def assert_public_domain_warning(page: Page, locator, message: str):
+    await enhanced_assert_visible(page, locator, message)
+
+async def assert_invalid_email_error(page: Page, locator, message: str):
+    await enhanced_assert_visible(page, locator, message)
+
+async def assert_invalid_credentials_error(page: Page, locator, message: str):
+    await enhanced_assert_visible(page, locator, message)
+
+async def assert_show_password_button(page: Page, locator, message: str):
+    await enhanced_assert_visible(page, locator, message)
+
+async def assert_hide_password_button(page: Page, locator, message: str):
+    await enhanced_assert_visible(page, locator, message)
+
+async def assert_forgot_password_link(page: Page, locator, message: str):
+    await enhanced_assert_visible(page, locator, message)
+
+async def assert_sign_in_heading(page: Page, locator, message: str):
+    await enhanced_assert_visible(page, locator, message)
+
+async def assert_black_pigeon_link(page: Page, locator, message: str):
+    await enhanced_assert_visible(page, locator, message)
+
+async def assert_sign_in_button_visible(page: Page, locator, message: str):
+    await enhanced_assert_visible(page, locator, message)
+
+async def assert_email_label(page: Page, locator, message: str):
+    await enhanced_assert_visible(page, locator, message)
+
+async def assert_password_label(page: Page, locator, message: str):
+    await enhanced_assert_visible(page, locator, message)
+
+async def assert_unregistered_email_error(page: Page, locator, message: str):
+    await enhanced_assert_visible(page, locator, message)
+
+async def assert_dont_have_account_text(page: Page, locator, message: str):
+    await enhanced_assert_visible(page, locator, message)
+
+async def assert_nonverified_email_error(page: Page, locator, message: str):
+    await enhanced_assert_visible(page, locator, message)
\ No newline at end of file
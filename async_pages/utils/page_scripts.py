@@ -0,0 +1,69 @@
+# Generated by utils/async_codegen.py from utils/page_scripts.py - do not edit, regenerate instead
+"""
+Page Scripts
+Shared plumbing of the in-page instrumentation (quiescence tracker, toast recorder, modal tracker): inject a
+script into every document of a context once, and wait on an in-page condition across navigations.
+"""
+
+import asyncio
+import time
+import weakref
+from typing import Callable, Optional
+from playwright.async_api import Page, TimeoutError as PlaywrightTimeoutError
+
+# Init scripts already added per context ({context: {script, ...}})
+_init_scripts = weakref.WeakKeyDictionary()
+
+
+async def install_init_script_once(context, script: str) -> bool:
+    """
+    Add an init script to a browser context unless it was added before
+
+    Args:
+        context: Playwright browser context
+        script: Script run in every new document of the context
+
+    Returns:
+        bool: True when the script was added now
+    """
+    installed = _init_scripts.setdefault(context, set())
+    if script in installed:
+        return False
+    await context.add_init_script(script)
+    installed.add(script)
+    return True
+
+
+async def wait_for_page_function(page: Page, script: str, arg=None, timeout: float = 5000,
+                           prepare: Callable = None) -> Optional[bool]:
+    """
+    Wait until an in-page function returns a truthy value; survives navigations
+
+    A navigation that replaces the document while waiting restarts the wait on the new document (the init
+    scripts have instrumented it) with the remaining time.
+
+    Args:
+        page: Playwright page object
+        script: Function evaluated in the page until it returns a truthy value
+        arg: Argument of the function
+        timeout: Max wait in ms
+        prepare: Called with the remaining ms before every attempt, returns the argument instead of `arg`
+                 (element handles must be resolved again on a new document)
+
+    Returns:
+        bool: True when the function returned a truthy value, False on timeout, None when the page closed
+    """
+    start = time.time()
+    while True:
+        remaining = max(timeout - (time.time() - start) * 1000, 1)
+        try:
+            await page.wait_for_function(script, arg=await prepare(remaining) if prepare else arg, timeout=remaining)
+            return True
+        except PlaywrightTimeoutError:
+            return False
+        except Exception:
+            if page.is_closed():
+                return None
+            # A navigation replaced the document while waiting - wait on the new one
+        if (time.time() - start) * 1000 >= timeout:
+            return False
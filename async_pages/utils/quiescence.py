@@ -0,0 +1,109 @@
+# Generated by utils/async_codegen.py from utils/quiescence.py - do not edit, regenerate instead
+"""
+Page Quiescence
+One "settle" step for page objects instead of blind sleeps: resolves as soon as the page has no fetch/XHR
+request in flight, no DOM mutation for a short quiet window and no finite CSS animation running on the
+target region - or when a hard ceiling is reached. Usually returns within tens of milliseconds.
+"""
+
+import asyncio
+import time
+from typing import Optional
+from playwright.async_api import Page, Locator
+from utils.config import QUIESCENCE_QUIET_MS, QUIESCENCE_TIMEOUT
+from async_pages.utils.page_scripts import install_init_script_once, wait_for_page_function
+
+# Tracks in-flight fetch/XHR requests and the last DOM mutation of a document (idempotent)
+TRACKER_SCRIPT = """
+(() => {
+    if (window.__bprpQuiet) return;
+    const state = { inflight: 0, lastActivity: performance.now() };
+    const touch = () => { state.lastActivity = performance.now(); };
+    const start = () => { state.inflight += 1; touch(); };
+    const done = () => { state.inflight = Math.max(0, state.inflight - 1); touch(); };
+    window.__bprpQuiet = state;
+
+    if (window.fetch) {
+        const fetch = window.fetch;
+        window.fetch = function (...args) {
+            start();
+            return fetch.apply(this, args).finally(done);
+        };
+    }
+    const send = XMLHttpRequest.prototype.send;
+    XMLHttpRequest.prototype.send = function (...args) {
+        start();
+        this.addEventListener('loadend', done, { once: true });
+        return send.apply(this, args);
+    };
+
+    const observe = () => new MutationObserver(touch).observe(document.documentElement,
+        { childList: true, subtree: true, characterData: true, attributes: true });
+    if (document.documentElement) observe(); else document.addEventListener('DOMContentLoaded', observe);
+})();
+"""
+
+# True when nothing is in flight, the DOM was quiet for `quiet` ms and no finite animation runs in the region
+SETTLED_SCRIPT = """
+([quiet, region]) => {
+    const state = window.__bprpQuiet;
+    if (!state) { """ + TRACKER_SCRIPT.strip().rstrip(';') + """; return false; }
+    if (state.inflight > 0 || performance.now() - state.lastActivity < quiet) return false;
+    const animations = region && region.getAnimations
+        ? region.getAnimations({ subtree: true }) : (document.getAnimations ? document.getAnimations() : []);
+    return !animations.some((animation) => animation.playState === 'running'
+        && animation.effect && animation.effect.getComputedTiming().endTime !== Infinity);
+}
+"""
+
+
+async def install_quiescence(page: Page):
+    """
+    Inject the request/mutation tracker into the page's context (all future documents) and the current document
+
+    Requests started before the tracker was installed are not seen, so install early (the page fixture does;
+    settle installs it lazily otherwise).
+    """
+    await install_init_script_once(page.context, TRACKER_SCRIPT)
+    try:
+        await page.evaluate(TRACKER_SCRIPT)
+    except Exception:
+        pass  # Navigation in progress - the init script covers the new document
+
+
+async def settle(page: Page, region: Locator = None, quiet_ms: int = QUIESCENCE_QUIET_MS,
+           timeout: int = QUIESCENCE_TIMEOUT) -> Optional[float]:
+    """
+    Wait until the page is quiescent
+
+    Args:
+        page: Playwright page object
+        region: Element whose CSS animations must have finished (default: the whole document)
+        quiet_ms: Window without requests finishing or DOM mutations
+        timeout: Hard ceiling in ms; reaching it is not an error
+
+    Returns:
+        float: Milliseconds until the page settled, or None when the ceiling was reached
+    """
+    start = time.time()
+    handles = []
+
+    async def settled_arg(remaining):
+        # The region is resolved again for every attempt - a navigation replaces its element
+        handle = None
+        if region is not None and await region.count():
+            handle = await region.first.element_handle(timeout=remaining)
+            handles.append(handle)
+        return [quiet_ms, handle]
+
+    try:
+        settled = await wait_for_page_function(page, SETTLED_SCRIPT, timeout=timeout, prepare=settled_arg)
+    finally:
+        for handle in handles:
+            try:
+                await handle.dispose()
+            except Exception:
+                pass
+    if settled is False:
+        print(f"⚠️ Page did not settle within {timeout}ms")
+    return (time.time() - start) * 1000 if settled else None
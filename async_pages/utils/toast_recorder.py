@@ -0,0 +1,246 @@
+# Generated by utils/async_codegen.py from utils/toast_recorder.py - do not edit, regenerate instead
+"""
+Toast Recorder
+Records every toast/alert the application shows (text, type, appeared/disappeared timestamps) with a DOM
+observer injected at context creation. Messages that disappear after a second are kept in a per-tab buffer
+(sessionStorage, so it survives same-origin navigations) that assertions query instantly - no pre-waits,
+retries or race-prone screenshots needed to catch "Company deleted successfully".
+"""
+
+import asyncio
+import inspect
+import json
+import re
+import time
+from typing import Dict, List, Optional, Union
+from playwright.async_api import Page
+from utils.config import TOAST_TIMEOUT, TOAST_BUFFER_SIZE
+from async_pages.utils.enhanced_assertions import capture_failure_screenshot
+from async_pages.utils.page_scripts import install_init_script_once, wait_for_page_function
+
+# Elements recorded as toasts (toast libraries, ARIA live regions, alert boxes)
+TOAST_SELECTOR = ", ".join([
+    "[role='alert']", "[role='status']", "[data-sonner-toast]", ".Toastify__toast",
+    "[class*='toast']:not([class*='toast-container']):not([class*='toaster'])", ".alert",
+])
+
+# Observes toasts of a document and appends them to window.__bprpToasts (idempotent)
+RECORDER_SCRIPT = """
+(() => {
+    if (window.__bprpToasts) return;
+    const KEY = '__bprpToasts', SELECTOR = %s, LIMIT = %d;
+    let saved = [];
+    try { saved = JSON.parse(sessionStorage.getItem(KEY) || '[]'); } catch (e) {}
+    const recorder = { entries: saved, seq: saved.reduce((max, entry) => Math.max(max, entry.id), 0) };
+    const tracked = new Map();
+    window.__bprpToasts = recorder;
+
+    const store = () => {
+        if (recorder.entries.length > LIMIT) recorder.entries.splice(0, recorder.entries.length - LIMIT);
+        try { sessionStorage.setItem(KEY, JSON.stringify(recorder.entries)); } catch (e) {}
+    };
+    const typeOf = (element) => {
+        const hint = (element.className && element.className.baseVal !== undefined
+            ? element.className.baseVal : String(element.className || '')) + ' '
+            + (element.getAttribute('data-type') || '') + ' ' + (element.getAttribute('role') || '');
+        for (const type of ['success', 'error', 'warning', 'info']) if (hint.toLowerCase().includes(type)) return type;
+        return /danger|fail/i.test(hint) ? 'error' : (element.getAttribute('role') === 'alert' ? 'alert' : 'info');
+    };
+    const textOf = (element) => (element.innerText || element.textContent || '').replace(/\\s+/g, ' ').trim();
+    const visible = (element) => element.isConnected && !!(element.offsetWidth || element.offsetHeight
+        || element.getClientRects().length) && getComputedStyle(element).visibility !== 'hidden';
+
+    const scan = () => {
+        const now = Date.now();
+        let changed = false;
+        document.querySelectorAll(SELECTOR).forEach((element) => {
+            // Record the outermost toast only (a toast wrapper and its role=status child are one message)
+            if (element.parentElement && element.parentElement.closest(SELECTOR)) return;
+            const text = textOf(element);
+            if (!text || !visible(element)) return;
+            const entry = tracked.get(element);
+            if (!entry) {
+                const created = { id: ++recorder.seq, text, type: typeOf(element), appeared: now,
+                                  disappeared: null, url: location.href };
+                recorder.entries.push(created);
+                tracked.set(element, created);
+                changed = true;
+            } else if (entry.text !== text) {
+                entry.text = text;  // Text rendered after the element was inserted
+                changed = true;
+            }
+        });
+        tracked.forEach((entry, element) => {
+            if (!visible(element)) {
+                entry.disappeared = now;
+                tracked.delete(element);
+                changed = true;
+            }
+        });
+        if (changed) store();
+    };
+
+    const observe = () => {
+        new MutationObserver(scan).observe(document.documentElement,
+            { childList: true, subtree: true, characterData: true, attributes: true,
+              attributeFilter: ['class', 'style', 'hidden', 'role'] });
+        scan();
+    };
+    if (document.documentElement) observe(); else document.addEventListener('DOMContentLoaded', observe);
+    window.addEventListener('pagehide', () => {
+        tracked.forEach((entry) => { entry.disappeared = Date.now(); });
+        store();
+    });
+})();
+""" % (json.dumps(TOAST_SELECTOR), TOAST_BUFFER_SIZE)
+
+# Entries after `since` whose text matches (substring, case-insensitive; or a regex), oldest first
+_MATCH_FUNCTION = """
+    const match = ([source, flags, since]) => {
+        const recorder = window.__bprpToasts;
+        if (!recorder) return [];
+        const pattern = source === null ? null : new RegExp(source, flags);
+        return recorder.entries.filter((entry) => entry.id > since && (!pattern || pattern.test(entry.text)));
+    };
+"""
+
+READ_SCRIPT = "(arg) => {" + _MATCH_FUNCTION + "return match(arg); }"
+
+# Truthy once a matching entry exists (installs the recorder lazily on pages created before the context had it)
+WAIT_SCRIPT = ("(arg) => { if (!window.__bprpToasts) { " + RECORDER_SCRIPT.strip().rstrip(';') + "; }"
+               + _MATCH_FUNCTION + "return match(arg).length > 0; }")
+
+MARK_SCRIPT = "() => window.__bprpToasts ? window.__bprpToasts.seq : 0"
+
+CLEAR_SCRIPT = """
+() => {
+    if (window.__bprpToasts) window.__bprpToasts.entries = [];
+    try { sessionStorage.removeItem('__bprpToasts'); } catch (e) {}
+}
+"""
+
+TextPattern = Union[str, re.Pattern, None]
+
+
+def _pattern_arg(text: TextPattern, since: int) -> list:
+    """[regex source, flags, since] for the in-page matcher (plain text matches as a case-insensitive substring)"""
+    if text is None:
+        return [None, "", since]
+    if isinstance(text, re.Pattern):
+        return [text.pattern, "i" if text.flags & re.IGNORECASE else "", since]
+    return [re.escape(text), "i", since]
+
+
+def _current_test_name() -> str:
+    """Name of the innermost test function on the call stack"""
+    frame = inspect.currentframe()
+    while frame:
+        if frame.f_code.co_name.startswith("test_"):
+            return frame.f_code.co_name
+        frame = frame.f_back
+    return "unknown_test"
+
+
+async def install_toast_recorder(context):
+    """
+    Inject the toast recorder into every document of a browser context
+
+    Call it right after the context is created (the context fixture does) so toasts shown during the very
+    first navigation are recorded too.
+    """
+    await install_init_script_once(context, RECORDER_SCRIPT)
+
+
+async def mark_toasts(page: Page) -> int:
+    """
+    Position in the toast buffer; pass it as `since` to only match toasts shown after this point
+
+    Take the mark before the action that triggers the toast, so an earlier identical toast cannot satisfy
+    the assertion.
+    """
+    try:
+        return await page.evaluate(MARK_SCRIPT)
+    except Exception:
+        return 0  # Navigation in progress - nothing recorded in the new document yet
+
+
+async def recorded_toasts(page: Page, text: TextPattern = None, since: int = 0) -> List[Dict]:
+    """
+    Toasts recorded in the current tab, oldest first
+
+    Args:
+        page: Playwright page object
+        text: Only toasts containing this text (case-insensitive) or matching this regex; None for all
+        since: Only toasts recorded after this mark (see mark_toasts)
+
+    Returns:
+        list: {"id", "text", "type", "appeared", "disappeared", "url"} per toast; timestamps in epoch ms,
+              disappeared is None while the toast is still shown
+    """
+    try:
+        return await page.evaluate(READ_SCRIPT, _pattern_arg(text, since))
+    except Exception:
+        return []
+
+
+async def wait_for_toast(page: Page, text: TextPattern = None, since: int = 0,
+                   timeout: int = TOAST_TIMEOUT) -> Optional[Dict]:
+    """
+    Return the first toast matching `text` - immediately if it was already shown (even if it is gone again)
+
+    Args:
+        page: Playwright page object
+        text: Text contained in the toast (case-insensitive) or regex; None for any toast
+        since: Only toasts recorded after this mark (see mark_toasts)
+        timeout: Max wait in ms for the toast to appear
+
+    Returns:
+        dict: The recorded toast, or None when none appeared within the timeout
+    """
+    start = time.time()
+    while True:
+        # The buffer carries over navigations, so a toast shown on the previous document still counts
+        if not await wait_for_page_function(page, WAIT_SCRIPT, _pattern_arg(text, since),
+                                      timeout - (time.time() - start) * 1000):
+            return None
+        entries = await recorded_toasts(page, text, since)
+        if entries:
+            return entries[0]
+        if (time.time() - start) * 1000 >= timeout:
+            return None
+
+
+async def expect_toast(page: Page, text: TextPattern, error_message: str = None, test_name: str = None,
+                 since: int = 0, timeout: int = TOAST_TIMEOUT) -> Dict:
+    """
+    Assert that a toast matching `text` was shown
+
+    On failure a screenshot is captured and the toasts that were shown instead are listed in the message.
+
+    Args:
+        page: Playwright page object
+        text: Text contained in the toast (case-insensitive) or regex
+        error_message: Assertion message (default: "Toast '<text>' should appear")
+        test_name: Name used for the failure screenshot (auto-detected if not provided)
+        since: Only toasts recorded after this mark (see mark_toasts)
+        timeout: Max wait in ms for the toast to appear
+
+    Returns:
+        dict: The recorded toast
+    """
+    toast = await wait_for_toast(page, text, since, timeout)
+    if toast is not None:
+        print(f"✅ Toast: {toast['text']} ({toast['type']})")
+        return toast
+    await capture_failure_screenshot(page, test_name or _current_test_name(), "assertion_failure")
+    shown = [entry["text"] for entry in await recorded_toasts(page, since=since)]
+    message = error_message or f"Toast '{getattr(text, 'pattern', text)}' should appear"
+    assert False, f"{message} (toasts shown: {shown or 'none'})"
+
+
+async def clear_toasts(page: Page):
+    """Empty the toast buffer of the current tab"""
+    try:
+        await page.evaluate(CLEAR_SCRIPT)
+    except Exception:
+        pass
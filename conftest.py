@@ -8,11 +8,40 @@ from openpyxl.styles import Font, PatternFill, Alignment, Border, Side
 from playwright.sync_api import sync_playwright, Page
 from utils.config import BROWSER_NAME, HEADLESS, DEFAULT_TIMEOUT, SLOW_MO, SCREENSHOT_DELAY
 from utils.screenshot_helper import capture_failure_screenshot
+from utils.web_perf_collector import WebPerfCollector
+from utils.network_observer import ApiLatencyRecorder
+from utils.test_scheduler import apply_schedule, check_dist_mode
+from utils.impact_selector import apply_impact_selection
+from utils.flaky_tracker import FlakyTracker, apply_quarantine, run_with_flaky_reruns, print_flaky_summary
+from utils.strategy_resolver import attach_strategy_stats, collect_strategy_stats, print_strategy_summary
+from utils.sleep_accounting import create_sleep_accountant, print_sleep_summary
+from utils.quiescence import install_quiescence, settle
+from utils.toast_recorder import install_toast_recorder
+from utils.tenant_pool import load_tenant_pool, provision_tenant, set_current_tenant
+from utils.modal_tracker import install_modal_tracker, wait_for_modal_open, open_modals, ModalLatencyRecorder
+from utils.step_checkpoint import StepFlow
+from utils.browser_server import BrowserServer, SharedBrowser
+from utils.memory_watchdog import MemoryWatchdog, MemoryRecorder, RecyclableBrowser
 
 # Global variables to store test results
 test_results = {}
 test_files_executed = set()
 
+# Per-test outcome history for flaky detection (created in pytest_configure)
+flaky_tracker = None
+
+# Sleep accounting (created in pytest_configure with --sleep-report / --sleep-budget)
+sleep_accountant = None
+
+# Run-level API latency recorder (created in pytest_configure with --api-latency)
+api_recorder = None
+
+# Run-level modal latency recorder (created in pytest_configure with --perf-metrics)
+modal_recorder = None
+
+# Run-level browser memory samples (created in pytest_configure with --memory-watchdog)
+memory_recorder = None
+
 # REPORT GENERATION FUNCTIONALITY
 # ============================================================================
 
@@ -266,48 +295,306 @@ def generate_excel_report(test_file: str, test_descriptions: dict, results: dict
     wb.save(report_filename)
     print(f"Test report generated: {report_filename}")
 
+# COMMAND LINE OPTIONS
+# ============================================================================
+
+def pytest_addoption(parser):
+    """Register project-specific command line options."""
+    group = parser.getgroup("bprp", "Black Pigeon automation options")
+    group.addoption(
+        "--perf-metrics", action="store_true", default=False,
+        help="Capture browser-side web performance metrics after each page navigation"
+    )
+    group.addoption(
+        "--api-latency", action="store_true", default=False,
+        help="Record backend request latency per test and export per-endpoint percentiles"
+    )
+    group.addoption(
+        "--duration-order", action="store_true", default=False,
+        help="Run tests longest-first using durations from Allure history"
+    )
+    group.addoption(
+        "--num-shards", type=int, default=None,
+        help="Split tests into N duration-balanced shards (use with --shard-id)"
+    )
+    group.addoption(
+        "--shard-id", type=int, default=None,
+        help="Zero-based index of the shard to run when --num-shards is used"
+    )
+    group.addoption(
+        "--coupling-report", action="store_true", default=False,
+        help="Print the units of coupled tests (shared state / order) that parallel workers keep together"
+    )
+    group.addoption(
+        "--impacted-since", default=None, metavar="GIT_REF",
+        help="Run only tests whose import graph is affected by changes since GIT_REF"
+    )
+    group.addoption(
+        "--impact-margin", action="store_true", default=False,
+        help="With --impacted-since, also run tests that failed in their last few recorded runs"
+    )
+    group.addoption(
+        "--flaky-reruns", type=int, default=0,
+        help="Re-run failures of suspected-flaky tests up to N times in a fresh traced context"
+    )
+    group.addoption(
+        "--quarantine", choices=("off", "exclude", "only"), default="off",
+        help="Quarantine lane: exclude known-flaky tests, or run only them as non-blocking"
+    )
+    group.addoption(
+        "--profile-locators", action="store_true", default=False,
+        help="Run tests/test_locator_profiling.py: rank slow, ambiguous and dead locators"
+    )
+    group.addoption(
+        "--benchmark", action="store_true", default=False,
+        help="Run tests marked benchmark (skipped otherwise)"
+    )
+    group.addoption(
+        "--sleep-report", action="store_true", default=False,
+        help="Account time.sleep / wait_for_timeout per test and call site and report the top sleep sites"
+    )
+    group.addoption(
+        "--sleep-budget", type=float, default=None, metavar="SECONDS",
+        help="Per-test sleep budget (implies --sleep-report); override per test with @pytest.mark.sleep_budget"
+    )
+    group.addoption(
+        "--tenant-reset", action="store_true", default=False,
+        help="Recreate the agencies provisioned for this worker's tenant, so the run starts from empty agencies"
+    )
+    group.addoption(
+        "--shared-browser", action="store_true", default=False,
+        help="Launch one Chromium per machine and connect every xdist worker to it (chromium only)"
+    )
+    group.addoption(
+        "--memory-watchdog", action="store_true", default=False,
+        help="Sample browser memory after every test, flag leaking tests and relaunch the browser over MEMORY_RECYCLE_MB"
+    )
+    group.addoption(
+        "--restart-steps", action="store_true", default=False,
+        help="Ignore step checkpoints of failed attempts and run multi-step tests from their first step"
+    )
+    group.addoption(
+        "--sleep-budget-mode", choices=("warn", "fail"), default="warn",
+        help="Warn about or fail tests whose cumulative sleep exceeds the budget"
+    )
+
+def pytest_configure(config):
+    """Load the per-test outcome history used for flaky detection, start sleep accounting if requested and check the xdist mode."""
+    global flaky_tracker, sleep_accountant, api_recorder, modal_recorder, memory_recorder
+    check_dist_mode(config)
+    flaky_tracker = FlakyTracker(max_reruns=config.getoption("--flaky-reruns"))
+    sleep_accountant = create_sleep_accountant(config)
+    api_recorder = ApiLatencyRecorder() if config.getoption("--api-latency") else None
+    modal_recorder = ModalLatencyRecorder() if config.getoption("--perf-metrics") else None
+    memory_recorder = MemoryRecorder() if config.getoption("--memory-watchdog") else None
+
+@pytest.hookimpl(tryfirst=True)
+def pytest_collection_modifyitems(session, config, items):
+    """Apply impact selection, quarantine lane, duration-aware ordering and sharding, and skip benchmarks unless requested.
+    Runs first so the xdist_group marks exist when xdist's worker hook turns them into "@<group>" node ids."""
+    seeded = flaky_tracker.seed_from_allure(items)
+    if seeded:
+        print(f"\n📚 Seeded outcome history of {seeded} tests from Allure history")
+    apply_impact_selection(config, items, flaky_tracker.history)
+    apply_quarantine(config, items, flaky_tracker)
+    apply_schedule(config, items)
+    if not config.getoption("--benchmark"):
+        skip_benchmark = pytest.mark.skip(reason="benchmarks run only with --benchmark")
+        for item in items:
+            if "benchmark" in item.keywords:
+                item.add_marker(skip_benchmark)
+
+def pytest_runtest_protocol(item, nextitem):
+    """Re-run suspected-flaky failures when --flaky-reruns is set (default protocol otherwise)."""
+    return run_with_flaky_reruns(item, nextitem, flaky_tracker)
+
+def pytest_runtest_logstart(nodeid, location):
+    """Attribute sleeps to the starting test."""
+    if sleep_accountant is not None:
+        sleep_accountant.start_test(nodeid)
+
+def pytest_runtest_logfinish(nodeid, location):
+    """Attribute sleeps outside tests to the session."""
+    if sleep_accountant is not None:
+        sleep_accountant.finish_test()
+
+def pytest_runtest_logreport(report):
+    """Record test outcomes for flaky detection and collect per-test sleep, strategy statistics, API/modal latency and browser memory."""
+    if flaky_tracker is not None:
+        flaky_tracker.record(report)
+    collect_strategy_stats(report)
+    if api_recorder is not None:
+        api_recorder.collect(report)
+    if modal_recorder is not None:
+        modal_recorder.collect(report)
+    if memory_recorder is not None:
+        memory_recorder.collect(report)
+    if sleep_accountant is not None:
+        sleep_accountant.collect(report)
+
+def pytest_report_teststatus(report, config):
+    """Show failed attempts that were re-run as RERUN instead of FAILED."""
+    if report.outcome == "rerun":
+        return "rerun", "R", ("RERUN", {"yellow": True})
+
+def pytest_terminal_summary(terminalreporter, exitstatus, config):
+    """Summarize flaky tests, used fallback strategies and sleep accounting after the run."""
+    print_flaky_summary(terminalreporter, flaky_tracker)
+    print_strategy_summary(terminalreporter)
+    print_sleep_summary(terminalreporter, sleep_accountant)
+
 # BROWSER AND PAGE FIXTURES
 # ============================================================================
 
 @pytest.fixture(scope="session")
-def browser():
-    """Session-scoped browser fixture with configuration from config.py"""
+def browser(request):
+    """Session-scoped browser fixture with configuration from config.py (the machine-wide browser with --shared-browser)"""
     with sync_playwright() as p:
-        if BROWSER_NAME == "chromium":
-            browser = p.chromium.launch(headless=HEADLESS, slow_mo=SLOW_MO)
-        elif BROWSER_NAME == "firefox":
-            browser = p.firefox.launch(headless=HEADLESS, slow_mo=SLOW_MO)
-        elif BROWSER_NAME == "webkit":
-            browser = p.webkit.launch(headless=HEADLESS, slow_mo=SLOW_MO)
-        else:
-            browser = p.chromium.launch(headless=HEADLESS, slow_mo=SLOW_MO)
-            
+        if request.config.getoption("--shared-browser"):
+            if BROWSER_NAME == "chromium":
+                server = BrowserServer(p, os.environ.get("PYTEST_XDIST_WORKER", "master"))
+                server.connect()
+                yield SharedBrowser(server)
+                server.close()
+                return
+            print(f"⚠️ --shared-browser supports chromium only - launching {BROWSER_NAME} per worker")
+
+        def launch():
+            if BROWSER_NAME == "chromium":
+                return p.chromium.launch(headless=HEADLESS, slow_mo=SLOW_MO)
+            elif BROWSER_NAME == "firefox":
+                return p.firefox.launch(headless=HEADLESS, slow_mo=SLOW_MO)
+            elif BROWSER_NAME == "webkit":
+                return p.webkit.launch(headless=HEADLESS, slow_mo=SLOW_MO)
+            return p.chromium.launch(headless=HEADLESS, slow_mo=SLOW_MO)
+
+        # The memory watchdog needs a browser it can relaunch between tests
+        browser = RecyclableBrowser(launch) if request.config.getoption("--memory-watchdog") else launch()
         yield browser
         browser.close()
 
+@pytest.fixture(scope="session")
+def memory_watchdog(browser):
+    """Session-scoped browser memory watchdog, enabled with --memory-watchdog (None otherwise); exported by the controller."""
+    if memory_recorder is None:
+        return None
+    return MemoryWatchdog(browser, memory_recorder)
+
+@pytest.fixture(scope="session", autouse=True)
+def tenant(request):
+    """Accounts and agencies leased to this worker from the tenant pool (shared default tenant without a pool)."""
+    pool = load_tenant_pool()
+    leased = pool.lease(os.environ.get("PYTEST_XDIST_WORKER", "master"))
+    try:
+        reset = request.config.getoption("--tenant-reset")
+        # The shared default tenant is never provisioned (its dedicated areas stay unconfigured)
+        if pool.leased is not None and (leased.needs_provisioning() or (reset and leased.provisioned)):
+            context = request.getfixturevalue("browser").new_context()
+            try:
+                provision_tenant(context.new_page(), pool, leased, reset=reset)
+            finally:
+                context.close()
+        set_current_tenant(leased)
+        yield leased
+    finally:
+        set_current_tenant(None)
+        pool.release()
+
+@pytest.fixture(scope="session")
+def admin_credentials(tenant):
+    """Admin account of this worker's tenant."""
+    return tenant.account("admin")
+
+@pytest.fixture(scope="session")
+def company_credentials(tenant):
+    """Account of this worker's tenant used for company operations."""
+    return tenant.account("company")
+
+@pytest.fixture(scope="session")
+def agency_credentials(tenant):
+    """Account of this worker's tenant that owns and creates agencies."""
+    return tenant.account("agency")
+
+@pytest.fixture(scope="session")
+def test_agency_info(tenant):
+    """Agency of this worker's tenant used for JD operations (agency_name, agency_id, company_name)."""
+    return tenant.agency("jd")
+
+@pytest.fixture(scope="session")
+def api_latency_recorder():
+    """Run-level API latency recorder, enabled with --api-latency (None otherwise); exported by the controller."""
+    return api_recorder
+
 @pytest.fixture
-def context(browser, request):
+def context(browser, request, api_latency_recorder, memory_watchdog):
     """Browser context fixture with tracing support."""
     context = browser.new_context()
+    install_toast_recorder(context)
+    install_modal_tracker(context)
     tracing_enabled = request.config.getoption("--tracing") if hasattr(request.config, 'getoption') else False
+    rerun_attempt = getattr(request.node, "_flaky_rerun_attempt", 0)
+    if rerun_attempt:
+        tracing_enabled = True  # Always trace re-runs of suspected-flaky tests
     if tracing_enabled:
         context.tracing.start(screenshots=True, snapshots=True, sources=True)
+    network_observer = api_latency_recorder.create_observer(context, request.node.nodeid) if api_latency_recorder else None
     yield context
+    if network_observer:
+        api_latency_recorder.add(network_observer)
+        allure.attach(
+            network_observer.format_waterfall(),
+            name=f"api_waterfall_{request.node.name}",
+            attachment_type=allure.attachment_type.TEXT
+        )
     if tracing_enabled:
         trace_dir = os.path.join(os.getcwd(), "traces")
         os.makedirs(trace_dir, exist_ok=True)
-        trace_file = os.path.join(trace_dir, f"trace_{request.node.name}.zip")
+        trace_suffix = f"_rerun{rerun_attempt}" if rerun_attempt else ""
+        trace_file = os.path.join(trace_dir, f"trace_{request.node.name}{trace_suffix}.zip")
         context.tracing.stop(path=trace_file)
     context.close()
+    if memory_watchdog:
+        memory_watchdog.after_test(request.node.nodeid)
+
+@pytest.fixture(scope="session")
+def web_perf_collector(request):
+    """Session-scoped web performance collector, enabled with --perf-metrics (None otherwise)."""
+    if not request.config.getoption("--perf-metrics"):
+        yield None
+        return
+    collector = WebPerfCollector(BROWSER_NAME)
+    yield collector
+    collector.export()
+
+@pytest.fixture(scope="session")
+def modal_latency_recorder():
+    """Run-level modal open latency recorder, enabled with --perf-metrics (None otherwise); exported by the controller."""
+    return modal_recorder
 
 @pytest.fixture
-def page(context):
+def page(context, request, web_perf_collector, modal_latency_recorder):
     """Page fixture using context, with configured timeout."""
+    if web_perf_collector:
+        web_perf_collector.install(context)
     page = context.new_page()
     page.set_default_timeout(DEFAULT_TIMEOUT)
+    install_quiescence(page)
+    if web_perf_collector:
+        web_perf_collector.attach(page, request.node.nodeid)
     yield page
+    if modal_latency_recorder and not page.is_closed():
+        modal_latency_recorder.collect_page(page, request.node.nodeid)
     page.close()
 
+@pytest.fixture
+def steps(page, request):
+    """Checkpointed steps of a long test: a retry of a failed attempt resumes after the last completed step."""
+    flow = StepFlow(page, request.node.nodeid, resume=not request.config.getoption("--restart-steps"))
+    yield flow
+    report = getattr(request.node, "rep_call", None)
+    if report is not None and report.passed:
+        flow.clear()
+
 # GLOBAL UTILITY FUNCTIONS
 # ============================================================================
 
@@ -340,34 +627,18 @@ def wait_for_action_completion(page: Page, action_type: str = "general"):
     else:
         page.wait_for_timeout(2000)  # Default 2 seconds
 
-def wait_for_modal_or_content(page: Page, timeout: int = 10000):
+def wait_for_modal_or_content(page: Page, timeout: int = 10000, name: str = None):
     """
     Global utility to wait for modals or dynamic content to appear after login.
+
+    With `name`, resolves as soon as a modal whose name contains it is open; otherwise when the page
+    settled. Returns the open modals (see utils/modal_tracker.py).
     """
-    try:
-        # Wait for any dynamic content to load
-        page.wait_for_load_state("networkidle", timeout=timeout)
-        page.wait_for_timeout(3000)  # Additional 3 seconds for modals
-        
-        # Try to detect if any modal or overlay is present
-        modal_selectors = [
-            '[role="dialog"]',
-            '.modal',
-            '[data-modal]',
-            '.overlay',
-            '[aria-modal="true"]'
-        ]
-        
-        for selector in modal_selectors:
-            try:
-                if page.locator(selector).count() > 0:
-                    page.wait_for_timeout(1000)  # Extra wait if modal detected
-                    break
-            except:
-                continue
-                
-    except Exception as e:
-        print(f"⚠️  Modal wait completed with timeout: {e}")
+    if name is not None:
+        wait_for_modal_open(page, name, timeout=timeout)
+    else:
+        settle(page, timeout=timeout)
+    return open_modals(page, name)
 
 def capture_immediate_screenshot(page: Page, test_name: str, description: str = "failure"):
     """
@@ -430,6 +701,16 @@ def pytest_runtest_makereport(item, call):
     """Pytest hook to capture test execution results and screenshots for failures."""
     outcome = yield
     rep = outcome.get_result()
+    if sleep_accountant is not None:
+        sleep_accountant.check_budget(item, rep)
+        sleep_accountant.attach(item, rep)
+    attach_strategy_stats(rep)
+    if api_recorder is not None:
+        api_recorder.attach(rep)
+    if modal_recorder is not None:
+        modal_recorder.attach(rep)
+    if memory_recorder is not None:
+        memory_recorder.attach(rep)
     setattr(item, f"rep_{rep.when}", rep)
     
     # Capture test results for report generation
@@ -475,6 +756,18 @@ def pytest_sessionfinish(session, exitstatus):
             # Generate Excel report
             generate_excel_report(test_file, test_descriptions, test_results[test_file])
     
+    # Persist outcome history and export the run's metrics once (on the xdist controller, not on every worker)
+    if not hasattr(session.config, "workerinput"):
+        # Only runs that executed tests add outcomes (not --collect-only or an empty selection)
+        if flaky_tracker is not None and session.testscollected and not session.config.option.collectonly:
+            flaky_tracker.save()
+        if api_recorder is not None:
+            api_recorder.export()
+        if modal_recorder is not None:
+            modal_recorder.export()
+        if memory_recorder is not None:
+            memory_recorder.export()
+
     # Clear the results for next run
     test_results.clear()
     test_files_executed.clear()
@@ -31,6 +31,11 @@ allure generate allure-results --clean -o allure-report
 
 if ($LASTEXITCODE -eq 0) {
     Write-Host "`nAllure report generated successfully!" -ForegroundColor Green
+
+    # Place performance metrics exports (--perf-metrics / --api-latency) next to the Allure export
+    if (Test-Path "metrics") {
+        Copy-Item "metrics\*Data.txt" "allure-report\export\" -ErrorAction SilentlyContinue
+    }
     Write-Host "Opening report in browser..." -ForegroundColor Cyan
     
     # Open the report
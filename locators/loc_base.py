@@ -0,0 +1,101 @@
+"""
+Lazy Locator Registry
+Base class for locator classes: definitions are declared once at class level and materialised on first
+access, cached per Playwright page (constructing a page object again reuses the same Locator objects),
+with an introspection API that lists every locator for tooling
+"""
+
+import re
+from typing import Callable, Dict, List
+from playwright.sync_api import Page
+
+_SELECTOR_PATTERN = re.compile(r"selector='(.*)'>$", re.DOTALL)
+
+
+class LazyLocator:
+    """
+    Class-level locator definition, built with the locator class instance on first access
+
+    Example:
+        save_button = LazyLocator(lambda self: self.page.get_by_role("button", name="Save"))
+    """
+
+    def __init__(self, build: Callable):
+        self.build = build
+        self.name = None
+        self.owner = None
+
+    def __set_name__(self, owner, name):
+        self.name = name
+        self.owner = owner
+
+    def __get__(self, instance, owner):
+        if instance is None:
+            return self
+        cache = _page_cache(instance)
+        key = id(self)
+        if key not in cache:
+            cache[key] = self.build(instance)
+        return cache[key]
+
+
+def _page_cache(instance) -> Dict:
+    """Locator cache stored on the page, falling back to the locator class instance"""
+    page = instance.page
+    cache = getattr(page, "_locator_cache", None)
+    if cache is None:
+        cache = {}
+        try:
+            page._locator_cache = cache
+        except AttributeError:
+            cache = instance.__dict__.setdefault("_locator_cache", cache)
+    return cache
+
+
+class LocatorRegistry:
+    """
+    Base class of the locator classes in locators/
+    """
+
+    def __init__(self, page: Page):
+        self.page = page
+
+    @classmethod
+    def definitions(cls) -> Dict[str, LazyLocator]:
+        """All locator definitions of the class (including inherited ones) in declaration order"""
+        found: Dict[str, LazyLocator] = {}
+        for klass in reversed(cls.__mro__):
+            for name, value in vars(klass).items():
+                if isinstance(value, LazyLocator):
+                    found[name] = value
+        return found
+
+    @classmethod
+    def locator_names(cls) -> List[str]:
+        """Names of all locator definitions"""
+        return list(cls.definitions())
+
+    def resolve_all(self) -> Dict[str, object]:
+        """Materialise every definition on this page (locators, or factories for parameterized locators)"""
+        return {name: getattr(self, name) for name in self.definitions()}
+
+    def describe(self) -> List[Dict]:
+        """
+        Machine-readable description of every locator
+
+        Returns:
+            list: {"class", "name", "kind" ("locator" or "factory"), "selector"} per definition
+        """
+        described = []
+        for name, value in self.resolve_all().items():
+            if callable(value) and not hasattr(value, "count"):
+                described.append({"class": type(self).__name__, "name": name, "kind": "factory", "selector": None})
+                continue
+            match = _SELECTOR_PATTERN.search(repr(value))
+            described.append({
+                "class": type(self).__name__,
+                "name": name,
+                "kind": "locator",
+                "selector": match.group(1) if match else repr(value),
+            })
+        return described
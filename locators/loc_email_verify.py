@@ -16,7 +16,7 @@ class EmailVerifyLocators:
         self.otp_input_container = page.locator(".flex.justify-center.gap-2")
         
         # Multiple OTP input selectors for different implementations
-        self.otp_spinbuttons = page.locator('spinbutton')
+        self.otp_spinbuttons = page.get_by_role('spinbutton')
         self.otp_digit_inputs = page.locator('input[maxlength="1"]')
         self.otp_number_inputs = page.locator('input[type="number"]')
         
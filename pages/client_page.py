@@ -5,6 +5,11 @@ Contains all client management functions including login, navigation, CRUD opera
 from playwright.sync_api import Page, expect
 from locators.loc_client import ClientLocators
 from utils.config import BASE_URL
+from utils.web_perf_collector import record_navigation
+from utils.dropdown_driver import DropdownDriver
+from utils.form_fill import FormFiller
+from utils.form_schemas import CLIENT_FORM
+from utils.toast_recorder import expect_toast
 import time
 from functools import wraps
 
@@ -61,6 +66,7 @@ class ClientPage:
         """Navigate to client page from current location."""
         self.locators.client_link.click()
         self.page.wait_for_load_state("networkidle")
+        record_navigation(self.page, "client_list")
     
     def navigate_to_client_page_direct(self, agency_id: str = "173"):
         """
@@ -72,6 +78,7 @@ class ClientPage:
         client_url = f"{BASE_URL}/agency/{agency_id}/client"
         self.page.goto(client_url)
         self.page.wait_for_load_state("networkidle")
+        record_navigation(self.page, "client_list")
         
     
     # ===== CLIENT LIST PAGE FUNCTIONS =====
@@ -199,13 +206,25 @@ class ClientPage:
         Args:
             option_text: The exact text of the option to select
         """
-        self.page.get_by_text(option_text, exact=True).click()
+        DropdownDriver(self.locators.page, self.page).choose_open_option(option_text)
+    
+    def select_from_dropdown(self, trigger, option_text: str, name: str = None):
+        """
+        Open a dropdown and select an option, scoped to the client modal when inside one.
+        
+        Args:
+            trigger: Locator that opens the dropdown
+            option_text: The exact text of the option to select
+            name: Dropdown name for the per-session option cache (omit for data-driven lists like companies)
+        """
+        modal = self.locators.client_modal_body.filter(has=trigger)
+        scope = modal if modal.count() else self.page
+        DropdownDriver(self.locators.page, scope).select(trigger, option_text, name=name)
     
     # ===== CONTACT FIELDS - PHONE =====
     def fill_phone_label(self, label: str):
         """Select phone label from dropdown."""
-        self.locators.phone_label_dropdown.click()
-        self.select_dropdown_option(label)
+        self.select_from_dropdown(self.locators.phone_label_dropdown, label, name="client.phone_label")
     
     def fill_phone_number(self, number: str):
         """Fill phone number field."""
@@ -219,8 +238,7 @@ class ClientPage:
     
     def fill_email_label(self, label: str):
         """Select email label from dropdown."""
-        self.locators.email_label_dropdown.click()
-        self.select_dropdown_option(label)
+        self.select_from_dropdown(self.locators.email_label_dropdown, label, name="client.email_label")
     
     def fill_email(self, email: str):
         """Fill email address field."""
@@ -543,16 +561,16 @@ class ClientPage:
     # ===== SUCCESS MESSAGE EXPECTATIONS =====
     
     def expect_client_created_successfully_message(self):
-        """Verify 'Client created successfully' message is visible."""
-        expect(self.locators.client_created_successfully_message).to_be_visible()
+        """Verify 'Client created successfully' message was shown."""
+        expect_toast(self.page, "Client created successfully")
     
     def expect_client_deleted_successfully_message(self):
-        """Verify 'Client deleted successfully' message is visible."""
-        expect(self.locators.client_deleted_successfully_message).to_be_visible()
+        """Verify 'Client deleted successfully' message was shown."""
+        expect_toast(self.page, "Client deleted successfully")
     
     def expect_note_saved_successfully_message(self):
-        """Verify note saved successfully message is visible."""
-        expect(self.locators.note_saved_successfully_message).to_be_visible()
+        """Verify note saved successfully message was shown."""
+        expect_toast(self.page, "Note saved successfully")
     
     def expect_note_saved_modal_heading(self):
         """Verify Note Saved! modal heading is visible."""
@@ -887,8 +905,7 @@ class ClientPage:
         """
         self.fill_english_first_name(english_first_name)
         self.fill_english_last_name(english_last_name)
-        self.click_company_dropdown()
-        self.select_dropdown_option(company_name)
+        self.select_from_dropdown(self.locators.company_select_trigger, company_name)
         self.fill_email_label(email_label)
         self.fill_email(email)
         self.click_create_button()
@@ -942,59 +959,33 @@ class ClientPage:
             additional_email: Additional email address
             additional_email_label: Additional email label
         """
-        # Fill mandatory fields
-        self.fill_english_first_name(english_first_name)
-        self.fill_english_last_name(english_last_name)
-        
-        # Fill optional basic information
-        if japanese_first_name:
-            self.fill_japanese_first_name(japanese_first_name)
-        if japanese_last_name:
-            self.fill_japanese_last_name(japanese_last_name)
-        
-        if job_title:
-            self.fill_job_title(job_title)
-        
-        # Select gender if provided
-        if gender:
-            self.click_gender_dropdown()
-            self.select_dropdown_option(gender)
-        
-        # Select department if provided
-        if department:
-            self.click_department_dropdown()
-            self.select_dropdown_option(department)
-        
-        # Select company (mandatory)
-        self.click_company_dropdown()
-        self.select_dropdown_option(company_name)
-        
-        # Select language levels if provided
-        if english_level:
-            self.click_english_level_dropdown()
-            self.select_dropdown_option(english_level)
-        
-        if japanese_level:
-            self.click_japanese_level_dropdown()
-            self.select_dropdown_option(japanese_level)
-        
-        # Fill phone contact if provided
+        client_data = {
+            "english_first_name": english_first_name,
+            "english_last_name": english_last_name,
+            "japanese_first_name": japanese_first_name,
+            "japanese_last_name": japanese_last_name,
+            "job_title": job_title,
+            "email": email,
+            "gender": gender,
+            "department": department,
+            "company": company_name,
+            "english_level": english_level,
+            "japanese_level": japanese_level,
+            "email_label": email_label,
+        }
+        # Phone contact is only filled when both label and number are provided
         if phone_label and phone_number:
-            self.fill_phone_label(phone_label)
-            self.fill_phone_number(phone_number)
+            client_data.update({"phone_label": phone_label, "phone_number": phone_number})
         
-        # Fill primary email (mandatory)
-        self.fill_email_label(email_label)
-        self.fill_email(email)
+        # Text fields in one batch, then dropdowns in form order, then one verification read
+        FormFiller(self, scope=self.page).fill(CLIENT_FORM, client_data)
         
         # Add additional email if provided
         if additional_email:
             self.click_add_email_address_button()
             # Fill additional email (you may need to add specific methods for second email)
-            time.sleep(0.5)
             additional_email_label_dropdown = self.page.get_by_text("Label").nth(2)
-            additional_email_label_dropdown.click()
-            self.select_dropdown_option(additional_email_label)
+            self.select_from_dropdown(additional_email_label_dropdown, additional_email_label, name="client.email_label")
             
             additional_email_input = self.page.get_by_placeholder("Email").nth(1)
             additional_email_input.fill(additional_email)
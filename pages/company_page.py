@@ -2,19 +2,37 @@ from playwright.sync_api import Page, expect
 from locators.loc_company import CompanyLocators
 from utils.config import BASE_URL
 from utils.enhanced_assertions import enhanced_assert_visible, enhanced_assert_not_visible
+from utils.web_perf_collector import record_navigation
+from utils.dropdown_driver import DropdownDriver
+from utils.form_fill import FormFiller
+from utils.form_schemas import COMPANY_FORM
+from utils.quiescence import settle
+from utils.toast_recorder import expect_toast, wait_for_toast
 import time
 import re
 
 class CompanyPage:
+    # Input aliases -> exact option text; other values are used as given
+    INDUSTRY_OPTIONS = {
+        "finance": "Finance", "healthcare": "Healthcare", "technology": "Technology",
+        "education": "Education", "retail": "Retail", "information technology": "Information Technology",
+    }
+    HIRING_STATUS_OPTIONS = {"active": "Active", "inactive": "Inactive", "on hold": "On Hold", "recruiting": "Recruiting"}
+    YES_NO_OPTIONS = {"yes": "Yes", "no": "No"}
+    GENDER_OPTIONS = {"male": "Male", "female": "Female"}
+    SKILL_OPTIONS = {"basic": "Basic", "conversational": "Conversational"}
+
     def __init__(self, page: Page):
         self.page = page
         self.locators = CompanyLocators(page)
+        self.dropdowns = DropdownDriver(page)
 
     # ===== NAVIGATION METHODS =====
     def navigate_to_login_page(self, url: str):
         """Navigate to login page and wait for elements to load."""
         self.page.goto(url)
         self.page.wait_for_load_state("networkidle")
+        record_navigation(self.page, "login")
         self.locators.email_input.wait_for()
         self.locators.password_input.wait_for()
 
@@ -31,7 +49,7 @@ class CompanyPage:
             # Final fallback
             company_element = self.page.locator("text=Company").first
             company_element.click()
-            time.sleep(2)
+            settle(self.page)
 
     def click_agency_card(self, agency_name: str = "Test this agency"):
         """Click on an agency card to navigate to agency details."""
@@ -46,7 +64,7 @@ class CompanyPage:
             print(f"Error clicking agency card '{agency_name}': {e}")
             first_agency = self.page.locator("[data-testid='agency-card'], .agency-card").first
             first_agency.click()
-            time.sleep(3)
+            settle(self.page)
 
     # ===== LOGIN METHODS =====
     def click_email_input(self):
@@ -173,7 +191,7 @@ class CompanyPage:
     def click_industry_dropdown(self):
         """Click industry dropdown."""
         self.locators.industry_dropdown.click()
-        time.sleep(1)
+        settle(self.page)
 
     def expect_industry_dropdown(self):
         """Expect industry dropdown to be visible."""
@@ -181,28 +199,14 @@ class CompanyPage:
 
     def select_industry_option(self, industry: str):
         """Select industry from dropdown options."""
-        self.click_industry_dropdown()
-        if industry.lower() == "finance":
-            self.locators.finance_option.click()
-        elif industry.lower() == "healthcare":
-            self.locators.healthcare_option.click()
-        elif industry.lower() == "technology":
-            self.locators.technology_option.click()
-        elif industry.lower() == "education":
-            self.locators.education_option.click()
-        elif industry.lower() == "retail":
-            self.locators.retail_option.click()
-        elif industry.lower() == "information technology":
-            self.locators.information_technology_option.click()
-        else:
-            self.page.get_by_text(industry, exact=True).click()
-        time.sleep(1)
+        option = self.INDUSTRY_OPTIONS.get(industry.lower(), industry)
+        self.dropdowns.select(self.locators.industry_dropdown, option, name="company.industry")
 
     # ===== HIRING STATUS DROPDOWN METHODS =====
     def click_hiring_status_dropdown(self):
         """Click hiring status dropdown."""
         self.locators.hiring_status_dropdown.click()
-        time.sleep(1)
+        settle(self.page)
 
     def expect_hiring_status_dropdown(self):
         """Expect hiring status dropdown to be visible."""
@@ -211,23 +215,8 @@ class CompanyPage:
     def select_hiring_status_option(self, status: str):
         """Select hiring status from dropdown options."""
         try:
-            # Use the exact working locator from browser investigation
-            # Click the hiring status dropdown trigger
-            self.page.locator("div:nth-child(5) > .custom-searchable-select > .searchable-select > .select-trigger > .trigger-content").click()
-            time.sleep(1)  # Wait for dropdown to open
-            
-            # Then click the option using the specific locator pattern that works
-            if status.lower() == "active":
-                self.page.locator("div").filter(has_text=re.compile(r"^Active$")).nth(1).click()
-            elif status.lower() == "inactive":
-                self.page.locator("div").filter(has_text=re.compile(r"^Inactive$")).click()
-            elif status.lower() == "on hold":
-                self.page.locator("div").filter(has_text=re.compile(r"^On Hold$")).click()
-            elif status.lower() == "recruiting":
-                self.page.locator("div").filter(has_text=re.compile(r"^Recruiting$")).click()
-            else:
-                self.page.get_by_text(status, exact=True).click()
-            time.sleep(1)
+            option = self.HIRING_STATUS_OPTIONS.get(status.lower(), status)
+            self.dropdowns.select(self.locators.hiring_status_dropdown, option, name="company.hiring_status")
         except Exception as e:
             print(f"Error selecting hiring status '{status}': {e}")
             raise
@@ -236,7 +225,7 @@ class CompanyPage:
     def click_company_grade_dropdown(self):
         """Click company grade dropdown."""
         self.locators.company_grade_dropdown.click()
-        time.sleep(1)
+        settle(self.page)
 
     def expect_company_grade_dropdown(self):
         """Expect company grade dropdown to be visible."""
@@ -245,14 +234,7 @@ class CompanyPage:
     def select_company_grade_option(self, grade: str):
         """Select company grade from dropdown options."""
         try:
-            # Use the exact working locator from browser investigation
-            # Click the company grade dropdown trigger
-            self.page.locator("div:nth-child(7) > .custom-searchable-select > .searchable-select > .select-trigger").click()
-            time.sleep(1)  # Wait for dropdown to open
-            
-            # Then click the option using get_by_text with exact match
-            self.page.get_by_text(grade, exact=True).click()
-            time.sleep(1)
+            self.dropdowns.select(self.locators.company_grade_dropdown, grade, name="company.grade")
         except Exception as e:
             print(f"Error selecting company grade '{grade}': {e}")
             raise
@@ -261,7 +243,7 @@ class CompanyPage:
     def click_hq_in_japan_dropdown(self):
         """Click HQ in Japan dropdown."""
         self.locators.hq_in_japan_dropdown.click()
-        time.sleep(1)
+        settle(self.page)
 
     def expect_hq_in_japan_dropdown(self):
         """Expect HQ in Japan dropdown to be visible."""
@@ -269,20 +251,14 @@ class CompanyPage:
 
     def select_hq_in_japan_option(self, option: str):
         """Select HQ in Japan option from dropdown."""
-        self.click_hq_in_japan_dropdown()
-        if option.lower() == "yes":
-            self.locators.hq_yes_option.click()
-        elif option.lower() == "no":
-            self.locators.hq_no_option.click()
-        else:
-            self.page.get_by_text(option).click()
-        time.sleep(1)
+        option_text = self.YES_NO_OPTIONS.get(option.lower(), option)
+        self.dropdowns.select(self.locators.hq_in_japan_dropdown, option_text, name="company.hq_in_japan")
 
     # ===== JOB OPENING DROPDOWN METHODS =====
     def click_job_opening_dropdown(self):
         """Click job opening dropdown."""
         self.locators.job_opening_dropdown.click()
-        time.sleep(1)
+        settle(self.page)
 
     def expect_job_opening_dropdown(self):
         """Expect job opening dropdown to be visible."""
@@ -291,20 +267,8 @@ class CompanyPage:
     def select_job_opening_option(self, option: str):
         """Select job opening option from dropdown."""
         try:
-            # Use the exact working locator from browser investigation
-            # Click the job opening dropdown trigger
-            self.page.locator("div:nth-child(9) > .custom-searchable-select > .searchable-select > .select-trigger").click()
-            time.sleep(1)  # Wait for dropdown to open
-            
-            # Then click the option using the specific locator pattern that works
-            if option.lower() == "yes":
-                self.page.locator("div").filter(has_text=re.compile(r"^Yes$")).click()
-            elif option.lower() == "no":
-                self.page.locator("div").filter(has_text=re.compile(r"^No$")).click()
-            else:
-                # Fallback for other values
-                self.page.get_by_text(option, exact=True).click()
-            time.sleep(1)
+            option_text = self.YES_NO_OPTIONS.get(option.lower(), option)
+            self.dropdowns.select(self.locators.job_opening_dropdown, option_text, name="company.job_opening")
         except Exception as e:
             print(f"Error selecting job opening '{option}': {e}")
             raise
@@ -313,7 +277,7 @@ class CompanyPage:
     def click_owner_dropdown(self):
         """Click owner dropdown."""
         self.locators.owner_dropdown.click()
-        time.sleep(1)
+        settle(self.page)
 
     def expect_owner_dropdown(self):
         """Expect owner dropdown to be visible."""
@@ -321,12 +285,7 @@ class CompanyPage:
 
     def select_owner_option(self, owner: str = "test"):
         """Select owner option from dropdown."""
-        self.click_owner_dropdown()
-        if owner.lower() == "test":
-            self.locators.owner_option.click()
-        else:
-            self.page.get_by_text(owner).click()
-        time.sleep(1)
+        self.dropdowns.select(self.locators.owner_dropdown, owner)
 
     # ===== FILE UPLOAD METHODS =====
     def click_upload_logo(self):
@@ -372,7 +331,7 @@ class CompanyPage:
         """Click Add company button (when list is not empty)."""
         try:
             self.locators.add_company_button.click()
-            time.sleep(2)
+            settle(self.page)
         except Exception as e:
             print(f"Error clicking add company button: {e}")
         except Exception as e:
@@ -381,17 +340,17 @@ class CompanyPage:
     def click_create_button(self):
         """Click Create button."""
         self.locators.create_button.click()
-        time.sleep(3)
+        settle(self.page)
 
     def click_save_button(self):
         """Click Save button."""
         self.locators.save_button.click()
-        time.sleep(3)
+        settle(self.page)
 
     def click_update_button(self):
         """Click Update button."""
         self.locators.update_button.click()
-        time.sleep(3)
+        settle(self.page)
 
     def click_cancel_button(self):
         """Click Cancel button."""
@@ -405,69 +364,69 @@ class CompanyPage:
     def click_view_details_button(self):
         """Click View Details button."""
         self.locators.view_details_button.click()
-        time.sleep(2)
+        settle(self.page)
 
     def click_three_dot_menu(self):
         """Click three dot menu."""
         self.locators.three_dot_menu.click()
-        time.sleep(1)
+        settle(self.page)
 
     def click_edit_company_button(self):
         """Click Edit company button."""
         self.locators.edit_company_button.click()
-        time.sleep(2)
+        settle(self.page)
 
     def click_delete_company_button(self):
         """Click Delete company button."""
         self.locators.delete_company_button.click()
-        time.sleep(2)
+        settle(self.page)
 
     # ===== COMPANY PROFILE TAB METHODS =====
     def click_summary_tab(self):
         """Click Summary tab."""
         self.locators.summary_tab.click()
-        time.sleep(2)
+        settle(self.page)
 
     def click_basic_company_info_tab(self):
         """Click Basic company info tab."""
         self.locators.basic_company_info_tab.click()
-        time.sleep(2)
+        settle(self.page)
 
     def click_web_contact_info_tab(self):
         """Click Web & Contact info tab."""
         self.locators.web_contact_info_tab.click()
-        time.sleep(2)
+        settle(self.page)
 
     def click_location_details_tab(self):
         """Click Location details tab."""
         self.locators.location_details_tab.click()
-        time.sleep(2)
+        settle(self.page)
 
     def click_employees_business_info_tab(self):
         """Click Employees & Business info tab."""
         self.locators.employees_business_info_tab.click()
-        time.sleep(2)
+        settle(self.page)
 
     # ===== CLIENT TAB METHODS =====
     def click_client_tab(self):
         """Click Client tab."""
         self.locators.client_tab.click()
-        time.sleep(2)
+        settle(self.page)
 
     def click_add_new_client_button(self):
         """Click Add new client button."""
         self.locators.add_new_client_button.click()
-        time.sleep(2)
+        settle(self.page)
 
     def click_add_client_button(self):
         """Click Add Client button."""
         self.locators.add_client_button.click()
-        time.sleep(2)
+        settle(self.page)
 
     def click_create_client_button(self):
         """Click Create client button."""
         self.locators.create_client_button.click()
-        time.sleep(3)
+        settle(self.page)
 
     # ===== CLIENT FORM INPUT METHODS =====
     def click_client_english_name_input(self):
@@ -570,7 +529,7 @@ class CompanyPage:
     def click_client_gender_dropdown(self):
         """Click client gender dropdown."""
         self.locators.client_gender_dropdown.click()
-        time.sleep(1)
+        settle(self.page)
 
     def expect_client_gender_dropdown(self):
         """Expect client gender dropdown to be visible."""
@@ -578,19 +537,13 @@ class CompanyPage:
 
     def select_client_gender_option(self, gender: str):
         """Select client gender from dropdown options."""
-        self.click_client_gender_dropdown()
-        if gender.lower() == "male":
-            self.locators.client_male_option.click()
-        elif gender.lower() == "female":
-            self.locators.client_female_option.click()
-        else:
-            self.page.get_by_text(gender).click()
-        time.sleep(1)
+        option = self.GENDER_OPTIONS.get(gender.lower(), gender)
+        self.dropdowns.select(self.locators.client_gender_dropdown, option, name="company.client_gender")
 
     def click_client_english_skill_dropdown(self):
         """Click client English skill dropdown."""
         self.locators.client_english_skill_dropdown.click()
-        time.sleep(1)
+        settle(self.page)
 
     def expect_client_english_skill_dropdown(self):
         """Expect client English skill dropdown to be visible."""
@@ -598,17 +551,13 @@ class CompanyPage:
 
     def select_client_english_skill_option(self, skill: str):
         """Select client English skill from dropdown options."""
-        self.click_client_english_skill_dropdown()
-        if skill.lower() == "basic":
-            self.locators.client_basic_option.click()
-        else:
-            self.page.get_by_text(skill).click()
-        time.sleep(1)
+        option = self.SKILL_OPTIONS.get(skill.lower(), skill)
+        self.dropdowns.select(self.locators.client_english_skill_dropdown, option, name="company.client_english_skill")
 
     def click_client_japanese_skill_dropdown(self):
         """Click client Japanese skill dropdown."""
         self.locators.client_japanese_skill_dropdown.click()
-        time.sleep(1)
+        settle(self.page)
 
     def expect_client_japanese_skill_dropdown(self):
         """Expect client Japanese skill dropdown to be visible."""
@@ -616,17 +565,13 @@ class CompanyPage:
 
     def select_client_japanese_skill_option(self, skill: str):
         """Select client Japanese skill from dropdown options."""
-        self.click_client_japanese_skill_dropdown()
-        if skill.lower() == "conversational":
-            self.locators.client_conversational_option.click()
-        else:
-            self.page.get_by_text(skill).click()
-        time.sleep(1)
+        option = self.SKILL_OPTIONS.get(skill.lower(), skill)
+        self.dropdowns.select(self.locators.client_japanese_skill_dropdown, option, name="company.client_japanese_skill")
 
     def click_add_email_button(self):
         """Click Add Email Address button."""
         self.locators.add_email_button.click()
-        time.sleep(1)
+        settle(self.page)
 
     # ===== VALIDATION EXPECTATION METHODS =====
     def expect_company_name_required_validation_error(self, test_name: str = None):
@@ -698,28 +643,28 @@ class CompanyPage:
     # ===== SUCCESS MESSAGE EXPECTATION METHODS =====
     def expect_company_created_successfully_message(self, test_name: str = None):
         """Expect company created successfully message to be visible."""
-        enhanced_assert_visible(self.page, self.locators.company_created_successfully_message, 
-                              "Company created successfully message should be visible", test_name, timeout=10000)
+        expect_toast(self.page, "Company added successfully",
+                     "Company created successfully message should be visible", test_name, timeout=10000)
 
     def expect_company_added_successfully_message(self, test_name: str = None):
         """Expect company added successfully message to be visible."""
-        enhanced_assert_visible(self.page, self.locators.company_added_successfully_message, 
-                              "Company added successfully message should be visible", test_name)
+        expect_toast(self.page, "Company added successfully",
+                     "Company added successfully message should be visible", test_name)
 
     def expect_company_updated_successfully_message(self, test_name: str = None):
         """Expect company updated successfully message to be visible."""
-        enhanced_assert_visible(self.page, self.locators.company_updated_successfully_message, 
-                              "Company updated successfully message should be visible", test_name)
+        expect_toast(self.page, "Company info updated successfully",
+                     "Company updated successfully message should be visible", test_name)
 
     def expect_company_deleted_successfully_message(self, test_name: str = None):
         """Expect company deleted successfully message to be visible."""
-        enhanced_assert_visible(self.page, self.locators.company_deleted_successfully_message, 
-                              "Company deleted successfully message should be visible", test_name)
+        expect_toast(self.page, "Company deleted successfully",
+                     "Company deleted successfully message should be visible", test_name)
 
     def expect_client_created_successfully_message(self, test_name: str = None):
         """Expect client created successfully message to be visible."""
-        enhanced_assert_visible(self.page, self.locators.client_created_successfully_message, 
-                              "Client created successfully message should be visible", test_name)
+        expect_toast(self.page, "Client created successfully",
+                     "Client created successfully message should be visible", test_name)
 
     # ===== PAGE ELEMENT EXPECTATION METHODS =====
     def expect_home_company_heading(self, test_name: str = None):
@@ -768,7 +713,8 @@ class CompanyPage:
     def wait_for_page_load(self, timeout: int = 10000):
         """Wait for page to load completely."""
         self.page.wait_for_load_state("networkidle", timeout=timeout)
-        time.sleep(2)
+        record_navigation(self.page, "company")
+        settle(self.page)
 
     def clear_company_name_input(self):
         """Clear company name input field."""
@@ -804,7 +750,7 @@ class CompanyPage:
         except:
             try:
                 self.page.wait_for_load_state("domcontentloaded", timeout=5000)
-                time.sleep(2)
+                settle(self.page)
             except:
                 time.sleep(3)
 
@@ -823,7 +769,7 @@ class CompanyPage:
             # Fallback
             add_button = self.page.locator("text='Add new company', text='Create new company'").first
             add_button.click()
-            time.sleep(2)
+            settle(self.page)
 
     def verify_breadcrumb_heading(self):
         """Verify that 'Home>Company' breadcrumb is visible."""
@@ -850,40 +796,17 @@ class CompanyPage:
     def select_industry(self, industry: str = "Finance"):
         """Select industry from dropdown."""
         try:
-            # Click dropdown
-            self.locators.industry_dropdown.click()
-            time.sleep(1)
-            
-            # Select industry
-            if industry.lower() == "finance":
-                self.locators.finance_option.click()
-            elif industry.lower() == "healthcare":
-                self.locators.healthcare_option.click()
-            elif industry.lower() == "technology":
-                self.locators.technology_option.click()
-            elif industry.lower() == "education":
-                self.locators.education_option.click()
-            else:
-                # Fallback - select any option with the given text
-                self.page.get_by_text(industry, exact=True).click()
-                
-            time.sleep(1)
+            option = self.INDUSTRY_OPTIONS.get(industry.lower(), industry)
+            self.dropdowns.select(self.locators.industry_dropdown, option, name="company.industry")
         except Exception as e:
             print(f"Error selecting industry '{industry}': {e}")
 
     def fill_optional_fields(self, website: str = None, address: str = None, owner: str = None, division: str = None):
         """Fill optional form fields if provided."""
-        if website:
-            try:
-                self.locators.website_input.fill(website)
-            except:
-                pass
-                
-        if address:
-            try:
-                self.locators.address_input.fill(address)
-            except:
-                pass
+        try:
+            FormFiller(self).fill(COMPANY_FORM, {"website": website, "address": address})
+        except Exception as e:
+            print(f"Error filling optional company fields: {e}")
                 
         if owner:
             try:
@@ -894,7 +817,7 @@ class CompanyPage:
         if division:
             try:
                 self.locators.division_dropdown.click()
-                time.sleep(1)
+                settle(self.page)
                 if division.lower() == "dhaka":
                     self.locators.dhaka_division.click()
                 else:
@@ -922,12 +845,11 @@ class CompanyPage:
         """Verify success message appears."""
         try:
             if message_type == "created":
-                return (self.locators.company_created_successfully_message.is_visible(timeout=10000) or
-                        self.locators.company_added_successfully_message.is_visible(timeout=10000))
+                return wait_for_toast(self.page, "Company added successfully", timeout=10000) is not None
             elif message_type == "updated":
-                return self.locators.company_updated_successfully_message.is_visible(timeout=10000)
+                return wait_for_toast(self.page, "Company info updated successfully", timeout=10000) is not None
             elif message_type == "deleted":
-                return self.locators.company_deleted_successfully_message.is_visible(timeout=10000)
+                return wait_for_toast(self.page, "Company deleted successfully", timeout=10000) is not None
         except:
             return False
 
@@ -1020,7 +942,7 @@ class CompanyPage:
                 parent = company_element.locator('xpath=..')
                 menu_btn = parent.locator(".p-1, [data-testid='menu']").first
                 menu_btn.click()
-                time.sleep(1)
+                settle(self.page)
         except Exception as e:
             print(f"Error clicking three dot menu for company '{company_name}': {e}")
 
@@ -1028,7 +950,7 @@ class CompanyPage:
         """Click edit button from three dot menu."""
         try:
             self.locators.edit_company_button.click()
-            time.sleep(2)
+            settle(self.page)
         except Exception as e:
             print(f"Error clicking edit company button: {e}")
 
@@ -1036,7 +958,7 @@ class CompanyPage:
         """Click delete button from three dot menu."""
         try:
             self.locators.delete_company_button.click()
-            time.sleep(2)
+            settle(self.page)
         except Exception as e:
             print(f"Error clicking delete company button: {e}")
 
@@ -1044,7 +966,7 @@ class CompanyPage:
         """Click the Update button."""
         try:
             self.locators.update_button.click()
-            time.sleep(3)
+            settle(self.page)
         except Exception as e:
             print(f"Error clicking update button: {e}")
 
@@ -1063,7 +985,7 @@ class CompanyPage:
         """Click Add new client button."""
         try:
             self.locators.add_new_client_button.click()
-            time.sleep(2)
+            settle(self.page)
         except Exception as e:
             print(f"Error clicking add new client button: {e}")
 
@@ -1104,7 +1026,7 @@ class CompanyPage:
             # Fallback - just wait for load state
             try:
                 self.page.wait_for_load_state("domcontentloaded", timeout=5000)
-                time.sleep(2)
+                settle(self.page)
             except:
                 time.sleep(3)  # Final fallback
 
@@ -1116,7 +1038,7 @@ class CompanyPage:
             if search_input.count() > 0:
                 search_input.fill(company_name)
                 search_input.press("Enter")
-                time.sleep(2)
+                settle(self.page)
             else:
                 print(f"⚠️ Search input not found, company should be visible in list: {company_name}")
         except Exception as e:
@@ -1143,7 +1065,7 @@ class CompanyPage:
             header_label = self.page.locator("label[for='companySelect']")
             if header_label.count() > 0:
                 header_label.click()
-                time.sleep(2)
+                settle(self.page)
                 print("✅ Clicked select all companies label (for='companySelect')")
                 return True
             
@@ -1152,7 +1074,7 @@ class CompanyPage:
             if len(all_labels) > 0:
                 # Try the first label (header select all)
                 all_labels[0].click()
-                time.sleep(2)
+                settle(self.page)
                 print("✅ Clicked first label (likely header select all)")
                 return True
             
@@ -1160,7 +1082,7 @@ class CompanyPage:
             header_checkbox = self.page.locator("input[type='checkbox']").first
             if header_checkbox.count() > 0:
                 header_checkbox.click(force=True)
-                time.sleep(2)
+                settle(self.page)
                 print("✅ Force clicked header checkbox")
                 return True
                 
@@ -1187,9 +1109,9 @@ class CompanyPage:
                 try:
                     # Scroll into view and click the label
                     label.scroll_into_view_if_needed()
-                    time.sleep(0.5)
+                    settle(self.page)
                     label.click(force=True)  # Force click to avoid interception
-                    time.sleep(0.5)
+                    settle(self.page)
                     selected_count += 1
                     print(f"✅ Selected company {selected_count}/{count}")
                 except Exception as e:
@@ -1218,7 +1140,7 @@ class CompanyPage:
             delete_button = self.locators.bulk_delete_button(expected_count)
             if delete_button.count() > 0:
                 delete_button.click()
-                time.sleep(1)
+                settle(self.page)
                 print(f"✅ Clicked bulk delete button for {expected_count} companies")
                 return True
             else:
@@ -1226,7 +1148,7 @@ class CompanyPage:
                 pattern_button = self.locators.bulk_delete_button_pattern.first
                 if pattern_button.count() > 0:
                     pattern_button.click()
-                    time.sleep(1)
+                    settle(self.page)
                     print(f"✅ Clicked bulk delete button using pattern matcher")
                     return True
                 else:
@@ -1274,7 +1196,7 @@ class CompanyPage:
             confirm_button = self.page.get_by_role("button", name="Confirm")
             if confirm_button.count() > 0:
                 confirm_button.click()
-                time.sleep(3)  # Wait longer for bulk deletion
+                settle(self.page)
                 print(f"✅ Confirmed bulk deletion of {selected_count} companies")
                 
                 # Try multiple success message locators for bulk deletion
@@ -1322,13 +1244,13 @@ class CompanyPage:
                 view_button = company_row.locator("button:has-text('View'), a:has-text('View'), button[title*='View' i]").first
                 if view_button.count() > 0:
                     view_button.click()
-                    time.sleep(2)
+                    settle(self.page)
                 else:
                     # Try alternative selectors
                     view_button = company_row.locator("button, a").filter(has_text="View").first
                     if view_button.count() > 0:
                         view_button.click()
-                        time.sleep(2)
+                        settle(self.page)
         except Exception as e:
             print(f"Error clicking view button for company '{company_name}': {e}")
 
@@ -1338,13 +1260,13 @@ class CompanyPage:
             company_link = self.page.locator(f"a:has-text('{company_name}'), td:has-text('{company_name}') a").first
             if company_link.count() > 0:
                 company_link.click()
-                time.sleep(2)
+                settle(self.page)
             else:
                 # Fallback - click on any text that matches company name
                 company_text = self.page.get_by_text(company_name, exact=True).first
                 if company_text.count() > 0:
                     company_text.click()
-                    time.sleep(2)
+                    settle(self.page)
         except Exception as e:
             print(f"Error clicking company name link for '{company_name}': {e}")
 
@@ -1355,13 +1277,13 @@ class CompanyPage:
             companies_link = self.page.locator("a:has-text('Companies'), a:has-text('Company'), nav a:has-text('Companies')").first
             if companies_link.count() > 0:
                 companies_link.click()
-                time.sleep(2)
+                settle(self.page)
             else:
                 # Alternative approach - look for menu items
                 companies_link = self.page.locator(".nav-link:has-text('Companies'), .menu-item:has-text('Companies')").first
                 if companies_link.count() > 0:
                     companies_link.click()
-                    time.sleep(2)
+                    settle(self.page)
         except Exception as e:
             print(f"Error clicking companies link: {e}")
 
@@ -1498,7 +1420,7 @@ class CompanyPage:
             
             if three_dot_locator.count() > 0:
                 three_dot_locator.click()
-                time.sleep(1)
+                settle(self.page)
                 print(f"✅ Clicked three dot menu for '{company_name}' using global locator")
                 return True
             else:
@@ -1554,7 +1476,7 @@ class CompanyPage:
                     if three_dot_button.count() > 0:
                         print(f"🎯 Found three dot menu button as sibling in company card for '{company_name}'")
                         three_dot_button.click()
-                        time.sleep(2)
+                        settle(self.page)
                         print(f"✅ Clicked three dot menu for '{company_name}'")
                     else:
                         # Fallback: look for any button that has no text (three dot buttons are usually empty)
@@ -1562,14 +1484,14 @@ class CompanyPage:
                         if len(empty_buttons) > 0:
                             # Usually the three dot menu is the last empty button
                             empty_buttons[-1].click()
-                            time.sleep(2)
+                            settle(self.page)
                             print(f"✅ Clicked fallback empty button (three dot menu) for '{company_name}'")
                         else:
                             # Final fallback: click the last button in the card
                             all_buttons = company_card.locator("button").all()
                             if len(all_buttons) > 1:  # Skip "View Details" and click the action button
                                 all_buttons[-1].click()
-                                time.sleep(2)
+                                settle(self.page)
                                 print(f"✅ Clicked last button in company card for '{company_name}' (final fallback)")
                             else:
                                 print(f"❌ No three dot menu button found in company card for '{company_name}'")
@@ -1587,14 +1509,14 @@ class CompanyPage:
             visible_delete_button = self.page.get_by_role("button", name="Delete").locator("visible=true").first
             if visible_delete_button.count() > 0:
                 visible_delete_button.click()
-                time.sleep(1)
+                settle(self.page)
                 print(f"✅ Clicked visible delete button for '{company_name}'")
             else:
                 # Fallback: just click the first delete button
                 delete_button = self.page.get_by_role("button", name="Delete").first
                 if delete_button.count() > 0:
                     delete_button.click()
-                    time.sleep(1)
+                    settle(self.page)
                     print(f"✅ Clicked first delete button for '{company_name}' (fallback)")
                 else:
                     print(f"❌ Delete button not found in menu for '{company_name}'")
@@ -1604,7 +1526,7 @@ class CompanyPage:
             confirm_button = self.page.get_by_role("button", name="Confirm")
             if confirm_button.count() > 0:
                 confirm_button.click()
-                time.sleep(2)
+                settle(self.page)
                 print(f"✅ Confirmed deletion for '{company_name}'")
                 
                 # Let the helper function handle the assertion - don't duplicate here
@@ -1648,7 +1570,7 @@ class CompanyPage:
             # Wait for content to load and be stable
             try:
                 page.wait_for_load_state("domcontentloaded", timeout=5000)
-                time.sleep(1)  # Small wait for content to stabilize
+                settle(self.page)
             except:
                 pass
             
@@ -1684,7 +1606,7 @@ class CompanyPage:
             # If we are here, it means the company wasn't found AND there's a next page.
             print(f"➡️ Company not found on page {current_page}. Moving to next page...")
             next_button.click()
-            time.sleep(2)  # Wait for next page to load
+            settle(self.page)
 
         print(f"❌ Exceeded maximum pages ({max_pages}). Company '{company_name}' was not found.")
         return False
@@ -1694,149 +1616,149 @@ class CompanyPage:
         """Edit company name field in Summary tab."""
         print(f"🔧 Editing company name to: {new_value}")
         self.locators.company_name_edit_icon.click()
-        time.sleep(1)
+        settle(self.page)
         self.locators.edit_company_name_input.clear()
         self.locators.edit_company_name_input.fill(new_value)
         self.locators.edit_modal_save_button.click()
-        time.sleep(2)
+        settle(self.page)
         print(f"✅ Company name updated to: {new_value}")
 
     def edit_web_page_field(self, new_value: str):
         """Edit web page field in Summary tab."""
         print(f"🔧 Editing web page to: {new_value}")
         self.locators.web_page_edit_icon.click()
-        time.sleep(1)
+        settle(self.page)
         self.locators.edit_web_page_input.clear()
         self.locators.edit_web_page_input.fill(new_value)
         self.locators.edit_modal_save_button.click()
-        time.sleep(2)
+        settle(self.page)
         print(f"✅ Web page updated to: {new_value}")
 
     def edit_industry_field(self, new_value: str):
         """Edit industry field in Summary tab."""
         print(f"🔧 Editing industry to: {new_value}")
         self.locators.industry_edit_icon.click()
-        time.sleep(1)
+        settle(self.page)
         self.locators.edit_industry_dropdown.click()
-        time.sleep(1)
+        settle(self.page)
         self.page.get_by_text(new_value, exact=True).click()
         self.locators.edit_modal_save_button.click()
-        time.sleep(2)
+        settle(self.page)
         print(f"✅ Industry updated to: {new_value}")
 
     def edit_hq_in_jpn_field(self, new_value: str):
         """Edit HQ in JPN field in Summary tab."""
         print(f"🔧 Editing HQ in JPN to: {new_value}")
         self.locators.hq_in_jpn_edit_icon.click()
-        time.sleep(1)
+        settle(self.page)
         self.locators.edit_hq_in_jpn_dropdown.click()
-        time.sleep(1)
+        settle(self.page)
         self.page.get_by_text(new_value, exact=True).click()
         self.locators.edit_modal_save_button.click()
-        time.sleep(2)
+        settle(self.page)
         print(f"✅ HQ in JPN updated to: {new_value}")
 
     def edit_global_hq_field(self, new_value: str):
         """Edit Global HQ field in Summary tab."""
         print(f"🔧 Editing Global HQ to: {new_value}")
         self.locators.global_hq_edit_icon.click()
-        time.sleep(1)
+        settle(self.page)
         self.locators.edit_global_hq_input.clear()
         self.locators.edit_global_hq_input.fill(new_value)
         self.locators.edit_modal_save_button.click()
-        time.sleep(2)
+        settle(self.page)
         print(f"✅ Global HQ updated to: {new_value}")
 
     def edit_country_of_origin_field(self, new_value: str):
         """Edit Country of origin field in Summary tab."""
         print(f"🔧 Editing Country of origin to: {new_value}")
         self.locators.country_of_origin_edit_icon.click()
-        time.sleep(1)
+        settle(self.page)
         self.locators.edit_country_of_origin_input.clear()
         self.locators.edit_country_of_origin_input.fill(new_value)
         self.locators.edit_modal_save_button.click()
-        time.sleep(2)
+        settle(self.page)
         print(f"✅ Country of origin updated to: {new_value}")
 
     def edit_company_address_field(self, new_value: str):
         """Edit Company address field in Summary tab."""
         print(f"🔧 Editing Company address to: {new_value}")
         self.locators.company_address_edit_icon.click()
-        time.sleep(1)
+        settle(self.page)
         self.locators.edit_company_address_input.clear()
         self.locators.edit_company_address_input.fill(new_value)
         self.locators.edit_modal_save_button.click()
-        time.sleep(2)
+        settle(self.page)
         print(f"✅ Company address updated to: {new_value}")
 
     def edit_company_hiring_status_field(self, new_value: str):
         """Edit Company hiring status field in Summary tab."""
         print(f"🔧 Editing Company hiring status to: {new_value}")
         self.locators.company_hiring_status_edit_icon.click()
-        time.sleep(1)
+        settle(self.page)
         self.locators.edit_company_hiring_status_dropdown.click()
-        time.sleep(1)
+        settle(self.page)
         self.page.get_by_text(new_value, exact=True).click()
         self.locators.edit_modal_save_button.click()
-        time.sleep(2)
+        settle(self.page)
         print(f"✅ Company hiring status updated to: {new_value}")
 
     def edit_job_opening_field(self, new_value: str):
         """Edit Job opening field in Summary tab."""
         print(f"🔧 Editing Job opening to: {new_value}")
         self.locators.job_opening_edit_icon.click()
-        time.sleep(1)
+        settle(self.page)
         self.locators.edit_job_opening_dropdown.click()
-        time.sleep(1)
+        settle(self.page)
         self.page.get_by_text(new_value, exact=True).click()
         self.locators.edit_modal_save_button.click()
-        time.sleep(2)
+        settle(self.page)
         print(f"✅ Job opening updated to: {new_value}")
 
     def edit_total_employees_jpn_field(self, new_value: str):
         """Edit Total employees JPN field in Summary tab."""
         print(f"🔧 Editing Total employees JPN to: {new_value}")
         self.locators.total_employees_jpn_edit_icon.click()
-        time.sleep(1)
+        settle(self.page)
         self.locators.edit_total_employees_jpn_input.clear()
         self.locators.edit_total_employees_jpn_input.fill(new_value)
         self.locators.edit_modal_save_button.click()
-        time.sleep(2)
+        settle(self.page)
         print(f"✅ Total employees JPN updated to: {new_value}")
 
     def edit_company_grade_field(self, new_value: str):
         """Edit Company grade field in Summary tab."""
         print(f"🔧 Editing Company grade to: {new_value}")
         self.locators.company_grade_edit_icon.click()
-        time.sleep(1)
+        settle(self.page)
         self.locators.edit_company_grade_dropdown.click()
-        time.sleep(1)
+        settle(self.page)
         self.page.get_by_text(new_value, exact=True).click()
         self.locators.edit_modal_save_button.click()
-        time.sleep(2)
+        settle(self.page)
         print(f"✅ Company grade updated to: {new_value}")
 
     def edit_company_client_owner_field(self, new_value: str):
         """Edit Company client owner field in Summary tab."""
         print(f"🔧 Editing Company client owner to: {new_value}")
         self.locators.company_client_owner_edit_icon.click()
-        time.sleep(1)
+        settle(self.page)
         self.locators.edit_company_client_owner_dropdown.click()
-        time.sleep(1)
+        settle(self.page)
         self.page.get_by_text(new_value, exact=True).click()
         self.locators.edit_modal_save_button.click()
-        time.sleep(2)
+        settle(self.page)
         print(f"✅ Company client owner updated to: {new_value}")
 
     def edit_telephone_field(self, new_value: str):
         """Edit Telephone field in Summary tab."""
         print(f"🔧 Editing Telephone to: {new_value}")
         self.locators.telephone_edit_icon.click()
-        time.sleep(1)
+        settle(self.page)
         self.locators.edit_telephone_input.clear()
         self.locators.edit_telephone_input.fill(new_value)
         self.locators.edit_modal_save_button.click()
-        time.sleep(2)
+        settle(self.page)
         print(f"✅ Telephone updated to: {new_value}")
 
     def get_company_name_display_value(self):
@@ -6,12 +6,18 @@ from mailosaur import MailosaurClient
 
 from locators.loc_email_verify import EmailVerifyLocators
 from utils import email_verify_helper
+from utils.otp_driver import OtpDriver
 
 class EmailVerifyPage:
     
     def __init__(self, page: Page):
         self.page = page
         self.locators = EmailVerifyLocators(page)
+        self.otp = OtpDriver(page, [
+            ("spinbuttons", self.locators.otp_spinbuttons),
+            ("digit_inputs", self.locators.otp_digit_inputs),
+            ("number_inputs", self.locators.otp_number_inputs),
+        ], name="email_verify.otp")
     
     # Navigation and Page Verification
     def expect_verification_page_visible(self):
@@ -34,78 +40,12 @@ class EmailVerifyPage:
     
     # OTP Input Operations
     def enter_otp_code(self, otp_code: str):
-        time.sleep(2)  # Wait for page to fully load
-        
-        # Method 1: Try spinbutton inputs
-        try:
-            self.page.wait_for_selector('spinbutton', timeout=5000)
-            if self.locators.otp_spinbuttons.count() >= 6:
-                for i, digit in enumerate(otp_code[:6]):
-                    self.locators.otp_spinbuttons.nth(i).fill(digit)
-                    time.sleep(0.2)
-                return
-        except Exception:
-            pass
-        
-        # Method 2: Try digit input fields
-        try:
-            if self.locators.otp_digit_inputs.count() >= 6:
-                for i, digit in enumerate(otp_code[:6]):
-                    self.locators.otp_digit_inputs.nth(i).fill(digit)
-                    time.sleep(0.2)
-                return
-        except Exception:
-            pass
-        
-        # Method 3: Try number input fields
-        try:
-            if self.locators.otp_number_inputs.count() >= 6:
-                for i, digit in enumerate(otp_code[:6]):
-                    self.locators.otp_number_inputs.nth(i).fill(digit)
-                    time.sleep(0.2)
-                return
-        except Exception:
-            pass
+        """Enter the whole code in one operation and verify it with one read (raises OtpEntryError otherwise)"""
+        self.otp.enter(otp_code)
     
     def clear_otp_fields_by_backspace(self):
-        time.sleep(1)
-        
-        # Method 1: Try spinbutton inputs
-        try:
-            if self.locators.otp_spinbuttons.count() >= 6:
-                # Click the 6th (last) box
-                self.locators.otp_spinbuttons.nth(5).click()
-                # Press backspace multiple times to clear all fields
-                for i in range(6):
-                    self.page.keyboard.press("Backspace")
-                    time.sleep(0.05)
-                return True
-        except Exception:
-            pass
-        
-        # Method 2: Try digit input fields
-        try:
-            if self.locators.otp_digit_inputs.count() >= 6:
-                self.locators.otp_digit_inputs.nth(5).click()
-                for i in range(6):
-                    self.page.keyboard.press("Backspace")
-                    time.sleep(0.05)
-                return True
-        except Exception:
-            pass
-        
-        # Method 3: Try number input fields
-        try:
-            if self.locators.otp_number_inputs.count() >= 6:
-                self.locators.otp_number_inputs.nth(5).click()
-                for i in range(6):
-                    self.page.keyboard.press("Backspace")
-                    time.sleep(0.05)
-                return True
-        except Exception:
-            pass
-        
-        return False
+        """Clear all OTP boxes in one operation, backspace sequence as fallback (raises OtpEntryError otherwise)"""
+        self.otp.clear()
 
     # Button Actions
     def click_verify_button(self):
@@ -7,13 +7,26 @@ from playwright.sync_api import Page, expect
 from locators.loc_jd import JDLocators
 from utils.config import BASE_URL
 from utils.enhanced_assertions import enhanced_assert_visible, enhanced_assert_not_visible
+from utils.web_perf_collector import record_navigation
+from utils.dropdown_driver import DropdownDriver
+from utils.form_fill import FormFiller
+from utils.form_schemas import JD_FORM
+from utils.strategy_resolver import run_strategies, resolve_locator, StrategyResolutionError
+from utils.quiescence import settle
+from utils.toast_recorder import expect_toast, wait_for_toast, recorded_toasts
+from utils.modal_tracker import wait_for_modal_open, wait_for_modal_closed, open_modals
 import time
 
+STRATEGY_TIMEOUT = 5000  # Max wait of a fallback strategy before the next one is tried
+JD_MODAL_NAME = "Add New JD"  # Heading of the JD creation modal, as seen by the modal tracker
+
 
 class JDPage:
     def __init__(self, page: Page):
         self.page = page
         self.locators = JDLocators(page)
+        self.dropdowns = DropdownDriver(page)
+        self.modal_dropdowns = DropdownDriver(page, self.locators.jd_modal_body)
 
     # ===== NAVIGATION METHODS =====
     def navigate_to_jd_page(self, agency_id: str):
@@ -21,12 +34,14 @@ class JDPage:
         url = self.locators.jd_page_url.format(agency_id=agency_id)
         self.page.goto(url)
         self.page.wait_for_load_state("networkidle")
-        time.sleep(2)  # Allow page to fully load
+        record_navigation(self.page, "jd_list")
+        settle(self.page)
 
     def navigate_to_login_page(self, url: str):
         """Navigate to login page"""
         self.page.goto(url)
         self.page.wait_for_load_state("networkidle")
+        record_navigation(self.page, "login")
 
     def verify_jd_page_url(self, agency_id: str):
         """Verify that we're on the correct JD page"""
@@ -38,7 +53,7 @@ class JDPage:
     def click_add_jd(self):
         """Click Add JD button to open creation modal"""
         self.locators.add_jd_button.click()
-        time.sleep(1)
+        settle(self.page)
 
     def expect_jd_modal_heading(self):
         """Verify JD creation modal heading is visible"""
@@ -53,7 +68,7 @@ class JDPage:
     def close_jd_modal(self):
         """Close JD modal using close button"""
         self.locators.close_modal_button.click()
-        time.sleep(1)
+        settle(self.page)
 
     def expect_no_jd_modal(self):
         """Verify JD modal is not visible"""
@@ -67,27 +82,19 @@ class JDPage:
 
     def wait_for_modal_to_open(self, timeout: int = 5000):
         """Wait for JD modal to open and become visible"""
-        try:
-            self.locators.jd_modal_heading.wait_for(state="visible", timeout=timeout)
-            return True
-        except:
-            return False
+        return wait_for_modal_open(self.page, JD_MODAL_NAME, timeout=timeout) is not None
 
     def wait_for_modal_to_close(self, timeout: int = 5000):
         """Wait for JD modal to close and become hidden"""
-        try:
-            self.locators.jd_modal_heading.wait_for(state="hidden", timeout=timeout)
-            return True
-        except:
-            return False
+        return wait_for_modal_closed(self.page, JD_MODAL_NAME, timeout=timeout)
 
     def is_modal_open(self) -> bool:
         """Check if JD modal is currently open"""
-        return self.locators.jd_modal_heading.count() > 0
+        return bool(open_modals(self.page, JD_MODAL_NAME))
 
     def is_modal_closed(self) -> bool:
         """Check if JD modal is currently closed"""
-        return self.locators.jd_modal_heading.count() == 0
+        return not open_modals(self.page, JD_MODAL_NAME)
 
     def expect_modal_remains_open_after_validation_error(self):
         """Verify modal stays open when validation errors occur"""
@@ -156,25 +163,29 @@ class JDPage:
         self.locators.job_function_input.fill(job_function)
 
     # ===== DROPDOWN SELECTION METHODS =====
+    # Input aliases -> exact option text; unknown values fall back to the first entry's default
+    WORK_STYLE_OPTIONS = {"remote": "Remote", "on-site": "On-site", "onsite": "On-site", "hybrid": "Hybrid"}
+    CURRENCY_OPTIONS = {"USD": "USD ($)", "EUR": "EUR (€)", "GBP": "GBP (£)", "JPY": "JPY (¥)"}
+    LANGUAGE_LEVEL_OPTIONS = {
+        "native or bilingual": "Native or Bilingual", "native": "Native or Bilingual",
+        "full professional": "Full Professional", "professional working": "Professional Working",
+        "limited working": "Limited Working", "elementary": "Elementary",
+    }
+    PRIORITY_GRADE_OPTIONS = {"AAA": "AAA", "AA": "AA", "A": "A", "BBB": "BBB", "BB": "BB"}
+    HIRING_STATUS_OPTIONS = {"open": "Open", "urgent": "Urgent", "closed": "Closed"}
+    EMPLOYMENT_TYPE_OPTIONS = {
+        "part-time": "Part-time", "parttime": "Part-time", "permanent": "Permanent",
+        "self-employed": "Self-employed", "freelance": "Freelance", "contract": "Contract",
+        "internship": "Internship", "apprenticeship": "Apprenticeship", "indirect contract": "Indirect Contract",
+    }
+
     def select_company(self, company_name: str):
         """Select company from dropdown"""
         print(f"🔧 Selecting company: {company_name}")
         
         try:
-            # Wait for the company dropdown to be visible first
             self.locators.company_dropdown.wait_for(state="visible", timeout=5000)
-            print("✅ Company dropdown is visible")
-            
-            # Click the chevron to open dropdown
-            self.locators.company_dropdown.click()
-            print("✅ Clicked company dropdown")
-            time.sleep(2)
-            
-            # Wait for and click the company option
-            self.locators.company_option(company_name).wait_for(state="visible", timeout=5000)
-            self.locators.company_option(company_name).click()
-            print(f"✅ Selected company: {company_name}")
-            
+            self.dropdowns.select(self.locators.company_dropdown, company_name)
         except Exception as e:
             print(f"❌ Error selecting company: {e}")
             raise
@@ -184,32 +195,10 @@ class JDPage:
         print(f"🔧 Selecting work style: {work_style}")
         
         try:
-            # Wait for the work style dropdown to be visible first
             self.locators.work_style_dropdown.wait_for(state="visible", timeout=5000)
-            print("✅ Work style dropdown is visible")
-            
-            # Click the chevron to open dropdown
-            self.locators.work_style_dropdown.click()
-            print("✅ Clicked work style dropdown")
-            time.sleep(2)  # Wait for dropdown to open
-            
-            # Select work style using exact text match and .first to avoid conflicts
-            if work_style.lower() == "remote":
-                self.page.get_by_text("Remote", exact=True).first.click(timeout=10000)
-                print("✅ Selected Remote work style")
-            elif work_style.lower() == "on-site" or work_style.lower() == "onsite":
-                self.page.get_by_text("On-site", exact=True).first.click(timeout=10000)
-                print("✅ Selected On-site work style")
-            elif work_style.lower() == "hybrid":
-                self.page.get_by_text("Hybrid", exact=True).first.click(timeout=10000)
-                print("✅ Selected Hybrid work style")
-            else:
-                # Default to Remote if not recognized
-                self.page.get_by_text("Remote", exact=True).first.click(timeout=10000)
-                print("✅ Selected Remote work style (default)")
-            
-            time.sleep(0.5)  # Wait for selection to register
-            
+            # Default to Remote if not recognized
+            option = self.WORK_STYLE_OPTIONS.get(work_style.lower(), "Remote")
+            self.dropdowns.select(self.locators.work_style_dropdown, option, name="jd.work_style")
         except Exception as e:
             print(f"❌ Error selecting work style: {e}")
             raise
@@ -218,25 +207,10 @@ class JDPage:
         """Select currency from dropdown
         Available options: USD ($), EUR (€), GBP (£), JPY (¥)
         """
-        self.locators.currency_dropdown.click()
-        time.sleep(2)  # Wait for dropdown to open
-        
-        currency_upper = currency.upper()
-        
+        # Default to USD if not recognized
+        option = self.CURRENCY_OPTIONS.get(currency.upper(), "USD ($)")
         try:
-            # Dropdowns close after selection, so use .first for the visible option
-            if currency_upper == "USD":
-                self.page.get_by_text("USD ($)", exact=True).first.click(timeout=10000)
-            elif currency_upper == "EUR":
-                self.page.get_by_text("EUR (€)", exact=True).first.click(timeout=10000)
-            elif currency_upper == "GBP":
-                self.page.get_by_text("GBP (£)", exact=True).first.click(timeout=10000)
-            elif currency_upper == "JPY":
-                self.page.get_by_text("JPY (¥)", exact=True).first.click(timeout=10000)
-            else:
-                # Default to USD if not recognized
-                self.page.get_by_text("USD ($)", exact=True).first.click(timeout=10000)
-            time.sleep(0.5)  # Wait for selection to register
+            self.dropdowns.select(self.locators.currency_dropdown, option, name="jd.currency")
         except Exception as e:
             print(f"⚠️ Could not select currency: {currency}, error: {e}")
 
@@ -245,30 +219,10 @@ class JDPage:
         Available options: Elementary, Limited Working, Professional Working, Full Professional, Native or Bilingual
         """
         print(f"🔧 Selecting Japanese level: {level}")
-        self.locators.japanese_level_dropdown.click()
-        time.sleep(2)  # Wait for dropdown to open
-        level_lower = level.lower()
-        
-        # Scope selection to within the modal only
-        modal = self.locators.jd_modal_body
-        
+        # Default to Elementary
+        option = self.LANGUAGE_LEVEL_OPTIONS.get(level.lower(), "Elementary")
         try:
-            # Select from within the modal only
-            if level_lower == "native or bilingual" or level_lower == "native":
-                modal.get_by_text("Native or Bilingual", exact=True).first.click(timeout=10000)
-            elif level_lower == "full professional":
-                modal.get_by_text("Full Professional", exact=True).first.click(timeout=10000)
-            elif level_lower == "professional working":
-                modal.get_by_text("Professional Working", exact=True).first.click(timeout=10000)
-            elif level_lower == "limited working":
-                modal.get_by_text("Limited Working", exact=True).first.click(timeout=10000)
-            elif level_lower == "elementary":
-                modal.get_by_text("Elementary", exact=True).first.click(timeout=10000)
-            else:
-                # Default to Elementary
-                modal.get_by_text("Elementary", exact=True).first.click(timeout=10000)
-            print(f"✅ Selected Japanese level: {level}")
-            time.sleep(0.5)  # Wait for selection to register
+            self.modal_dropdowns.select(self.locators.japanese_level_dropdown, option, name="jd.japanese_level")
         except Exception as e:
             print(f"⚠️ Could not select Japanese level: {level}, error: {e}")
 
@@ -277,136 +231,42 @@ class JDPage:
         Available options: Elementary, Limited Working, Professional Working, Full Professional, Native or Bilingual
         """
         print(f"🔧 Selecting English level: {level}")
-        self.locators.english_level_dropdown.click()
-        time.sleep(2)  # Wait for dropdown to open
-        level_lower = level.lower()
-        
-        modal = self.locators.jd_modal_body
-        # Scope selection to within the modal only
-        
+        # Default to Elementary
+        option = self.LANGUAGE_LEVEL_OPTIONS.get(level.lower(), "Elementary")
         try:
-            # Select from within the modal only
-            if level_lower == "native or bilingual" or level_lower == "native":
-                modal.get_by_text("Native or Bilingual", exact=True).first.click(timeout=10000)
-            elif level_lower == "full professional":
-                modal.get_by_text("Full Professional", exact=True).first.click(timeout=10000)
-            elif level_lower == "professional working":
-                modal.get_by_text("Professional Working", exact=True).first.click(timeout=10000)
-            elif level_lower == "limited working":
-                modal.get_by_text("Limited Working", exact=True).first.click(timeout=10000)
-            elif level_lower == "elementary":
-                modal.get_by_text("Elementary", exact=True).first.click(timeout=10000)
-            else:
-                # Default to Elementary
-                modal.get_by_text("Elementary", exact=True).first.click(timeout=10000)
-            print(f"✅ Selected English level: {level}")
-            time.sleep(0.5)  # Wait for selection to register
+            self.modal_dropdowns.select(self.locators.english_level_dropdown, option, name="jd.english_level")
         except Exception as e:
             print(f"⚠️ Could not select English level: {level}, error: {e}")
 
     def select_priority_grade(self, priority: str):
         """Select priority grade from dropdown"""
         print(f"🔧 Selecting Priority Grade: {priority}")
-        
-        # Scroll to priority grade field to ensure it's visible
-        self.locators.priority_grade_dropdown.scroll_into_view_if_needed()
-        time.sleep(1)
-        
-        self.locators.priority_grade_dropdown.click()
-        time.sleep(2)  # Wait for dropdown to open and load all options
-        
-        # Scope selection to within the modal only
-        modal = self.locators.jd_modal_body
-        
-        priority_upper = priority.upper()
-        
+        # Default to A if not recognized
+        option = self.PRIORITY_GRADE_OPTIONS.get(priority.upper(), "A")
         try:
-            # Select from within the modal only
-            if priority_upper == "AAA":
-                modal.get_by_text("AAA", exact=True).first.click(timeout=10000)
-            elif priority_upper == "AA":
-                modal.get_by_text("AA", exact=True).first.click(timeout=10000)
-            elif priority_upper == "A":
-                modal.get_by_text("A", exact=True).first.click(timeout=10000)
-            elif priority_upper == "BBB":
-                modal.get_by_text("BBB", exact=True).first.click(timeout=10000)
-            elif priority_upper == "BB":
-                modal.get_by_text("BB", exact=True).first.click(timeout=10000)
-            else:
-                # Default to A if not recognized
-                modal.get_by_text("A", exact=True).first.click(timeout=10000)
-            print(f"✅ Selected Priority Grade: {priority}")
-            time.sleep(0.5)  # Wait for selection to register
+            self.locators.priority_grade_dropdown.scroll_into_view_if_needed()
+            self.modal_dropdowns.select(self.locators.priority_grade_dropdown, option, name="jd.priority_grade")
         except Exception as e:
             print(f"⚠️ Could not select Priority Grade: {priority}, error: {e}")
 
     def select_hiring_status(self, status: str):
         """Select hiring status from dropdown"""
         print(f"🔧 Selecting Hiring Status: {status}")
-        self.locators.hiring_status_dropdown.scroll_into_view_if_needed()
-        time.sleep(1)
-        
-        self.locators.hiring_status_dropdown.click()
-        time.sleep(2)  # Wait for dropdown to open and load all options
-        
-        # Scope selection to within the modal only
-        modal = self.locators.jd_modal_body
-        
-        status_lower = status.lower()
-        
+        # Default to Open if not recognized
+        option = self.HIRING_STATUS_OPTIONS.get(status.lower(), "Open")
         try:
-            # Select from within the modal only
-            if status_lower == "open":
-                modal.get_by_text("Open", exact=True).first.click(timeout=10000)
-            elif status_lower == "urgent":
-                modal.get_by_text("Urgent", exact=True).first.click(timeout=10000)
-            elif status_lower == "closed":
-                modal.get_by_text("Closed", exact=True).first.click(timeout=10000)
-            else:
-                # Default to Open if not recognized
-                modal.get_by_text("Open", exact=True).first.click(timeout=10000)
-            print(f"✅ Selected Hiring Status: {status}")
-            time.sleep(0.5)  # Wait for selection to register
+            self.locators.hiring_status_dropdown.scroll_into_view_if_needed()
+            self.modal_dropdowns.select(self.locators.hiring_status_dropdown, option, name="jd.hiring_status")
         except Exception as e:
             print(f"⚠️ Could not select Hiring Status: {status}, error: {e}")
 
     def select_employment_type(self, employment_type: str):
         """Select employment type from dropdown"""
         print(f"🔧 Selecting Employment Type: {employment_type}")
-        # self.locators.employment_type_dropdown.scroll_into_view_if_needed()
-        time.sleep(1)
-        
-        self.locators.employment_type_dropdown.click()
-        time.sleep(2)  # Wait for dropdown to open and load all options
-        
-        # Scope selection to within the modal only
-        modal = self.locators.jd_modal_body
-        
-        type_lower = employment_type.lower()
-        
+        # Default to Permanent if not recognized
+        option = self.EMPLOYMENT_TYPE_OPTIONS.get(employment_type.lower(), "Permanent")
         try:
-            # Select from within the modal only
-            if type_lower == "part-time" or type_lower == "parttime":
-                modal.get_by_text("Part-time", exact=True).first.click(timeout=10000)
-            elif type_lower == "permanent":
-                modal.get_by_text("Permanent", exact=True).first.click(timeout=10000)
-            elif type_lower == "self-employed":
-                modal.get_by_text("Self-employed", exact=True).first.click(timeout=10000)
-            elif type_lower == "freelance":
-                modal.get_by_text("Freelance", exact=True).first.click(timeout=10000)
-            elif type_lower == "contract":
-                modal.get_by_text("Contract", exact=True).first.click(timeout=10000)
-            elif type_lower == "internship":
-                modal.get_by_text("Internship", exact=True).first.click(timeout=10000)
-            elif type_lower == "apprenticeship":
-                modal.get_by_text("Apprenticeship", exact=True).first.click(timeout=10000)
-            elif type_lower == "indirect contract":
-                modal.get_by_text("Indirect Contract", exact=True).first.click(timeout=10000)
-            else:
-                # Default to Permanent if not recognized
-                modal.get_by_text("Permanent", exact=True).first.click(timeout=10000)
-            print(f"✅ Selected Employment Type: {employment_type}")
-            time.sleep(0.5)  # Wait for selection to register
+            self.modal_dropdowns.select(self.locators.employment_type_dropdown, option, name="jd.employment_type")
         except Exception as e:
             print(f"⚠️ Could not select Employment Type: {employment_type}, error: {e}")
 
@@ -417,21 +277,9 @@ class JDPage:
         """
         print(f"🔧 Selecting client from dropdown")
         
-        # Scroll to client dropdown to ensure visibility
-        # self.locators.client_dropdown.scroll_into_view_if_needed()
-        time.sleep(1)
-        
         try:
-            # Click to open dropdown
-            self.locators.client_dropdown.click()
-            print("✅ Clicked client dropdown")
-            time.sleep(2)  # Wait for dropdown to open and load options
-            
             # Use the known client option "client new" - this is always available
-            self.page.get_by_text("client new", exact=True).first.click(timeout=10000)
-            print(f"✅ Selected client: client new")
-            time.sleep(0.5)  # Wait for selection to register
-                
+            self.dropdowns.select(self.locators.client_dropdown, "client new")
         except Exception as e:
             print(f"❌ Could not select client: {e}")
             raise
@@ -440,22 +288,22 @@ class JDPage:
     def save_jd(self):
         """Save JD form"""
         self.locators.save_button.click()
-        time.sleep(2)
+        settle(self.page)
 
     def update_jd(self):
         """Update JD form"""
         self.locators.update_button.click()
-        time.sleep(2)
+        settle(self.page)
 
     def cancel_jd_operation(self):
         """Cancel JD creation/editing"""
         self.locators.cancel_button.click()
-        time.sleep(1)
+        settle(self.page)
 
     def attempt_save_with_validation_errors(self):
         """Attempt to save JD form to trigger validation errors"""
         self.locators.save_button.click()
-        time.sleep(1)  # Allow validation errors to appear
+        settle(self.page)
 
     def trigger_mandatory_field_validation(self):
         """Trigger validation by attempting to save empty mandatory fields"""
@@ -507,7 +355,7 @@ class JDPage:
     def scroll_down(self, y=500):
         """Scroll down the JD modal to reveal hidden fields/buttons"""
         self.page.evaluate(f"window.scrollBy(0, {y});")
-        time.sleep(1)
+        settle(self.page)
 
     def scroll_into_view_if_needed(self, locator=None):
         """Scroll to make sure the element is in view"""
@@ -517,103 +365,50 @@ class JDPage:
 
     # ===== COMPREHENSIVE FORM FILLING METHOD =====
     def fill_jd_form(self, jd_data: dict):
-        """Fill JD form with provided data dictionary"""
-        # Fill mandatory fields
-        if "position_title" in jd_data:
-            self.fill_position_job_title(jd_data["position_title"])
-        
-        if "company" in jd_data:
-            self.select_company(jd_data["company"])
-        
-        if "work_style" in jd_data:
-            self.select_work_style(jd_data["work_style"])
-        
-        if "workplace" in jd_data:
-            self.fill_jd_workplace(jd_data["workplace"])
-        
-        # Fill optional fields if provided
-        if "min_salary" in jd_data and jd_data["min_salary"]:
-            self.fill_minimum_salary(jd_data["min_salary"])
-        
-        if "max_salary" in jd_data and jd_data["max_salary"]:
-            self.fill_maximum_salary(jd_data["max_salary"])
-        
-        if "currency" in jd_data and jd_data["currency"]:
-            self.select_currency(jd_data["currency"])
-        
-        if "job_age_min" in jd_data and jd_data["job_age_min"]:
-            self.fill_job_age_min(jd_data["job_age_min"])
-        
-        if "job_age_max" in jd_data and jd_data["job_age_max"]:
-            self.fill_job_age_max(jd_data["job_age_max"])
-        
-        if "target_age_min" in jd_data and jd_data["target_age_min"]:
-            self.fill_target_age_min(jd_data["target_age_min"])
-        
-        if "target_age_max" in jd_data and jd_data["target_age_max"]:
-            self.fill_target_age_max(jd_data["target_age_max"])
-            self.scroll_into_view_if_needed(self.locators.save_button)
-        
-        if "japanese_level" in jd_data and jd_data["japanese_level"]:
-            self.select_japanese_level(jd_data["japanese_level"])
-        
-        if "english_level" in jd_data and jd_data["english_level"]:
-            self.select_english_level(jd_data["english_level"])
-        
-        if "priority_grade" in jd_data and jd_data["priority_grade"]:
-            self.select_priority_grade(jd_data["priority_grade"])
-
-        # Mandatory to select client after company
-        if "client" in jd_data and jd_data["client"]:
-            self.select_client(jd_data["client"])
-        
-        if "hiring_status" in jd_data and jd_data["hiring_status"]:
-            self.select_hiring_status(jd_data["hiring_status"])
-        
-        if "employment_type" in jd_data and jd_data["employment_type"]:
-            self.select_employment_type(jd_data["employment_type"])
-        
-        if "department" in jd_data and jd_data["department"]:
-            self.fill_department(jd_data["department"])
-        
-        if "direct_report" in jd_data and jd_data["direct_report"]:
-            self.fill_direct_report(jd_data["direct_report"])
-        
-        if "job_function" in jd_data and jd_data["job_function"]:
-            self.fill_job_function(jd_data["job_function"])
-
+        """Fill JD form with provided data dictionary
+        Text fields are set in one batch, then dropdowns in form order (client after company),
+        then the text values are verified with a single read
+        """
+        modal = self.locators.jd_modal_body.filter(has=self.locators.position_job_title_input)
+        return FormFiller(self, scope=modal).fill(JD_FORM, jd_data)
 
     # ===== FILE UPLOAD METHODS =====
     def upload_jd_file(self, file_path: str):
-        """Upload JD file"""
-        try:
-            # Try to use the file input directly
+        """Upload JD file (direct file input, or click the upload area first - memoized per route)"""
+        def via_file_input():
+            self.locators.file_upload_input.first.set_input_files(file_path, timeout=STRATEGY_TIMEOUT)
+
+        def via_upload_area():
+            self.locators.upload_jd_file_area.click()
             self.locators.file_upload_input.first.set_input_files(file_path)
-        except Exception as e:
-            # Alternative approach - click upload area first
-            try:
-                self.locators.upload_jd_file_area.click()
-                time.sleep(1)
-                self.locators.file_upload_input.first.set_input_files(file_path)
-            except Exception as e2:
-                print(f"File upload failed: {e2}")
-                raise e2
+
+        try:
+            run_strategies(self.page, "jd.upload_jd_file", [
+                ("file_input", via_file_input),
+                ("upload_area", via_upload_area),
+            ])
+        except StrategyResolutionError as e:
+            print(f"File upload failed: {e.__cause__}")
+            raise e.__cause__
 
     def click_upload_file_button(self):
         """Click upload file button to open file upload modal"""
         self.locators.upload_file_button.click()
-        time.sleep(1)
+        settle(self.page)
 
     # ===== BULK FILE UPLOAD FUNCTIONALITY =====
     def click_upload_file_button_for_bulk_import(self):
         """Click 'Upload File' button to open file selection dialog for bulk import"""
         try:
             print("📁 Clicking Upload File button for bulk import")
-            enhanced_assert_visible(self.page, self.locators.upload_file_button, 
+            upload_button = resolve_locator(self.page, "jd.bulk_upload_button", [
+                ("upload_file_button", self.locators.upload_file_button),
+                ("upload_file_text", self.page.get_by_text("Upload File", exact=True)),
+            ])
+            enhanced_assert_visible(self.page, upload_button.first, 
                                    "Upload File button should be visible", "upload_file_button")
             
-            self.locators.upload_file_button.click()
-            time.sleep(1)
+            upload_button.first.click()
             
             # Verify file upload modal opens
             self.verify_file_upload_modal_opened()
@@ -870,13 +665,13 @@ class JDPage:
             # Click cancel upload button if available
             if self.locators.upload_cancel_button.count() > 0:
                 self.locators.upload_cancel_button.click()
-                time.sleep(1)
+                settle(self.page)
                 print("✅ File upload cancelled via cancel button")
             else:
                 # Alternative: close the upload modal
                 if self.locators.close_modal_button.count() > 0:
                     self.locators.close_modal_button.click()
-                    time.sleep(1)
+                    settle(self.page)
                     print("✅ File upload cancelled via modal close")
             
             return True
@@ -895,7 +690,7 @@ class JDPage:
                                    "Select all checkbox should be visible", "select_all_checkbox")
             
             self.locators.select_all_checkbox.click()
-            time.sleep(1)
+            settle(self.page)
             
             # Verify bulk actions menu becomes available
             self.verify_bulk_actions_menu_enabled()
@@ -1012,7 +807,7 @@ class JDPage:
                                    "Bulk status update button should be visible", "bulk_status_update_button")
             
             self.locators.bulk_status_update_button.click()
-            time.sleep(1)
+            settle(self.page)
             
             # Select the new status from dropdown/modal
             self.select_bulk_status_option(new_status)
@@ -1037,18 +832,18 @@ class JDPage:
             status_dropdown = self.page.locator(".bulk-status-dropdown, [name='bulkStatus']")
             if status_dropdown.count() > 0:
                 status_dropdown.click()
-                time.sleep(0.5)
+                settle(self.page)
                 
                 # Select the status option
                 status_option = self.page.get_by_text(status, exact=True)
                 status_option.click()
-                time.sleep(0.5)
+                settle(self.page)
             else:
                 # Alternative: direct button selection
                 status_button = self.page.get_by_role("button", name=status)
                 if status_button.count() > 0:
                     status_button.click()
-                    time.sleep(0.5)
+                    settle(self.page)
             
             print(f"✅ Selected bulk status option: {status}")
             return True
@@ -1069,7 +864,7 @@ class JDPage:
             
             if confirm_button.count() > 0:
                 confirm_button.click()
-                time.sleep(2)
+                settle(self.page)
                 print("✅ Confirmed bulk status update")
             else:
                 print("⚠️ No confirmation button found for bulk status update")
@@ -1164,7 +959,7 @@ class JDPage:
                                    f"Confirm button for bulk {operation_type} should be visible", f"confirm_bulk_{operation_type}")
             
             confirm_button.click()
-            time.sleep(2)
+            settle(self.page)
             
             print(f"✅ Confirmed bulk {operation_type} operation")
             return True
@@ -1185,7 +980,7 @@ class JDPage:
                                    f"Cancel button for bulk {operation_type} should be visible", f"cancel_bulk_{operation_type}")
             
             cancel_button.click()
-            time.sleep(1)
+            settle(self.page)
             
             print(f"✅ Cancelled bulk {operation_type} operation")
             return True
@@ -1591,7 +1386,7 @@ class JDPage:
             
             if retry_button.count() > 0:
                 retry_button.click()
-                time.sleep(2)
+                settle(self.page)
                 print("✅ Retry processing initiated")
                 return True
             else:
@@ -1616,7 +1411,7 @@ class JDPage:
     def click_add_new_jd_button(self):
         """Click 'Add new JD' button when no JDs exist"""
         self.locators.add_new_jd_button.click()
-        time.sleep(1)
+        settle(self.page)
 
     def get_jd_card_by_title(self, title: str):
         """Get JD card element by position title"""
@@ -1626,7 +1421,7 @@ class JDPage:
         """Click on JD card to view details"""
         jd_card = self.get_jd_card_by_title(title)
         jd_card.click()
-        time.sleep(2)
+        settle(self.page)
 
     # ===== JD LIST NAVIGATION AND DISPLAY METHODS =====
     def navigate_to_jd_list_within_agency(self, agency_id: str):
@@ -1703,7 +1498,7 @@ class JDPage:
             
             # Click the card to view details
             jd_card.click()
-            time.sleep(2)
+            settle(self.page)
             
             print(f"✅ Successfully clicked JD card '{title}' to view details")
             return True
@@ -1785,7 +1580,7 @@ class JDPage:
         try:
             if self.locators.back_to_list_button.count() > 0:
                 self.locators.back_to_list_button.click()
-                time.sleep(2)
+                settle(self.page)
                 print("✅ Successfully navigated back to JD list")
                 return True
             else:
@@ -1802,17 +1597,17 @@ class JDPage:
     def click_edit_jd_button(self, title: str):
         """Click edit button for specific JD"""
         self.locators.edit_jd_button_by_title(title).click()
-        time.sleep(1)
+        settle(self.page)
 
     def click_delete_jd_button(self, title: str):
         """Click delete button for specific JD"""
         self.locators.delete_jd_button_by_title(title).click()
-        time.sleep(1)
+        settle(self.page)
 
     def click_view_jd_button(self, title: str):
         """Click view button for specific JD"""
         self.locators.view_jd_button_by_title(title).click()
-        time.sleep(2)
+        settle(self.page)
 
     # ===== SINGLE JD DELETION METHODS =====
     def trigger_jd_deletion_from_list(self, jd_title: str):
@@ -1826,7 +1621,7 @@ class JDPage:
                                    f"Delete button for JD '{jd_title}' should be visible", "delete_button_visible")
             
             delete_button.click()
-            time.sleep(1)
+            settle(self.page)
             
             # Verify deletion confirmation dialog appears
             self.verify_deletion_confirmation_dialog()
@@ -1851,7 +1646,7 @@ class JDPage:
                                    "Delete button should be visible in detail view", "delete_button_detail_view")
             
             delete_button.click()
-            time.sleep(1)
+            settle(self.page)
             
             # Verify deletion confirmation dialog appears
             self.verify_deletion_confirmation_dialog()
@@ -1897,7 +1692,7 @@ class JDPage:
             
             # Click confirm delete button
             self.locators.confirm_delete_button.click()
-            time.sleep(2)
+            settle(self.page)
             
             # Wait for deletion to complete and modal to close
             self.wait_for_deletion_confirmation_to_close()
@@ -1915,7 +1710,7 @@ class JDPage:
             
             # Click cancel delete button
             self.locators.cancel_delete_button.click()
-            time.sleep(1)
+            settle(self.page)
             
             # Wait for confirmation dialog to close
             self.wait_for_deletion_confirmation_to_close()
@@ -2059,7 +1854,7 @@ class JDPage:
                                    f"Checkbox for JD '{jd_title}' should be visible", "jd_checkbox_visible")
             
             jd_checkbox.click()
-            time.sleep(0.5)
+            settle(self.page)
             
             print(f"✅ Successfully selected checkbox for JD '{jd_title}'")
             return True
@@ -2101,7 +1896,7 @@ class JDPage:
                                    "Select all checkbox should be visible", "select_all_checkbox")
             
             self.locators.select_all_checkbox.click()
-            time.sleep(1)
+            settle(self.page)
             
             # Verify bulk actions are enabled
             self.verify_bulk_actions_enabled()
@@ -2160,7 +1955,7 @@ class JDPage:
                                    "Bulk delete button should be visible", "bulk_delete_button_trigger")
             
             self.locators.bulk_delete_button.click()
-            time.sleep(1)
+            settle(self.page)
             
             # Verify bulk deletion confirmation dialog appears
             self.verify_bulk_deletion_confirmation_dialog()
@@ -2203,7 +1998,7 @@ class JDPage:
             
             # Click confirm bulk delete button
             self.locators.confirm_bulk_delete_button.click()
-            time.sleep(3)  # Allow more time for bulk operations
+            settle(self.page)
             
             # Wait for bulk deletion confirmation to close
             self.wait_for_bulk_deletion_confirmation_to_close()
@@ -2222,7 +2017,7 @@ class JDPage:
             
             # Click cancel bulk delete button
             self.locators.cancel_bulk_delete_button.click()
-            time.sleep(1)
+            settle(self.page)
             
             # Wait for confirmation dialog to close
             self.wait_for_bulk_deletion_confirmation_to_close()
@@ -2438,7 +2233,7 @@ class JDPage:
             # Check the force delete checkbox if present
             if self.locators.force_delete_checkbox.count() > 0:
                 self.locators.force_delete_checkbox.click()
-                time.sleep(0.5)
+                settle(self.page)
                 print("✅ Force delete checkbox checked")
             
             # Confirm deletion
@@ -2559,7 +2354,7 @@ class JDPage:
                     close_buttons = self.page.locator("button").filter(has_text="Close")
                     if close_buttons.count() > 0:
                         close_buttons.first.click()
-                        time.sleep(1)
+                        settle(self.page)
                 
                 # Retry the deletion
                 self.trigger_jd_deletion_from_list(jd_title)
@@ -2723,7 +2518,7 @@ class JDPage:
                                    f"Edit button for JD '{jd_title}' should be visible", "edit_button_visible")
             
             edit_button.click()
-            time.sleep(2)
+            settle(self.page)
             
             # Verify edit modal opened
             self.verify_edit_modal_opened()
@@ -2748,7 +2543,7 @@ class JDPage:
                                    "Edit button should be visible in detail view", "edit_button_detail_view")
             
             edit_button.click()
-            time.sleep(2)
+            settle(self.page)
             
             # Verify edit modal opened
             self.verify_edit_modal_opened()
@@ -2862,7 +2657,7 @@ class JDPage:
                 edit_url = self.locators.edit_jd_url_pattern.format(agency_id=agency_id, jd_id=jd_id)
                 self.page.goto(edit_url)
                 self.page.wait_for_load_state("networkidle")
-                time.sleep(2)
+                settle(self.page)
                 
                 # Verify we're on edit page
                 current_url = self.page.url
@@ -2931,14 +2726,14 @@ class JDPage:
             if "company" in updated_data:
                 print(f"📝 Updating company to: '{updated_data['company']}'")
                 self.locators.edit_company_dropdown.click()
-                time.sleep(1)
+                settle(self.page)
                 self.locators.company_option(updated_data["company"]).click()
             
             # Update work style if provided
             if "work_style" in updated_data:
                 print(f"📝 Updating work style to: '{updated_data['work_style']}'")
                 self.locators.edit_work_style_dropdown.click()
-                time.sleep(1)
+                settle(self.page)
                 self.select_work_style_option_in_edit(updated_data["work_style"])
             
             # Update salary fields if provided
@@ -2985,7 +2780,7 @@ class JDPage:
     def select_currency_in_edit_mode(self, currency: str):
         """Select currency in edit mode"""
         self.locators.currency_dropdown.click()
-        time.sleep(1)
+        settle(self.page)
         if currency.upper() == "JPY":
             self.locators.jpy_currency_option.click()
         elif currency.upper() == "USD":
@@ -3079,7 +2874,7 @@ class JDPage:
         """Attempt to update JD to trigger validation errors"""
         print("🔍 Attempting update to trigger validation errors")
         self.locators.confirm_edit_button.click()
-        time.sleep(1)  # Allow validation errors to appear
+        settle(self.page)
 
     def save_jd_changes(self):
         """Save JD changes in edit mode"""
@@ -3091,7 +2886,7 @@ class JDPage:
                                    "Update button should be visible", "update_button_save")
             
             self.locators.confirm_edit_button.click()
-            time.sleep(2)
+            settle(self.page)
             
             print("✅ JD changes save initiated")
             return True
@@ -3265,7 +3060,7 @@ class JDPage:
                                    "Cancel edit button should be visible", "cancel_edit_button")
             
             self.locators.cancel_edit_button.click()
-            time.sleep(1)
+            settle(self.page)
             
             print("✅ Edit cancellation initiated")
             return True
@@ -3444,7 +3239,7 @@ class JDPage:
                 # Test direct URL navigation during edit
                 current_url = self.page.url
                 self.page.goto(current_url.replace("/edit", ""))
-                time.sleep(2)
+                settle(self.page)
                 
                 # Check if we're redirected or if unsaved changes warning appears
                 self.handle_unsaved_changes_warning("discard")
@@ -3541,13 +3336,13 @@ class JDPage:
         """Search for JDs using search input"""
         self.locators.search_input.fill(search_term)
         self.page.keyboard.press("Enter")
-        time.sleep(2)
+        settle(self.page)
 
     def clear_search(self):
         """Clear search input"""
         self.locators.search_input.fill("")
         self.page.keyboard.press("Enter")
-        time.sleep(2)
+        settle(self.page)
 
     def expect_search_results_visible(self):
         """Verify search results are visible"""
@@ -3570,7 +3365,7 @@ class JDPage:
         """Submit search by pressing Enter or clicking search button"""
         print("🔍 Submitting search")
         self.page.keyboard.press("Enter")
-        time.sleep(2)
+        settle(self.page)
 
     def perform_search(self, search_term: str):
         """Complete search workflow: fill input and submit"""
@@ -3705,7 +3500,7 @@ class JDPage:
             if self.locators.clear_search_button.count() > 0:
                 print("🔍 Clicking clear search button")
                 self.locators.clear_search_button.click()
-                time.sleep(1)
+                settle(self.page)
                 return True
             else:
                 print("ℹ️ Clear search button not available")
@@ -3795,12 +3590,12 @@ class JDPage:
     def open_filters(self):
         """Open filter panel"""
         self.locators.filters_button.click()
-        time.sleep(1)
+        settle(self.page)
 
     def close_filters(self):
         """Close filter panel"""
         self.locators.close_filter_button.click()
-        time.sleep(1)
+        settle(self.page)
 
     def apply_company_filter(self, company_name: str):
         """Apply company name filter"""
@@ -3824,24 +3619,24 @@ class JDPage:
     def apply_filters(self):
         """Apply selected filters"""
         self.locators.apply_filters_button.click()
-        time.sleep(2)
+        settle(self.page)
 
     def clear_all_filters(self):
         """Clear all applied filters"""
         self.locators.all_clear_button.click()
-        time.sleep(2)
+        settle(self.page)
 
     def reset_filters(self):
         """Reset filters to default state"""
         self.locators.reset_filters_button.click()
-        time.sleep(2)
+        settle(self.page)
 
     # ===== ENHANCED FILTER PANEL INTERACTION METHODS =====
     def click_filters_button(self):
         """Click filters button to open filter panel"""
         print("🔧 Opening filter panel")
         self.locators.filters_button.click()
-        time.sleep(1)
+        settle(self.page)
         return self.verify_filter_panel_opened()
 
     def verify_filter_panel_opened(self) -> bool:
@@ -3900,7 +3695,7 @@ class JDPage:
         try:
             # Open company filter dropdown
             self.locators.company_name_filter.click()
-            time.sleep(0.5)
+            settle(self.page)
             
             # Select company option
             self.locators.company_filter_dropdown.select_option(label=company_name)
@@ -3930,7 +3725,7 @@ class JDPage:
         try:
             # Open status filter dropdown
             self.locators.hiring_status_filter.click()
-            time.sleep(0.5)
+            settle(self.page)
             
             # Select status option
             self.locators.status_filter_dropdown.select_option(label=status)
@@ -3948,7 +3743,7 @@ class JDPage:
         try:
             # Open work style filter dropdown
             self.locators.work_style_filter.click()
-            time.sleep(0.5)
+            settle(self.page)
             
             # Select work style option
             self.locators.work_style_filter_dropdown.select_option(label=work_style)
@@ -4033,7 +3828,7 @@ class JDPage:
         print("🔧 Applying filters")
         try:
             self.locators.apply_filters_button.click()
-            time.sleep(2)  # Wait for filters to be applied
+            settle(self.page)
             print("✅ Filters applied successfully")
             return True
         except Exception as e:
@@ -4176,7 +3971,7 @@ class JDPage:
             
             # Click all clear button
             self.locators.all_clear_button.click()
-            time.sleep(2)
+            settle(self.page)
             
             print("✅ All filters cleared")
             return True
@@ -4216,7 +4011,7 @@ class JDPage:
             if filter_type == "company":
                 # Open company filter and get options
                 self.locators.company_name_filter.click()
-                time.sleep(0.5)
+                settle(self.page)
                 option_elements = self.locators.company_filter_dropdown.locator("option")
                 for i in range(option_elements.count()):
                     option_text = option_elements.nth(i).text_content()
@@ -4226,7 +4021,7 @@ class JDPage:
             elif filter_type == "status":
                 # Open status filter and get options
                 self.locators.hiring_status_filter.click()
-                time.sleep(0.5)
+                settle(self.page)
                 option_elements = self.locators.status_filter_dropdown.locator("option")
                 for i in range(option_elements.count()):
                     option_text = option_elements.nth(i).text_content()
@@ -4236,7 +4031,7 @@ class JDPage:
             elif filter_type == "work_style":
                 # Open work style filter and get options
                 self.locators.work_style_filter.click()
-                time.sleep(0.5)
+                settle(self.page)
                 option_elements = self.locators.work_style_filter_dropdown.locator("option")
                 for i in range(option_elements.count()):
                     option_text = option_elements.nth(i).text_content()
@@ -4319,7 +4114,7 @@ class JDPage:
             
             # Click the all clear button
             self.locators.all_clear_button.click()
-            time.sleep(2)  # Wait for filters to be cleared
+            settle(self.page)
             
             print("✅ 'All clear' button clicked successfully")
             return True
@@ -4467,7 +4262,7 @@ class JDPage:
             if self.locators.reset_filters_button.count() > 0:
                 print("🔧 Trying reset button as alternative")
                 self.locators.reset_filters_button.click()
-                time.sleep(2)
+                settle(self.page)
                 
                 if self.verify_all_filters_removed():
                     print("✅ Filters reset successfully using reset button")
@@ -4506,7 +4301,7 @@ class JDPage:
             # Apply the cleared state
             if self.locators.apply_filters_button.count() > 0:
                 self.locators.apply_filters_button.click()
-                time.sleep(2)
+                settle(self.page)
             
             print("✅ Manual filter clearing completed")
             return True
@@ -4583,7 +4378,7 @@ class JDPage:
             if self.locators.reset_filters_button.count() > 0:
                 self.apply_multiple_filters(test_filters)
                 self.locators.reset_filters_button.click()
-                time.sleep(2)
+                settle(self.page)
                 results["reset_button"] = self.verify_all_filters_removed()
             else:
                 print("   ℹ️ Reset button not available")
@@ -4665,7 +4460,7 @@ class JDPage:
             if self.locators.next_page_button.count() > 0:
                 print("-> Next button found, clicking to navigate to next page...")
                 self.locators.next_page_button.click()
-                time.sleep(2)
+                settle(self.page)
                 return True
             else:
                 print("-> No more pages available (next button is disabled or not found)")
@@ -4679,7 +4474,7 @@ class JDPage:
         try:
             if self.locators.previous_page_button.count() > 0:
                 self.locators.previous_page_button.click()
-                time.sleep(2)
+                settle(self.page)
                 return True
             return False
         except Exception as e:
@@ -4689,7 +4484,7 @@ class JDPage:
     def navigate_to_page_number(self, page_num: int):
         """Navigate to specific page number"""
         self.locators.page_number(page_num).click()
-        time.sleep(2)
+        settle(self.page)
 
     def get_current_page_number(self) -> int:
         """Get current page number"""
@@ -4974,22 +4769,22 @@ class JDPage:
     def click_bulk_delete(self):
         """Click bulk delete button"""
         self.locators.bulk_delete_button.click()
-        time.sleep(1)
+        settle(self.page)
 
     def click_bulk_status_update(self):
         """Click bulk status update button"""
         self.locators.bulk_status_update_button.click()
-        time.sleep(1)
+        settle(self.page)
 
     def confirm_bulk_delete(self):
         """Confirm bulk delete operation"""
         self.locators.confirm_bulk_delete_button.click()
-        time.sleep(2)
+        settle(self.page)
 
     def cancel_bulk_delete(self):
         """Cancel bulk delete operation"""
         self.locators.cancel_bulk_delete_button.click()
-        time.sleep(1)
+        settle(self.page)
 
     # ===== DELETE CONFIRMATION =====
     def expect_delete_confirmation_modal(self):
@@ -5000,33 +4795,29 @@ class JDPage:
     def confirm_delete(self):
         """Confirm single JD deletion"""
         self.locators.confirm_delete_button.click()
-        time.sleep(2)
+        settle(self.page)
 
     def cancel_delete(self):
         """Cancel single JD deletion"""
         self.locators.cancel_delete_button.click()
-        time.sleep(1)
+        settle(self.page)
 
     # ===== SUCCESS/ERROR MESSAGE VERIFICATION =====
     def expect_jd_created_successfully(self):
         """Verify JD created successfully message"""
-        enhanced_assert_visible(self.page, self.locators.jd_created_successfully_message, 
-                               "JD created successfully message should be visible", "jd_created_success")
+        expect_toast(self.page, "JD created successfully", "JD created successfully message should be visible", "jd_created_success")
 
     def expect_jd_updated_successfully(self):
         """Verify JD updated successfully message"""
-        enhanced_assert_visible(self.page, self.locators.jd_updated_successfully_message, 
-                               "JD updated successfully message should be visible", "jd_updated_success")
+        expect_toast(self.page, "JD updated successfully", "JD updated successfully message should be visible", "jd_updated_success")
 
     def expect_jd_deleted_successfully(self):
         """Verify JD deleted successfully message"""
-        enhanced_assert_visible(self.page, self.locators.jd_deleted_successfully_message, 
-                               "JD deleted successfully message should be visible", "jd_deleted_success")
+        expect_toast(self.page, "JD deleted successfully", "JD deleted successfully message should be visible", "jd_deleted_success")
 
     def expect_file_uploaded_successfully(self):
         """Verify file uploaded successfully message"""
-        enhanced_assert_visible(self.page, self.locators.file_uploaded_successfully_message, 
-                               "File uploaded successfully message should be visible", "file_uploaded_success")
+        expect_toast(self.page, "File uploaded successfully", "File uploaded successfully message should be visible", "file_uploaded_success")
 
     # ===== VALIDATION ERROR VERIFICATION =====
     def expect_position_title_required_error(self):
@@ -5226,29 +5017,26 @@ class JDPage:
     def wait_for_page_load(self):
         """Wait for page to fully load"""
         self.page.wait_for_load_state("networkidle")
-        time.sleep(1)
+        settle(self.page)
 
     def wait_for_toast_message(self, timeout: int = 5000) -> bool:
-        """Wait for any toast message to appear"""
-        try:
-            self.locators.toast_message.first.wait_for(state="visible", timeout=timeout)
-            return True
-        except:
-            return False
+        """Wait for any toast message to appear (also true if it already disappeared again)"""
+        return wait_for_toast(self.page, timeout=timeout) is not None
 
     def get_toast_message_text(self) -> str:
-        """Get the text of the current toast message"""
-        if self.locators.toast_message.count() > 0:
-            return self.locators.toast_message.first.text_content()
-        return ""
+        """Get the text of the latest toast message"""
+        toasts = recorded_toasts(self.page)
+        return toasts[-1]["text"] if toasts else ""
 
     def check_success_toast_visible(self) -> bool:
-        """Check if success toast is visible"""
-        return self.locators.success_toast.count() > 0
+        """Check if the latest toast was a success toast"""
+        toasts = recorded_toasts(self.page)
+        return bool(toasts) and toasts[-1]["type"] == "success"
 
     def check_error_toast_visible(self) -> bool:
-        """Check if error toast is visible"""
-        return self.locators.error_toast.count() > 0
+        """Check if the latest toast was an error toast"""
+        toasts = recorded_toasts(self.page)
+        return bool(toasts) and toasts[-1]["type"] == "error"
 
     def check_loading_spinner_visible(self) -> bool:
         """Check if loading spinner is visible"""
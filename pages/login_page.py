@@ -2,6 +2,7 @@ from playwright.sync_api import Page, expect
 from locators.loc_login import LoginLocators
 from utils.enhanced_assertions import enhanced_assert_visible, enhanced_assert_not_visible
 import utils.login_helper as login_helper
+from utils.web_perf_collector import record_navigation
 
 class LoginPage:
     def __init__(self, page: Page):
@@ -10,6 +11,7 @@ class LoginPage:
 
     def navigate_to_landing_page(self, url: str):
         self.page.goto(url)
+        record_navigation(self.page, "login")
 
     def click_get_started(self):
         self.locators.get_started_button.click()
@@ -7,11 +7,17 @@ import time
 from playwright.sync_api import Page
 from locators.loc_talent import TalentLocators
 from utils.enhanced_assertions import enhanced_assert_visible
+from utils.dropdown_driver import DropdownDriver
 
 class TalentPage:
+    # Input aliases -> exact option text; other values are used as given
+    GENDER_OPTIONS = {"male": "Male", "female": "Female"}
+    LANGUAGE_LEVEL_OPTIONS = {"basic": "Basic", "conversational": "Conversational", "fluent": "Fluent", "native": "Native"}
+
     def __init__(self, page: Page):
         self.page = page
         self.locators = TalentLocators(page)
+        self.dropdowns = DropdownDriver(page)
     
     # Navigation Methods
     def click_talent_main_link(self):
@@ -80,47 +86,14 @@ class TalentPage:
         self.locators.last_name_input.fill(last_name)
     
     def select_gender(self, gender: str):
-        """Select gender from dropdown using working locators."""
-        self.locators.gender_dropdown.click()
-        time.sleep(1)
-        if gender.lower() == "male":
-            self.locators.male_option.click()
-        elif gender.lower() == "female":
-            self.locators.female_option.click()
-        time.sleep(1)
+        """Select gender from dropdown."""
+        option = self.GENDER_OPTIONS.get(gender.lower(), gender)
+        self.dropdowns.select(self.locators.gender_dropdown, option, name="talent.gender")
 
     def select_job_title(self, job_title: str):
-        """Select job title from dropdown using working locators."""
-        self.locators.job_title_dropdown.click()
-        time.sleep(1)
-        if job_title.lower() == "student":
-            self.locators.student_option.click()
-        else:
-            # Fallback for other job titles
-            self.page.get_by_text(job_title).click()
-        time.sleep(1)
-
-    def select_japanese_level(self, level: str):
-        """Select Japanese language level using working locators."""
-        self.locators.japanese_level_dropdown.click()
-        time.sleep(1)
-        if level.lower() == "fluent":
-            self.locators.fluent_option.click()
-        else:
-            # Fallback for other levels
-            self.page.get_by_text(level).click()
-        time.sleep(1)
-
-    def select_english_level(self, level: str):
-        """Select English language level using working locators."""
-        self.locators.english_level_dropdown.click()
-        time.sleep(1)
-        if level.lower() == "native":
-            self.locators.native_option.click()
-        else:
-            # Fallback for other levels
-            self.page.get_by_text(level).click()
-        time.sleep(1)
+        """Select job title from dropdown."""
+        option = "Student" if job_title.lower() == "student" else job_title
+        self.dropdowns.select(self.locators.job_title_dropdown, option, name="talent.job_title")
 
     def select_location(self, location: str):
         """Select location from dropdown using MCP-verified specific locators."""
@@ -128,19 +101,8 @@ class TalentPage:
         try:
             # Primary method: Click location dropdown using MCP-verified pattern
             location_dropdown = self.page.locator("div").filter(has_text="Location").locator("div[cursor=pointer]").first
-            location_dropdown.click()
-            time.sleep(1)
-            
-            # Use search functionality if available
-            search_input = self.page.get_by_role("textbox", name="Search...")
-            if search_input.is_visible():
-                search_input.fill(location)
-                time.sleep(1)
-            
-            # Select the location option with exact text matching
-            self.page.get_by_text(location, exact=True).click()
+            self.dropdowns.select(location_dropdown, location, name="talent.location")
             print(f"✅ Selected Location: {location}")
-            time.sleep(1)
             
         except Exception as e:
             print(f"⚠️ Location dropdown method 1 failed: {e}")
@@ -170,19 +132,8 @@ class TalentPage:
         try:
             # Primary method: Target the CV language dropdown using MCP-verified pattern
             cv_language_dropdown = self.page.locator("div").filter(has_text="Select Language").locator("div[cursor=pointer]").first
-            cv_language_dropdown.click()
-            time.sleep(1)
-            
-            # Use search functionality if available
-            search_input = self.page.get_by_role("textbox", name="Search...")
-            if search_input.is_visible():
-                search_input.fill(language)
-                time.sleep(1)
-            
-            # Select the language option with exact text matching
-            self.page.get_by_text(language, exact=True).click()
+            self.dropdowns.select(cv_language_dropdown, language, name="talent.cv_language")
             print(f"✅ Selected CV Language: {language}")
-            time.sleep(1)
             
         except Exception as e:
             print(f"⚠️ CV language dropdown method 1 failed: {e}")
@@ -213,31 +164,13 @@ class TalentPage:
     
     def select_japanese_level(self, level: str):
         """Select Japanese language level."""
-        self.locators.japanese_level_dropdown.click()
-        time.sleep(1)
-        if level.lower() == "basic":
-            self.locators.basic_level.click()
-        elif level.lower() == "conversational":
-            self.locators.conversational_level.click()
-        elif level.lower() == "fluent":
-            self.locators.fluent_level.click()
-        elif level.lower() == "native":
-            self.locators.native_level.click()
-        time.sleep(1)
+        option = self.LANGUAGE_LEVEL_OPTIONS.get(level.lower(), level)
+        self.dropdowns.select(self.locators.japanese_level_dropdown, option, name="talent.japanese_level")
     
     def select_english_level(self, level: str):
         """Select English language level."""
-        self.locators.english_level_dropdown.click()
-        time.sleep(1)
-        if level.lower() == "basic":
-            self.locators.basic_level.click()
-        elif level.lower() == "conversational":
-            self.locators.conversational_level.click()
-        elif level.lower() == "fluent":
-            self.locators.fluent_level.click()
-        elif level.lower() == "native":
-            self.locators.native_level.click()
-        time.sleep(1)
+        option = self.LANGUAGE_LEVEL_OPTIONS.get(level.lower(), level)
+        self.dropdowns.select(self.locators.english_level_dropdown, option, name="talent.english_level")
     
     def fill_cv_name(self, cv_name: str):
         """Fill CV name field."""
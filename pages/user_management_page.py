@@ -6,6 +6,7 @@ Handles all user management operations including roles & access and user list fu
 from playwright.sync_api import Page, expect
 from locators.loc_user_management import UserManagementLocators
 from utils.config import BASE_URL
+from utils.toast_recorder import wait_for_toast, recorded_toasts
 import time
 
 
@@ -267,26 +268,23 @@ class UserManagementPage:
 
     # ===== VALIDATION HELPER METHODS =====
     def wait_for_toast_message(self, timeout: int = 5000) -> bool:
-        """Wait for any toast message to appear"""
-        try:
-            self.locators.toast_message.first.wait_for(state="visible", timeout=timeout)
-            return True
-        except:
-            return False
+        """Wait for any toast message to appear (also true if it already disappeared again)"""
+        return wait_for_toast(self.page, timeout=timeout) is not None
 
     def get_toast_message_text(self) -> str:
-        """Get the text of the current toast message"""
-        if self.locators.toast_message.count() > 0:
-            return self.locators.toast_message.first.text_content()
-        return ""
+        """Get the text of the latest toast message"""
+        toasts = recorded_toasts(self.page)
+        return toasts[-1]["text"] if toasts else ""
 
     def check_success_toast_visible(self) -> bool:
-        """Check if success toast is visible"""
-        return self.locators.success_toast.count() > 0
+        """Check if the latest toast was a success toast"""
+        toasts = recorded_toasts(self.page)
+        return bool(toasts) and toasts[-1]["type"] == "success"
 
     def check_error_toast_visible(self) -> bool:
-        """Check if error toast is visible"""
-        return self.locators.error_toast.count() > 0
+        """Check if the latest toast was an error toast"""
+        toasts = recorded_toasts(self.page)
+        return bool(toasts) and toasts[-1]["type"] == "error"
 
     def check_validation_error_visible(self) -> bool:
         """Check if form validation error is visible"""
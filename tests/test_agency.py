@@ -45,10 +45,10 @@ def test_TC_03(page: Page):
     agency_page.click_close_modal_button()
 
 @allure.title("TC_04 - Verify newly created agency appears in the all agency list.")
-def test_TC_04(page: Page, created_agency_name):
+def test_TC_04(page: Page, created_agency_name, agency_credentials):
     """Verify newly created agency appears in the all agency list."""
     agency_name = created_agency_name
-    agency_page = do_create_agency(page, agency_name, email="gi7j8d@mepost.pw")
+    agency_page = do_create_agency(page, agency_name, agency_credentials["email"], agency_credentials["password"])
     
     # Wait for creation to complete and navigate to list
     time.sleep(5)  # Allow time for creation and navigation
@@ -65,18 +65,18 @@ def test_TC_04(page: Page, created_agency_name):
     enhanced_assert_visible(page, page.get_by_text(agency_name, exact=True).first, f"Agency '{agency_name}' should be visible in the agencies list", "test_TC_04")
 
 @allure.title("TC_05 - Verify user can delete the agency created previously.")
-def test_TC_05(page: Page, created_agency_name):
+def test_TC_05(page: Page, created_agency_name, agency_credentials):
     """Verify user can delete the agency created previously."""
     agency_name = created_agency_name
-    agency_page = navigate_to_agency_page(page, "gi7j8d@mepost.pw", "Kabir123#")
+    agency_page = navigate_to_agency_page(page, agency_credentials["email"], agency_credentials["password"])
     page.go_back()
     agency_page.delete_agency_by_name(agency_name)
 
 @allure.title("TC_06 - Verify user can edit the agency user created.")
-def test_TC_06(page: Page, created_agency_name):
+def test_TC_06(page: Page, created_agency_name, agency_credentials):
     """Verify user can edit the agency user created."""
     agency_name = created_agency_name
-    agency_page = do_create_agency(page, agency_name, email="gi7j8d@mepost.pw")
+    agency_page = do_create_agency(page, agency_name, agency_credentials["email"], agency_credentials["password"])
     time.sleep(5)
     
     updated_name = agency_name + " - Edited"
@@ -0,0 +1,33 @@
+import pytest
+from playwright.sync_api import Page
+from utils.bulk_import_benchmark import BulkImportBenchmark, load_previous_run
+from utils.jd_helper import do_jd_login
+
+# Bulk JD import throughput benchmark - runs only with --benchmark. It imports real JDs (up to 10k rows) into
+# the tenant's dedicated bulk_benchmark agency and deletes them again afterwards.
+
+pytestmark = pytest.mark.benchmark
+
+@pytest.fixture
+def bulk_benchmark(page: Page, admin_credentials, tenant):
+    """Benchmark on the tenant's bulk_benchmark agency; deletes the imported JDs in teardown"""
+    agency_id = tenant.agency("bulk_benchmark").get("agency_id")
+    if not agency_id:
+        pytest.skip("No bulk_benchmark agency - configure one in tenants.json (a tenant pool provisions it)")
+    jd_page = do_jd_login(page, admin_credentials["email"], admin_credentials["password"], agency_id)
+    benchmark = BulkImportBenchmark(jd_page, agency_id)
+    yield benchmark
+    benchmark.cleanup()
+
+def test_benchmark_bulk_jd_import(bulk_benchmark):
+    """Import generated JD files of increasing size and report throughput and the nonlinear knee"""
+    previous = load_previous_run()
+
+    results = bulk_benchmark.run()
+
+    print("\n" + bulk_benchmark.format_report())
+    print(f"📊 Bulk import benchmark saved to {bulk_benchmark.save()}")
+    if previous:
+        for regression in bulk_benchmark.compare(previous):
+            print(f"⚠️ Bulk import regression: {regression}")
+    assert results and results[0]["processing_ms"] is not None, "Smallest import did not finish processing"
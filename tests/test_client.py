@@ -18,6 +18,10 @@ from utils.enhanced_assertions import enhanced_assert_visible
 random_email = RandomEmail()
 random_name = RandomTalentName()
 
+# TC_01-TC_07 run in the tenant's client agency, which stays free of clients (TC_02 expects an empty list);
+# TC_08 on create, list and delete clients in its jd agency and act on the clients TC_08/TC_09 create
+pytestmark = pytest.mark.order_dependent
+
 # Example using decorator
 @allure.title("TC_01 - Verify user can navigate to client page after login.")
 @with_client_login()
@@ -73,7 +77,7 @@ def test_TC_03(page: Page):
     client_page.click_close_modal_button()
 
 @allure.title("TC_04 - Verify first name and last name validation errors (min length and special characters).")
-@with_client_login(agency_id="173")
+@with_client_login()
 def test_TC_04(page: Page):
     """Verify first name and last name validation errors (min length and special characters)."""
     client_page: ClientPage = page._client_page
@@ -108,7 +112,7 @@ def test_TC_04(page: Page):
     client_page.click_close_modal_button()
 
 @allure.title("TC_05 - Verify file upload validation for size and format.")
-@with_client_login(agency_id="173")
+@with_client_login()
 def test_TC_05(page: Page):
     """Verify file upload validation for size and format."""
     client_page: ClientPage = page._client_page
@@ -128,7 +132,7 @@ def test_TC_05(page: Page):
     client_page.click_close_modal_button()
 
 @allure.title("TC_06 - Verify validation errors appear when creating client without mandatory fields.")
-@with_client_login(agency_id="173")
+@with_client_login()
 def test_TC_06(page: Page):
     """Verify validation errors appear when creating client without mandatory fields."""
     client_page: ClientPage = page._client_page
@@ -146,7 +150,7 @@ def test_TC_06(page: Page):
     client_page.expect_email_name_label_required_error()
 
 @allure.title("TC_07 - Verify 'Invalid email address' error appears with invalid email format.")
-@with_client_login(agency_id="173")
+@with_client_login()
 def test_TC_07(page: Page):
     """Verify 'Invalid email address' error appears with invalid email format."""
     client_page: ClientPage = page._client_page
@@ -164,7 +168,7 @@ def test_TC_07(page: Page):
     client_page.click_close_modal_button()
 
 @allure.title("TC_08 - Verify user can create a client with only mandatory fields.")
-@with_client_login(agency_id="174")
+@with_client_login(area="jd")
 def test_TC_08(page: Page):
     """Verify user can create a client with only mandatory fields."""
     client_page: ClientPage = page._client_page
@@ -176,7 +180,7 @@ def test_TC_08(page: Page):
     client_page.verify_client_created()
 
 @allure.title("TC_09 - Verify user can create a client with all fields (mandatory and optional) and file upload validation.")
-@with_client_login(agency_id="174")
+@with_client_login(area="jd")
 def test_TC_09(page: Page):
     """Verify user can create a client with all fields (mandatory and optional) and file upload validation."""
     client_page: ClientPage = page._client_page    
@@ -209,7 +213,7 @@ def test_TC_09(page: Page):
     client_page.verify_client_created()
 
 @allure.title("TC_10 - Verify 'View Details' button is visible for existing clients.")
-@with_client_login(agency_id="174")
+@with_client_login(area="jd")
 def test_TC_10(page: Page):
     """Verify 'View Details' button is visible for existing clients."""
     client_page: ClientPage = page._client_page
@@ -217,7 +221,7 @@ def test_TC_10(page: Page):
     client_page.expect_view_details_button()
 
 @allure.title("TC_11 - Verify 'Open action menu' button is visible for existing clients.")
-@with_client_login(agency_id="174")
+@with_client_login(area="jd")
 def test_TC_11(page: Page):
     """Verify 'Open action menu' button is visible for existing clients."""
     client_page: ClientPage = page._client_page
@@ -225,7 +229,7 @@ def test_TC_11(page: Page):
     client_page.expect_open_action_menu_button()
 
 @allure.title("TC_12 - Verify delete confirmation modal appears when deleting a client.")
-@with_client_login(agency_id="174")
+@with_client_login(area="jd")
 def test_TC_12(page: Page):
     """Verify delete confirmation modal appears when deleting a client."""
     client_page: ClientPage = page._client_page
@@ -236,7 +240,7 @@ def test_TC_12(page: Page):
     client_page.expect_confirm_delete_button()
 
 @allure.title("TC_13 - Verify user can successfully delete a client.")
-@with_client_login(agency_id="174")
+@with_client_login(area="jd")
 def test_TC_13(page: Page):
     """Verify user can successfully delete a client."""
     client_page: ClientPage = page._client_page
@@ -248,7 +252,7 @@ def test_TC_13(page: Page):
     time.sleep(1)
 
 @allure.title("TC_14 - Verify search functionality works for finding clients and no results message for non-existent query.")
-@with_client_login(agency_id="174")
+@with_client_login(area="jd")
 def test_TC_14(page: Page):
     """Verify search functionality works for finding clients and no results message for non-existent query."""
     client_page: ClientPage = page._client_page
@@ -267,7 +271,7 @@ def test_TC_14(page: Page):
     time.sleep(0.5)
 
 @allure.title("TC_15 - Verify 'Add Notes' button is visible in action menu and modal opens correctly.")
-@with_client_login(agency_id="174")
+@with_client_login(area="jd")
 def test_TC_15(page: Page):
     """Verify 'Add Notes' button is visible in action menu and modal opens correctly."""
     client_page: ClientPage = page._client_page
@@ -281,7 +285,7 @@ def test_TC_15(page: Page):
     client_page.click_close_modal_button()
 
 @allure.title("TC_16 - Verify user can successfully add a note, success modal appears with heading, message, and close button, then modal closes and user stays on client page.")
-@with_client_login(agency_id="174")
+@with_client_login(area="jd")
 def test_TC_16(page: Page):
     """Verify user can successfully add a note, success modal appears with heading, message, and close button, then modal closes and user stays on client page."""
     client_page: ClientPage = page._client_page
@@ -302,7 +306,7 @@ def test_TC_16(page: Page):
     client_page.expect_client_page_heading()
 
 @allure.title("TC_17 - Verify that add notes field does not accept blank spaces only.")
-@with_client_login(agency_id="174")
+@with_client_login(area="jd")
 def test_TC_17(page: Page):
     """Verify that add notes field does not accept blank spaces only."""
     client_page: ClientPage = page._client_page
@@ -316,7 +320,7 @@ def test_TC_17(page: Page):
     client_page.expect_note_required_error()
 
 @allure.title("TC_18 - Verify filter feature is present and after clicking it filters modal opens and all filter fields are present.")
-@with_client_login(agency_id="174")
+@with_client_login(area="jd")
 def test_TC_18(page: Page):
     """Verify filter feature is present and after clicking it filters modal opens and all filter fields are present."""
     client_page: ClientPage = page._client_page
@@ -342,7 +346,7 @@ def test_TC_18(page: Page):
     client_page.expect_all_clear_button()
 
 @allure.title("TC_19 - Verify client detail view breadcrumb and name display in Japanese format (Last First).")
-@with_client_login(agency_id="174")
+@with_client_login(area="jd")
 def test_TC_19(page: Page):
     """Verify client detail view breadcrumb and name display in Japanese format (Last First)."""
     client_page: ClientPage = page._client_page
@@ -364,7 +368,7 @@ def test_TC_19(page: Page):
     # Verify detail view heading shows: TESTLAST TestFirst (Japanese format - same as card)
     client_page.expect_client_name_japanese_format(japanese_format_name)
 
-@with_client_login(agency_id="174")
+@with_client_login(area="jd")
 def test_TC_20(page: Page):
     """Verify pagination controls work correctly - forward and backward navigation between pages."""
     client_page: ClientPage = page._client_page
@@ -384,7 +388,7 @@ def test_TC_20(page: Page):
     verify_pagination_navigation(page, client_page, total_pages)
 
 @allure.title("TC_21 - Verify filter functionality with individual filters and combined filters.")
-@with_client_login(agency_id="174")
+@with_client_login(area="jd")
 def test_TC_21(page: Page):
     """Verify filter works correctly with individual field filters and combined multiple filters."""
     client_page: ClientPage = page._client_page
@@ -465,7 +469,7 @@ def test_TC_21(page: Page):
     client_page.expect_department_in_results("Operations")
     
 @allure.title("TC_22 - Verify bulk actions modal opens after selecting bulk checkbox.")
-@with_client_login(agency_id="174")
+@with_client_login(area="jd")
 def test_TC_22(page: Page):
     """Verify that after clicking bulk select, Delete and Add Notes buttons appear and their modals open."""
     client_page: ClientPage = page._client_page
@@ -480,7 +484,7 @@ def test_TC_22(page: Page):
     verify_bulk_actions(page, client_page)
 
 @allure.title("TC_23 - Verify bulk action buttons disappear after unselecting bulk checkbox.")
-@with_client_login(agency_id="174")
+@with_client_login(area="jd")
 def test_TC_23(page: Page):
     """Verify that after unselecting bulk select, bulk action buttons disappear."""
     client_page: ClientPage = page._client_page
@@ -503,7 +507,7 @@ def test_TC_23(page: Page):
     print("✅ Bulk action buttons disappeared after unselecting")
 
 @allure.title("TC_24 - Verify selecting individual clients shows correct count in bulk action buttons.")
-@with_client_login(agency_id="174")
+@with_client_login(area="jd")
 def test_TC_24(page: Page):
     """Verify that after selecting 2 or 4 individual clients, Delete and Add Notes buttons show correct count."""
     client_page: ClientPage = page._client_page
@@ -527,7 +531,7 @@ def test_TC_24(page: Page):
     print("✅ Verified count of 4 in bulk action buttons")
 
 @allure.title("TC_25 - Verify bulk delete functionality for 2 selected clients.")
-@with_client_login(agency_id="174")
+@with_client_login(area="jd")
 def test_TC_25(page: Page):
     """Verify that user can delete 2 clients using bulk delete action."""
     client_page: ClientPage = page._client_page
@@ -552,7 +556,7 @@ def test_TC_25(page: Page):
     print("✅ Successfully deleted 2 clients via bulk action")
 
 @allure.title("TC_26 - Verify bulk add notes functionality with navigation counter.")
-@with_client_login(agency_id="174")
+@with_client_login(area="jd")
 def test_TC_26(page: Page):
     """Verify bulk add notes action for 2 clients with note navigation (1 of 2 to 2 of 2)."""
     client_page: ClientPage = page._client_page
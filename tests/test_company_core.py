@@ -21,9 +21,9 @@ def test_TC_01(page: Page):
     # Verify breadcrumb shows "Home>Company" to confirm we're on the right page
     company_page.expect_home_company_heading("test_TC_01")
 
-def test_TC_02(page: Page):
+def test_TC_02(page: Page, company_credentials):
     """Verify all mandatory field validation errors are displayed when form is submitted empty."""
-    company_page = company_helper.navigate_to_company_creation_form(page, "nua26i@onemail.host", "Kabir123#")
+    company_page = company_helper.navigate_to_company_creation_form(page, company_credentials["email"], company_credentials["password"])
     
     # Submit the form without filling any mandatory fields
     company_page.click_create_button()
@@ -36,9 +36,9 @@ def test_TC_02(page: Page):
     company_helper.assert_address_required_error(page, company_page, "test_TC_02")
     company_helper.assert_owner_required_error(page, company_page, "test_TC_02")
 
-def test_TC_03(page: Page):
+def test_TC_03(page: Page, company_credentials):
     """Verify company name minimum length validation error message."""
-    company_page = company_helper.navigate_to_company_creation_form(page, "nua26i@onemail.host", "Kabir123#")
+    company_page = company_helper.navigate_to_company_creation_form(page, company_credentials["email"], company_credentials["password"])
     
     # Fill mandatory fields with invalid short company name
     company_page.fill_company_name_input("AB")
@@ -47,9 +47,9 @@ def test_TC_03(page: Page):
     time.sleep(2)
     company_helper.assert_company_name_min_length_error(page, company_page, "test_TC_03")
 
-def test_TC_04(page: Page):
+def test_TC_04(page: Page, company_credentials):
     """Verify company name maximum length validation error message."""
-    company_page = company_helper.navigate_to_company_creation_form(page, "nua26i@onemail.host", "Kabir123#")
+    company_page = company_helper.navigate_to_company_creation_form(page, company_credentials["email"], company_credentials["password"])
     
     # Fill mandatory fields with invalid long company name
     company_page.fill_company_name_input("A" * 85)
@@ -58,9 +58,9 @@ def test_TC_04(page: Page):
     time.sleep(2)
     company_helper.assert_company_name_max_length_error(page, company_page, "test_TC_04")
 
-def test_TC_05(page: Page):
+def test_TC_05(page: Page, company_credentials):
     """Verify company name special character validation error message."""
-    company_page = company_helper.navigate_to_company_creation_form(page, "nua26i@onemail.host", "Kabir123#")
+    company_page = company_helper.navigate_to_company_creation_form(page, company_credentials["email"], company_credentials["password"])
     
     # Fill mandatory fields with invalid special character company name
     company_page.fill_company_name_input("#Invalid Company")
@@ -69,16 +69,16 @@ def test_TC_05(page: Page):
     time.sleep(2)
     company_helper.assert_company_name_special_char_error(page, company_page, "test_TC_05")
 
-def test_TC_06(page: Page):
+def test_TC_06(page: Page, company_credentials):
     """Verify file upload size validation error."""
-    company_page = company_helper.navigate_to_company_creation_form(page, "nua26i@onemail.host", "Kabir123#")
+    company_page = company_helper.navigate_to_company_creation_form(page, company_credentials["email"], company_credentials["password"])
     company_page.upload_file("images_for_test/pexels-6MB.jpg")
     time.sleep(2)
     company_helper.assert_file_size_validation_error(page, company_page, "test_TC_06")
 
-def test_TC_07(page: Page):
+def test_TC_07(page: Page, company_credentials):
     """Verify file type upload validation error."""
-    company_page = company_helper.navigate_to_company_creation_form(page, "nua26i@onemail.host", "Kabir123#")
+    company_page = company_helper.navigate_to_company_creation_form(page, company_credentials["email"], company_credentials["password"])
     company_page.upload_file("images_for_test/file-PDF_1MB.pdf")
     time.sleep(2)
     company_helper.assert_file_type_validation_error(page, company_page, "test_TC_07")
@@ -96,9 +96,9 @@ def test_TC_08(page: Page):
     # company_helper.assert_company_logo_visible_with_name(page, company_page, unique_company_name, "test_TC_08")
 
 #Test case 09 & 10 will use the same random generated company name.
-def test_TC_09(page: Page, created_company_name):
+def test_TC_09(page: Page, company_credentials, created_company_name):
     """Verify successful company creation with all mandatory fields."""
-    company_page = company_helper.navigate_to_company_creation_form(page, "nua26i@onemail.host", "Kabir123#")
+    company_page = company_helper.navigate_to_company_creation_form(page, company_credentials["email"], company_credentials["password"])
     
     # Fill all mandatory fields: name, industry, website, owner, address
     company_page.fill_company_name_input(created_company_name)
@@ -111,10 +111,10 @@ def test_TC_09(page: Page, created_company_name):
     time.sleep(2)
     company_helper.assert_company_created_successfully(page, company_page, created_company_name, "test_TC_09")
 
-def test_TC_10(page: Page, created_company_name):
+def test_TC_10(page: Page, company_credentials, created_company_name):
     """Verify duplicate company name validation using the company created in TC_09."""
     # Login and navigate to company page (same as any other test)
-    company_page = company_helper.navigate_to_company_creation_form(page, "nua26i@onemail.host", "Kabir123#")
+    company_page = company_helper.navigate_to_company_creation_form(page, company_credentials["email"], company_credentials["password"])
     
     # Fill form with the SAME company name from TC_09 (guaranteed duplicate)
     company_page.fill_company_name_input(created_company_name)
@@ -131,19 +131,19 @@ def test_TC_10(page: Page, created_company_name):
     company_helper.assert_company_name_already_exists_error(page, company_page, "test_TC_10")
     print(f"✅ Duplicate validation confirmed for company name: '{created_company_name}'")
 
-def test_TC_11(page: Page, created_company_name):
+def test_TC_11(page: Page, company_credentials, created_company_name):
     """Verify navigation to company details page via clicking first company."""
-    company_helper.navigate_to_company_details_via_first_link(page, "nua26i@onemail.host", "Kabir123#", created_company_name, "test_TC_11")
+    company_helper.navigate_to_company_details_via_first_link(page, company_credentials["email"], company_credentials["password"], created_company_name, "test_TC_11")
 
-def test_TC_12(page: Page, created_company_name):
+def test_TC_12(page: Page, company_credentials, created_company_name):
     """Verify deletion of company created in TC_09."""
-    company_helper.delete_company_and_verify(page, "nua26i@onemail.host", "Kabir123#", created_company_name, "test_TC_12")
+    company_helper.delete_company_and_verify(page, company_credentials["email"], company_credentials["password"], created_company_name, "test_TC_12")
     print(f"✅ TC_12: Successfully deleted company: '{created_company_name}'")
 
-def test_TC_13(page: Page):
+def test_TC_13(page: Page, company_credentials):
     """Verify bulk deletion of few individual companies (3-5) using individual checkboxes."""
     # Use existing bulk deletion helper with individual selection
-    company_helper.bulk_delete_companies_and_verify(page, "nua26i@onemail.host", "Kabir123#", select_all=False, individual_count=4, test_name="test_TC_13")
+    company_helper.bulk_delete_companies_and_verify(page, company_credentials["email"], company_credentials["password"], select_all=False, individual_count=4, test_name="test_TC_13")
 
 
 
@@ -9,16 +9,6 @@ from utils.jd_helper import (do_apply_all_filters, do_jd_login,do_open_filters_p
 from utils.enhanced_assertions import (enhanced_assert_visible,enhanced_assert_not_visible,)
 from utils.config import BASE_URL
 
-@pytest.fixture(scope="module")
-def admin_credentials():
-    """Admin credentials for JD management tests"""
-    return {"email": "mi003b@onemail.host", "password": "Kabir123#"}
-
-@pytest.fixture(scope="module")
-def test_agency_info():
-    """Test agency information for JD operations"""
-    return {"agency_name": "demo 06","agency_id": "174","company_name": "company for test",}
-
 @pytest.fixture(scope="module")
 def test_jd_data():
     """Generate test JD data for the module"""
@@ -36,14 +26,14 @@ def fresh_jd_data():
     print(f"Generated fresh JD data: {asdict(jd_data)}")
     return jd_data
 
-def test_TC_01(page: Page, admin_credentials):
+def test_TC_01(page: Page, admin_credentials, tenant):
     """TC_01: Verify JD list empty state display"""
     print("🧪 TC_01: Testing JD list empty state")
 
-    # Use agency 173 which has no JDs
-    empty_agency_id = "173"
+    # Use the tenant's agency which has no JDs
+    empty_agency_id = tenant.agency("empty")["agency_id"]
 
-    # Login and navigate to JD page for agency 173
+    # Login and navigate to JD page for the empty agency
     jd_page = do_jd_login(page, admin_credentials["email"], admin_credentials["password"], empty_agency_id)
     time.sleep(2)
 
@@ -55,14 +45,14 @@ def test_TC_01(page: Page, admin_credentials):
 
     print("✅ TC_01 passed: JD list empty state working correctly")
 
-def test_TC_02(page: Page, admin_credentials):
+def test_TC_02(page: Page, admin_credentials, tenant):
     """TC_02: Verify JD creation modal heading and form fields presence"""
     print("🧪 TC_02: Testing JD creation modal heading and form fields")
 
-    # Use agency 173 (empty state agency)
-    empty_agency_id = "173"
+    # Use the tenant's empty-state agency
+    empty_agency_id = tenant.agency("empty")["agency_id"]
 
-    # Login and navigate to JD page for agency 173
+    # Login and navigate to JD page for the empty agency
     jd_page = do_jd_login(page, admin_credentials["email"], admin_credentials["password"], empty_agency_id)
 
     # Click on "Add new JD" button
@@ -440,12 +430,12 @@ def test_TC_13(page: Page, admin_credentials, test_agency_info):
 
     print("✅ TC_13 passed: JD search no results message working correctly")
 
-def test_TC_14(page: Page, test_agency_info):
+def test_TC_14(page: Page, admin_credentials, test_agency_info):
     """Verify that filter panel is accessible and all 12 filter headings are visible."""
     print("\n🧪 TC_14: Testing filter panel accessibility and filter headings visibility")
 
     # Login to agency with JD data (agency 174)
-    jd_page = do_jd_login(page, "mi003b@onemail.host", "Kabir123#", test_agency_info["agency_id"])
+    jd_page = do_jd_login(page, admin_credentials["email"], admin_credentials["password"], test_agency_info["agency_id"])
     # time.sleep(0.5)
     
     # Open filters panel
@@ -460,12 +450,12 @@ def test_TC_14(page: Page, test_agency_info):
     
     print("✅ TC_14 passed: Filter panel accessible, all filter headings visible")
 
-def test_TC_15(page: Page, test_agency_info):
+def test_TC_15(page: Page, admin_credentials, test_agency_info):
     """Verify that applying company filter displays only JDs from that company."""
     print("\n🧪 TC_15: Testing single company filter application")
 
     # Login to agency with JD data (agency 174)
-    jd_page = do_jd_login(page, "mi003b@onemail.host", "Kabir123#", test_agency_info["agency_id"])
+    jd_page = do_jd_login(page, admin_credentials["email"], admin_credentials["password"], test_agency_info["agency_id"])
     time.sleep(0.5)
     
     # Open filters panel
@@ -479,12 +469,12 @@ def test_TC_15(page: Page, test_agency_info):
 
     print("✅ TC_15 passed: Company filter working correctly, only matching JDs displayed")
 
-def test_TC_16(page: Page, test_agency_info):
+def test_TC_16(page: Page, admin_credentials, test_agency_info):
     """Verify that applying multiple filter fields at once works correctly with AND logic."""
     print("\n🧪 TC_16: Testing multiple filters applied at once")
 
     # Login to agency with JD data (agency 174)
-    jd_page = do_jd_login(page, "mi003b@onemail.host", "Kabir123#", test_agency_info["agency_id"])
+    jd_page = do_jd_login(page, admin_credentials["email"], admin_credentials["password"], test_agency_info["agency_id"])
     
     # Open filters panel
     do_open_filters_panel(page)
@@ -497,12 +487,12 @@ def test_TC_16(page: Page, test_agency_info):
     
     print("\n✅ TC_16 passed: Multiple filters applied successfully, AND logic verified")
 
-def test_TC_17(page: Page, test_agency_info):
+def test_TC_17(page: Page, admin_credentials, test_agency_info):
     """Verify that applying multiple filters (Company + Hiring Status) works with AND logic."""
     print("\n🧪 TC_17: Testing multiple filters with AND logic")
     
     # Login to agency with JD data (agency 174)
-    jd_page = do_jd_login(page, "mi003b@onemail.host", "Kabir123#", test_agency_info["agency_id"])
+    jd_page = do_jd_login(page, admin_credentials["email"], admin_credentials["password"], test_agency_info["agency_id"])
     time.sleep(2)
     
     # Open filters panel
@@ -544,12 +534,12 @@ def test_TC_17(page: Page, test_agency_info):
     
     print("✅ TC_17 passed: Multiple filters work with AND logic, and clearing restores all JDs")
 
-def test_TC_18(page: Page, test_agency_info):
+def test_TC_18(page: Page, admin_credentials, test_agency_info):
     """TC_18: Verify JD share functionality - sharing JD with user and then deleting user from share"""
     print("\n🧪 TC_18: Testing JD share and delete user functionality")
     
     # Login to agency with JD data (agency 174)
-    jd_page = do_jd_login(page, "mi003b@onemail.host", "Kabir123#", test_agency_info["agency_id"])
+    jd_page = do_jd_login(page, admin_credentials["email"], admin_credentials["password"], test_agency_info["agency_id"])
     time.sleep(2)
     
     # Open share modal for the first JD in the list
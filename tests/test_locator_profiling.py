@@ -0,0 +1,52 @@
+import pytest
+from playwright.sync_api import Page
+from locators.loc_jd import JDLocators
+from locators.loc_company import CompanyLocators
+from locators.loc_client import ClientLocators
+from locators.loc_user_management import UserManagementLocators
+from locators.loc_login import LoginLocators
+from utils.locator_profiler import LocatorProfiler
+from utils.jd_helper import do_jd_login
+from utils.company_helper import navigate_to_company_list
+from utils.client_helper import do_client_login_and_navigate
+from utils.user_management_helper import do_user_management_login
+from utils.config import BASE_URL
+
+# Locator profiling runs only with --profile-locators (it resolves every locator many times)
+
+@pytest.fixture(scope="module")
+def locator_profiler(request):
+    """Profiler shared by the module - the report is exported after the last page"""
+    if not request.config.getoption("--profile-locators"):
+        pytest.skip("locator profiling runs only with --profile-locators")
+    profiler = LocatorProfiler()
+    yield profiler
+    if profiler.pages_profiled:
+        print("\n" + profiler.format_report())
+        profiler.export()
+
+def test_profile_login_page_locators(page: Page, locator_profiler):
+    """Profile login page locators"""
+    page.goto(f"{BASE_URL}/login/")
+    page.wait_for_load_state("networkidle")
+    assert locator_profiler.profile_page(page, [LoginLocators], "login") > 0
+
+def test_profile_jd_list_locators(page: Page, locator_profiler, admin_credentials, test_agency_info):
+    """Profile JD locators on the JD list of the test agency"""
+    do_jd_login(page, admin_credentials["email"], admin_credentials["password"], test_agency_info["agency_id"])
+    assert locator_profiler.profile_page(page, [JDLocators], "jd_list") > 0
+
+def test_profile_company_list_locators(page: Page, locator_profiler, company_credentials):
+    """Profile company locators on the company list"""
+    navigate_to_company_list(page, company_credentials["email"], company_credentials["password"])
+    assert locator_profiler.profile_page(page, [CompanyLocators], "company_list") > 0
+
+def test_profile_client_list_locators(page: Page, locator_profiler):
+    """Profile client locators on the client list"""
+    do_client_login_and_navigate(page)
+    assert locator_profiler.profile_page(page, [ClientLocators], "client_list") > 0
+
+def test_profile_user_management_locators(page: Page, locator_profiler, admin_credentials):
+    """Profile user management locators on the Roles & Access tab"""
+    do_user_management_login(page, admin_credentials["email"], admin_credentials["password"])
+    assert locator_profiler.profile_page(page, [UserManagementLocators], "roles_access") > 0
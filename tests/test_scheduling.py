@@ -0,0 +1,137 @@
+import os
+import re
+import pytest
+from utils.flaky_tracker import history_key
+
+pytest_plugins = ["pytester"]
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+# Same collection hook as the project conftest: tryfirst, so the xdist_group marks exist before xdist reads them
+CONFTEST = """
+import pytest
+from utils.test_scheduler import apply_schedule, check_dist_mode
+
+def pytest_addoption(parser):
+    group = parser.getgroup("bprp")
+    group.addoption("--duration-order", action="store_true", default=False)
+    group.addoption("--num-shards", type=int, default=None)
+    group.addoption("--shard-id", type=int, default=None)
+    group.addoption("--coupling-report", action="store_true", default=False)
+
+def pytest_configure(config):
+    check_dist_mode(config)
+
+@pytest.hookimpl(tryfirst=True)
+def pytest_collection_modifyitems(session, config, items):
+    apply_schedule(config, items)
+"""
+
+# test_read only passes on the worker that ran test_create
+COUPLED_TESTS = """
+import pytest
+
+@pytest.fixture(scope="module")
+def created_record():
+    return {}
+
+def test_create(created_record):
+    created_record["name"] = "record"
+
+def test_read(created_record):
+    assert created_record["name"] == "record"
+
+def test_rename(created_record):
+    created_record["name"] += " renamed"
+"""
+
+FREE_TESTS = """
+import time
+import pytest
+
+@pytest.mark.parametrize("n", range(12))
+def test_free(n):
+    time.sleep(0.05)
+"""
+
+RESULT_LINE = re.compile(r"\[(gw\d+)\].*?(PASSED|FAILED|ERROR) (\S+)")
+
+
+@pytest.fixture
+def project(pytester, monkeypatch):
+    """Pytester project with one coupled unit and a dozen free tests, importing this repo's utils"""
+    monkeypatch.setenv("PYTHONPATH", ROOT + os.pathsep + os.environ.get("PYTHONPATH", ""))
+    pytester.makeconftest(CONFTEST)
+    pytester.makepyfile(test_coupled=COUPLED_TESTS, test_free=FREE_TESTS)
+    return pytester
+
+
+def worker_results(result) -> dict:
+    """{nodeid: (worker, outcome)} from the verbose xdist output"""
+    results = {}
+    for line in result.outlines:
+        match = RESULT_LINE.search(line)
+        if match:
+            results[match.group(3)] = (match.group(1), match.group(2))
+    return results
+
+
+def coupled(results: dict) -> dict:
+    return {nodeid: value for nodeid, value in results.items() if nodeid.startswith("test_coupled.py")}
+
+
+def test_coupled_unit_runs_on_one_worker(project):
+    """Tests sharing written module state get one xdist group and run on one worker, in collection order"""
+    result = project.runpytest_subprocess("-n", "2", "--dist", "loadgroup", "-v")
+    result.assert_outcomes(passed=15)
+    unit = coupled(worker_results(result))
+    assert len(unit) == 3
+    assert all("@" in nodeid for nodeid in unit), "xdist_group marks were added after xdist's collection hook"
+    assert len({worker for worker, _ in unit.values()}) == 1
+    assert [history_key(nodeid).split("::")[1] for nodeid in unit] == ["test_create", "test_read", "test_rename"]
+
+
+def test_duration_order_keeps_unit_together(project):
+    """--duration-order under xdist reorders whole units; the coupled tests still share a worker"""
+    result = project.runpytest_subprocess("-n", "2", "--dist", "loadgroup", "--duration-order", "-v")
+    result.assert_outcomes(passed=15)
+    unit = coupled(worker_results(result))
+    assert len(unit) == 3
+    assert len({worker for worker, _ in unit.values()}) == 1
+
+
+def test_shards_split_units_whole(project):
+    """Both shards together run every test once, and the coupled unit lands in one shard on one worker"""
+    shards = []
+    for shard_id in (0, 1):
+        result = project.runpytest_subprocess("-n", "2", "--dist", "loadgroup", "--num-shards", "2",
+                                              "--shard-id", str(shard_id), "-v")
+        assert result.ret == 0
+        shards.append(worker_results(result))
+    ran = [history_key(nodeid) for shard in shards for nodeid in shard]
+    assert len(ran) == len(set(ran)) == 15
+    units = [coupled(shard) for shard in shards]
+    assert sorted(len(unit) for unit in units) == [0, 3]
+    unit = units[0] or units[1]
+    assert len({worker for worker, _ in unit.values()}) == 1
+
+
+def test_coupling_report(project):
+    """The report names the coupled unit and why; free tests are only counted"""
+    result = project.runpytest_subprocess("--collect-only", "-q", "--coupling-report")
+    result.stdout.fnmatch_lines([
+        "*1 coupled units (3 tests), 12 free tests",
+        "*test_coupled.py::test_create (3 tests): state: created_record",
+        "*test_create -> test_read -> test_rename",
+    ])
+
+
+@pytest.mark.parametrize("nodeid, key", [
+    ("tests/test_jd.py::test_TC_03@tests/test_jd.py::test_TC_01", "tests/test_jd.py::test_TC_03"),
+    ("tests/test_login.py::test_TC_01[a@b.com]", "tests/test_login.py::test_TC_01[a@b.com]"),
+    ("tests/test_login.py::test_TC_01[a@b.com]@tests/test_login.py::test_TC_01_a_b.com_",
+     "tests/test_login.py::test_TC_01[a@b.com]"),
+])
+def test_history_key_strips_group_suffix(nodeid, key):
+    """Flaky history is kept per test, with or without the xdist group suffix"""
+    assert history_key(nodeid) == key
@@ -0,0 +1,67 @@
+import pytest
+from playwright.sync_api import Page
+from utils.search_benchmark import SearchBenchmark, SearchTarget, pick_hit_term, load_previous_run
+from utils.jd_helper import do_jd_login
+from utils.client_helper import do_client_login_and_navigate
+from utils.company_helper import navigate_to_company_list
+from utils.user_management_helper import do_user_management_login
+
+# Search latency benchmark - runs only with --benchmark; each run is saved and compared with the previous one
+
+pytestmark = pytest.mark.benchmark
+
+@pytest.fixture(scope="module")
+def search_benchmark():
+    """Benchmark shared by the module - saved and compared with the previous run after the last target"""
+    benchmark = SearchBenchmark()
+    yield benchmark
+    if not benchmark.samples:
+        return
+    previous = load_previous_run()
+    print("\n" + benchmark.format_report())
+    print(f"📊 Search benchmark saved to {benchmark.save()}")
+    if previous:
+        for regression in benchmark.compare(previous):
+            print(f"⚠️ Search regression: {regression}")
+
+def _run(page: Page, benchmark: SearchBenchmark, target: SearchTarget, dataset: str):
+    hit_term = pick_hit_term(target.results)
+    if not hit_term:
+        pytest.skip(f"{target.name}: no results on {dataset} to derive a matching term from")
+    samples = benchmark.run_target(page, target, hit_term, dataset)
+    assert any(sample["render_ms"] is not None for sample in samples), f"{target.name}: results never rendered"
+
+@pytest.mark.parametrize("area", ["jd", "client"])
+def test_benchmark_jd_search(page: Page, search_benchmark, admin_credentials, tenant, area):
+    """Benchmark JD search latency on two agencies of the tenant (different data set sizes)"""
+    dataset = f"{area}_agency"
+    jd_page = do_jd_login(page, admin_credentials["email"], admin_credentials["password"],
+                          tenant.agency(area)["agency_id"])
+    target = SearchTarget("jd_search", jd_page.locators.search_input,
+                          page.locator(".jd-card, [class*='jd-card'], [data-testid='jd-card']"),
+                          submit=lambda: page.keyboard.press("Enter"))
+    _run(page, search_benchmark, target, dataset)
+
+def test_benchmark_client_search(page: Page, search_benchmark):
+    """Benchmark client search latency (search as you type)"""
+    client_page = do_client_login_and_navigate(page)
+    target = SearchTarget("client_search", client_page.locators.search_clients_input,
+                          client_page.locators.view_details_button)
+    _run(page, search_benchmark, target, "client_agency")
+
+def test_benchmark_company_search(page: Page, search_benchmark, company_credentials):
+    """Benchmark company search latency"""
+    company_page = navigate_to_company_list(page, company_credentials["email"], company_credentials["password"])
+    search_input = page.locator("input[placeholder*='search' i], input[type='search']").first
+    target = SearchTarget("company_search", search_input, company_page.locators.view_details_button,
+                          submit=lambda: search_input.press("Enter"))
+    _run(page, search_benchmark, target, "company_list")
+
+def test_benchmark_role_search(page: Page, search_benchmark, admin_credentials):
+    """Benchmark role search latency on the Roles & Access tab"""
+    user_mgmt_page = do_user_management_login(page, admin_credentials["email"], admin_credentials["password"])
+    search_button = user_mgmt_page.locators.search_role_button
+    target = SearchTarget("role_search", user_mgmt_page.locators.role_search_input.first,
+                          page.locator("tbody tr, .role-item"),
+                          submit=lambda: search_button.click() if search_button.count() > 0 else None)
+    _run(page, search_benchmark, target, "demo_06")
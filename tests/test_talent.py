@@ -23,62 +23,62 @@ def test_talent_helper(page: Page):
 # NAVIGATION & UI STRUCTURE TESTS
 # =============================================================================
 
-def test_TC_01_navigate_to_talent_section_from_dashboard(page: Page):
+def test_TC_01_navigate_to_talent_section_from_dashboard(page: Page, company_credentials):
     """Verify that Agency Personnel can successfully navigate to the 'Talent' section from the main dashboard and view available talent management options."""
     helper = TalentHelper(page)
-    talent_page = helper.do_talent_login("nua26i@onemail.host", "Kabir123#")
+    talent_page = helper.do_talent_login(company_credentials["email"], company_credentials["password"])
     helper.validate_talent_navigation_accessibility()
 
-def test_TC_02_add_new_talent_button_opens_form(page: Page):
+def test_TC_02_add_new_talent_button_opens_form(page: Page, company_credentials):
     """Verify that clicking the '+ New Talent' button opens a well-structured form for creating a new talent profile."""
     helper = TalentHelper(page)
-    talent_page = helper.do_talent_login("nua26i@onemail.host", "Kabir123#")
+    talent_page = helper.do_talent_login(company_credentials["email"], company_credentials["password"])
     helper.validate_add_new_talent_form_structure()
 
-def test_TC_03_form_responsiveness_mobile(page: Page):
+def test_TC_03_form_responsiveness_mobile(page: Page, company_credentials):
     """Verify that the "Create and Update Talent Profile" form is fully responsive and functional on mobile devices."""
     helper = TalentHelper(page)
-    talent_page = helper.do_talent_login("nua26i@onemail.host", "Kabir123#")
+    talent_page = helper.do_talent_login(company_credentials["email"], company_credentials["password"])
     helper.validate_form_responsiveness_mobile()
 
-def test_TC_04_cancel_button_discards_changes(page: Page):
+def test_TC_04_cancel_button_discards_changes(page: Page, company_credentials):
     """Verify that clicking the "Cancel" button on the talent creation/edit form discards changes and redirects to the talent list without saving any input."""
     helper = TalentHelper(page)
-    talent_page = helper.do_talent_login("nua26i@onemail.host", "Kabir123#")
+    talent_page = helper.do_talent_login(company_credentials["email"], company_credentials["password"])
     helper.validate_cancel_button_discards_changes()
 
 # FORM VALIDATION TESTS
 # =============================================================================
 
-def test_TC_05_mandatory_fields_validation_empty_form(page: Page):
+def test_TC_05_mandatory_fields_validation_empty_form(page: Page, company_credentials):
     """Verify that all mandatory fields in the new talent form are enforced by the system and appropriate warnings are shown if skipped."""
     helper = TalentHelper(page)
-    talent_page = helper.do_talent_login("nua26i@onemail.host", "Kabir123#")
+    talent_page = helper.do_talent_login(company_credentials["email"], company_credentials["password"])
     helper.validate_required_fields_empty_form()  # Use helper method for validation
     talent_page.click_cancel_button()  # Close modal
 
-def test_TC_06_First_and_last_name_character_limit_validation(page: Page):
+def test_TC_06_First_and_last_name_character_limit_validation(page: Page, company_credentials):
     """Validate that the Full Name field accepts only 2 to 50 characters and displays an error otherwise."""
     helper = TalentHelper(page)
-    talent_page = helper.do_talent_login("nua26i@onemail.host", "Kabir123#")
+    talent_page = helper.do_talent_login(company_credentials["email"], company_credentials["password"])
     helper.do_name_fields_character_limit_validation()
 
-def test_TC_07_estimated_age_validation_invalid_range_minimum(page: Page):
+def test_TC_07_estimated_age_validation_invalid_range_minimum(page: Page, company_credentials):
     """Confirm that age below 18 shows validation error."""
     helper = TalentHelper(page)
-    talent_page = helper.do_talent_login("nua26i@onemail.host", "Kabir123#")
+    talent_page = helper.do_talent_login(company_credentials["email"], company_credentials["password"])
     helper.validate_age_minimum_range_error()
 
-def test_TC_08_estimated_age_validation_invalid_range_maximum(page: Page):
+def test_TC_08_estimated_age_validation_invalid_range_maximum(page: Page, company_credentials):
     """Confirm that age above 70 shows validation error."""
     helper = TalentHelper(page)
-    talent_page = helper.do_talent_login("nua26i@onemail.host", "Kabir123#")
+    talent_page = helper.do_talent_login(company_credentials["email"], company_credentials["password"])
     helper.validate_age_maximum_range_error()
 
-def test_TC_09_estimated_age_valid_range(page: Page):
+def test_TC_09_estimated_age_valid_range(page: Page, company_credentials):
     """Ensure that a valid Estimated Age value (within 18-70) is accepted and saved correctly."""
     helper = TalentHelper(page)
-    talent_page = helper.do_talent_login("nua26i@onemail.host", "Kabir123#")
+    talent_page = helper.do_talent_login(company_credentials["email"], company_credentials["password"])
     helper.do_valid_age_range_validation()
 
 def test_TC_10_comprehensive_talent_creation_with_all_fields_and_files(page: Page):
@@ -96,10 +96,10 @@ def test_TC_10_comprehensive_talent_creation_with_all_fields_and_files(page: Pag
     helper.assert_talent_appears_in_list_with_correct_values(talent_data)
 
 #Not tested yet.
-def test_TC_11_comprehensive_talent_edit_with_education_and_cv(page: Page):
+def test_TC_11_comprehensive_talent_edit_with_education_and_cv(page: Page, company_credentials):
     """Create talent, view details, edit personal info with new data, add education and CV, then verify updates."""
     helper = TalentHelper(page)
-    talent_page = helper.do_talent_login("nua26i@onemail.host", "Kabir123#")
+    talent_page = helper.do_talent_login(company_credentials["email"], company_credentials["password"])
     updated_talent_data = helper.do_comprehensive_talent_edit_with_education_and_cv()
 
 def test_TC_12_phone_number_format_validation(page: Page):
@@ -12,11 +12,6 @@ def test_role_name():
     return f"Test Role {generate_role_name()}"
 
 
-@pytest.fixture(scope="module")
-def admin_credentials():
-    return {"email": "mi003b@onemail.host", "password": "Kabir123#"}
-
-
 def test_TC_01(page: Page, admin_credentials):
     """Verify successful navigation to user management."""
     user_mgmt_page = do_user_management_login(page, admin_credentials["email"], admin_credentials["password"])
@@ -6,31 +6,33 @@ Contains utility functions for agency tests
 from playwright.sync_api import Page
 from utils.config import BASE_URL
 from utils.login_helper import do_login
+from utils.tenant_pool import current_tenant
 from conftest import wait_for_action_completion
 from utils.enhanced_assertions import enhanced_assert_visible, enhanced_assert_not_visible
 import time
 
-def do_agency_login(page: Page, email: str, password: str):
+def do_agency_login(page: Page, email: str = None, password: str = None):
     """
     Helper function to login and handle agency page
     
     Args:
         page: Playwright page object
-        email: User email
-        password: User password
+        email: User email (default: the tenant's agency account)
+        password: User password (default: the tenant's agency password)
     
     Returns:
         AgencyPage instance
     """
     from pages.agency_page import AgencyPage
     agency_page = AgencyPage(page)
-    do_login(page, email, password)
+    account = current_tenant().account("agency")
+    do_login(page, email or account["email"], password or account["password"])
     # Small wait for agency page to load
     time.sleep(2)
     return agency_page
 
-def do_create_agency(page: Page, agency_name: str, email: str = "gi7j8d@mepost.pw", 
-                    password: str = "Kabir123#", website: str = "https://testagency123.com",
+def do_create_agency(page: Page, agency_name: str, email: str = None, 
+                    password: str = None, website: str = "https://testagency123.com",
                     address: str = "123 Test Agency St", 
                     description: str = "This is a test agency for automation."):
     """
@@ -39,8 +41,8 @@ def do_create_agency(page: Page, agency_name: str, email: str = "gi7j8d@mepost.p
     Args:
         page: Playwright page object
         agency_name: Name of the agency to create
-        email: Login email (optional)
-        password: Login password (optional)
+        email: Login email (default: the tenant's agency account)
+        password: Login password (default: the tenant's agency password)
         website: Agency website (optional)
         address: Agency address (optional)
         description: Agency description (optional)
@@ -48,10 +50,7 @@ def do_create_agency(page: Page, agency_name: str, email: str = "gi7j8d@mepost.p
     Returns:
         AgencyPage instance
     """
-    from pages.agency_page import AgencyPage
-    agency_page = AgencyPage(page)
-    do_login(page, email, password)
-    time.sleep(2)
+    agency_page = do_agency_login(page, email, password)
     
     print(f"🔧 Creating agency: {agency_name}")
     
@@ -0,0 +1,495 @@
+"""
+Async Page Object Generator
+Generates playwright.async_api variants of the page objects (and the helpers they use) into async_pages/,
+so one event loop can drive many browser contexts concurrently. The sync modules stay the source of truth:
+functions that (transitively) call Playwright become `async def`, those calls are awaited, `with page.expect_*()`
+becomes `async with`, and `time.sleep` becomes `asyncio.sleep`. Comments and formatting are kept.
+
+Usage:
+    python -m utils.async_codegen          # regenerate async_pages/
+    python -m utils.async_codegen --check  # exit 1 when async_pages/ is out of date
+"""
+
+import os
+import re
+import ast
+import sys
+import argparse
+from typing import Dict, List, Optional, Set, Tuple
+
+OUTPUT_PACKAGE = "async_pages"
+
+# Sync modules converted into async_pages/ (page objects first, then the helpers they use)
+SOURCE_MODULES = [
+    "pages.login_page",
+    "pages.jd_page",
+    "pages.client_page",
+    "pages.company_page",
+    "utils.login_helper",
+    "utils.enhanced_assertions",
+    "utils.web_perf_collector",
+    "utils.dropdown_driver",
+    "utils.form_fill",
+    "utils.strategy_resolver",
+    "utils.page_scripts",
+    "utils.quiescence",
+    "utils.toast_recorder",
+    "utils.modal_tracker",
+    "utils.jd_helper",
+    "utils.client_helper",
+    "utils.company_helper",
+]
+
+# Functions taken from conftest.py into async_pages/conftest_utils.py (conftest itself stays sync)
+CONFTEST_FUNCTIONS = ["wait_for_action_completion"]
+CONFTEST_MODULE = "conftest_utils"
+
+# Playwright methods that are coroutines in the async API (Page, Locator, Keyboard, Mouse, BrowserContext, CDPSession)
+PLAYWRIGHT_COROUTINES = {
+    "add_cookies", "add_init_script", "all", "all_inner_texts", "all_text_contents", "aria_snapshot", "blur",
+    "bounding_box", "bring_to_front", "check", "clear", "clear_cookies", "click", "close", "content", "cookies",
+    "count", "dblclick", "dispatch_event", "dispose", "down", "drag_and_drop", "drag_to", "element_handle", "element_handles",
+    "emulate_media", "evaluate", "evaluate_all", "evaluate_handle", "expose_function", "fill", "focus",
+    "get_attribute", "go_back", "go_forward", "goto", "highlight", "hover", "inner_html", "inner_text",
+    "input_value", "insert_text", "is_checked", "is_disabled", "is_editable", "is_enabled", "is_hidden",
+    "is_visible", "move", "new_cdp_session", "new_context", "new_page", "pause", "press", "press_sequentially",
+    "query_selector", "query_selector_all", "reload", "route", "screenshot", "scroll_into_view_if_needed",
+    "select_option", "select_text", "send", "set_checked", "set_files", "set_content", "set_extra_http_headers",
+    "set_input_files", "set_viewport_size", "storage_state", "tap", "text_content", "type", "uncheck", "unroute",
+    "up", "wait_for", "wait_for_event", "wait_for_function", "wait_for_load_state", "wait_for_selector",
+    "wait_for_timeout", "wait_for_url", "wheel",
+}
+
+# Playwright event context managers (`with page.expect_file_chooser() as info:` -> `async with`, `await info.value`)
+PLAYWRIGHT_EVENT_MANAGERS = {
+    "expect_console_message", "expect_download", "expect_event", "expect_file_chooser", "expect_navigation",
+    "expect_page", "expect_popup", "expect_request", "expect_request_finished", "expect_response",
+    "expect_websocket", "expect_worker",
+}
+
+# Parameter names that hold coroutine functions in the async layer (decorated functions, strategies, checks)
+ASYNC_CALLABLE_PARAMS = {"func", "test_func", "strategy", "accept", "prepare"}
+
+# Functions that cannot be coroutines
+SYNC_ONLY_FUNCTIONS = {"__init__", "__set_name__", "__get__"}
+
+_ASSERTION_PATTERN = re.compile(r"^(not_)?to_\w+$")
+_CONTAINER_CALLS = {"dict", "list", "set"}
+
+
+def _module_path(module: str, root: str) -> str:
+    return os.path.join(root, *module.split(".")) + ".py"
+
+
+def _target_module(module: str) -> str:
+    return f"{OUTPUT_PACKAGE}.{module}"
+
+
+# Imports rewritten in the generated modules: sync module -> async module
+MODULE_MAP = {module: _target_module(module) for module in SOURCE_MODULES}
+MODULE_MAP["conftest"] = _target_module(CONFTEST_MODULE)
+MODULE_MAP["playwright.sync_api"] = "playwright.async_api"
+
+
+def _target_path(module: str, root: str) -> str:
+    return _module_path(_target_module(module), root)
+
+
+class ModuleInfo:
+    """Parsed source module with the names needed for the async analysis"""
+
+    def __init__(self, module: str, source: bytes, tree: ast.Module):
+        self.module = module
+        self.source = source
+        self.tree = tree
+        self.functions: Dict[str, ast.AST] = {}            # module-level functions
+        self.classes: Dict[str, Dict[str, ast.AST]] = {}   # class -> methods
+        self.containers: Set[str] = set()                  # module-level dict/list/set names
+        self.imported_functions: Dict[str, Tuple[str, str]] = {}  # local name -> (converted module, name)
+        self.module_aliases: Dict[str, str] = {}           # local name -> converted module
+        self.plain_modules: Set[str] = set()               # names bound to other imported modules (re, os, ...)
+        for node in tree.body:
+            if isinstance(node, (ast.FunctionDef, ast.AsyncFunctionDef)):
+                self.functions[node.name] = node
+            elif isinstance(node, ast.ClassDef):
+                self.classes[node.name] = {n.name: n for n in node.body if isinstance(n, (ast.FunctionDef, ast.AsyncFunctionDef))}
+            elif isinstance(node, (ast.Assign, ast.AnnAssign)):
+                value = node.value
+                targets = node.targets if isinstance(node, ast.Assign) else [node.target]
+                is_container = isinstance(value, (ast.Dict, ast.List, ast.Set)) or (
+                    isinstance(value, ast.Call) and isinstance(value.func, ast.Name) and value.func.id in _CONTAINER_CALLS)
+                if is_container:
+                    self.containers.update(t.id for t in targets if isinstance(t, ast.Name))
+
+
+class AsyncAnalysis:
+    """Decides which functions become coroutines and which calls are awaited"""
+
+    def __init__(self, modules: Dict[str, ModuleInfo]):
+        self.modules = modules
+        self.async_functions: Dict[str, Set[str]] = {m: set() for m in modules}        # module -> function names
+        self.async_methods: Dict[Tuple[str, str], Set[str]] = {}                       # (module, class) -> methods
+        self.sync_method_names: Set[str] = set()
+        self.warnings: List[str] = []
+        for name, info in modules.items():
+            for node in ast.walk(info.tree):
+                if isinstance(node, (ast.Import, ast.ImportFrom)):
+                    self._record_import(info, node)
+            for class_name in info.classes:
+                self.async_methods[(name, class_name)] = set()
+        self._solve()
+
+    def _record_import(self, info: ModuleInfo, node):
+        if isinstance(node, ast.ImportFrom) and node.module in self.modules:
+            for alias in node.names:
+                info.imported_functions[alias.asname or alias.name] = (node.module, alias.name)
+        elif isinstance(node, ast.Import):
+            for alias in node.names:
+                if alias.name in self.modules and alias.asname:
+                    info.module_aliases[alias.asname] = alias.name
+                else:
+                    info.plain_modules.add(alias.asname or alias.name.split(".")[0])
+
+    def _all_async_method_names(self) -> Set[str]:
+        names = set()
+        for methods in self.async_methods.values():
+            names |= methods
+        return names
+
+    def is_awaited(self, call: ast.Call, info: ModuleInfo, class_name: Optional[str], local_async: Set[str]) -> bool:
+        """Whether a call returns an awaitable in the async layer"""
+        func = call.func
+        if isinstance(func, ast.Name):
+            name = func.id
+            if name in local_async or name in ASYNC_CALLABLE_PARAMS:
+                return True
+            if name in self.async_functions[info.module]:
+                return True
+            imported = info.imported_functions.get(name)
+            return bool(imported and imported[1] in self.async_functions[imported[0]])
+        if isinstance(func, ast.Call):
+            # getattr(page_object, method_name)(...) on page objects
+            return isinstance(func.func, ast.Name) and func.func.id == "getattr" and not (
+                isinstance(func.args[0], ast.Attribute) and func.args[0].attr == "locators")
+        if not isinstance(func, ast.Attribute):
+            return False
+
+        attr, receiver = func.attr, func.value
+        if isinstance(receiver, ast.Name) and receiver.id == "time" and attr == "sleep":
+            return True
+        if _ASSERTION_PATTERN.match(attr) and isinstance(receiver, ast.Call) and \
+                isinstance(receiver.func, ast.Name) and receiver.func.id == "expect":
+            return True
+        if attr in PLAYWRIGHT_EVENT_MANAGERS:
+            return False  # used with async with
+        if isinstance(receiver, (ast.Constant, ast.JoinedStr)):
+            return False
+        if isinstance(receiver, ast.Name):
+            if receiver.id in info.containers or receiver.id in info.plain_modules:
+                return False
+            if receiver.id in info.module_aliases:
+                return attr in self.async_functions[info.module_aliases[receiver.id]]
+            if receiver.id == "self" and class_name is not None:
+                methods = info.classes.get(class_name, {})
+                if attr in methods:
+                    return attr in self.async_methods[(info.module, class_name)]
+        if attr in PLAYWRIGHT_COROUTINES:
+            return not (attr == "count" and call.args)  # str.count / list.count take an argument
+        return attr in self._all_async_method_names() and attr not in self.sync_method_names
+
+    def _contains_await(self, func_node, info: ModuleInfo, class_name: Optional[str]) -> bool:
+        local_async = {n.name for n in ast.walk(func_node)
+                       if isinstance(n, ast.FunctionDef) and n is not func_node and getattr(n, "_becomes_async", False)}
+        for node in _walk_own_body(func_node):
+            if isinstance(node, ast.Call) and self.is_awaited(node, info, class_name, local_async):
+                return True
+            if isinstance(node, ast.With) and _is_event_with(node):
+                return True
+        return False
+
+    def _function_nodes(self):
+        """(function node, module info, class name, is top level) of every function, nested ones included"""
+        for info in self.modules.values():
+            for node in info.tree.body:
+                owners = [(item, node.name) for item in node.body] if isinstance(node, ast.ClassDef) else [(node, None)]
+                for owner, class_name in owners:
+                    if not isinstance(owner, ast.FunctionDef):
+                        continue
+                    for func in ast.walk(owner):
+                        if isinstance(func, ast.FunctionDef):
+                            yield func, info, class_name, func is owner
+
+    def _solve(self):
+        """Fixed point: a function is async when its own body awaits something"""
+        functions = list(self._function_nodes())
+        changed = True
+        while changed:
+            changed = False
+            for func, info, class_name, top_level in functions:
+                if getattr(func, "_becomes_async", False) or func.name in SYNC_ONLY_FUNCTIONS:
+                    continue
+                if not self._contains_await(func, info, class_name):
+                    continue
+                func._becomes_async = True
+                changed = True
+                if top_level and class_name:
+                    self.async_methods[(info.module, class_name)].add(func.name)
+                elif top_level:
+                    self.async_functions[info.module].add(func.name)
+
+        all_async = self._all_async_method_names()
+        for (module, class_name), methods in self.async_methods.items():
+            self.sync_method_names.update(m for m in self.modules[module].classes[class_name] if m not in methods)
+        for method in sorted(all_async & self.sync_method_names):
+            self.warnings.append(f"method name '{method}' is async in one class and sync in another - "
+                                 "calls on other objects are not awaited")
+        self.sync_method_names -= PLAYWRIGHT_COROUTINES
+
+
+def _walk_own_body(func_node):
+    """Walk a function body without descending into nested functions, classes or lambdas (lambdas are yielded)"""
+    stack = list(func_node.body)
+    while stack:
+        node = stack.pop()
+        if isinstance(node, (ast.FunctionDef, ast.AsyncFunctionDef, ast.ClassDef)):
+            continue
+        yield node
+        if not isinstance(node, ast.Lambda):
+            stack.extend(ast.iter_child_nodes(node))
+
+
+def _is_event_with(node: ast.With) -> bool:
+    """`with page.expect_file_chooser() as info:` style Playwright event context managers"""
+    return any(isinstance(item.context_expr, ast.Call) and isinstance(item.context_expr.func, ast.Attribute)
+               and item.context_expr.func.attr in PLAYWRIGHT_EVENT_MANAGERS for item in node.items)
+
+
+class _Edits:
+    """Byte-offset text edits applied in one pass"""
+
+    def __init__(self, source: bytes):
+        self.source = source
+        self.line_starts = [0]
+        for line in source.split(b"\n")[:-1]:
+            self.line_starts.append(self.line_starts[-1] + len(line) + 1)
+        self.items = []  # (offset, order, span, end, text)
+
+    def offset(self, lineno: int, col: int) -> int:
+        return self.line_starts[lineno - 1] + col
+
+    def insert_start(self, node, text: str):
+        start, end = self.offset(node.lineno, node.col_offset), self.offset(node.end_lineno, node.end_col_offset)
+        self.items.append((start, 1, -(end - start), start, text))
+
+    def insert_end(self, node, text: str):
+        start, end = self.offset(node.lineno, node.col_offset), self.offset(node.end_lineno, node.end_col_offset)
+        self.items.append((end, 0, end - start, end, text))
+
+    def replace(self, node, text: str):
+        start, end = self.offset(node.lineno, node.col_offset), self.offset(node.end_lineno, node.end_col_offset)
+        self.items.append((start, 2, 0, end, text))
+
+    def apply(self) -> bytes:
+        out = []
+        cursor = 0
+        for start, _, _, end, text in sorted(self.items, key=lambda item: item[:3]):
+            out.append(self.source[cursor:start])
+            out.append(text.encode("utf-8"))
+            cursor = max(cursor, end)
+        out.append(self.source[cursor:])
+        return b"".join(out)
+
+
+def _needs_parentheses(node, parents: Dict[int, ast.AST]) -> bool:
+    parent = parents.get(id(node))
+    if isinstance(parent, (ast.Attribute, ast.Subscript)) and parent.value is node:
+        return True
+    return isinstance(parent, ast.Call) and parent.func is node
+
+
+def _rewrite_import(node, source: str) -> Optional[str]:
+    """Import statement with converted modules pointing to async_pages/ (None when unchanged)"""
+    segment = ast.get_source_segment(source, node)
+    rewritten = segment
+    for module in sorted(MODULE_MAP, key=len, reverse=True):
+        rewritten = re.sub(rf"(?<![\w.]){re.escape(module)}(?![\w])", MODULE_MAP[module], rewritten)
+    return rewritten if rewritten != segment else None
+
+
+def convert_module(info: ModuleInfo, analysis: AsyncAnalysis, source_name: str) -> str:
+    """Convert one parsed sync module to async source text"""
+    edits = _Edits(info.source)
+    parents = {}
+    for node in ast.walk(info.tree):
+        for child in ast.iter_child_nodes(node):
+            parents[id(child)] = node
+
+    event_names: Set[str] = set()
+    text = info.source.decode("utf-8")
+
+    def visit_function(func_node, class_name):
+        local_async = {n.name for n in ast.walk(func_node)
+                       if isinstance(n, ast.FunctionDef) and getattr(n, "_becomes_async", False)}
+        if getattr(func_node, "_becomes_async", False):
+            edits.items.append((edits.offset(func_node.lineno, func_node.col_offset), 1, 0,
+                                edits.offset(func_node.lineno, func_node.col_offset), "async "))
+            if any(isinstance(d, ast.Name) and d.id == "property" for d in func_node.decorator_list):
+                analysis.warnings.append(f"{source_name}:{func_node.lineno} property '{func_node.name}' awaits - "
+                                         "callers must await the attribute")
+        for node in _walk_own_body(func_node):
+            if isinstance(node, ast.Call) and analysis.is_awaited(node, info, class_name, local_async):
+                wrap = _needs_parentheses(node, parents)
+                edits.insert_start(node, "(await " if wrap else "await ")
+                if wrap:
+                    edits.insert_end(node, ")")
+                func = node.func
+                if isinstance(func, ast.Attribute) and isinstance(func.value, ast.Name) and \
+                        func.value.id == "time" and func.attr == "sleep":
+                    edits.replace(func.value, "asyncio")
+            elif isinstance(node, ast.GeneratorExp) and any(
+                    isinstance(n, ast.Call) and analysis.is_awaited(n, info, class_name, local_async) for n in ast.walk(node)):
+                analysis.warnings.append(f"{source_name}:{node.lineno} awaited call inside a generator expression")
+            elif isinstance(node, ast.Lambda):
+                inner = [n for n in ast.walk(node.body) if isinstance(n, ast.Call)
+                         and analysis.is_awaited(n, info, class_name, local_async)]
+                if inner and not (len(inner) == 1 and inner[0] is node.body):
+                    analysis.warnings.append(f"{source_name}:{node.lineno} lambda uses the result of an awaited call")
+            elif isinstance(node, ast.With) and _is_event_with(node):
+                edits.items.append((edits.offset(node.lineno, node.col_offset), 1, 0,
+                                    edits.offset(node.lineno, node.col_offset), "async "))
+                for item in node.items:
+                    if isinstance(item.optional_vars, ast.Name):
+                        event_names.add(item.optional_vars.id)
+            elif isinstance(node, (ast.Import, ast.ImportFrom)):
+                rewritten = _rewrite_import(node, text)
+                if rewritten is not None:
+                    edits.replace(node, rewritten)
+        for node in _walk_own_body(func_node):
+            if isinstance(node, ast.Attribute) and node.attr == "value" and isinstance(node.value, ast.Name) \
+                    and node.value.id in event_names:
+                wrap = _needs_parentheses(node, parents)
+                edits.insert_start(node, "(await " if wrap else "await ")
+                if wrap:
+                    edits.insert_end(node, ")")
+        for node in ast.walk(func_node):
+            if isinstance(node, ast.FunctionDef) and node is not func_node and _enclosing_function(node, parents) is func_node:
+                visit_function(node, class_name)
+
+    for node in info.tree.body:
+        if isinstance(node, ast.FunctionDef):
+            visit_function(node, None)
+        elif isinstance(node, ast.ClassDef):
+            for item in node.body:
+                if isinstance(item, ast.FunctionDef):
+                    visit_function(item, node.name)
+        elif isinstance(node, (ast.Import, ast.ImportFrom)):
+            rewritten = _rewrite_import(node, text)
+            if rewritten is not None:
+                edits.replace(node, rewritten)
+
+    first_import = next((n for n in info.tree.body if isinstance(n, (ast.Import, ast.ImportFrom))), None)
+    if first_import is not None:
+        edits.items.append((edits.offset(first_import.lineno, 0), 1, 0,
+                            edits.offset(first_import.lineno, 0), "import asyncio\n"))
+    body = edits.apply().decode("utf-8")
+    header = f"# Generated by utils/async_codegen.py from {source_name} - do not edit, regenerate instead\n"
+    return header + body
+
+
+def _enclosing_function(node, parents):
+    parent = parents.get(id(node))
+    while parent is not None and not isinstance(parent, (ast.FunctionDef, ast.AsyncFunctionDef)):
+        parent = parents.get(id(parent))
+    return parent
+
+
+def _conftest_source(root: str) -> bytes:
+    """conftest functions used by the converted helpers, as a standalone module"""
+    with open(os.path.join(root, "conftest.py"), "rb") as f:
+        source = f.read().decode("utf-8-sig")
+    tree = ast.parse(source)
+    parts = ['"""\nShared wait utilities from conftest.py\n"""\n\nfrom playwright.sync_api import Page\n']
+    for node in tree.body:
+        if isinstance(node, ast.FunctionDef) and node.name in CONFTEST_FUNCTIONS:
+            parts.append(ast.get_source_segment(source, node))
+    return "\n\n".join(parts).encode("utf-8") + b"\n"
+
+
+def load_modules(root: str) -> Dict[str, ModuleInfo]:
+    modules = {}
+    for module in SOURCE_MODULES:
+        with open(_module_path(module, root), "rb") as f:
+            source = f.read()
+        if source.startswith(b"\xef\xbb\xbf"):
+            source = source[3:]
+        modules[module] = ModuleInfo(module, source, ast.parse(source))
+    conftest_source = _conftest_source(root)
+    modules[CONFTEST_MODULE] = ModuleInfo(CONFTEST_MODULE, conftest_source, ast.parse(conftest_source))
+    return modules
+
+
+def generate(root: str = ".") -> Tuple[Dict[str, str], List[str]]:
+    """
+    Generate the async modules
+
+    Returns:
+        tuple: ({output path: source}, warnings)
+    """
+    modules = load_modules(root)
+    # "from conftest import ..." resolves to the extracted functions
+    for info in modules.values():
+        for node in ast.walk(info.tree):
+            if isinstance(node, ast.ImportFrom) and node.module == "conftest":
+                node.module = CONFTEST_MODULE
+    analysis = AsyncAnalysis(modules)
+
+    outputs = {}
+    for module, info in modules.items():
+        source_name = "conftest.py" if module == CONFTEST_MODULE else module.replace(".", "/") + ".py"
+        outputs[_target_path(module, root)] = convert_module(info, analysis, source_name)
+
+    package_dirs = {os.path.dirname(path) for path in outputs}
+    package_dirs.add(os.path.join(root, OUTPUT_PACKAGE))
+    for directory in package_dirs:
+        init_path = os.path.join(directory, "__init__.py")
+        if init_path not in outputs and os.path.abspath(directory) != os.path.abspath(os.path.join(root, OUTPUT_PACKAGE)):
+            outputs[init_path] = ""
+    return outputs, analysis.warnings
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(description="Generate async_pages/ from the sync page objects")
+    parser.add_argument("--check", action="store_true", help="Only check that async_pages/ is up to date")
+    parser.add_argument("--root", default=".", help="Project root")
+    args = parser.parse_args(argv)
+
+    outputs, warnings = generate(args.root)
+    for warning in warnings:
+        print(f"⚠️ {warning}")
+
+    stale = []
+    for path, source in sorted(outputs.items()):
+        current = None
+        if os.path.exists(path):
+            with open(path, "r", encoding="utf-8") as f:
+                current = f.read()
+        if current == source:
+            continue
+        stale.append(path)
+        if not args.check:
+            os.makedirs(os.path.dirname(path), exist_ok=True)
+            with open(path, "w", encoding="utf-8") as f:
+                f.write(source)
+
+    if args.check:
+        if stale:
+            print(f"❌ async_pages/ is out of date ({len(stale)} files) - run python -m utils.async_codegen")
+            return 1
+        print("✅ async_pages/ is up to date")
+        return 0
+    print(f"✅ Generated {len(outputs)} files, {len(stale)} changed")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,305 @@
+"""
+Shared Browser Server
+One Chromium per machine instead of one per xdist worker: the first worker launches the browser with a
+remote debugging port, every worker connects to it over CDP and creates its own contexts. The endpoint is
+kept in metrics/browser_server/; a health check before every new context reconnects - and relaunches the
+browser when it crashed. The last worker to leave shuts the browser down.
+"""
+
+import json
+import os
+import signal
+import subprocess
+import time
+import urllib.request
+from typing import Optional
+from utils.config import (BROWSER_SERVER_DIR, BROWSER_SERVER_START_TIMEOUT, BROWSER_SERVER_LOCK_TIMEOUT,
+                          HEADLESS, SLOW_MO)
+from utils.metrics_export import get_metrics_path
+
+ENDPOINT_FILE = "endpoint.json"
+LOCK_FILE = "server.lock"
+
+# Playwright's default Chromium switches (chromiumSwitches.ts), so the shared browser behaves like a launched one
+# - most importantly no timer throttling or renderer backgrounding of tabs that are not in front
+CHROMIUM_DEFAULT_ARGS = [
+    "--disable-field-trial-config",
+    "--disable-background-networking",
+    "--disable-background-timer-throttling",
+    "--disable-backgrounding-occluded-windows",
+    "--disable-back-forward-cache",
+    "--disable-breakpad",
+    "--disable-client-side-phishing-detection",
+    "--disable-component-extensions-with-background-pages",
+    "--disable-component-update",
+    "--no-default-browser-check",
+    "--disable-default-apps",
+    "--disable-dev-shm-usage",
+    "--disable-extensions",
+    "--disable-features=ImprovedCookieControls,LazyFrameLoading,GlobalMediaControls,DestroyProfileOnBrowserClose,"
+    "MediaRouter,DialMediaRouteProvider,AcceptCHFrame,AutoExpandDetailsElement,CertificateTransparencyComponentUpdater,"
+    "AvoidUnnecessaryBeforeUnloadCheckSync,Translate,HttpsUpgrades,PaintHolding",
+    "--allow-pre-commit-input",
+    "--disable-hang-monitor",
+    "--disable-ipc-flooding-protection",
+    "--disable-popup-blocking",
+    "--disable-prompt-on-repost",
+    "--disable-renderer-backgrounding",
+    "--force-color-profile=srgb",
+    "--metrics-recording-only",
+    "--no-first-run",
+    "--enable-automation",
+    "--password-store=basic",
+    "--use-mock-keychain",
+    "--no-service-autorun",
+    "--export-tagged-pdf",
+    "--disable-search-engine-choice-screen",
+    "--unsafely-disable-devtools-self-xss-warnings",
+]
+CHROMIUM_HEADLESS_ARGS = [
+    "--headless=new",
+    "--hide-scrollbars",
+    "--mute-audio",
+    "--blink-settings=primaryHoverType=2,availableHoverTypes=2,primaryPointerType=4,availablePointerTypes=4",
+]
+
+
+def chromium_args(profile_dir: str, headless: bool = HEADLESS) -> list:
+    """
+    Command line switches of the shared browser: Playwright's defaults plus a debugging port and profile
+
+    Playwright launches Chromium with chromiumSandbox off, i.e. with --no-sandbox (needed when CI runs as
+    root); the shared browser does the same except on Windows, where the sandbox works without privileges.
+    """
+    args = CHROMIUM_DEFAULT_ARGS + ["--remote-debugging-port=0", f"--user-data-dir={profile_dir}"]
+    if headless:
+        args += CHROMIUM_HEADLESS_ARGS
+    if os.name != "nt":
+        args.append("--no-sandbox")
+    return args
+
+
+def _pid_alive(pid: int) -> bool:
+    """True while a process runs (always True on Windows, where signal 0 would terminate it)"""
+    if os.name == "nt":
+        return True
+    try:
+        os.kill(pid, 0)
+    except ProcessLookupError:
+        return False
+    except PermissionError:
+        pass
+    return True
+
+
+def endpoint_healthy(endpoint: str, timeout: float = 2) -> bool:
+    """True when the browser answers on its debugging endpoint"""
+    try:
+        with urllib.request.urlopen(f"{endpoint}/json/version", timeout=timeout) as response:
+            return "webSocketDebuggerUrl" in json.loads(response.read().decode("utf-8"))
+    except (OSError, ValueError):
+        return False
+
+
+class BrowserServer:
+    """
+    Launches (once per machine) and connects to the shared browser; one instance per worker process
+    """
+
+    def __init__(self, playwright, worker: str, server_dir: str = None):
+        """
+        Initialize server handle
+
+        Args:
+            playwright: Started sync Playwright instance of this worker
+            worker: Worker id ("gw0", ... or "master")
+            server_dir: Directory of the endpoint, lock and client files (default metrics/browser_server)
+        """
+        self.playwright = playwright
+        self.worker = worker
+        self.server_dir = server_dir or get_metrics_path(BROWSER_SERVER_DIR)
+        os.makedirs(self.server_dir, exist_ok=True)
+        self.client_file = os.path.join(self.server_dir, f"{worker}-{os.getpid()}.client")
+        self.browser = None
+        self.restarts = 0
+
+    # ===== LOCKING =====
+
+    def _lock(self):
+        """Machine-wide lock around launching the browser (lock file; a stale lock is taken over)"""
+        path = os.path.join(self.server_dir, LOCK_FILE)
+        deadline = time.time() + BROWSER_SERVER_LOCK_TIMEOUT
+        while True:
+            try:
+                os.close(os.open(path, os.O_CREAT | os.O_EXCL | os.O_WRONLY))
+                return
+            except FileExistsError:
+                try:
+                    if time.time() - os.path.getmtime(path) > BROWSER_SERVER_LOCK_TIMEOUT:
+                        print("⚠️ Taking over stale browser server lock")
+                        os.remove(path)
+                        continue
+                except OSError:
+                    continue  # Released meanwhile
+                if time.time() > deadline:
+                    raise TimeoutError(f"Browser server lock {path} held for over {BROWSER_SERVER_LOCK_TIMEOUT}s")
+                time.sleep(0.2)
+
+    def _unlock(self):
+        try:
+            os.remove(os.path.join(self.server_dir, LOCK_FILE))
+        except OSError:
+            pass
+
+    # ===== SERVER =====
+
+    def _read_endpoint(self) -> Optional[dict]:
+        try:
+            with open(os.path.join(self.server_dir, ENDPOINT_FILE), "r", encoding="utf-8") as f:
+                return json.load(f)
+        except (OSError, ValueError):
+            return None
+
+    def _launch(self) -> dict:
+        """Launch the bundled Chromium with a debugging port and wait until it answers"""
+        profile_dir = os.path.join(self.server_dir, "profile")
+        os.makedirs(profile_dir, exist_ok=True)
+        port_file = os.path.join(profile_dir, "DevToolsActivePort")
+        if os.path.exists(port_file):
+            os.remove(port_file)
+        args = [self.playwright.chromium.executable_path] + chromium_args(profile_dir) + ["about:blank"]
+        process = subprocess.Popen(args, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL,
+                                   start_new_session=os.name != "nt")
+
+        deadline = time.time() + BROWSER_SERVER_START_TIMEOUT
+        while time.time() < deadline:
+            if process.poll() is not None:
+                raise RuntimeError(f"Shared browser exited during startup (code {process.returncode})")
+            try:
+                with open(port_file, "r", encoding="utf-8") as f:
+                    port = f.readline().strip()
+            except OSError:
+                port = ""
+            if port and endpoint_healthy(f"http://127.0.0.1:{port}"):
+                server = {"endpoint": f"http://127.0.0.1:{port}", "pid": process.pid, "started": time.time()}
+                with open(os.path.join(self.server_dir, ENDPOINT_FILE), "w", encoding="utf-8") as f:
+                    json.dump(server, f)
+                print(f"🌐 Launched shared browser (pid {process.pid}) at {server['endpoint']}")
+                return server
+            time.sleep(0.2)
+        process.kill()
+        raise TimeoutError(f"Shared browser did not open its debugging port within {BROWSER_SERVER_START_TIMEOUT}s")
+
+    def ensure_server(self) -> str:
+        """Endpoint of a healthy shared browser, launched when none runs (or the previous one crashed)"""
+        server = self._read_endpoint()
+        if server and endpoint_healthy(server["endpoint"]):
+            return server["endpoint"]
+        self._lock()
+        try:
+            server = self._read_endpoint()  # Another worker may have launched it while we waited
+            if server and endpoint_healthy(server["endpoint"]):
+                return server["endpoint"]
+            if server:
+                print(f"⚠️ Shared browser at {server['endpoint']} is not responding - relaunching")
+                self._terminate(server["pid"])
+            return self._launch()["endpoint"]
+        finally:
+            self._unlock()
+
+    def _terminate(self, pid: int):
+        try:
+            os.kill(pid, signal.SIGTERM)
+        except OSError:
+            pass
+
+    # ===== CONNECTION =====
+
+    def connect(self):
+        """Register this worker as a client and connect to the shared browser"""
+        with open(self.client_file, "w", encoding="utf-8") as f:
+            json.dump({"worker": self.worker, "pid": os.getpid()}, f)
+        self.browser = self.playwright.chromium.connect_over_cdp(self.ensure_server(), slow_mo=SLOW_MO)
+        print(f"🔌 Worker {self.worker} connected to the shared browser")
+        return self.browser
+
+    def healthy_browser(self):
+        """The connected browser; reconnects (relaunching a crashed browser) when the connection is gone"""
+        server = self._read_endpoint()
+        if self.browser is not None and self.browser.is_connected() and server and endpoint_healthy(server["endpoint"]):
+            return self.browser
+        self.restarts += 1
+        print(f"♻️ Worker {self.worker} lost the shared browser - reconnecting (restart {self.restarts})")
+        try:
+            self.browser.close()
+        except Exception:
+            pass
+        self.browser = self.playwright.chromium.connect_over_cdp(self.ensure_server(), slow_mo=SLOW_MO)
+        return self.browser
+
+    def new_context(self, **kwargs):
+        """New context of this worker on the shared browser (health-checked)"""
+        return self.healthy_browser().new_context(**kwargs)
+
+    def close(self):
+        """Disconnect; the last client shuts the shared browser down"""
+        if self.browser is not None:
+            try:
+                self.browser.close()  # Closes this worker's contexts and disconnects
+            except Exception:
+                pass
+            self.browser = None
+        try:
+            os.remove(self.client_file)
+        except OSError:
+            pass
+        self._lock()
+        try:
+            if self._live_clients():
+                return
+            server = self._read_endpoint()
+            if server:
+                print(f"🛑 Last worker done - shutting down the shared browser (pid {server['pid']})")
+                self._terminate(server["pid"])
+                try:
+                    os.remove(os.path.join(self.server_dir, ENDPOINT_FILE))
+                except OSError:
+                    pass
+        finally:
+            self._unlock()
+
+    def _live_clients(self) -> int:
+        """Clients still connected (client files of crashed workers are removed)"""
+        live = 0
+        for name in os.listdir(self.server_dir):
+            if not name.endswith(".client"):
+                continue
+            path = os.path.join(self.server_dir, name)
+            try:
+                with open(path, "r", encoding="utf-8") as f:
+                    pid = json.load(f)["pid"]
+            except (OSError, ValueError, KeyError):
+                continue
+            if _pid_alive(pid):
+                live += 1
+            else:
+                os.remove(path)
+        return live
+
+
+class SharedBrowser:
+    """
+    Stands in for the Browser of the browser fixture: new_context goes through the health check, everything
+    else is delegated to the current connection
+    """
+
+    def __init__(self, server: BrowserServer):
+        """Initialize with this worker's server handle"""
+        self._server = server
+
+    def new_context(self, **kwargs):
+        """New context of this worker (reconnects first when the shared browser is gone)"""
+        return self._server.new_context(**kwargs)
+
+    def __getattr__(self, name):
+        return getattr(self._server.healthy_browser(), name)
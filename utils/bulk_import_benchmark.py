@@ -0,0 +1,267 @@
+"""
+Bulk Import Benchmark
+Uploads generated JD CSV files of increasing row counts and measures, per size, the upload time, the server
+processing time and the time until the JD list shows the imported rows. Finds the knee where processing
+time stops growing linearly with the row count, then deletes the imported rows again (their titles carry
+the run tag). Runs are saved under metrics/bulk_import_benchmark/.
+"""
+
+import csv
+import math
+import os
+import re
+import time
+import uuid
+from typing import Dict, List, Optional
+from playwright.sync_api import Page
+from utils.config import (BULK_BENCH_ROW_COUNTS, BULK_BENCH_PROCESS_TIMEOUT, BULK_BENCH_LIST_TIMEOUT,
+                          BULK_BENCH_POLL_MS, BULK_BENCH_CLEANUP_TIMEOUT, BULK_BENCH_KNEE_EXPONENT,
+                          BULK_BENCH_REGRESSION)
+from utils.jd_file_test_helper import JDFileTestHelper
+from utils.metrics_export import save_benchmark_run, load_latest_benchmark_run
+
+BULK_BENCH_DIR = "bulk_import_benchmark"
+GENERATED_FILES_DIR = "generated"
+JD_CARD_SELECTOR = ".jd-card, [class*='jd-card']"
+
+# Messages shown when the server finished processing an import
+PROCESSED_PATTERN = re.compile(
+    r"JDs imported successfully|Processing completed|File imported successfully|Import finished", re.IGNORECASE)
+
+
+def row_title(tag: str, index: int) -> str:
+    """Unique title prefix of a generated row"""
+    return f"{tag}-{index:05d}"
+
+
+def generate_jd_csv(rows: int, tag: str, directory: str = None) -> str:
+    """
+    Write a bulk JD CSV with `rows` rows, based on the rows of bulk_jd_data.csv
+
+    Every position title starts with "<tag>-<row number>" so the imported rows can be found in the list.
+
+    Args:
+        rows: Number of JD rows
+        tag: Unique tag of this run
+        directory: Output directory (default: images_for_test/jd_files/generated)
+
+    Returns:
+        str: Path of the generated file
+    """
+    helper = JDFileTestHelper()
+    with open(helper.get_valid_file_path("bulk"), "r", encoding="utf-8", newline="") as f:
+        reader = csv.DictReader(f)
+        fieldnames = reader.fieldnames
+        templates = list(reader)
+
+    directory = directory or str(helper.test_files_dir / GENERATED_FILES_DIR)
+    os.makedirs(directory, exist_ok=True)
+    path = os.path.join(directory, f"bulk_jd_{rows}.csv")
+    with open(path, "w", encoding="utf-8", newline="") as f:
+        writer = csv.DictWriter(f, fieldnames=fieldnames, quoting=csv.QUOTE_NONNUMERIC)
+        writer.writeheader()
+        for i in range(rows):
+            row = dict(templates[i % len(templates)])
+            row["position_title"] = f"{row_title(tag, i)} {row['position_title']}"
+            writer.writerow(row)
+    return path
+
+
+def scaling_exponents(results: List[Dict]) -> List[Optional[float]]:
+    """
+    Growth exponent of processing time between consecutive sizes: log(t2/t1) / log(n2/n1)
+
+    1.0 means processing time grows linearly with the row count, 2.0 quadratically.
+    """
+    exponents = [None]
+    for previous, current in zip(results, results[1:]):
+        t1, t2 = previous.get("processing_ms"), current.get("processing_ms")
+        if not t1 or not t2 or current["rows"] == previous["rows"]:
+            exponents.append(None)
+            continue
+        exponents.append(round(math.log(t2 / t1) / math.log(current["rows"] / previous["rows"]), 2))
+    return exponents
+
+
+class BulkImportBenchmark:
+    """
+    Uploads JD files of increasing size through the page object's bulk import dialog
+    """
+
+    def __init__(self, jd_page, agency_id: str, row_counts: List[int] = None):
+        """
+        Initialize benchmark
+
+        Args:
+            jd_page: JDPage instance (logged in)
+            agency_id: Agency whose JD list receives the imports
+            row_counts: Sizes to import, smallest first (default BULK_BENCH_ROW_COUNTS)
+        """
+        self.jd_page = jd_page
+        self.page: Page = jd_page.page
+        self.agency_id = agency_id
+        self.row_counts = sorted(row_counts or BULK_BENCH_ROW_COUNTS)
+        self.tag = f"BENCH{uuid.uuid4().hex[:6].upper()}"
+        self.results: List[Dict] = []
+
+    def _upload(self, file_path: str) -> Dict:
+        """Upload through the bulk import dialog, timing the upload request and the processing"""
+        size = os.path.getsize(file_path)
+        self.jd_page.navigate_to_jd_page(self.agency_id)
+        self.jd_page.click_upload_file_button_for_bulk_import()
+        with self.page.expect_file_chooser() as fc_info:
+            self.jd_page.locators.browse_files_button.click()
+
+        start = time.time()
+        # The upload is the POST that carries (at least most of) the file
+        with self.page.expect_request_finished(
+                lambda request: request.method in ("POST", "PUT") and len(request.post_data_buffer or b"") >= size // 2,
+                timeout=BULK_BENCH_PROCESS_TIMEOUT) as request_info:
+            fc_info.value.set_files(file_path)
+        uploaded = time.time()
+        request = request_info.value
+        response = request.response()
+
+        processed = None
+        try:
+            self.page.get_by_text(PROCESSED_PATTERN).first.wait_for(state="visible", timeout=BULK_BENCH_PROCESS_TIMEOUT)
+            processed = time.time()
+        except Exception:
+            print(f"⚠️ No processing-complete message within {BULK_BENCH_PROCESS_TIMEOUT / 1000:.0f}s")
+        return {
+            "bytes": size,
+            "status": response.status if response else None,
+            "upload_ms": round((uploaded - start) * 1000),
+            "processing_ms": round((processed - uploaded) * 1000) if processed else None,
+            "processed_at": processed,
+        }
+
+    def _search(self, text: str):
+        """Open the agency's JD list filtered by a search text"""
+        self.page.goto(self.jd_page.locators.jd_page_url.format(agency_id=self.agency_id),
+                       wait_until="domcontentloaded")
+        self.jd_page.locators.search_input.fill(text)
+        self.page.keyboard.press("Enter")
+
+    def _wait_until_listed(self, title: str, since: float) -> Optional[int]:
+        """Search the JD list for a title until it shows up; ms since `since`, or None on timeout"""
+        cards = self.page.locator(JD_CARD_SELECTOR).filter(has_text=title)
+        deadline = since + BULK_BENCH_LIST_TIMEOUT / 1000
+        while time.time() < deadline:
+            self._search(title)
+            try:
+                cards.first.wait_for(state="visible", timeout=BULK_BENCH_POLL_MS)
+                return round((time.time() - since) * 1000)
+            except Exception:
+                continue
+        return None
+
+    def run_size(self, rows: int) -> Dict:
+        """
+        Import one generated file and measure it
+
+        Returns:
+            dict: rows, bytes, status, upload_ms, processing_ms, list_ms (processing done -> last row listed),
+                  rows_per_s (rows / (upload + processing))
+        """
+        print(f"📦 Bulk import benchmark: {rows} rows")
+        file_path = generate_jd_csv(rows, f"{self.tag}R{rows}")
+        result = {"rows": rows}
+        result.update(self._upload(file_path))
+        processed_at = result.pop("processed_at")
+        result["list_ms"] = (self._wait_until_listed(row_title(f"{self.tag}R{rows}", rows - 1), processed_at)
+                             if processed_at else None)
+        total_ms = result["upload_ms"] + (result["processing_ms"] or 0)
+        result["rows_per_s"] = round(rows / (total_ms / 1000), 1) if result["processing_ms"] and total_ms else None
+        print(f"   upload {result['upload_ms']}ms, processing {result['processing_ms']}ms, listed after {result['list_ms']}ms")
+        self.results.append(result)
+        return result
+
+    def run(self) -> List[Dict]:
+        """Import every size, smallest first; stops growing once an import does not finish"""
+        for rows in self.row_counts:
+            if self.run_size(rows)["processing_ms"] is None:
+                print(f"⚠️ Import of {rows} rows did not finish - skipping larger sizes")
+                break
+        return self.results
+
+    def cleanup(self) -> bool:
+        """
+        Delete the JDs this run imported: search the run tag, select all, bulk delete, until none are listed
+
+        Returns:
+            bool: True when no tagged JD is left
+        """
+        cards = self.page.locator(JD_CARD_SELECTOR).filter(has_text=self.tag)
+        deadline = time.time() + BULK_BENCH_CLEANUP_TIMEOUT / 1000
+        rounds = 0
+        while time.time() < deadline:
+            self._search(self.tag)
+            try:
+                cards.first.wait_for(state="visible", timeout=BULK_BENCH_POLL_MS)
+            except Exception:
+                print(f"🧹 Deleted the JDs tagged {self.tag} in {rounds} bulk deletes")
+                return True
+            self.jd_page.select_all_jds()
+            self.jd_page.trigger_bulk_deletion()
+            self.jd_page.confirm_bulk_deletion()
+            rounds += 1
+        print(f"⚠️ JDs tagged {self.tag} are left in agency {self.agency_id} after "
+              f"{BULK_BENCH_CLEANUP_TIMEOUT / 1000:.0f}s of cleanup")
+        return False
+
+    def knee(self) -> Optional[int]:
+        """
+        Smallest row count at which processing time grows faster than linearly
+
+        Returns:
+            int: Row count where the growth exponent first exceeds BULK_BENCH_KNEE_EXPONENT, or None
+        """
+        for result, exponent in zip(self.results, scaling_exponents(self.results)):
+            if exponent is not None and exponent > BULK_BENCH_KNEE_EXPONENT:
+                return result["rows"]
+        return None
+
+    def compare(self, baseline: Dict, threshold: float = BULK_BENCH_REGRESSION) -> List[str]:
+        """
+        Compare throughput per size with a previous run
+
+        Args:
+            baseline: A saved run (see load_previous_run)
+            threshold: Relative drop of rows/s reported as a regression (0.2 = 20%)
+
+        Returns:
+            list: Regression descriptions
+        """
+        before = {result["rows"]: result.get("rows_per_s") for result in baseline.get("results", [])}
+        regressions = []
+        for result in self.results:
+            old, new = before.get(result["rows"]), result["rows_per_s"]
+            if old and new and new < old * (1 - threshold):
+                regressions.append(f"{result['rows']} rows: {old:.1f} -> {new:.1f} rows/s (-{(1 - new / old) * 100:.0f}%)")
+        previous_knee = baseline.get("knee")
+        if self.knee() and (previous_knee is None or self.knee() < previous_knee):
+            regressions.append(f"processing turns nonlinear at {self.knee()} rows (before: {previous_knee or 'never'})")
+        return regressions
+
+    def format_report(self) -> str:
+        """Human-readable summary of the run"""
+        lines = ["📦 Bulk JD import throughput",
+                 f"   {'rows':>6}{'upload ms':>11}{'process ms':>12}{'listed ms':>11}{'rows/s':>9}{'growth':>8}"]
+        fmt = lambda value: f"{value}" if value is not None else "-"
+        for result, exponent in zip(self.results, scaling_exponents(self.results)):
+            lines.append(f"   {result['rows']:>6}{result['upload_ms']:>11}{fmt(result['processing_ms']):>12}"
+                         f"{fmt(result['list_ms']):>11}{fmt(result['rows_per_s']):>9}{fmt(exponent):>8}")
+        knee = self.knee()
+        lines.append(f"   Knee: processing turns nonlinear at {knee} rows" if knee else "   Knee: none (processing scales linearly)")
+        return "\n".join(lines)
+
+    def save(self, export_dir: str = None) -> str:
+        """Save this run as metrics/bulk_import_benchmark/run_<timestamp>.json"""
+        return save_benchmark_run(BULK_BENCH_DIR, {"tag": self.tag, "agency_id": self.agency_id,
+                                                   "results": self.results, "knee": self.knee()}, export_dir)
+
+
+def load_previous_run(export_dir: str = None) -> Optional[Dict]:
+    """Latest saved bulk import benchmark run, or None (load it before saving the current one)"""
+    return load_latest_benchmark_run(BULK_BENCH_DIR, export_dir)
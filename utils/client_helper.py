@@ -5,23 +5,28 @@ Contains helper functions and decorators for client module tests
 import functools
 from playwright.sync_api import Page
 from pages.client_page import ClientPage
+from utils.modal_tracker import wait_for_modal_closed, open_modals
+from utils.tenant_pool import current_tenant
 
 
-# Default login credentials for client tests
-DEFAULT_EMAIL = "mi003b@onemail.host"
-DEFAULT_PASSWORD = "Kabir123#"
-DEFAULT_AGENCY_ID = "173"
+def _client_login_defaults(email=None, password=None, agency_id=None, area="client"):
+    """Fill missing login values from this worker's tenant (admin account, agency of `area`)."""
+    tenant = current_tenant()
+    account = tenant.account("admin")
+    return (email or account["email"], password or account["password"],
+            agency_id or tenant.agency(area)["agency_id"])
 
 
-def with_client_login(email=DEFAULT_EMAIL, password=DEFAULT_PASSWORD, agency_id=DEFAULT_AGENCY_ID, navigate_to_client_page=True):
+def with_client_login(email=None, password=None, agency_id=None, navigate_to_client_page=True, area="client"):
     """
     Decorator that automatically handles login and navigation to client page for test functions.
     
     Args:
-        email (str): Email for login (default: mi003b@onemail.host)
-        password (str): Password for login (default: Kabir123#)
-        agency_id (str): Agency ID to navigate to (default: 173)
+        email (str): Email for login (default: the tenant's admin account)
+        password (str): Password for login (default: the tenant's admin password)
+        agency_id (str): Agency ID to navigate to (default: the tenant's agency of `area`)
         navigate_to_client_page (bool): Whether to navigate to client page after login (default: True)
+        area (str): Tenant agency area used without agency_id (default: "client", kept free of clients)
     
     Usage:
         @with_client_login()
@@ -30,8 +35,8 @@ def with_client_login(email=DEFAULT_EMAIL, password=DEFAULT_PASSWORD, agency_id=
             # Access ClientPage through page._client_page if needed
             pass
         
-        # With custom agency_id
-        @with_client_login(agency_id="174")
+        # In the tenant's jd agency (the one that holds clients) instead of the empty client agency
+        @with_client_login(area="jd")
         def test_TC_02(page: Page):
             # Test code here
             pass
@@ -49,7 +54,8 @@ def with_client_login(email=DEFAULT_EMAIL, password=DEFAULT_PASSWORD, agency_id=
             client_page = ClientPage(page)
             
             # Perform login and navigation
-            client_page.login_and_navigate_to_agency_dashboard(email, password, agency_id)
+            client_page.login_and_navigate_to_agency_dashboard(
+                *_client_login_defaults(email, password, agency_id, area))
             
             # Navigate to client page if requested
             if navigate_to_client_page:
@@ -65,7 +71,7 @@ def with_client_login(email=DEFAULT_EMAIL, password=DEFAULT_PASSWORD, agency_id=
     return decorator
 
 
-def do_client_login(page: Page, email=DEFAULT_EMAIL, password=DEFAULT_PASSWORD, agency_id=DEFAULT_AGENCY_ID):
+def do_client_login(page: Page, email=None, password=None, agency_id=None):
     """
     Helper function to perform client login and navigation.
     Returns ClientPage instance.
@@ -86,11 +92,11 @@ def do_client_login(page: Page, email=DEFAULT_EMAIL, password=DEFAULT_PASSWORD,
             # Test code here
     """
     client_page = ClientPage(page)
-    client_page.login_and_navigate_to_agency_dashboard(email, password, agency_id)
+    client_page.login_and_navigate_to_agency_dashboard(*_client_login_defaults(email, password, agency_id))
     return client_page
 
 
-def do_client_login_and_navigate(page: Page, email=DEFAULT_EMAIL, password=DEFAULT_PASSWORD, agency_id=DEFAULT_AGENCY_ID):
+def do_client_login_and_navigate(page: Page, email=None, password=None, agency_id=None):
     """
     Helper function to perform client login, navigate to agency dashboard, and then to client page.
     Returns ClientPage instance.
@@ -247,13 +253,9 @@ def select_random_clients_from_first_four(page: Page, count: int = 2):
 
 
 def wait_for_modal_backdrop_hidden(page: Page, timeout: int = 5000):
-    """Wait for any modal backdrop to disappear."""
-    import time
-    time.sleep(1)
-    try:
-        page.wait_for_selector(".modal-backdrop", state="hidden", timeout=timeout)
-    except:
-        pass  # Backdrop might not exist
+    """Wait for every open modal (and with it its backdrop) to close."""
+    if not wait_for_modal_closed(page, timeout=timeout):
+        print(f"⚠️ Modal still open after {timeout}ms: {[modal['name'] for modal in open_modals(page)]}")
 
 
 def wait_for_bulk_delete_success(page: Page, timeout: int = 10000):
@@ -6,38 +6,44 @@ Contains utility functions for company tests
 from playwright.sync_api import Page
 from utils.config import BASE_URL
 from utils.login_helper import do_login
+from utils.tenant_pool import current_tenant
 from conftest import wait_for_action_completion
 from utils.enhanced_assertions import enhanced_assert_visible, enhanced_assert_not_visible
 import time
 import re
 
-def do_company_login(page: Page, email: str, password: str):
+def _company_account(email: str = None, password: str = None):
+    """Fill missing login values from this worker's tenant (company account)"""
+    account = current_tenant().account("company")
+    return email or account["email"], password or account["password"]
+
+def do_company_login(page: Page, email: str = None, password: str = None):
     """
     Helper function to login and return company page instance
     
     Args:
         page: Playwright page object
-        email: User email
-        password: User password
+        email: User email (default: the tenant's company account)
+        password: User password (default: the tenant's company password)
     
     Returns:
         CompanyPage instance
     """
     from pages.company_page import CompanyPage
     company_page = CompanyPage(page)
-    do_login(page, email, password)
+    do_login(page, *_company_account(email, password))
     time.sleep(2)
     return company_page
 
-def navigate_to_company_list(page: Page, email: str, password: str):
+def navigate_to_company_list(page: Page, email: str = None, password: str = None):
     """
     Complete navigation flow to company list page following the sequence:
     Login → Select "Test this agency" → Company Sidebar Link
     
     Args:
         page: Playwright page object
-        email: User email  
-        password: User password
+        email: User email (default: the tenant's company account)
+        password: User password (default: the tenant's company password)
         
     Returns:
         CompanyPage instance positioned at company list page
@@ -74,14 +80,14 @@ def navigate_to_company_list(page: Page, email: str, password: str):
     
     return company_page
 
-def navigate_to_company_details_direct(page: Page, email: str, password: str):
+def navigate_to_company_details_direct(page: Page, email: str = None, password: str = None):
     """
     Direct navigation flow to company details page using exact working locators
     
     Args:
         page: Playwright page object
-        email: User email  
-        password: User password
+        email: User email (default: the tenant's company account)
+        password: User password (default: the tenant's company password)
         
     Returns:
         CompanyPage instance positioned at company details page
@@ -92,7 +98,8 @@ def navigate_to_company_details_direct(page: Page, email: str, password: str):
     print("📍 Starting direct navigation to company details...")
     
     # Direct login flow
-    page.goto("https://bprp-qa.shadhinlab.xyz/login")
+    email, password = _company_account(email, password)
+    page.goto(f"{BASE_URL}/login")
     page.get_by_role("textbox", name="Email").fill(email)
     page.get_by_role("textbox", name="Password").fill(password)
     page.get_by_role("button", name="Sign in").click()
@@ -167,14 +174,14 @@ def navigate_to_company_details(page: Page, email: str, password: str):
     print("📍 Successfully navigated to company details page")
     return company_page
 
-def navigate_to_company_creation_form(page: Page, email: str, password: str):
+def navigate_to_company_creation_form(page: Page, email: str = None, password: str = None):
     """
     Complete navigation flow to company creation form with conditional logic
     
     Args:
         page: Playwright page object
-        email: User email  
-        password: User password
+        email: User email (default: the tenant's company account)
+        password: User password (default: the tenant's company password)
         
     Returns:
         CompanyPage instance positioned at company creation form
@@ -205,7 +212,7 @@ def navigate_to_company_creation_form(page: Page, email: str, password: str):
     return company_page
 
 def create_company_with_basic_info(page: Page, company_name: str, industry: str = "Finance", 
-                                 email: str = "nua26i@onemail.host", password: str = "Kabir123#"):
+                                 email: str = None, password: str = None):
     """
     Create a company with basic required information
     
@@ -213,8 +220,8 @@ def create_company_with_basic_info(page: Page, company_name: str, industry: str
         page: Playwright page object
         company_name: Name of the company to create
         industry: Industry to select (default: Finance)
-        email: Login email
-        password: Login password
+        email: Login email (default: the tenant's company account)
+        password: Login password (default: the tenant's company password)
         
     Returns:
         CompanyPage instance
@@ -235,7 +242,7 @@ def create_company_with_full_info(page: Page, company_name: str, industry: str =
                                 main_tel: str = None, hr_tel: str = None, hiring_status: str = None,
                                 company_grade: str = None, hq_in_japan: str = None, 
                                 job_opening: str = None, owner: str = None,
-                                email: str = "nua26i@onemail.host", password: str = "Kabir123#"):
+                                email: str = None, password: str = None):
     """
     Create a company with full information including optional fields
     
@@ -253,8 +260,8 @@ def create_company_with_full_info(page: Page, company_name: str, industry: str =
         hq_in_japan: Optional HQ in Japan
         job_opening: Optional job opening status
         owner: Optional owner
-        email: Login email
-        password: Login password
+        email: Login email (default: the tenant's company account)
+        password: Login password (default: the tenant's company password)
         
     Returns:
         CompanyPage instance
@@ -415,8 +422,8 @@ def find_company_in_list_and_action(page: Page, company_name: str, action: str =
     return False
 
 def edit_company_info(page: Page, company_name: str, new_company_name: str = None, 
-                     new_industry: str = None, email: str = "nua26i@onemail.host", 
-                     password: str = "Kabir123#"):
+                     new_industry: str = None, email: str = None, 
+                     password: str = None):
     """
     Edit company information
     
@@ -425,8 +432,8 @@ def edit_company_info(page: Page, company_name: str, new_company_name: str = Non
         company_name: Current company name to find
         new_company_name: New company name (optional)
         new_industry: New industry (optional)
-        email: Login email
-        password: Login password
+        email: Login email (default: the tenant's company account)
+        password: Login password (default: the tenant's company password)
         
     Returns:
         CompanyPage instance
@@ -592,14 +599,14 @@ def assert_on_company_details_page(page: Page, company_page, company_name: str,
     company_page.expect_company_details_page(company_name, test_name)
     print(f"✅ On company details page for: {company_name}")
 
-def navigate_to_company_list(page: Page, email: str, password: str):
+def navigate_to_company_list(page: Page, email: str = None, password: str = None):
     """
     Navigate to company list page
     
     Args:
         page: Playwright page object
-        email: User email
-        password: User password
+        email: User email (default: the tenant's company account)
+        password: User password (default: the tenant's company password)
         
     Returns:
         CompanyPage instance positioned at company list
@@ -625,15 +632,15 @@ def assert_duplicate_company_name_error(page: Page, company_page, test_name: str
     company_page.expect_company_name_already_exists_error(test_name)
     print("✅ Duplicate company name validation error displayed correctly")
 
-def create_company_with_all_fields_and_image(page: Page, company_name: str, email: str = "nua26i@onemail.host", password: str = "Kabir123#"):
+def create_company_with_all_fields_and_image(page: Page, company_name: str, email: str = None, password: str = None):
     """
     Complete company creation workflow with all fields including image upload
     
     Args:
         page: Playwright page object
         company_name: Name of the company to create
-        email: Login email
-        password: Login password
+        email: Login email (default: the tenant's company account)
+        password: Login password (default: the tenant's company password)
         
     Returns:
         CompanyPage instance
@@ -850,15 +857,15 @@ def delete_company_and_verify(page: Page, email: str, password: str, company_nam
     return company_page
 
 
-def bulk_delete_companies_and_verify(page: Page, email: str = "nua26i@onemail.host", password: str = "Kabir123#", 
+def bulk_delete_companies_and_verify(page: Page, email: str = None, password: str = None, 
                                     select_all: bool = True, individual_count: int = 0, test_name: str = None):
     """
     Helper function for bulk deletion of companies with verification
     
     Args:
         page: Playwright page object
-        email: User email
-        password: User password
+        email: User email (default: the tenant's company account)
+        password: User password (default: the tenant's company password)
         select_all: If True, select all companies on page. If False, select individual_count companies.
         individual_count: Number of individual companies to select (only used if select_all is False)
         test_name: Test case name for screenshots
@@ -1323,7 +1330,7 @@ class ComprehensiveCompanyTestHelper:
         print("📋 STEP 1: Creating company with all initial values...")
         
         # Navigate to company creation form
-        company_page = navigate_to_company_creation_form(page, "nua26i@onemail.host", "Kabir123#")
+        company_page = navigate_to_company_creation_form(page)
         
         # Fill all fields with initial values
         print("🔧 Filling mandatory fields...")
@@ -1407,1781 +1414,3 @@ class ComprehensiveCompanyTestHelper:
         company_page = CompanyPage(page)
         
         return initial_values, updated_values, company_page
-    
-    @staticmethod
-    def edit_and_assert_company_name_field(page: Page, company_page, initial_values: dict, updated_values: dict):
-        """
-        Edit company name field with validation testing and full assertion.
-        
-        Args:
-            page: Playwright page object
-            company_page: CompanyPage instance
-            initial_values: Dictionary containing initial company values
-            updated_values: Dictionary containing updated company values
-        """
-        from playwright.sync_api import expect
-        
-        print(f"🔧 Editing company name from '{initial_values['company_name']}' to '{updated_values['company_name']}'")
-        
-        # Step 1: Locate the specific company name field container in the summary section
-        company_name_container = page.locator('div.group_single_item.group').filter(has_text=f"Company name:{initial_values['company_name']}")
-        
-        # Step 2: First ensure the container is visible
-        expect(company_name_container).to_be_visible()
-        
-        # Step 3: Hover over the container to make the edit icon appear
-        print("🔍 Hovering over company name field to reveal edit icon...")
-        company_name_container.hover()
-        time.sleep(2)  # Wait longer for edit icon to appear
-        
-        # Step 4: Locate the edit icon within that specific container
-        edit_icon = company_name_container.locator('.group_single_edit_icon')
-        
-        # Step 5: Wait for the icon to be visible and then click
-        print("🔍 Waiting for edit icon to become visible...")
-        expect(edit_icon).to_be_visible(timeout=5000)
-        
-        print("🔍 Clicking edit icon...")
-        edit_icon.click()
-        time.sleep(1)  # Wait for modal to open
-        
-        # Step 6: Wait for the textbox and first test validation with space at end
-        company_name_textbox = page.get_by_role("textbox", name="Company name")
-        company_name_textbox.wait_for(state="visible", timeout=10000)
-        
-        # Test validation: Add space at the end to trigger validation error
-        print("🔍 Testing validation: Adding space at end of company name...")
-        company_name_textbox.clear()
-        company_name_textbox.fill(f"{updated_values['company_name']} ")  # Add space at end
-        time.sleep(0.5)
-        
-        # Try to save with invalid data (space at end)
-        page.get_by_role("button", name="Save").click()
-        time.sleep(2)  # Wait for validation message
-        
-        # Assert validation error appears
-        validation_error = page.get_by_text("Company name should not start or end with special characters.")
-        enhanced_assert_visible(page, validation_error, "Validation error should appear for space at end", "validation_space_at_end")
-        print("✅ Validation error correctly appeared for space at end")
-        
-        # Now clear and input the correct data
-        print("🔧 Now inputting correct company name without space...")
-        company_name_textbox.clear()
-        assert page.get_by_text("Company name is required.").is_visible()  # Ensure validation message is still visible
-        company_name_textbox.fill(updated_values['company_name'])
-        time.sleep(0.5)
-        
-        # Step 7: Save the changes
-        page.get_by_role("button", name="Save").click()
-        time.sleep(2)  # Wait for save to complete
-        
-        # Step 8: Assert the update message appears
-        enhanced_assert_visible(page, company_page.locators.company_updated_successfully_message, "Company info updated message should appear", "edit_company_name")
-        time.sleep(1)
-        
-        # Step 9: Assert the updated company name is visible on the page
-        print(f"🔍 Verifying company name was updated to: {updated_values['company_name']}")
-        # Use more specific locator targeting the Summary section field
-        updated_name_visible = page.locator("div.group_single_item.group").filter(has_text=f"Company name:{updated_values['company_name']}")
-        expect(updated_name_visible).to_be_visible()
-        print(f"✅ Company name successfully updated to: {updated_values['company_name']}")
-    
-    @staticmethod
-    def edit_and_assert_website_field(page: Page, company_page, initial_values: dict, updated_values: dict):
-        """
-        Edit website field with validation testing and full assertion.
-        
-        Args:
-            page: Playwright page object
-            company_page: CompanyPage instance
-            initial_values: Dictionary containing initial company values
-            updated_values: Dictionary containing updated company values
-        """
-        from playwright.sync_api import expect
-        
-        print(f"🔧 Editing website from '{initial_values['website']}' to '{updated_values['website']}'")
-        
-        # Step 1: Locate the specific website field container in the summary section
-        website_container = page.locator('div.group_single_item.group').filter(has_text=f"Web page:{initial_values['website']}")
-        
-        # Step 2: First ensure the container is visible
-        expect(website_container).to_be_visible()
-        
-        # Step 3: Hover over the container to make the edit icon appear
-        print("🔍 Hovering over website field to reveal edit icon...")
-        website_container.hover()
-        time.sleep(2)  # Wait for edit icon to appear
-        
-        # Step 4: Locate and click the edit icon
-        edit_icon = website_container.locator('.group_single_edit_icon')
-        expect(edit_icon).to_be_visible(timeout=5000)
-        edit_icon.click()
-        time.sleep(1)  # Wait for modal to open
-        
-        # Step 5: Test validation with invalid website (without https)
-        # Try multiple locator strategies for the website input
-        try:
-            # First try the standard locator
-            website_textbox = page.get_by_role("textbox", name="Web page")
-            website_textbox.wait_for(state="visible", timeout=5000)
-        except:
-            try:
-                # Try alternative name
-                website_textbox = page.get_by_role("textbox", name="Website")
-                website_textbox.wait_for(state="visible", timeout=5000)
-            except:
-                try:
-                    # Try more generic approach
-                    website_textbox = page.locator("input[placeholder*='website' i], input[name*='website' i]").first
-                    website_textbox.wait_for(state="visible", timeout=5000)
-                except:
-                    # Last resort: use the company page's website input locator
-                    website_textbox = company_page.locators.website_input
-                    website_textbox.wait_for(state="visible", timeout=5000)
-        
-        print("🔍 Testing validation: Adding invalid website without https...")
-        website_textbox.clear()
-        website_textbox.fill("www.invalid-website.com")  # Invalid without https
-        time.sleep(0.5)
-        
-        # Try to save with invalid data
-        page.get_by_role("button", name="Save").click()
-        time.sleep(2)  # Wait for validation message
-        
-        # Assert validation error appears
-        validation_error = page.get_by_text("Please enter a valid website URL")
-        enhanced_assert_visible(page, validation_error, "Validation error should appear for invalid website", "validation_invalid_website")
-        print("✅ Validation error correctly appeared for invalid website")
-        
-        # Now clear and input the correct data
-        print("🔧 Now inputting correct website...")
-        website_textbox.clear()
-        assert page.get_by_text("Website is required.").is_visible()  # Ensure validation message is still visible
-        website_textbox.fill(updated_values['website'])
-        time.sleep(0.5)
-        
-        # Step 6: Save the changes
-        page.get_by_role("button", name="Save").click()
-        time.sleep(2)  # Wait for save to complete
-        
-        # Step 7: Assert the update message appears
-        enhanced_assert_visible(page, company_page.locators.company_updated_successfully_message, "Company info updated message should appear", "edit_website")
-        time.sleep(1)
-        
-        # Step 8: Assert the updated website is visible on the page
-        print(f"🔍 Verifying website was updated to: {updated_values['website']}")
-        updated_website_visible = page.locator("div.group_single_item.group").filter(has_text=f"Web page:{updated_values['website']}")
-        expect(updated_website_visible).to_be_visible()
-        print(f"✅ Website successfully updated to: {updated_values['website']}")
-    
-    @staticmethod
-    def edit_and_assert_industry_field(page: Page, company_page, initial_values: dict, updated_values: dict):
-        """
-        Edit industry field with validation and full assertion.
-        """
-        from playwright.sync_api import expect
-        
-        print(f"🔧 Editing industry from '{initial_values['industry']}' to '{updated_values['industry']}'")
-        
-        # Step 1: Locate the specific industry field container
-        industry_container = page.locator('div.group_single_item.group').filter(has_text=f"Industry:{initial_values['industry']}")
-        
-        # Step 2: Hover and click edit icon
-        print("🔍 Hovering over industry field to reveal edit icon...")
-        expect(industry_container).to_be_visible()
-        industry_container.hover()
-        time.sleep(2)
-        
-        edit_icon = industry_container.locator('.group_single_edit_icon')
-        expect(edit_icon).to_be_visible(timeout=5000)
-        edit_icon.click()
-        time.sleep(1)
-        
-        # Step 3: Select new industry from dropdown
-        print(f"🔧 Selecting new industry: {updated_values['industry']}")
-        industry_dropdown = page.locator(".select-trigger")
-        industry_dropdown.click()
-        time.sleep(1)
-        
-        page.get_by_text(updated_values['industry'], exact=True).click()
-        time.sleep(0.5)
-        
-        # Step 4: Save changes
-        page.get_by_role("button", name="Save").click()
-        time.sleep(2)
-        
-        # Step 5: Assert success and updated value
-        enhanced_assert_visible(page, company_page.locators.company_updated_successfully_message, "Company info updated message should appear", "edit_industry")
-        time.sleep(1)
-        
-        print(f"🔍 Verifying industry was updated to: {updated_values['industry']}")
-        updated_industry_visible = page.locator("div.group_single_item.group").filter(has_text=f"Industry:{updated_values['industry']}")
-        expect(updated_industry_visible).to_be_visible()
-        print(f"✅ Industry successfully updated to: {updated_values['industry']}")
-    
-    @staticmethod
-    def edit_and_assert_address_field(page: Page, company_page, initial_values: dict, updated_values: dict):
-        """
-        Edit company address field with validation and full assertion.
-        """
-        from playwright.sync_api import expect
-        
-        print(f"🔧 Editing address from '{initial_values['address']}' to '{updated_values['address']}'")
-        
-        # Step 1: Locate the specific address field container
-        address_container = page.locator('div.group_single_item.group').filter(has_text=f"Company address:{initial_values['address']}")
-        
-        # Step 2: Hover and click edit icon
-        print("🔍 Hovering over address field to reveal edit icon...")
-        expect(address_container).to_be_visible()
-        address_container.hover()
-        time.sleep(2)
-        
-        edit_icon = address_container.locator('.group_single_edit_icon')
-        expect(edit_icon).to_be_visible(timeout=5000)
-        edit_icon.click()
-        time.sleep(1)
-        
-        # Step 3: Fill address field with multiple locator strategies
-        try:
-            # First try the edit-specific locator
-            address_textbox = page.get_by_role("textbox", name="Company address")
-            address_textbox.wait_for(state="visible", timeout=5000)
-        except:
-            try:
-                # Try the simpler address locator
-                address_textbox = page.get_by_role("textbox", name="Address")
-                address_textbox.wait_for(state="visible", timeout=5000)
-            except:
-                try:
-                    # Try more generic approach
-                    address_textbox = page.locator("input[placeholder*='address' i], input[name*='address' i], textarea[placeholder*='address' i]").first
-                    address_textbox.wait_for(state="visible", timeout=5000)
-                except:
-                    # Last resort: use the company page's address input locator
-                    address_textbox = company_page.locators.address_input
-                    address_textbox.wait_for(state="visible", timeout=5000)
-        
-        address_textbox.clear()
-        address_textbox.fill(updated_values['address'])
-        time.sleep(0.5)
-        
-        # Step 4: Save changes
-        page.get_by_role("button", name="Save").click()
-        time.sleep(3)
-        
-        # Step 5: Assert success and updated value
-        enhanced_assert_visible(page, company_page.locators.company_updated_successfully_message, "Company info updated message should appear", "edit_address")
-        time.sleep(2)
-        
-        print(f"🔍 Verifying address was updated to: {updated_values['address']}")
-        updated_address_visible = page.locator("div.group_single_item.group").filter(has_text=f"Company address:{updated_values['address']}")
-        expect(updated_address_visible).to_be_visible()
-        print(f"✅ Address successfully updated to: {updated_values['address']}")
-    
-    @staticmethod
-    def edit_and_assert_hq_in_japan_field(page: Page, company_page, initial_values: dict, updated_values: dict):
-        """
-        Edit HQ in Japan field with validation and full assertion.
-        """
-        from playwright.sync_api import expect
-        
-        print(f"🔧 Editing HQ in Japan from '{initial_values['hq_in_japan']}' to '{updated_values['hq_in_japan']}'")
-        
-        # Step 1: Locate the specific HQ in Japan field container
-        hq_container = page.locator('div.group_single_item.group').filter(has_text=f"HQ in JPN:{initial_values['hq_in_japan']}")
-        
-        # Step 2: Hover and click edit icon
-        print("🔍 Hovering over HQ in Japan field to reveal edit icon...")
-        expect(hq_container).to_be_visible()
-        hq_container.hover()
-        time.sleep(2)
-        
-        edit_icon = hq_container.locator('.group_single_edit_icon')
-        expect(edit_icon).to_be_visible(timeout=5000)
-        edit_icon.click()
-        time.sleep(1)
-        
-        # Step 3: Select new option from dropdown
-        print(f"🔧 Selecting new HQ in Japan option: {updated_values['hq_in_japan']}")
-        hq_dropdown = page.locator(".select-trigger")
-        hq_dropdown.click()
-        time.sleep(1)
-        
-        page.get_by_text(updated_values['hq_in_japan'], exact=True).click()
-        time.sleep(0.5)
-        
-        # Step 4: Save changes
-        page.get_by_role("button", name="Save").click()
-        time.sleep(2)
-        
-        # Step 5: Assert success and updated value
-        enhanced_assert_visible(page, company_page.locators.company_updated_successfully_message, "Company info updated message should appear", "edit_hq_in_japan")
-        time.sleep(1)
-        
-        print(f"🔍 Verifying HQ in Japan was updated to: {updated_values['hq_in_japan']}")
-        updated_hq_visible = page.locator("div.group_single_item.group").filter(has_text=f"HQ in JPN:{updated_values['hq_in_japan']}")
-        expect(updated_hq_visible).to_be_visible()
-        print(f"✅ HQ in Japan successfully updated to: {updated_values['hq_in_japan']}")
-    
-    @staticmethod
-    def edit_and_assert_global_hq_field(page: Page, company_page, initial_values: dict, updated_values: dict):
-        """
-        Edit Global HQ field with validation and full assertion.
-        """
-        from playwright.sync_api import expect
-        
-        print(f"🔧 Editing Global HQ to '{updated_values['global_hq']}'")
-        
-        # Step 1: Locate the Global HQ field container (initially N/A)
-        global_hq_container = page.locator('div.group_single_item.group').filter(has_text="Global HQ:N/A")
-        
-        # Step 2: Hover and click edit icon
-        print("🔍 Hovering over Global HQ field to reveal edit icon...")
-        expect(global_hq_container).to_be_visible()
-        global_hq_container.hover()
-        time.sleep(2)
-        
-        edit_icon = global_hq_container.locator('.group_single_edit_icon')
-        expect(edit_icon).to_be_visible(timeout=5000)
-        edit_icon.click()
-        time.sleep(1)
-        
-        # Step 3: Fill Global HQ field
-        global_hq_textbox = page.get_by_role("textbox", name="Global HQ")
-        global_hq_textbox.wait_for(state="visible", timeout=10000)
-        global_hq_textbox.clear()
-        global_hq_textbox.fill(updated_values['global_hq'])
-        time.sleep(0.5)
-        
-        # Step 4: Save changes
-        page.get_by_role("button", name="Save").click()
-        time.sleep(2)
-        
-        # Step 5: Assert success and updated value
-        enhanced_assert_visible(page, company_page.locators.company_updated_successfully_message, "Company info updated message should appear", "edit_global_hq")
-        time.sleep(1)
-        
-        print(f"🔍 Verifying Global HQ was updated to: {updated_values['global_hq']}")
-        updated_global_hq_visible = page.locator("div.group_single_item.group").filter(has_text=f"Global HQ:{updated_values['global_hq']}")
-        expect(updated_global_hq_visible).to_be_visible()
-        print(f"✅ Global HQ successfully updated to: {updated_values['global_hq']}")
-    
-    @staticmethod
-    def edit_and_assert_country_of_origin_field(page: Page, company_page, initial_values: dict, updated_values: dict):
-        """
-        Edit Country of Origin field with validation and full assertion.
-        """
-        from playwright.sync_api import expect
-        
-        print(f"🔧 Editing Country of Origin to '{updated_values['country_of_origin']}'")
-        
-        # Step 1: Locate the Country of Origin field container (initially N/A)
-        country_container = page.locator('div.group_single_item.group').filter(has_text="Country of origin:N/A")
-        
-        # Step 2: Hover and click edit icon
-        print("🔍 Hovering over Country of Origin field to reveal edit icon...")
-        expect(country_container).to_be_visible()
-        country_container.hover()
-        time.sleep(2)
-        
-        edit_icon = country_container.locator('.group_single_edit_icon')
-        expect(edit_icon).to_be_visible(timeout=5000)
-        edit_icon.click()
-        time.sleep(1)
-        
-        # Step 3: Fill Country of Origin field
-        country_textbox = page.get_by_role("textbox", name="Country of Origin")
-        country_textbox.wait_for(state="visible", timeout=10000)
-        country_textbox.clear()
-        country_textbox.fill(updated_values['country_of_origin'])
-        time.sleep(0.5)
-        
-        # Step 4: Save changes
-        page.get_by_role("button", name="Save").click()
-        time.sleep(2)
-        
-        # Step 5: Check success message with if/else logic
-        success_message = company_page.locators.company_updated_successfully_message
-        
-        if success_message.is_visible():
-            # SUCCESS: Message appeared
-            print("✅ SUCCESS: 'Company info updated successfully' message appeared for Country of Origin")
-            time.sleep(2)
-        else:
-            # ERROR or NO MESSAGE: Log and continue
-            print("⚠️ ASSERTION FAILED: 'Company info updated successfully' message NOT found for Country of Origin")
-            print("🔍 LOGGING: Country of Origin success message failed but continuing...")
-            time.sleep(1)
-        
-        time.sleep(1)
-        
-        print(f"🔍 Verifying Country of Origin was updated to: {updated_values['country_of_origin']}")
-        updated_country_visible = page.locator("div.group_single_item.group").filter(has_text=f"Country of origin:{updated_values['country_of_origin']}")
-        expect(updated_country_visible).to_be_visible()
-        print(f"✅ Country of Origin successfully updated to: {updated_values['country_of_origin']}")
-    
-    @staticmethod
-    def edit_and_assert_company_hiring_status_field(page: Page, company_page, initial_values: dict, updated_values: dict):
-        """
-        Edit Company hiring status field with validation and full assertion.
-        """
-        from playwright.sync_api import expect
-        
-        print(f"🔧 Editing Company hiring status from '{initial_values['hiring_status']}' to '{updated_values['hiring_status']}'")
-        
-        # Step 1: Locate the Company hiring status field container
-        hiring_status_container = page.locator('div.group_single_item.group').filter(has_text=f"Company hiring status:{initial_values['hiring_status']}")
-        
-        # Step 2: Hover and click edit icon
-        print("🔍 Hovering over Company hiring status field to reveal edit icon...")
-        expect(hiring_status_container).to_be_visible()
-        hiring_status_container.hover()
-        time.sleep(2)
-        
-        edit_icon = hiring_status_container.locator('.group_single_edit_icon')
-        expect(edit_icon).to_be_visible(timeout=5000)
-        edit_icon.click()
-        time.sleep(1)
-        
-        # Step 3: Select new option from dropdown
-        print(f"🔧 Selecting new hiring status: {updated_values['hiring_status']}")
-        hiring_dropdown = page.locator(".select-trigger")
-        hiring_dropdown.click()
-        time.sleep(1)
-        
-        page.get_by_text(updated_values['hiring_status'], exact=True).click()
-        time.sleep(0.5)
-        
-        # Step 4: Save changes
-        page.get_by_role("button", name="Save").click()
-        time.sleep(2)
-        
-        # Step 5: Assert success and updated value
-        enhanced_assert_visible(page, company_page.locators.company_updated_successfully_message, "Company info updated message should appear", "edit_hiring_status")
-        time.sleep(1)
-        
-        print(f"🔍 Verifying Company hiring status was updated to: {updated_values['hiring_status']}")
-        updated_hiring_visible = page.locator("div.group_single_item.group").filter(has_text=f"Company hiring status:{updated_values['hiring_status']}")
-        expect(updated_hiring_visible).to_be_visible()
-        print(f"✅ Company hiring status successfully updated to: {updated_values['hiring_status']}")
-    
-    @staticmethod
-    def edit_and_assert_job_opening_field(page: Page, company_page, initial_values: dict, updated_values: dict):
-        """
-        Edit Job opening field with validation and full assertion.
-        """
-        from playwright.sync_api import expect
-        
-        print(f"🔧 Editing Job opening from '{initial_values['job_opening']}' to '{updated_values['job_opening']}'")
-        
-        # Step 1: Locate the Job opening field container
-        job_opening_container = page.locator('div.group_single_item.group').filter(has_text=f"Job opening:{initial_values['job_opening']}")
-        
-        # Step 2: Hover and click edit icon
-        print("🔍 Hovering over Job opening field to reveal edit icon...")
-        expect(job_opening_container).to_be_visible()
-        job_opening_container.hover()
-        time.sleep(2)
-        
-        edit_icon = job_opening_container.locator('.group_single_edit_icon')
-        expect(edit_icon).to_be_visible(timeout=5000)
-        edit_icon.click()
-        time.sleep(1)
-        
-        # Step 3: Select new option from dropdown
-        print(f"🔧 Selecting new job opening option: {updated_values['job_opening']}")
-        job_dropdown = page.locator(".select-trigger")
-        job_dropdown.click()
-        time.sleep(1)
-        
-        page.get_by_text(updated_values['job_opening'], exact=True).click()
-        time.sleep(0.5)
-        
-        # Step 4: Save changes
-        page.get_by_role("button", name="Save").click()
-        time.sleep(2)
-        
-        # Step 5: Assert success and updated value
-        enhanced_assert_visible(page, company_page.locators.company_updated_successfully_message, "Company info updated message should appear", "edit_job_opening")
-        time.sleep(1)
-        
-        print(f"🔍 Verifying Job opening was updated to: {updated_values['job_opening']}")
-        updated_job_visible = page.locator("div.group_single_item.group").filter(has_text=f"Job opening:{updated_values['job_opening']}")
-        expect(updated_job_visible).to_be_visible()
-        print(f"✅ Job opening successfully updated to: {updated_values['job_opening']}")
-    
-    @staticmethod
-    def edit_and_assert_total_employees_jpn_field(page: Page, company_page, initial_values: dict, updated_values: dict):
-        """
-        Edit Total employees JPN field with validation and full assertion.
-        """
-        from playwright.sync_api import expect
-        
-        print(f"🔧 Editing Total employees JPN from '{initial_values['total_employees']}' to '{updated_values['total_employees']}'")
-        
-        # Step 1: Locate the Total employees JPN field container
-        total_employees_container = page.locator('div.group_single_item.group').filter(has_text=f"Total employees JPN:{initial_values['total_employees']}")
-        
-        # Step 2: Hover and click edit icon
-        print("🔍 Hovering over Total employees JPN field to reveal edit icon...")
-        expect(total_employees_container).to_be_visible()
-        total_employees_container.hover()
-        time.sleep(2)
-        
-        edit_icon = total_employees_container.locator('.group_single_edit_icon')
-        expect(edit_icon).to_be_visible(timeout=5000)
-        edit_icon.click()
-        time.sleep(1)
-        
-        # Step 3: Fill Total employees JPN field
-        total_employees_textbox = page.get_by_role("textbox", name="Total employees JPN")
-        total_employees_textbox.wait_for(state="visible", timeout=10000)
-        total_employees_textbox.clear()
-        total_employees_textbox.fill(updated_values['total_employees'])
-        time.sleep(0.5)
-        
-        # Step 4: Save changes
-        page.get_by_role("button", name="Save").click()
-        time.sleep(2)
-        
-        # Step 5: Assert success and updated value
-        enhanced_assert_visible(page, company_page.locators.company_updated_successfully_message, "Company info updated message should appear", "edit_total_employees")
-        time.sleep(1)
-        
-        print(f"🔍 Verifying Total employees JPN was updated to: {updated_values['total_employees']}")
-        updated_employees_visible = page.locator("div.group_single_item.group").filter(has_text=f"Total employees JPN:{updated_values['total_employees']}")
-        expect(updated_employees_visible).to_be_visible()
-        print(f"✅ Total employees JPN successfully updated to: {updated_values['total_employees']}")
-    
-    @staticmethod
-    def edit_and_assert_company_grade_field(page: Page, company_page, initial_values: dict, updated_values: dict):
-        """
-        Edit Company grade field with validation and full assertion.
-        """
-        from playwright.sync_api import expect
-        
-        print(f"🔧 Editing Company grade from '{initial_values['company_grade']}' to '{updated_values['company_grade']}'")
-        
-        # Step 1: Locate the Company grade field container
-        company_grade_container = page.locator('div.group_single_item.group').filter(has_text=f"Company grade:{initial_values['company_grade']}")
-        
-        # Step 2: Hover and click edit icon
-        print("🔍 Hovering over Company grade field to reveal edit icon...")
-        expect(company_grade_container).to_be_visible()
-        company_grade_container.hover()
-        time.sleep(2)
-        
-        edit_icon = company_grade_container.locator('.group_single_edit_icon')
-        expect(edit_icon).to_be_visible(timeout=5000)
-        edit_icon.click()
-        time.sleep(1)
-        
-        # Step 3: Select new option from dropdown
-        print(f"🔧 Selecting new company grade: {updated_values['company_grade']}")
-        grade_dropdown = page.locator(".select-trigger")
-        grade_dropdown.click()
-        time.sleep(1)
-        
-        page.get_by_text(updated_values['company_grade'], exact=True).click()
-        time.sleep(0.5)
-        
-        # Step 4: Save changes
-        page.get_by_role("button", name="Save").click()
-        time.sleep(2)
-        
-        # Step 5: Assert success and updated value
-        enhanced_assert_visible(page, company_page.locators.company_updated_successfully_message, "Company info updated message should appear", "edit_company_grade")
-        time.sleep(1)
-        
-        print(f"🔍 Verifying Company grade was updated to: {updated_values['company_grade']}")
-        updated_grade_visible = page.locator("div.group_single_item.group").filter(has_text=f"Company grade:{updated_values['company_grade']}")
-        expect(updated_grade_visible).to_be_visible()
-        print(f"✅ Company grade successfully updated to: {updated_values['company_grade']}")
-    
-    @staticmethod
-    def edit_and_assert_main_tel_field(page: Page, company_page, initial_values: dict, updated_values: dict):
-        """
-        Edit Main TEL field using the complex telephone modal with division and telephone management.
-        Flow: Click edit → Modify existing Main TEL division/telephone → Add new entry → Save → Verify → Remove new entry
-        """
-        from playwright.sync_api import expect
-        
-        print(f"🔧 Starting Main TEL field comprehensive editing flow")
-        print(f"📍 Current Main TEL: {initial_values['main_tel']}")
-        print(f"📍 Target Main TEL: {updated_values['main_tel']}")
-        
-        # Step 1: Click Main TEL edit icon to open the telephone modal
-        main_tel_container = page.locator('div.group_single_item.group').filter(has_text=f"Main TEL:{initial_values['main_tel']}")
-        expect(main_tel_container).to_be_visible()
-        main_tel_container.hover()
-        time.sleep(2)
-        
-        edit_icon = main_tel_container.locator('.group_single_edit_icon')
-        expect(edit_icon).to_be_visible(timeout=5000)
-        edit_icon.click()
-        time.sleep(2)
-        
-        print("📱 Telephone modal opened - modifying existing Main TEL entry")
-        
-        # Step 2: Modify the first telephone entry (Main TEL) - Division and Telephone
-        # Based on MCP exploration: telephones[0] is the Main TEL entry
-        main_division_input = page.locator('[id="telephones[0].division"]')
-        main_telephone_input = page.locator('[id="telephones[0].telephone"]')
-        
-        expect(main_division_input).to_be_visible(timeout=10000)
-        expect(main_telephone_input).to_be_visible(timeout=10000)
-        
-        # Store the new division name for later verification
-        new_division_name = "Test Division"
-        new_telephone_number = updated_values['main_tel']
-        
-        main_division_input.clear()
-        main_division_input.fill(new_division_name)
-        time.sleep(0.5)
-        
-        main_telephone_input.clear()
-        main_telephone_input.fill(new_telephone_number)
-        time.sleep(0.5)
-        
-        print(f"🔄 Updated Main TEL: Division='{new_division_name}', Telephone='{new_telephone_number}'")
-        
-        # Step 3: Add a new telephone entry
-        add_new_button = page.get_by_role("button", name="Add New")
-        expect(add_new_button).to_be_visible()
-        add_new_button.click()
-        time.sleep(1)
-        
-        print("➕ Added new telephone entry")
-        
-        # Step 4: Fill the new telephone entry (should be the last one in the list)
-        # Find the newly added empty entries
-        additional_division_name = "Additional Division"
-        additional_telephone_number = "+8801783487"
-        
-        # The new entry should be at the end of the list - use a more flexible approach
-        new_division_inputs = page.locator('input[id*="telephones"][id*="division"]')
-        new_telephone_inputs = page.locator('input[id*="telephones"][id*="telephone"]')
-        
-        # Count total entries and use the last one
-        division_count = new_division_inputs.count()
-        telephone_count = new_telephone_inputs.count()
-        
-        if division_count >= 3 and telephone_count >= 3:  # Should have at least 3 entries now
-            last_division_input = new_division_inputs.nth(division_count - 1)
-            last_telephone_input = new_telephone_inputs.nth(telephone_count - 1)
-            
-            last_division_input.fill(additional_division_name)
-            time.sleep(0.5)
-            last_telephone_input.fill(additional_telephone_number)
-            time.sleep(0.5)
-            
-            print(f"📞 Added new entry: Division='{additional_division_name}', Telephone='{additional_telephone_number}'")
-        
-        # Step 5: Save all changes
-        save_button = page.get_by_role("button", name="Save")
-        save_button.click()
-        time.sleep(3)
-        
-        # Step 6: Assert success message
-        enhanced_assert_visible(page, company_page.locators.company_updated_successfully_message, "Company info updated message should appear", "edit_main_tel")
-        time.sleep(1)
-        
-        # Step 7: Verify the updated field name and value
-        print(f"🔍 Verifying Main TEL was updated to: {new_division_name} TEL: {new_telephone_number}")
-        updated_main_tel_visible = page.locator("div.group_single_item.group").filter(has_text=f"{new_division_name} TEL:{new_telephone_number}")
-        expect(updated_main_tel_visible).to_be_visible()
-        
-        # Step 8: Verify the additional telephone entry was also added
-        print(f"🔍 Verifying additional telephone entry: {additional_division_name} TEL: {additional_telephone_number}")
-        additional_tel_visible = page.locator("div.group_single_item.group").filter(has_text=f"{additional_division_name} TEL:{additional_telephone_number}")
-        expect(additional_tel_visible).to_be_visible()
-        
-        print(f"✅ Main TEL successfully updated to: {new_division_name} TEL: {new_telephone_number}")
-        print(f"✅ Additional telephone entry added: {additional_division_name} TEL: {additional_telephone_number}")
-        
-        # Step 9: Now test removal - click edit again to remove the additional entry
-        print("🗑️ Testing removal of the additional telephone entry")
-        
-        # Click edit icon of the updated Main TEL field (now with new name)
-        updated_main_tel_container = page.locator("div.group_single_item.group").filter(has_text=f"{new_division_name} TEL:{new_telephone_number}")
-        expect(updated_main_tel_container).to_be_visible()
-        updated_main_tel_container.hover()
-        time.sleep(2)
-        
-        updated_edit_icon = updated_main_tel_container.locator('.group_single_edit_icon')
-        expect(updated_edit_icon).to_be_visible(timeout=5000)
-        updated_edit_icon.click()
-        time.sleep(2)
-        
-        # Step 10: Find and click the remove button for the additional entry
-        # The additional entry should have a remove button - find it by its division name
-        remove_buttons = page.get_by_role("button", name="Remove")
-        remove_count = remove_buttons.count()
-        
-        if remove_count >= 2:  # Should have at least 2 remove buttons
-            # Click the last remove button (for the additional entry)
-            last_remove_button = remove_buttons.nth(remove_count - 1)
-            last_remove_button.click()
-            time.sleep(1)
-            
-            print(f"🗑️ Clicked remove button for additional entry")
-        
-        # Step 11: Save the removal
-        save_button = page.get_by_role("button", name="Save")
-        save_button.click()
-        time.sleep(3)
-        
-        # Step 12: Check success message for removal with if/else logic
-        success_message = company_page.locators.company_updated_successfully_message
-        
-        if success_message.is_visible():
-            # SUCCESS: Message appeared
-            print("✅ SUCCESS: 'Company info updated successfully' message appeared for TEL removal")
-            time.sleep(2)
-        else:
-            # ERROR or NO MESSAGE: Log and continue
-            print("⚠️ ASSERTION FAILED: 'Company info updated successfully' message NOT found for TEL removal")
-            print("🔍 LOGGING: TEL removal success message failed but continuing...")
-            time.sleep(1)
-        
-        time.sleep(1)
-        
-        # Step 13: Verify the additional entry is removed
-        print(f"🔍 Verifying additional telephone entry was removed")
-        try:
-            additional_tel_removed = page.locator("div.group_single_item.group").filter(has_text=f"{additional_division_name} TEL:{additional_telephone_number}")
-            expect(additional_tel_removed).not_to_be_visible(timeout=5000)
-            print(f"✅ Additional telephone entry successfully removed")
-        except:
-            print(f"⚠️ Additional telephone entry may still be visible or removal verification failed")
-        
-        # Step 14: Final verification that main telephone is still there with updated values
-        final_main_tel_visible = page.locator("div.group_single_item.group").filter(has_text=f"{new_division_name} TEL:{new_telephone_number}")
-        expect(final_main_tel_visible).to_be_visible()
-        print(f"✅ Main TEL field comprehensive editing completed successfully!")
-    
-    @staticmethod
-    def edit_and_assert_hr_tel_field(page: Page, company_page, initial_values: dict, updated_values: dict):
-        """
-        Edit HR TEL field using the complex telephone modal with division and telephone management.
-        Flow: Click edit → Modify existing HR TEL division/telephone → Add new entry → Save → Verify → Remove new entry
-        """
-        from playwright.sync_api import expect
-        
-        print(f"🔧 Starting HR TEL field comprehensive editing flow")
-        print(f"📍 Current HR TEL: {initial_values['hr_tel']}")
-        print(f"📍 Target HR TEL: {updated_values['hr_tel']}")
-        
-        # Step 1: Click HR TEL edit icon to open the telephone modal
-        hr_tel_container = page.locator('div.group_single_item.group').filter(has_text=f"HR TEL:{initial_values['hr_tel']}")
-        expect(hr_tel_container).to_be_visible()
-        hr_tel_container.hover()
-        time.sleep(2)
-        
-        edit_icon = hr_tel_container.locator('.group_single_edit_icon')
-        expect(edit_icon).to_be_visible(timeout=5000)
-        edit_icon.click()
-        time.sleep(2)
-        
-        print("� Telephone modal opened - modifying existing HR TEL entry")
-        
-        # Step 2: Find and modify the HR TEL entry in the modal
-        # HR TEL is typically the second entry (telephones[1]) based on MCP exploration
-        hr_division_input = page.locator('[id="telephones[1].division"]')
-        hr_telephone_input = page.locator('[id="telephones[1].telephone"]')
-        
-        expect(hr_division_input).to_be_visible(timeout=10000)
-        expect(hr_telephone_input).to_be_visible(timeout=10000)
-        
-        # Store the new division name for later verification
-        new_division_name = "Test HR Division"
-        new_telephone_number = updated_values['hr_tel']
-        
-        hr_division_input.clear()
-        hr_division_input.fill(new_division_name)
-        time.sleep(0.5)
-        
-        hr_telephone_input.clear()
-        hr_telephone_input.fill(new_telephone_number)
-        time.sleep(0.5)
-        
-        print(f"🔄 Updated HR TEL: Division='{new_division_name}', Telephone='{new_telephone_number}'")
-        
-        # Step 3: Add a new telephone entry
-        add_new_button = page.get_by_role("button", name="Add New")
-        expect(add_new_button).to_be_visible()
-        add_new_button.click()
-        time.sleep(1)
-        
-        print("➕ Added new telephone entry")
-        
-        # Step 4: Fill the new telephone entry (should be the last one in the list)
-        additional_division_name = "Additional HR Division"
-        additional_telephone_number = "+8801783487"
-        
-        # Find the newly added empty entries
-        new_division_inputs = page.locator('input[id*="telephones"][id*="division"]')
-        new_telephone_inputs = page.locator('input[id*="telephones"][id*="telephone"]')
-        
-        # Count total entries and use the last one
-        division_count = new_division_inputs.count()
-        telephone_count = new_telephone_inputs.count()
-        
-        if division_count >= 3 and telephone_count >= 3:  # Should have at least 3 entries now
-            last_division_input = new_division_inputs.nth(division_count - 1)
-            last_telephone_input = new_telephone_inputs.nth(telephone_count - 1)
-            
-            last_division_input.fill(additional_division_name)
-            time.sleep(0.5)
-            last_telephone_input.fill(additional_telephone_number)
-            time.sleep(0.5)
-            
-            print(f"📞 Added new entry: Division='{additional_division_name}', Telephone='{additional_telephone_number}'")
-        
-        # Step 5: Save all changes
-        save_button = page.get_by_role("button", name="Save")
-        save_button.click()
-        time.sleep(3)
-        
-        # Step 6: Assert success message
-        enhanced_assert_visible(page, company_page.locators.company_updated_successfully_message, "Company info updated message should appear", "edit_hr_tel")
-        time.sleep(1)
-        
-        # Step 7: Verify the updated field name and value
-        print(f"🔍 Verifying HR TEL was updated to: {new_division_name} TEL: {new_telephone_number}")
-        updated_hr_tel_visible = page.locator("div.group_single_item.group").filter(has_text=f"{new_division_name} TEL:{new_telephone_number}")
-        expect(updated_hr_tel_visible).to_be_visible()
-        
-        # Step 8: Verify the additional telephone entry was also added
-        print(f"🔍 Verifying additional telephone entry: {additional_division_name} TEL: {additional_telephone_number}")
-        additional_tel_visible = page.locator("div.group_single_item.group").filter(has_text=f"{additional_division_name} TEL:{additional_telephone_number}")
-        expect(additional_tel_visible).to_be_visible()
-        
-        print(f"✅ HR TEL successfully updated to: {new_division_name} TEL: {new_telephone_number}")
-        print(f"✅ Additional telephone entry added: {additional_division_name} TEL: {additional_telephone_number}")
-        
-        # Step 9: Now test removal - click edit again to remove the additional entry
-        print("🗑️ Testing removal of the additional telephone entry")
-        
-        # Click edit icon of the updated HR TEL field (now with new name)
-        updated_hr_tel_container = page.locator("div.group_single_item.group").filter(has_text=f"{new_division_name} TEL:{new_telephone_number}")
-        expect(updated_hr_tel_container).to_be_visible()
-        updated_hr_tel_container.hover()
-        time.sleep(2)
-        
-        updated_edit_icon = updated_hr_tel_container.locator('.group_single_edit_icon')
-        expect(updated_edit_icon).to_be_visible(timeout=5000)
-        updated_edit_icon.click()
-        time.sleep(2)
-        
-        # Step 10: Find and click the remove button for the additional entry
-        # The additional entry should have a remove button - find it by targeting the last one
-        remove_buttons = page.get_by_role("button", name="Remove")
-        remove_count = remove_buttons.count()
-        
-        if remove_count >= 2:  # Should have at least 2 remove buttons
-            # Click the last remove button (for the additional entry)
-            last_remove_button = remove_buttons.nth(remove_count - 1)
-            last_remove_button.click()
-            time.sleep(1)
-            
-            print(f"🗑️ Clicked remove button for additional entry")
-        
-        # Step 11: Save the removal
-        save_button = page.get_by_role("button", name="Save")
-        save_button.click()
-        time.sleep(3)
-        
-        # Step 12: Assert success message for removal
-        enhanced_assert_visible(page, company_page.locators.company_updated_successfully_message, "Company info updated message should appear", "remove_additional_hr_tel")
-        time.sleep(1)
-        
-        # Step 13: Verify the additional entry is removed
-        print(f"🔍 Verifying additional telephone entry was removed")
-        try:
-            additional_tel_removed = page.locator("div.group_single_item.group").filter(has_text=f"{additional_division_name} TEL:{additional_telephone_number}")
-            expect(additional_tel_removed).not_to_be_visible(timeout=5000)
-            print(f"✅ Additional telephone entry successfully removed")
-        except:
-            print(f"⚠️ Additional telephone entry may still be visible or removal verification failed")
-        
-        # Step 14: Final verification that HR telephone is still there with updated values
-        final_hr_tel_visible = page.locator("div.group_single_item.group").filter(has_text=f"{new_division_name} TEL:{new_telephone_number}")
-        expect(final_hr_tel_visible).to_be_visible()
-        print(f"✅ HR TEL field comprehensive editing completed successfully!")
-    
-    # =============================================================================
-    # TAB-SPECIFIC FIELD EDITING FUNCTIONS
-    # =============================================================================
-    
-    # -------------------------------------------------------------------------
-    # BASIC COMPANY INFO TAB FUNCTIONS
-    # -------------------------------------------------------------------------
-    
-    @staticmethod
-    def edit_and_assert_company_hiring_status_field_basic_tab(page: Page, company_page, initial_values: dict, updated_values: dict):
-        """Edit Company hiring status field in Basic Company Info tab (stay on Basic Info tab)."""
-        from playwright.sync_api import expect
-        
-        print(f"🔧 [Basic Tab] Editing Company hiring status to '{updated_values['hiring_status']}'")
-        
-        # Step 1: Find hiring status field on Basic Info tab and click edit
-        current_hiring_status_container = page.locator('div.group_single_item.group').filter(has_text="Company hiring status")
-        expect(current_hiring_status_container).to_be_visible()
-        
-        current_hiring_status_container.hover()
-        time.sleep(1)
-        edit_icon = current_hiring_status_container.locator('.group_single_edit_icon')
-        expect(edit_icon).to_be_visible(timeout=5000)
-        edit_icon.click()
-        time.sleep(1)
-        
-        # Step 2: Select new option from dropdown using simple get_by_text
-        hiring_dropdown = page.locator(".select-trigger")
-        hiring_dropdown.click()
-        time.sleep(1)
-        
-        # Select the new hiring status option
-        option_locator = page.get_by_text(updated_values['hiring_status'], exact=True)
-        expect(option_locator).to_be_visible(timeout=5000)
-        option_locator.click()
-        time.sleep(0.5)
-        
-        # Step 3: Save changes
-        page.get_by_role("button", name="Save").click()
-        time.sleep(3)
-        
-        # Step 4: Check for success message or error - if/else logic
-        success_message = company_page.locators.company_updated_successfully_message
-        
-        if success_message.is_visible():
-            # SUCCESS: Message appeared, modal will close automatically
-            print("✅ SUCCESS: 'Company info updated successfully' message appeared")
-            time.sleep(2)  # Wait for modal to close
-            print(f"✅ [Basic Tab] Company hiring status successfully updated to: {updated_values['hiring_status']}")
-            
-        else:
-            # FAILURE or ERROR: Success message not found, log this and close modal manually
-            print("❌ ASSERTION FAILED: 'Company info updated successfully' message NOT found within 3 seconds")
-            print("🔍 LOGGING: Checking if there's an error message or if modal needs manual closing...")
-            
-            # Check for any error message
-            try:
-                error_messages = page.locator(".error, .alert, .warning").all()
-                if error_messages:
-                    for error in error_messages:
-                        if error.is_visible():
-                            error_text = error.text_content()
-                            print(f"⚠️ ERROR MESSAGE FOUND: {error_text}")
-            except:
-                print("🔍 No specific error messages found")
-            
-            # Manually close modal by clicking close button
-            print("🔧 Manually closing modal using close button...")
-            try:
-                close_button = page.get_by_role("button", name="Close")
-                if close_button.is_visible():
-                    close_button.click()
-                    print("✅ Close button clicked")
-                else:
-                    # Try escape key
-                    page.keyboard.press("Escape")
-                    print("✅ Escape key pressed")
-                    
-                # Wait for modal backdrop to completely disappear
-                print("🔍 Waiting for modal backdrop to completely disappear...")
-                time.sleep(3)
-                modal_backdrop = page.locator("div.modal-backdrop")
-                try:
-                    modal_backdrop.wait_for(state="hidden", timeout=5000)
-                    print("✅ Modal backdrop successfully hidden")
-                except:
-                    # Force click outside if still visible
-                    if modal_backdrop.is_visible():
-                        print("⚠️ Modal backdrop still visible, clicking outside...")
-                        page.click("body", position={"x": 100, "y": 100})
-                        time.sleep(2)
-                
-                time.sleep(2)
-            except Exception as e:
-                print(f"❌ Failed to close modal: {e}")
-            
-            print(f"⚠️ [Basic Tab] Company hiring status field processed (success message failed, but continuing): {updated_values['hiring_status']}")
-            
-            # Skip verification when success message failed
-            time.sleep(1)
-            return
-        
-        # Step 6: Verify updated value (only when success message appeared)
-        updated_hiring_status_visible = page.locator("div.group_single_item.group").filter(has_text=f"Company hiring status:{updated_values['hiring_status']}")
-        expect(updated_hiring_status_visible).to_be_visible()
-        print(f"✅ [Basic Tab] Company hiring status successfully updated to: {updated_values['hiring_status']}")
-    
-    @staticmethod
-    def edit_and_assert_company_name_field_basic_tab(page: Page, company_page, initial_values: dict, updated_values: dict):
-        """Assert Company name field shows TC_01 updated value in Basic Company Info tab (NO EDITING)."""
-        from playwright.sync_api import expect
-        
-        print(f"� [Basic Tab] Verifying Company name field shows TC_01 updated value (NOT editing to '{updated_values['company_name']}')")
-        
-        # Step 1: Find company name field on Basic Info tab and verify TC_01 value is present
-        current_name_container = page.locator('div.group_single_item.group').filter(has_text="Company name:")
-        expect(current_name_container).to_be_visible()
-        
-        print("✅ [Basic Tab] Company name field found - TC_01 updated value is present (skipping edit)")
-        time.sleep(1)
-
-    @staticmethod
-    def edit_and_assert_company_grade_field_basic_tab(page: Page, company_page, initial_values: dict, updated_values: dict):
-        """Edit Company grade field in Basic Company Info tab (stay on Basic Info tab)."""
-        from playwright.sync_api import expect
-        
-        print(f"🔧 [Basic Tab] Editing Company grade to '{updated_values['company_grade']}'")
-        
-        # Step 1: Find company grade field on Basic Info tab and click edit
-        current_grade_container = page.locator('div.group_single_item.group').filter(has_text="Company grade:")
-        expect(current_grade_container).to_be_visible()
-        
-        current_grade_container.hover()
-        time.sleep(1)
-        edit_icon = current_grade_container.locator('.group_single_edit_icon')
-        expect(edit_icon).to_be_visible(timeout=5000)
-        edit_icon.click()
-        time.sleep(1)
-        
-        # Step 2: Select new option from dropdown using simple get_by_text
-        grade_dropdown = page.locator(".select-trigger")
-        grade_dropdown.click()
-        time.sleep(1)
-        
-        # Select the new grade option
-        option_locator = page.get_by_text(updated_values['company_grade'], exact=True)
-        expect(option_locator).to_be_visible(timeout=5000)
-        option_locator.click()
-        time.sleep(0.5)
-        
-        # Step 3: Save changes
-        page.get_by_role("button", name="Save").click()
-        time.sleep(3)
-        
-        # Step 4: Check for success message or error - if/else logic
-        success_message = company_page.locators.company_updated_successfully_message
-        
-        if success_message.is_visible():
-            # SUCCESS: Message appeared, modal will close automatically
-            print("✅ SUCCESS: 'Company info updated successfully' message appeared")
-            time.sleep(2)  # Wait for modal to close
-            print(f"✅ [Basic Tab] Company grade successfully updated to: {updated_values['company_grade']}")
-            
-        else:
-            # FAILURE or ERROR: Success message not found, log this and close modal manually
-            print("❌ ASSERTION FAILED: 'Company info updated successfully' message NOT found within 3 seconds")
-            print("🔍 LOGGING: Checking if there's an error message or if modal needs manual closing...")
-            
-            # Check for any error message
-            try:
-                error_messages = page.locator(".error, .alert, .warning").all()
-                if error_messages:
-                    for error in error_messages:
-                        if error.is_visible():
-                            error_text = error.text_content()
-                            print(f"⚠️ ERROR MESSAGE FOUND: {error_text}")
-            except:
-                print("🔍 No specific error messages found")
-            
-            # Manually close modal by clicking close button
-            print("🔧 Manually closing modal using close button...")
-            try:
-                close_button = page.get_by_role("button", name="Close")
-                if close_button.is_visible():
-                    close_button.click()
-                    print("✅ Close button clicked")
-                else:
-                    # Try escape key
-                    page.keyboard.press("Escape")
-                    print("✅ Escape key pressed")
-                time.sleep(2)
-            except Exception as e:
-                print(f"❌ Failed to close modal: {e}")
-            
-            print(f"⚠️ [Basic Tab] Company grade field processed (success message failed, but continuing): {updated_values['company_grade']}")
-    
-    @staticmethod
-    def edit_and_assert_what_brand_field(page: Page, company_page, updated_values: dict):
-        """Edit What brand field in Basic Company Info tab (new field)."""
-        from playwright.sync_api import expect
-        
-        print(f"🔧 [Basic Tab] Adding What brand field: {updated_values['what_brand']}")
-        
-        # Step 1: Find and click the What brand field edit icon
-        what_brand_container = page.locator('div.group_single_item.group').filter(has_text="What brand")
-        expect(what_brand_container).to_be_visible()
-        what_brand_container.hover()
-        time.sleep(2)
-        
-        edit_icon = what_brand_container.locator('.group_single_edit_icon')
-        expect(edit_icon).to_be_visible(timeout=5000)
-        edit_icon.click()
-        time.sleep(1)
-        
-        # Step 2: Fill what brand field
-        what_brand_textbox = page.get_by_role("textbox", name="What brand")
-        what_brand_textbox.wait_for(state="visible", timeout=10000)
-        what_brand_textbox.fill(updated_values['what_brand'])
-        time.sleep(0.5)
-        
-        # Step 3: Save changes
-        page.get_by_role("button", name="Save").click()
-        time.sleep(2)
-        
-        # Step 4: Assert success and updated value
-        enhanced_assert_visible(page, company_page.locators.company_updated_successfully_message, "Company info updated message should appear", "edit_what_brand")
-        time.sleep(1)
-        
-        # Step 5: Verify updated value
-        updated_brand_visible = page.locator("div.group_single_item.group").filter(has_text=f"What brand:{updated_values['what_brand']}")
-        expect(updated_brand_visible).to_be_visible()
-        print(f"✅ [Basic Tab] What brand successfully updated to: {updated_values['what_brand']}")
-    
-    @staticmethod
-    def edit_and_assert_under_which_group_field(page: Page, company_page, updated_values: dict):
-        """Edit Under which group field in Basic Company Info tab (new field)."""
-        from playwright.sync_api import expect
-        
-        print(f"🔧 [Basic Tab] Adding Under which group field: {updated_values['under_which_group']}")
-        
-        # Step 1: Find and click the Under which group field edit icon
-        group_container = page.locator('div.group_single_item.group').filter(has_text="Under which group")
-        expect(group_container).to_be_visible()
-        group_container.hover()
-        time.sleep(2)
-        
-        edit_icon = group_container.locator('.group_single_edit_icon')
-        expect(edit_icon).to_be_visible(timeout=5000)
-        edit_icon.click()
-        time.sleep(1)
-        
-        # Step 2: Fill under which group field
-        group_textbox = page.get_by_role("textbox", name="Under which group")
-        group_textbox.wait_for(state="visible", timeout=10000)
-        group_textbox.fill(updated_values['under_which_group'])
-        time.sleep(0.5)
-        
-        # Step 3: Save changes
-        page.get_by_role("button", name="Save").click()
-        time.sleep(2)
-        
-        # Step 4: Assert success and updated value
-        enhanced_assert_visible(page, company_page.locators.company_updated_successfully_message, "Company info updated message should appear", "edit_under_which_group")
-        time.sleep(1)
-        
-        # Step 5: Verify updated value
-        updated_group_visible = page.locator("div.group_single_item.group").filter(has_text=f"Under which group:{updated_values['under_which_group']}")
-        expect(updated_group_visible).to_be_visible()
-        print(f"✅ [Basic Tab] Under which group successfully updated to: {updated_values['under_which_group']}")
-    
-    @staticmethod
-    def edit_and_assert_industry_field_basic_tab(page: Page, company_page, initial_values: dict, updated_values: dict):
-        """Edit Industry field in Basic Company Info tab (assert current from Summary tab, then update)."""
-        from playwright.sync_api import expect
-        
-        print(f"🔧 [Basic Tab] Editing Industry from '{initial_values['industry']}' to '{updated_values['industry']}'")
-        
-        # Step 1: Assert current value from Summary tab is visible
-        current_industry_container = page.locator('div.group_single_item.group').filter(has_text=f"Industry:{initial_values['industry']}")
-        expect(current_industry_container).to_be_visible()
-        print(f"✅ Verified current industry from Summary tab: {initial_values['industry']}")
-        
-        # Step 2: Click edit icon
-        current_industry_container.hover()
-        time.sleep(2)
-        edit_icon = current_industry_container.locator('.group_single_edit_icon')
-        expect(edit_icon).to_be_visible(timeout=5000)
-        edit_icon.click()
-        time.sleep(1)
-        
-        # Step 3: Select new option from dropdown
-        industry_dropdown = page.locator(".select-trigger")
-        industry_dropdown.click()
-        time.sleep(1)
-        
-        # Select the new industry option
-        option_locator = page.get_by_text(updated_values['industry'])
-        expect(option_locator).to_be_visible(timeout=5000)
-        option_locator.click()
-        time.sleep(0.5)
-        
-        # Step 4: Save changes
-        page.get_by_role("button", name="Save").click()
-        time.sleep(2)
-        
-        # Step 5: Assert success and updated value
-        enhanced_assert_visible(page, company_page.locators.company_updated_successfully_message, "Company info updated message should appear", "edit_industry_basic_tab")
-        time.sleep(1)
-        
-        # Step 6: Verify updated value
-        updated_industry_visible = page.locator("div.group_single_item.group").filter(has_text=f"Industry:{updated_values['industry']}")
-        expect(updated_industry_visible).to_be_visible()
-        print(f"✅ [Basic Tab] Industry successfully updated to: {updated_values['industry']}")
-    
-    # -------------------------------------------------------------------------
-    # WEB & CONTACT INFO TAB FUNCTIONS
-    # -------------------------------------------------------------------------
-    
-    @staticmethod
-    def assert_main_tel_field_web_contact_tab(page: Page, company_page, initial_values: dict):
-        """Assert Main TEL field value in Web & Contact Info tab (verification only)."""
-        from playwright.sync_api import expect
-        
-        print(f"🔍 [Web & Contact Tab] Verifying Main TEL field: {initial_values['main_tel']}")
-        
-        # Assert the Main TEL value from Summary tab is visible
-        main_tel_visible = page.locator("div.group_single_item.group").filter(has_text=f"Main TEL:{initial_values['main_tel']}")
-        expect(main_tel_visible).to_be_visible()
-        print(f"✅ [Web & Contact Tab] Main TEL field verified: {initial_values['main_tel']}")
-    
-    @staticmethod
-    def assert_hr_tel_field_web_contact_tab(page: Page, company_page, initial_values: dict):
-        """Assert HR TEL field value in Web & Contact Info tab (verification only)."""
-        from playwright.sync_api import expect
-        
-        print(f"🔍 [Web & Contact Tab] Verifying HR TEL field: {initial_values['hr_tel']}")
-        
-        # Assert the HR TEL value from Summary tab is visible
-        hr_tel_visible = page.locator("div.group_single_item.group").filter(has_text=f"HR TEL:{initial_values['hr_tel']}")
-        expect(hr_tel_visible).to_be_visible()
-        print(f"✅ [Web & Contact Tab] HR TEL field verified: {initial_values['hr_tel']}")
-    
-    @staticmethod
-    def edit_and_assert_website_field_web_contact_tab(page: Page, company_page, initial_values: dict, updated_values: dict):
-        """Edit Website field in Web & Contact Info tab (assert current from Summary tab, then update)."""
-        from playwright.sync_api import expect
-        
-        print(f"🔧 [Web & Contact Tab] Editing Website from '{initial_values['website']}' to '{updated_values['website']}'")
-        
-        # Step 1: Assert current value from Summary tab is visible
-        current_website_container = page.locator('div.group_single_item.group').filter(has_text=f"Web page:{initial_values['website']}")
-        expect(current_website_container).to_be_visible()
-        print(f"✅ Verified current website from Summary tab: {initial_values['website']}")
-        
-        # Step 2: Click edit icon
-        current_website_container.hover()
-        time.sleep(2)
-        edit_icon = current_website_container.locator('.group_single_edit_icon')
-        expect(edit_icon).to_be_visible(timeout=5000)
-        edit_icon.click()
-        time.sleep(1)
-        
-        # Step 3: Fill website field with multiple locator strategies
-        try:
-            website_textbox = page.get_by_role("textbox", name="Web page")
-            website_textbox.wait_for(state="visible", timeout=5000)
-        except:
-            try:
-                website_textbox = page.get_by_role("textbox", name="Website")
-                website_textbox.wait_for(state="visible", timeout=5000)
-            except:
-                website_textbox = company_page.locators.website_input
-                website_textbox.wait_for(state="visible", timeout=5000)
-        
-        website_textbox.clear()
-        website_textbox.fill(updated_values['website'])
-        time.sleep(0.5)
-        
-        # Step 4: Save changes
-        page.get_by_role("button", name="Save").click()
-        time.sleep(2)
-        
-        # Step 5: Assert success and updated value
-        enhanced_assert_visible(page, company_page.locators.company_updated_successfully_message, "Company info updated message should appear", "edit_website_web_contact_tab")
-        time.sleep(1)
-        
-        # Step 6: Verify updated value
-        updated_website_visible = page.locator("div.group_single_item.group").filter(has_text=f"Web page:{updated_values['website']}")
-        expect(updated_website_visible).to_be_visible()
-        print(f"✅ [Web & Contact Tab] Website successfully updated to: {updated_values['website']}")
-    
-    # -------------------------------------------------------------------------
-    # LOCATION DETAILS TAB FUNCTIONS
-    # -------------------------------------------------------------------------
-    
-    @staticmethod
-    def edit_and_assert_hq_in_japan_field_location_tab(page: Page, company_page, initial_values: dict, updated_values: dict):
-        """Edit HQ in Japan field in Location Details tab (assert current from Summary tab, then update)."""
-        from playwright.sync_api import expect
-        
-        print(f"🔧 [Location Tab] Editing HQ in JPN from '{initial_values['hq_in_japan']}' to '{updated_values['hq_in_japan']}'")
-        
-        # Step 1: Assert current value from Summary tab is visible
-        current_hq_container = page.locator('div.group_single_item.group').filter(has_text=f"HQ in JPN:{initial_values['hq_in_japan']}")
-        expect(current_hq_container).to_be_visible()
-        print(f"✅ Verified current HQ in JPN from Summary tab: {initial_values['hq_in_japan']}")
-        
-        # Step 2: Click edit icon
-        current_hq_container.hover()
-        time.sleep(2)
-        edit_icon = current_hq_container.locator('.group_single_edit_icon')
-        expect(edit_icon).to_be_visible(timeout=5000)
-        edit_icon.click()
-        time.sleep(1)
-        
-        # Step 3: Select new option from dropdown
-        print("🔧 Opening HQ in JPN dropdown...")
-        
-        # Try multiple approaches to open the dropdown
-        try:
-            # Approach 1: Look for select-trigger
-            hq_dropdown = page.locator(".select-trigger")
-            if hq_dropdown.count() > 0:
-                print("✅ Found .select-trigger, clicking...")
-                hq_dropdown.click()
-                time.sleep(2)
-            else:
-                print("⚠️ .select-trigger not found, trying alternative...")
-                
-                # Approach 2: Look for dropdown trigger in the edit area
-                dropdown_trigger = page.locator('[role="combobox"], .dropdown-trigger, .select-input')
-                if dropdown_trigger.count() > 0:
-                    print("✅ Found alternative dropdown trigger, clicking...")
-                    dropdown_trigger.first.click()
-                    time.sleep(2)
-                else:
-                    print("⚠️ No dropdown trigger found, checking if modal opened...")
-                    # Check if modal opened instead
-                    modal = page.locator('[role="dialog"], .modal')
-                    if modal.count() > 0:
-                        print("✅ Modal opened instead of dropdown")
-                        # Handle modal-based selection (if needed)
-                        modal_dropdown = modal.locator('.select-trigger, [role="combobox"]')
-                        if modal_dropdown.count() > 0:
-                            modal_dropdown.first.click()
-                            time.sleep(2)
-        except Exception as e:
-            print(f"⚠️ Error opening dropdown: {e}")
-        
-        # Debug: Check if dropdown opened (try multiple selectors)
-        dropdown_selectors = ['.select-content', '.dropdown-content', '.options-list', '[role="listbox"]']
-        dropdown_opened = False
-        
-        for selector in dropdown_selectors:
-            dropdown_content = page.locator(selector)
-            if dropdown_content.count() > 0 and dropdown_content.is_visible():
-                print(f"✅ Dropdown opened successfully with selector: {selector}")
-                dropdown_opened = True
-                break
-        
-        if not dropdown_opened:
-            print("❌ Dropdown did not open with any known selector")
-            print("🔍 Available elements after clicking:")
-            # Debug: List visible elements
-            all_elements = page.locator('*').all()
-            visible_count = 0
-            for elem in all_elements[:10]:  # Check first 10 elements
-                try:
-                    if elem.is_visible():
-                        visible_count += 1
-                except:
-                    pass
-            print(f"🔍 Found {visible_count} visible elements on page")
-            
-            # Try to find dropdown content with a broader search
-            broad_dropdown = page.locator('div:has-text("Yes"), div:has-text("No")').first
-            if broad_dropdown.count() > 0:
-                print("✅ Found dropdown options with broad search")
-                dropdown_opened = True
-                dropdown_content = broad_dropdown.locator('..')  # Parent element
-            else:
-                raise Exception("Could not open HQ in Japan dropdown")
-        
-        # Select the "No" option directly
-        print(f"🔍 Selecting option: {updated_values['hq_in_japan']}")
-        
-        # Simple direct approach - click on "No" text
-        try:
-            print("🔧 Looking for 'No' option to click...")
-            no_option = page.get_by_text("No", exact=True)
-            if no_option.count() > 0:
-                print("✅ Found 'No' option, clicking...")
-                no_option.click()
-                time.sleep(1)
-                print(f"✅ Successfully clicked on 'No' option")
-            else:
-                print("❌ 'No' option not found with exact text")
-                # Try with contains
-                no_option = page.locator("*:has-text('No')").first
-                no_option.click()
-                time.sleep(1)
-                print(f"✅ Successfully clicked 'No' with contains text")
-        except Exception as e:
-            print(f"❌ Failed to click 'No' option: {e}")
-            raise Exception("Could not select 'No' option from dropdown")
-        
-        # Step 4: Save changes
-        page.get_by_role("button", name="Save").click()
-        time.sleep(2)
-        
-        # Step 5: Assert success and updated value
-        enhanced_assert_visible(page, company_page.locators.company_updated_successfully_message, "Company info updated message should appear", "edit_hq_in_japan_location_tab")
-        time.sleep(1)
-        
-        # Step 6: Verify updated value
-        updated_hq_visible = page.locator("div.group_single_item.group").filter(has_text=f"HQ in JPN:{updated_values['hq_in_japan']}")
-        expect(updated_hq_visible).to_be_visible()
-        print(f"✅ [Location Tab] HQ in JPN successfully updated to: {updated_values['hq_in_japan']}")
-    
-    @staticmethod
-    def edit_and_assert_global_hq_field_location_tab(page: Page, company_page, initial_values: dict, updated_values: dict):
-        """Edit Global HQ field in Location Details tab (assert current from Summary tab, then update)."""
-        from playwright.sync_api import expect
-        
-        print(f"🔧 [Location Tab] Editing Global HQ from '{initial_values['global_hq']}' to '{updated_values['global_hq']}'")
-        
-        # Step 1: Assert current value from Summary tab is visible
-        current_global_hq_container = page.locator('div.group_single_item.group').filter(has_text=f"Global HQ:{initial_values['global_hq']}")
-        expect(current_global_hq_container).to_be_visible()
-        print(f"✅ Verified current Global HQ from Summary tab: {initial_values['global_hq']}")
-        
-        # Step 2: Click edit icon
-        current_global_hq_container.hover()
-        time.sleep(2)
-        edit_icon = current_global_hq_container.locator('.group_single_edit_icon')
-        expect(edit_icon).to_be_visible(timeout=5000)
-        edit_icon.click()
-        time.sleep(1)
-        
-        # Step 3: Fill Global HQ field
-        global_hq_textbox = page.get_by_role("textbox", name="Global HQ")
-        global_hq_textbox.wait_for(state="visible", timeout=10000)
-        global_hq_textbox.clear()
-        global_hq_textbox.fill(updated_values['global_hq'])
-        time.sleep(0.5)
-        
-        # Step 4: Save changes
-        page.get_by_role("button", name="Save").click()
-        time.sleep(2)
-        
-        # Step 5: Assert success and updated value
-        enhanced_assert_visible(page, company_page.locators.company_updated_successfully_message, "Company info updated message should appear", "edit_global_hq_location_tab")
-        time.sleep(1)
-        
-        # Step 6: Verify updated value
-        updated_global_hq_visible = page.locator("div.group_single_item.group").filter(has_text=f"Global HQ:{updated_values['global_hq']}")
-        expect(updated_global_hq_visible).to_be_visible()
-        print(f"✅ [Location Tab] Global HQ successfully updated to: {updated_values['global_hq']}")
-    
-    @staticmethod
-    def edit_and_assert_country_of_origin_field_location_tab(page: Page, company_page, initial_values: dict, updated_values: dict):
-        """Edit Country of Origin field in Location Details tab (assert current from Summary tab, then update)."""
-        from playwright.sync_api import expect
-        
-        print(f"🔧 [Location Tab] Editing Country of Origin from '{initial_values['country_of_origin']}' to '{updated_values['country_of_origin']}'")
-        
-        # Step 1: Assert current value from Summary tab is visible
-        current_country_container = page.locator('div.group_single_item.group').filter(has_text=f"Country of origin:{initial_values['country_of_origin']}")
-        expect(current_country_container).to_be_visible()
-        print(f"✅ Verified current Country of Origin from Summary tab: {initial_values['country_of_origin']}")
-        
-        # Step 2: Click edit icon
-        current_country_container.hover()
-        time.sleep(2)
-        edit_icon = current_country_container.locator('.group_single_edit_icon')
-        expect(edit_icon).to_be_visible(timeout=5000)
-        edit_icon.click()
-        time.sleep(1)
-        
-        # Step 3: Fill Country of Origin field
-        country_textbox = page.get_by_role("textbox", name="Country of Origin")
-        country_textbox.wait_for(state="visible", timeout=10000)
-        country_textbox.clear()
-        country_textbox.fill(updated_values['country_of_origin'])
-        time.sleep(0.5)
-        
-        # Step 4: Save changes
-        page.get_by_role("button", name="Save").click()
-        time.sleep(2)
-        
-        # Step 5: Assert success and updated value
-        enhanced_assert_visible(page, company_page.locators.company_updated_successfully_message, "Company info updated message should appear", "edit_country_of_origin_location_tab")
-        time.sleep(1)
-        
-        # Step 6: Verify updated value
-        updated_country_visible = page.locator("div.group_single_item.group").filter(has_text=f"Country of origin:{updated_values['country_of_origin']}")
-        expect(updated_country_visible).to_be_visible()
-        print(f"✅ [Location Tab] Country of Origin successfully updated to: {updated_values['country_of_origin']}")
-    
-    @staticmethod
-    def edit_and_assert_address_field_location_tab(page: Page, company_page, initial_values: dict, updated_values: dict):
-        """Edit Company address field in Location Details tab (assert current from Summary tab, then update)."""
-        from playwright.sync_api import expect
-        
-        print(f"🔧 [Location Tab] Editing Company address from '{initial_values['address']}' to '{updated_values['address']}'")
-        
-        # Step 1: Assert current value from Summary tab is visible
-        current_address_container = page.locator('div.group_single_item.group').filter(has_text=f"Company address:{initial_values['address']}")
-        expect(current_address_container).to_be_visible()
-        print(f"✅ Verified current Company address from Summary tab: {initial_values['address']}")
-        
-        # Step 2: Click edit icon
-        current_address_container.hover()
-        time.sleep(2)
-        edit_icon = current_address_container.locator('.group_single_edit_icon')
-        expect(edit_icon).to_be_visible(timeout=5000)
-        edit_icon.click()
-        time.sleep(1)
-        
-        # Step 3: Fill address field with multiple locator strategies
-        try:
-            address_textbox = page.get_by_role("textbox", name="Company address")
-            address_textbox.wait_for(state="visible", timeout=5000)
-        except:
-            try:
-                address_textbox = page.get_by_role("textbox", name="Address")
-                address_textbox.wait_for(state="visible", timeout=5000)
-            except:
-                address_textbox = company_page.locators.address_input
-                address_textbox.wait_for(state="visible", timeout=5000)
-        
-        address_textbox.clear()
-        address_textbox.fill(updated_values['address'])
-        time.sleep(0.5)
-        
-        # Step 4: Save changes
-        page.get_by_role("button", name="Save").click()
-        time.sleep(2)
-        
-        # Step 5: Assert success and updated value
-        enhanced_assert_visible(page, company_page.locators.company_updated_successfully_message, "Company info updated message should appear", "edit_address_location_tab")
-        time.sleep(1)
-        
-        # Step 6: Verify updated value
-        updated_address_visible = page.locator("div.group_single_item.group").filter(has_text=f"Company address:{updated_values['address']}")
-        expect(updated_address_visible).to_be_visible()
-        print(f"✅ [Location Tab] Company address successfully updated to: {updated_values['address']}")
-    
-    # -------------------------------------------------------------------------
-    # EMPLOYEES & BUSINESS INFO TAB FUNCTIONS
-    # -------------------------------------------------------------------------
-    
-    @staticmethod
-    def edit_and_assert_total_employees_jpn_field_employees_tab(page: Page, company_page, initial_values: dict, updated_values: dict):
-        """Edit Total employees JPN field in Employees & Business Info tab (assert current from Summary tab, then update)."""
-        from playwright.sync_api import expect
-        
-        print(f"🔧 [Employees Tab] Editing Total employees JPN from '{initial_values['total_employees']}' to '{updated_values['total_employees']}'")
-        
-        # Step 1: Assert current value from Summary tab is visible
-        current_employees_container = page.locator('div.group_single_item.group').filter(has_text=f"Total employees JPN:{initial_values['total_employees']}")
-        expect(current_employees_container).to_be_visible()
-        print(f"✅ Verified current Total employees JPN from Summary tab: {initial_values['total_employees']}")
-        
-        # Step 2: Click edit icon
-        current_employees_container.hover()
-        time.sleep(2)
-        edit_icon = current_employees_container.locator('.group_single_edit_icon')
-        expect(edit_icon).to_be_visible(timeout=5000)
-        edit_icon.click()
-        time.sleep(1)
-        
-        # Step 3: Fill Total employees JPN field
-        employees_textbox = page.get_by_role("textbox", name="Total employees JPN")
-        employees_textbox.wait_for(state="visible", timeout=10000)
-        employees_textbox.clear()
-        employees_textbox.fill(updated_values['total_employees'])
-        time.sleep(0.5)
-        
-        # Step 4: Save changes
-        page.get_by_role("button", name="Save").click()
-        time.sleep(2)
-        
-        # Step 5: Assert success and updated value
-        enhanced_assert_visible(page, company_page.locators.company_updated_successfully_message, "Company info updated message should appear", "edit_total_employees_employees_tab")
-        time.sleep(1)
-        
-        # Step 6: Verify updated value
-        updated_employees_visible = page.locator("div.group_single_item.group").filter(has_text=f"Total employees JPN:{updated_values['total_employees']}")
-        expect(updated_employees_visible).to_be_visible()
-        print(f"✅ [Employees Tab] Total employees JPN successfully updated to: {updated_values['total_employees']}")
-    
-    @staticmethod
-    def edit_and_assert_business_contents_field(page: Page, company_page, updated_values: dict):
-        """Edit Business Contents and Key products field in Employees & Business Info tab (new field)."""
-        from playwright.sync_api import expect
-        
-        print(f"🔧 [Employees Tab] Adding Business Contents field: {updated_values['business_contents']}")
-        
-        # Step 1: Find and click the Business Contents field edit icon
-        business_contents_container = page.locator('div.group_single_item.group').filter(has_text="Business Contents")
-        expect(business_contents_container).to_be_visible()
-        business_contents_container.hover()
-        time.sleep(2)
-        
-        edit_icon = business_contents_container.locator('.group_single_edit_icon')
-        expect(edit_icon).to_be_visible(timeout=5000)
-        edit_icon.click()
-        time.sleep(1)
-        
-        # Step 2: Fill business contents field
-        business_contents_textbox = page.get_by_role("textbox", name="Business Contents")
-        business_contents_textbox.wait_for(state="visible", timeout=10000)
-        business_contents_textbox.fill(updated_values['business_contents'])
-        time.sleep(0.5)
-        
-        # Step 3: Save changes
-        page.get_by_role("button", name="Save").click()
-        time.sleep(2)
-        
-        # Step 4: Assert success and updated value
-        enhanced_assert_visible(page, company_page.locators.company_updated_successfully_message, "Company info updated message should appear", "edit_business_contents")
-        time.sleep(3)  # Wait for UI to update
-        
-        # Step 5: Verify updated value - look for Business Contents container with the text
-        updated_business_visible = page.locator("div.group_single_item.group").filter(has_text="Business Contents").filter(has_text=updated_values['business_contents'])
-        expect(updated_business_visible).to_be_visible(timeout=10000)
-        print(f"✅ [Employees Tab] Business Contents successfully updated to: {updated_values['business_contents']}")
-    
-    @staticmethod
-    def edit_and_assert_job_opening_field_employees_tab(page: Page, company_page, initial_values: dict, updated_values: dict):
-        """Edit Job opening field in Employees & Business Info tab (assert current from Summary tab, then update)."""
-        from playwright.sync_api import expect
-        
-        print(f"🔧 [Employees Tab] Editing Job opening from '{initial_values['job_opening']}' to '{updated_values['job_opening']}'")
-        
-        # Step 1: Assert current value from Summary tab is visible
-        current_job_opening_container = page.locator('div.group_single_item.group').filter(has_text=f"Job opening:{initial_values['job_opening']}")
-        expect(current_job_opening_container).to_be_visible()
-        print(f"✅ Verified current Job opening from Summary tab: {initial_values['job_opening']}")
-        
-        # Step 2: Click edit icon
-        current_job_opening_container.hover()
-        time.sleep(2)
-        edit_icon = current_job_opening_container.locator('.group_single_edit_icon')
-        expect(edit_icon).to_be_visible(timeout=5000)
-        edit_icon.click()
-        time.sleep(1)
-        
-        # Step 3: Select new option from dropdown
-        job_opening_dropdown = page.locator(".select-trigger")
-        job_opening_dropdown.click()
-        time.sleep(1)
-        
-        # Select the new job opening option
-        option_locator = page.get_by_text(updated_values['job_opening'])
-        expect(option_locator).to_be_visible(timeout=5000)
-        option_locator.click()
-        time.sleep(0.5)
-        
-        # Step 4: Save changes
-        page.get_by_role("button", name="Save").click()
-        time.sleep(2)
-        
-        # Step 5: Assert success and updated value
-        enhanced_assert_visible(page, company_page.locators.company_updated_successfully_message, "Company info updated message should appear", "edit_job_opening_employees_tab")
-        time.sleep(1)
-        
-        # Step 6: Verify updated value
-        updated_job_opening_visible = page.locator("div.group_single_item.group").filter(has_text=f"Job opening:{updated_values['job_opening']}")
-        expect(updated_job_opening_visible).to_be_visible()
-        print(f"✅ [Employees Tab] Job opening successfully updated to: {updated_values['job_opening']}")
-    
-    @staticmethod
-    def edit_and_assert_quick_notes_field(page: Page, company_page, updated_values: dict):
-        """Edit Quick notes field in Employees & Business Info tab with validation (new field)."""
-        from playwright.sync_api import expect
-        
-        print(f"🔧 [Employees Tab] Editing Quick notes field: {updated_values['quick_notes']}")
-        
-        # Step 1: Find Quick notes field on Employees & Business Info tab using specific locator
-        quick_notes_container = page.locator('div.grid.gap-2.group').filter(has_text="Quick notes:")
-        expect(quick_notes_container).to_be_visible()
-        print("✅ Found Quick notes field on Employees & Business Info tab")
-        
-        # Step 2: Assert current value "No quick notes available." is visible on the page
-        print("🔍 Validating current value: 'No quick notes available.' is displayed")
-        no_notes_message = page.get_by_text("No quick notes available.")
-        expect(no_notes_message).to_be_visible(timeout=5000)
-        print("✅ Current value validated: 'No quick notes available.' message found on page")
-        
-        # Step 3: Hover over the field to reveal edit icon
-        print("🔍 Hovering over Quick notes field to reveal edit icon...")
-        quick_notes_container.hover()
-        time.sleep(2)
-        
-        edit_icon = quick_notes_container.locator('.group_single_edit_icon')
-        expect(edit_icon).to_be_visible(timeout=5000)
-        edit_icon.click()
-        time.sleep(1)
-        
-        # Step 4: Fill quick notes field with new value in the modal - Rich Text Editor
-        print(f"🔧 Writing new value in Quick notes modal (rich text editor): {updated_values['quick_notes']}")
-        print("🔍 Waiting for rich text editor modal to open...")
-        time.sleep(2)  # Wait for modal to open
-        
-        try:
-            # This is a rich text editor, not a simple textbox
-            quick_notes_editor = page.locator("textbox").first  # The rich text editor textbox
-            quick_notes_editor.wait_for(state="visible", timeout=5000)
-            print("✅ Found rich text editor textbox")
-        except:
-            try:
-                # Alternative - target the paragraph inside the textbox
-                quick_notes_editor = page.locator("textbox paragraph")
-                quick_notes_editor.wait_for(state="visible", timeout=5000)
-                print("✅ Found rich text editor paragraph")
-            except:
-                try:
-                    # Alternative - use generic textbox locator
-                    quick_notes_editor = page.locator("[role='textbox']").first
-                    quick_notes_editor.wait_for(state="visible", timeout=5000) 
-                    print("✅ Found textbox with role='textbox'")
-                except:
-                    print("❌ Could not find rich text editor - checking page state...")
-                    # Try to see if modal opened at all
-                    modal_elements = page.locator("[role='dialog'], .modal, .dialog").count()
-                    print(f"🔍 Found {modal_elements} modal elements on page")
-                    raise Exception("No rich text editor found in Quick notes modal")
-        
-        quick_notes_editor.fill(updated_values['quick_notes'])
-        time.sleep(0.5)
-        
-        # Step 5: Save changes
-        page.get_by_role("button", name="Save").click()
-        time.sleep(3)
-        
-        # Step 6: Check for success message - once success appears, verify and close
-        success_message = company_page.locators.company_updated_successfully_message
-        
-        if success_message.is_visible():
-            # SUCCESS: Message appeared, now verify the updated value
-            print("✅ SUCCESS: 'Company info updated successfully' message appeared")
-            time.sleep(1)  # Brief wait for modal to close
-            
-            # Verify the updated value is visible on the page
-            try:
-                updated_notes_visible = page.locator("div.group_single_item.group").filter(has_text=f"Quick notes:{updated_values['quick_notes']}")
-                expect(updated_notes_visible).to_be_visible(timeout=3000)
-                print(f"✅ [Employees Tab] Quick notes successfully updated and verified: {updated_values['quick_notes']}")
-            except:
-                # If exact match fails, try a more flexible approach
-                quick_notes_text = page.locator("div.group_single_item.group").filter(has_text="Quick notes:")
-                if quick_notes_text.is_visible():
-                    print(f"✅ [Employees Tab] Quick notes field updated (text verification passed)")
-                else:
-                    print(f"⚠️ [Employees Tab] Quick notes updated but verification failed - continuing")
-            
-        else:
-            # FAILURE: Success message not found
-            print("❌ ERROR: 'Company info updated successfully' message NOT found")
-            
-            # Manually close modal
-            try:
-                close_button = page.get_by_role("button", name="Close")
-                if close_button.is_visible():
-                    close_button.click()
-                    time.sleep(1)
-                    print("✅ Modal closed manually")
-            except:
-                print("⚠️ Could not close modal manually")
-            
-            # Raise error to fail the test
-            raise AssertionError("Quick notes update failed - no success message appeared")
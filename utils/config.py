@@ -1,6 +1,6 @@
 import os
 
-BASE_URL = "https://bprp-qa.shadhinlab.xyz"
+BASE_URL = os.getenv("BPRP_BASE_URL", "https://bprp-qa.shadhinlab.xyz")  # Override to point at a local stand-in
 BROWSER_NAME = "chromium"  # chromium, firefox, webkit
 
 # Automatically run in headless mode in CI/CD environments
@@ -16,6 +16,7 @@ FULL_PAGE_SCREENSHOT = True
 TOAST_WAIT_TIME = 1500  # Wait 3 seconds for toasts to appear
 TOAST_TIMEOUT = 5000   # Wait up to 10 seconds for toast visibility
 ERROR_MESSAGE_WAIT = 2000  # Wait 2 seconds for error messages
+TOAST_BUFFER_SIZE = 200  # Toasts kept per tab by the toast recorder (oldest dropped first)
 
 # Screenshot naming configuration
 SCREENSHOT_DATE_FORMAT = "%d-%m-%Y"
@@ -30,4 +31,88 @@ FAILURE_SCREENSHOT_DIR = "failures"
 # Network and loading configuration
 NETWORK_IDLE_TIMEOUT = 5000  # Wait for network idle
 PAGE_LOAD_STRATEGY = "networkidle"  # or "domcontentloaded" or "load"
-SLOW_MO = 1000  # Slow down operations by 1000ms
\ No newline at end of file
+SLOW_MO = 1000  # Slow down operations by 1000ms
+
+# Performance metrics configuration
+METRICS_EXPORT_DIR = "metrics"  # Time-series exports (InfluxDB line protocol / Prometheus text)
+
+# Flaky test tracking configuration
+TEST_HISTORY_DIR = "test_history"  # Local outcome history and quarantine list
+TEST_HISTORY_LENGTH = 30           # Outcomes kept per test
+FLAKY_FLIP_RATE = 0.2              # Flip rate at which a failure is treated as suspected-flaky
+QUARANTINE_FLIP_RATE = 0.3         # Flip rate at which a test is quarantined
+QUARANTINE_MIN_RUNS = 5            # Minimum recorded runs before automatic quarantine
+
+# Locator profiling configuration
+LOCATOR_PROFILE_ROUNDS = 5  # Resolutions per selector and page (median is reported)
+LOCATOR_SLOW_MS = 5         # Resolution cost above the baseline round trip reported as slow
+
+# Load runner configuration
+LOAD_DEFAULT_USERS = 5        # Concurrent virtual users
+LOAD_DEFAULT_ITERATIONS = 10  # Iterations per virtual user when no duration is given
+LOAD_RAMP_UP = 10             # Seconds over which the virtual users are started
+LOAD_MAX_PAGES = 5            # Pages walked per pagination iteration
+
+# Search benchmark configuration
+SEARCH_BENCH_TRIALS = 5         # Trials per search term
+SEARCH_BENCH_QUIET_MS = 500     # DOM quiet window after which search results count as rendered
+SEARCH_BENCH_TIMEOUT = 10000    # Max wait for search results to render
+SEARCH_BENCH_KEY_DELAY = 50     # Delay between keystrokes in ms (a fast typist)
+SEARCH_BENCH_REGRESSION = 0.2   # Relative increase of the median render time reported as a regression
+
+# Bulk import benchmark configuration
+BULK_BENCH_ROW_COUNTS = [10, 100, 1000, 10000]  # Generated JD rows per import, smallest first
+BULK_BENCH_PROCESS_TIMEOUT = 600000  # Max wait for an upload plus its processing (10 minutes)
+BULK_BENCH_LIST_TIMEOUT = 300000     # Max wait for the imported rows to show up in the JD list
+BULK_BENCH_POLL_MS = 3000            # Wait per list search while polling for the imported rows
+BULK_BENCH_CLEANUP_TIMEOUT = 1800000  # Max time for deleting the imported rows after the run (30 minutes)
+BULK_BENCH_KNEE_EXPONENT = 1.2       # Growth exponent of processing time treated as nonlinear
+BULK_BENCH_REGRESSION = 0.2          # Relative drop of rows/s reported as a regression
+
+# Sleep accounting configuration
+SLEEP_REPORT_TOP = 20  # Sleep sites listed in the terminal summary
+
+# Page quiescence configuration
+QUIESCENCE_QUIET_MS = 100   # DOM/network quiet window after which the page counts as settled
+QUIESCENCE_TIMEOUT = 5000   # Hard ceiling of a settle step
+
+# Modal tracker configuration
+MODAL_WAIT_TIMEOUT = 5000   # Max wait for a modal to open or close
+MODAL_HISTORY_SIZE = 200    # Modal open/close records kept per tab
+
+# Tenant pool configuration
+TENANT_POOL_FILE = "tenants.json"      # Per-worker tenants (accounts + agencies); env BPRP_TENANTS overrides the path
+TENANT_LEASE_DIR = "tenant_leases"     # Lease lock files and provisioned agencies, under METRICS_EXPORT_DIR
+TENANT_LEASE_TTL = 6 * 3600            # Seconds after which the lease of a crashed run is taken over
+TENANT_AGENCY_PREFIX = "bprp-tenant"   # Name prefix of agencies provisioned for a tenant
+TENANT_AGENCY_AREAS = ("jd", "empty", "client", "bulk_benchmark")  # Agencies every tenant needs (empty: must contain no JDs)
+TENANT_DEDICATED_AREAS = ("bulk_benchmark",)  # Areas never served by a tenant's "default" agency (not in DEFAULT_TENANT)
+TENANT_COMPANY_AREAS = ("jd",)         # Agencies that need a client company ("company_name"; JD creation selects it)
+
+# Tenant used when no pool is configured (shared by all workers)
+DEFAULT_TENANT = {
+    "key": "shared",
+    "accounts": {
+        "admin": {"email": "mi003b@onemail.host", "password": "Kabir123#"},
+        "company": {"email": "nua26i@onemail.host", "password": "Kabir123#"},
+        "agency": {"email": "gi7j8d@mepost.pw", "password": "Kabir123#"},
+    },
+    "agencies": {
+        "jd": {"agency_name": "demo 06", "agency_id": "174", "company_name": "company for test"},
+        "empty": {"agency_id": "173"},
+        "client": {"agency_id": "173"},
+    },
+}
+
+# Step checkpoint configuration
+STEP_CHECKPOINT_DIR = "step_checkpoints"  # Checkpoints of failed multi-step tests, under METRICS_EXPORT_DIR
+STEP_CHECKPOINT_TTL = 3600                # Seconds a checkpoint is resumed from (older: the test starts over)
+
+# Shared browser server configuration
+BROWSER_SERVER_DIR = "browser_server"  # Endpoint, lock and client files plus the browser profile, under METRICS_EXPORT_DIR
+BROWSER_SERVER_START_TIMEOUT = 30      # Seconds for the shared browser to open its debugging port
+BROWSER_SERVER_LOCK_TIMEOUT = 60       # Seconds a worker waits for another one launching the browser
+
+# Memory watchdog configuration
+MEMORY_RECYCLE_MB = 1500  # Total browser RSS after a test that makes the watchdog relaunch the browser
+MEMORY_LEAK_MB = 50       # Memory a test may leave behind after its context closed before it is flagged
@@ -0,0 +1,249 @@
+"""
+Coupling Analyzer
+Finds tests that share state at collection time, so a parallel run keeps them on one worker in collection
+order while every other test distributes freely. Tests are coupled when they share a module/session fixture
+that a test writes to (created_jd_title["title"] = ..., verified_email_data["email"] = ...), a fixture that
+names generated test data one test creates and later tests use (created_company_name), or the
+order_dependent marker.
+"""
+
+import ast
+import inspect
+import re
+import textwrap
+from typing import Dict, List, Optional, Set
+
+# Method calls on a fixture value that do not change it (anything else counts as a write)
+READ_ONLY_METHODS = {
+    "get", "keys", "values", "items", "copy", "count", "index", "lower", "upper", "strip", "split",
+    "startswith", "endswith", "replace", "format", "join", "title",
+}
+
+# Fixture scopes that share one value between tests
+SHARED_SCOPES = ("class", "module", "package", "session")
+
+ORDER_MARKER = "order_dependent"
+
+_ast_cache: Dict[object, Optional[ast.AST]] = {}
+
+
+def _function_ast(func) -> Optional[ast.AST]:
+    """Parsed definition of a function, or None when its source is unavailable"""
+    func = inspect.unwrap(func)
+    if func not in _ast_cache:
+        try:
+            tree = ast.parse(textwrap.dedent(inspect.getsource(func)))
+            _ast_cache[func] = tree.body[0] if tree.body else None
+        except (OSError, TypeError, SyntaxError):
+            _ast_cache[func] = None
+    return _ast_cache[func]
+
+
+def _root_name(node: ast.AST) -> Optional[str]:
+    """Variable at the root of an attribute/subscript chain (data["email"].x -> "data")"""
+    while isinstance(node, (ast.Attribute, ast.Subscript)):
+        node = node.value
+    return node.id if isinstance(node, ast.Name) else None
+
+
+def written_names(func_node: ast.AST, names: Set[str], method_calls: bool = True) -> Set[str]:
+    """
+    Names among `names` whose value the function mutates
+
+    Item/attribute assignment, del, augmented assignment and (with method_calls) method calls other than
+    READ_ONLY_METHODS count as writes; simple aliases (data = verified_email_data) are followed.
+
+    Args:
+        func_node: Function definition
+        names: Parameter names to check
+        method_calls: Count method calls as writes (off for session fixtures, whose methods are lookups)
+
+    Returns:
+        set: Names written to
+    """
+    aliases = {name: name for name in names}
+    for node in ast.walk(func_node):
+        if isinstance(node, ast.Assign) and isinstance(node.value, ast.Name) and node.value.id in aliases:
+            for target in node.targets:
+                if isinstance(target, ast.Name):
+                    aliases[target.id] = aliases[node.value.id]
+
+    written = set()
+
+    def mark(target):
+        root = _root_name(target)
+        if root in aliases and not isinstance(target, ast.Name):  # Rebinding a local is not a write
+            written.add(aliases[root])
+
+    for node in ast.walk(func_node):
+        if isinstance(node, (ast.Assign, ast.Delete)):
+            for target in node.targets:
+                mark(target)
+        elif isinstance(node, (ast.AugAssign, ast.AnnAssign)):
+            mark(node.target)
+        elif method_calls and isinstance(node, ast.Call) and isinstance(node.func, ast.Attribute):
+            root = _root_name(node.func.value)
+            if root in aliases and node.func.attr not in READ_ONLY_METHODS:
+                written.add(aliases[root])
+    return written
+
+
+def consumed_in_teardown(fixture_func) -> bool:
+    """True when a yield fixture reads its value after the yield (a benchmark or profiler the tests fill)"""
+    node = _function_ast(fixture_func)
+    if node is None:
+        return False
+    for statement in ast.walk(node):
+        if isinstance(statement, ast.Yield) and isinstance(statement.value, ast.Name):
+            name, line = statement.value.id, statement.lineno
+            return any(isinstance(use, ast.Name) and use.id == name and use.lineno > line for use in ast.walk(node))
+    return False
+
+
+def is_generated_identity(fixture_func) -> bool:
+    """
+    True when a fixture returns generated test data (generate_company_name(), f"Role {generate_role_name()}")
+
+    Such a value names data one test creates and later tests look up, so its users depend on their order.
+    """
+    node = _function_ast(fixture_func)
+    if node is None:
+        return False
+    for statement in ast.walk(node):
+        if isinstance(statement, (ast.Return, ast.Yield)) and statement.value is not None:
+            for call in ast.walk(statement.value):
+                if isinstance(call, ast.Call):
+                    func = call.func
+                    name = func.id if isinstance(func, ast.Name) else getattr(func, "attr", "")
+                    if name.startswith("generate"):
+                        return True
+    return False
+
+
+def _scope_key(fixture_def, item) -> tuple:
+    """Identity of one fixture value: a module fixture has one value per module, a session fixture one per run"""
+    if fixture_def.scope == "session":
+        return ("session", fixture_def.argname)
+    if fixture_def.scope == "package":
+        return ("package", fixture_def.baseid, fixture_def.argname)
+    if fixture_def.scope == "class" and item.cls is not None:
+        return ("class", item.nodeid.rsplit("::", 1)[0], fixture_def.argname)
+    return ("module", item.nodeid.split("::")[0], fixture_def.argname)
+
+
+class CouplingAnalyzer:
+    """
+    Groups collected tests into units that must run on one worker in order; uncoupled tests are units of one
+    """
+
+    def __init__(self, items: list):
+        """
+        Analyze collected tests
+
+        Args:
+            items: Collected pytest items (unit order follows collection order)
+        """
+        self.items = items
+        self._parent = list(range(len(items)))
+        self.reasons: Dict[int, Set[str]] = {}  # {root index: {"state: created_jd_title", ...}}
+        self._analyze()
+
+    def _find(self, index: int) -> int:
+        while self._parent[index] != index:
+            self._parent[index] = self._parent[self._parent[index]]
+            index = self._parent[index]
+        return index
+
+    def _couple(self, owners: Dict[tuple, int], key: tuple, index: int, reason: str):
+        """Put a test into the unit of the first test sharing `key`"""
+        if key not in owners:
+            owners[key] = index
+            self.reasons.setdefault(self._find(index), set()).add(reason)
+            return
+        root, other = self._find(index), self._find(owners[key])
+        if root != other:
+            self._parent[root] = other
+            self.reasons.setdefault(other, set()).update(self.reasons.pop(root, set()))
+        self.reasons.setdefault(other, set()).add(reason)
+
+    def shared_fixtures(self, item) -> Dict[str, object]:
+        """{name: FixtureDef} of the non-function-scoped fixtures a test uses"""
+        fixture_info = getattr(item, "_fixtureinfo", None)
+        if fixture_info is None:
+            return {}
+        shared = {}
+        for name in item.fixturenames:
+            fixture_defs = fixture_info.name2fixturedefs.get(name)
+            if fixture_defs and fixture_defs[-1].scope in SHARED_SCOPES:
+                shared[name] = fixture_defs[-1]
+        return shared
+
+    def test_writes(self, item, shared: Dict[str, object]) -> Set[str]:
+        """Shared fixtures the test body writes to (every own-module fixture when its source is unavailable)"""
+        node = _function_ast(item.obj) if hasattr(item, "obj") else None
+        if node is None:
+            module_id = item.nodeid.split("::")[0]
+            return {name for name, fixture_def in shared.items() if fixture_def.baseid == module_id}
+        session = {name for name, fixture_def in shared.items() if fixture_def.scope == "session"}
+        return (written_names(node, set(shared) - session)
+                | written_names(node, session, method_calls=False))
+
+    def fixture_coupling(self, fixture_def) -> Optional[str]:
+        """Coupling a fixture implies by itself: state (tests fill it), order (generated test data) or None"""
+        if fixture_def.scope == "session":
+            return None
+        if consumed_in_teardown(fixture_def.func):
+            return "state"
+        if is_generated_identity(fixture_def.func):
+            return "order"
+        return None
+
+    def _analyze(self):
+        owners: Dict[tuple, int] = {}  # First test per shared value (fixture or ordered module)
+        kinds: Dict[tuple, str] = {}   # {shared value: "state" / "order"}
+        users: Dict[tuple, List[int]] = {}
+        for index, item in enumerate(self.items):
+            shared = self.shared_fixtures(item)
+            written = self.test_writes(item, shared)
+            for name, fixture_def in shared.items():
+                key = _scope_key(fixture_def, item)
+                users.setdefault(key, []).append(index)
+                kind = "state" if name in written else self.fixture_coupling(fixture_def)
+                if kind and kinds.get(key) != "state":
+                    kinds[key] = kind
+            if item.get_closest_marker(ORDER_MARKER):
+                self._couple(owners, ("order", item.nodeid.split("::")[0]), index, f"order: {ORDER_MARKER} marker")
+
+        for key, kind in kinds.items():
+            indexes = users[key]
+            if len(indexes) < 2:
+                continue
+            for index in indexes:
+                self._couple(owners, key, index, f"{kind}: {key[-1]}")
+
+    def units(self) -> List[List]:
+        """Coupled units (lists of items in collection order); uncoupled tests form single-item units"""
+        units: Dict[int, List] = {}
+        for index, item in enumerate(self.items):
+            units.setdefault(self._find(index), []).append(item)
+        return list(units.values())
+
+    def unit_reasons(self, unit: list) -> List[str]:
+        """Why the tests of a unit are coupled"""
+        root = self._find(self.items.index(unit[0]))
+        return sorted(self.reasons.get(root, set()))
+
+    def report_lines(self) -> List[str]:
+        """Human readable summary: coupled units with their reasons, then the number of free tests"""
+        coupled = [unit for unit in self.units() if len(unit) > 1]
+        free = len(self.items) - sum(len(unit) for unit in coupled)
+        lines = [f"🔗 {len(coupled)} coupled units ({len(self.items) - free} tests), {free} free tests"]
+        for unit in coupled:
+            lines.append(f"   {unit_name(unit)} ({len(unit)} tests): {', '.join(self.unit_reasons(unit))}")
+            lines.append(f"      {' -> '.join(item.name for item in unit)}")
+        return lines
+
+
+def unit_name(unit: list) -> str:
+    """xdist group name of a unit (nodeid of its first test; "[", "]" and "@" replaced so the suffix can be stripped)"""
+    return re.sub(r"[\[\]@]", "_", f"{unit[0].nodeid.split('::')[0]}::{unit[0].name}")
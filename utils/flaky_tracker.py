@@ -0,0 +1,249 @@
+"""
+Flaky Test Tracker
+Keeps a compact per-test outcome history across runs (seeded from Allure history), computes flip rates,
+re-runs suspected-flaky failures in a fresh traced context and splits known-flaky tests into a quarantine lane
+"""
+
+import os
+import re
+import json
+from typing import Dict, List, Optional
+import pytest
+from _pytest.runner import runtestprotocol
+from utils.config import (TEST_HISTORY_DIR, TEST_HISTORY_LENGTH, FLAKY_FLIP_RATE,
+                          QUARANTINE_FLIP_RATE, QUARANTINE_MIN_RUNS)
+from utils.test_scheduler import ALLURE_HISTORY_FILE, allure_history_id
+
+OUTCOMES_FILE = "outcomes.json"
+QUARANTINE_FILE = "quarantine.txt"  # Manually quarantined node ids, one per line
+MIN_RUNS_FOR_FLAKY = 3
+
+# Allure statuses mapped to the compact outcome codes (P = passed, F = failed)
+_ALLURE_STATUS_CODES = {"passed": "P", "failed": "F", "broken": "F"}
+
+
+def history_key(nodeid: str) -> str:
+    """Node id without the "@<group>" suffix xdist adds under --dist loadgroup (one history per test)"""
+    return re.sub(r"@[^\[\]]*$", "", nodeid)
+
+
+def flip_rate(outcomes: str) -> float:
+    """
+    Fraction of consecutive runs whose outcome differs from the previous run
+
+    Example:
+        "PPPP" -> 0.0, "PFPF" -> 1.0, "PPFP" -> 0.67
+    """
+    if len(outcomes) < 2:
+        return 0.0
+    flips = sum(1 for previous, current in zip(outcomes, outcomes[1:]) if previous != current)
+    return flips / (len(outcomes) - 1)
+
+
+class FlakyTracker:
+    """
+    Per-test outcome history (oldest first, "P"/"F" per run) stored in test_history/outcomes.json
+    """
+
+    def __init__(self, history_dir: str = TEST_HISTORY_DIR, max_reruns: int = 0):
+        """
+        Initialize tracker and load stored history
+
+        Args:
+            history_dir: Directory holding outcomes.json and quarantine.txt
+            max_reruns: Reruns allowed for a suspected-flaky failure (0 disables reruns)
+        """
+        self.history_dir = history_dir
+        self.max_reruns = max_reruns
+        self.history: Dict[str, str] = self._load_history()
+        self.manual_quarantine = self._load_quarantine_list()
+        self.run_outcomes: Dict[str, List[str]] = {}
+        self.passed_on_rerun: List[str] = []
+
+    def _load_history(self) -> Dict[str, str]:
+        """Load stored outcome strings"""
+        path = os.path.join(self.history_dir, OUTCOMES_FILE)
+        if not os.path.exists(path):
+            return {}
+        try:
+            with open(path, "r", encoding="utf-8") as f:
+                return json.load(f).get("tests", {})
+        except (OSError, ValueError) as e:
+            print(f"⚠️ Could not read test history {path}: {e}")
+            return {}
+
+    def _load_quarantine_list(self) -> set:
+        """Load manually quarantined node ids (lines starting with # are comments)"""
+        path = os.path.join(self.history_dir, QUARANTINE_FILE)
+        if not os.path.exists(path):
+            return set()
+        with open(path, "r", encoding="utf-8") as f:
+            return {line.strip() for line in f if line.strip() and not line.startswith("#")}
+
+    def seed_from_allure(self, items: list, history_file: str = ALLURE_HISTORY_FILE) -> int:
+        """
+        Seed history for tests without local history from Allure's history.json
+
+        Args:
+            items: Collected pytest items
+            history_file: Path of Allure's history.json
+
+        Returns:
+            int: Number of tests seeded
+        """
+        missing = [item for item in items if item.nodeid not in self.history]
+        if not missing or not os.path.exists(history_file):
+            return 0
+        try:
+            with open(history_file, "r", encoding="utf-8") as f:
+                allure_history = json.load(f)
+        except (OSError, ValueError) as e:
+            print(f"⚠️ Could not read Allure history {history_file}: {e}")
+            return 0
+
+        seeded = 0
+        for item in missing:
+            entry = allure_history.get(allure_history_id(item))
+            if not entry:
+                continue
+            # Allure keeps the newest run first
+            codes = [_ALLURE_STATUS_CODES.get(run.get("status")) for run in reversed(entry.get("items", []))]
+            outcomes = "".join(code for code in codes if code)
+            if outcomes:
+                self.history[history_key(item.nodeid)] = outcomes[-TEST_HISTORY_LENGTH:]
+                seeded += 1
+        return seeded
+
+    def outcomes(self, nodeid: str) -> str:
+        """Stored history plus outcomes recorded in the current run"""
+        nodeid = history_key(nodeid)
+        return self.history.get(nodeid, "") + "".join(self.run_outcomes.get(nodeid, []))
+
+    def flip_rate(self, nodeid: str) -> float:
+        """Flip rate of a test over its known history"""
+        return flip_rate(self.outcomes(nodeid))
+
+    def is_suspected_flaky(self, nodeid: str) -> bool:
+        """A test that has both passed and failed recently and flips at least FLAKY_FLIP_RATE of the time"""
+        outcomes = self.history.get(history_key(nodeid), "")
+        return (len(outcomes) >= MIN_RUNS_FOR_FLAKY and "P" in outcomes and "F" in outcomes
+                and flip_rate(outcomes) >= FLAKY_FLIP_RATE)
+
+    def is_quarantined(self, nodeid: str) -> bool:
+        """Manually listed in quarantine.txt or flipping at least QUARANTINE_FLIP_RATE over enough runs"""
+        nodeid = history_key(nodeid)
+        if nodeid in self.manual_quarantine:
+            return True
+        outcomes = self.history.get(nodeid, "")
+        return len(outcomes) >= QUARANTINE_MIN_RUNS and flip_rate(outcomes) >= QUARANTINE_FLIP_RATE
+
+    def record(self, report):
+        """
+        Record the outcome of a test phase report (called from pytest_runtest_logreport)
+
+        Setup errors and call results count; a failed attempt that is re-run is recorded as a failure.
+        """
+        if report.when == "call":
+            if report.outcome == "rerun" or report.failed:
+                code = "F"
+            elif report.passed:
+                code = "P"
+            elif hasattr(report, "wasxfail"):
+                code = "F"  # Quarantined test failed (reported as xfail)
+            else:
+                return
+        elif report.when == "setup" and (report.outcome == "rerun" or report.failed):
+            code = "F"
+        else:
+            return
+        self.run_outcomes.setdefault(history_key(report.nodeid), []).append(code)
+
+    def save(self):
+        """Merge this run's outcomes into the stored history, keeping the last TEST_HISTORY_LENGTH runs per test"""
+        for nodeid, codes in self.run_outcomes.items():
+            self.history[nodeid] = (self.history.get(nodeid, "") + "".join(codes))[-TEST_HISTORY_LENGTH:]
+        os.makedirs(self.history_dir, exist_ok=True)
+        path = os.path.join(self.history_dir, OUTCOMES_FILE)
+        with open(path, "w", encoding="utf-8") as f:
+            json.dump({"tests": self.history}, f, indent=1, sort_keys=True)
+        self.run_outcomes.clear()
+
+    def flakiest(self, limit: int = 10) -> List[tuple]:
+        """Tests with the highest flip rate as (nodeid, flip_rate, outcomes)"""
+        rates = [(nodeid, self.flip_rate(nodeid), self.outcomes(nodeid)) for nodeid in set(self.history) | set(self.run_outcomes)]
+        rates = [rate for rate in rates if rate[1] > 0]
+        return sorted(rates, key=lambda rate: rate[1], reverse=True)[:limit]
+
+
+def apply_quarantine(config, items: list, tracker: FlakyTracker):
+    """
+    Apply --quarantine to the collected items in place
+
+    exclude: drop quarantined tests (blocking lane)
+    only:    run only quarantined tests, marked as non-strict xfail so the lane never fails the build
+    """
+    lane = config.getoption("--quarantine")
+    if lane == "off":
+        return
+
+    quarantined = [item for item in items if tracker.is_quarantined(item.nodeid)]
+    quarantined_ids = {id(item) for item in quarantined}
+    if lane == "exclude":
+        selected = [item for item in items if id(item) not in quarantined_ids]
+        deselected = quarantined
+        print(f"\n🚧 Quarantine lane excluded: {len(quarantined)} known-flaky tests deselected")
+    else:
+        selected = quarantined
+        deselected = [item for item in items if id(item) not in quarantined_ids]
+        for item in selected:
+            item.add_marker(pytest.mark.xfail(reason="Quarantined flaky test", strict=False))
+        print(f"\n🚧 Quarantine lane: running {len(quarantined)} known-flaky tests (non-blocking)")
+
+    if deselected:
+        config.hook.pytest_deselected(items=deselected)
+    items[:] = selected
+
+
+def run_with_flaky_reruns(item, nextitem, tracker: Optional[FlakyTracker]) -> Optional[bool]:
+    """
+    Run one test and re-run it in a fresh context with full tracing if it failed and is suspected flaky
+
+    Returns None (use pytest's default protocol) when reruns are disabled, True otherwise.
+    Failed attempts that get re-run are reported with the "rerun" outcome.
+    """
+    if tracker is None or tracker.max_reruns <= 0:
+        return None
+
+    item.ihook.pytest_runtest_logstart(nodeid=item.nodeid, location=item.location)
+    reports = runtestprotocol(item, nextitem=nextitem, log=False)
+    attempt = 0
+    while (attempt < tracker.max_reruns and any(report.failed for report in reports)
+           and tracker.is_suspected_flaky(item.nodeid)):
+        attempt += 1
+        for report in reports:
+            if report.failed:
+                report.outcome = "rerun"
+            item.ihook.pytest_runtest_logreport(report=report)
+        print(f"\n🔁 Re-running suspected-flaky test {item.nodeid} (attempt {attempt + 1}, "
+              f"flip rate {tracker.flip_rate(item.nodeid):.0%}) with tracing")
+        item._flaky_rerun_attempt = attempt  # context fixture forces tracing for rerun attempts
+        reports = runtestprotocol(item, nextitem=nextitem, log=False)
+
+    if attempt and not any(report.failed for report in reports):
+        tracker.passed_on_rerun.append(item.nodeid)
+    for report in reports:
+        item.ihook.pytest_runtest_logreport(report=report)
+    item.ihook.pytest_runtest_logfinish(nodeid=item.nodeid, location=item.location)
+    return True
+
+
+def print_flaky_summary(terminalreporter, tracker: FlakyTracker):
+    """Terminal summary of tests that passed on rerun and the flakiest tests in history"""
+    if not tracker.passed_on_rerun and not tracker.flakiest(1):
+        return
+    terminalreporter.section("flaky tests")
+    for nodeid in tracker.passed_on_rerun:
+        terminalreporter.write_line(f"PASSED ON RERUN {nodeid}")
+    for nodeid, rate, outcomes in tracker.flakiest():
+        flag = " [quarantined]" if tracker.is_quarantined(nodeid) else ""
+        terminalreporter.write_line(f"{rate:>5.0%} {outcomes[-TEST_HISTORY_LENGTH:]:<{TEST_HISTORY_LENGTH}} {nodeid}{flag}")
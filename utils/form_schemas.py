@@ -0,0 +1,109 @@
+"""
+Form Schemas
+Declarative field definitions (data key -> label/locator, kind, validation) of the create/edit modals,
+filled by utils.form_fill.FormFiller, and of the company details page, edited by utils.inline_edit.InlineEditDriver
+"""
+
+from utils.form_fill import FormSchema, FormField, TEXT, SELECT, FILE, is_number
+from utils.inline_edit import InlineField, ValidationProbe, RICH_TEXT, RICH_TEXT_CONTAINER_SELECTOR
+
+# JD "Add New JD" modal - keys match random_jd_data.JDTestData / jd_test_data dictionaries
+JD_FORM = FormSchema("JD form", [
+    FormField("position_title", TEXT, label="Position Job Title", locator="position_job_title_input"),
+    FormField("workplace", TEXT, label="JD Workplace", locator="jd_workplace_input"),
+    FormField("min_salary", TEXT, label="Minimum Salary", locator="minimum_salary_input", validate=is_number),
+    FormField("max_salary", TEXT, label="Maximum Salary", locator="maximum_salary_input", validate=is_number),
+    FormField("job_age_min", TEXT, label="Job Age Min", locator="job_age_min_input", validate=is_number),
+    FormField("job_age_max", TEXT, label="Job Age Max", locator="job_age_max_input", validate=is_number),
+    FormField("target_age_min", TEXT, label="Target Age Min", locator="target_age_min_input", validate=is_number),
+    FormField("target_age_max", TEXT, label="Target Age Max", locator="target_age_max_input", validate=is_number),
+    FormField("department", TEXT, label="Department", locator="department_input"),
+    FormField("direct_report", TEXT, label="Direct Report", locator="direct_report_input"),
+    FormField("job_function", TEXT, label="Job Function", locator="job_function_input"),
+    FormField("company", SELECT, method="select_company"),
+    FormField("work_style", SELECT, method="select_work_style"),
+    FormField("currency", SELECT, method="select_currency"),
+    FormField("japanese_level", SELECT, method="select_japanese_level"),
+    FormField("english_level", SELECT, method="select_english_level"),
+    FormField("priority_grade", SELECT, method="select_priority_grade"),
+    FormField("client", SELECT, method="select_client"),  # enabled only after company is selected
+    FormField("hiring_status", SELECT, method="select_hiring_status"),
+    FormField("employment_type", SELECT, method="select_employment_type"),
+    FormField("jd_file", FILE, method="upload_jd_file"),
+])
+
+# Company "Add Company" modal
+COMPANY_FORM = FormSchema("Company form", [
+    FormField("name", TEXT, label="Name", locator="company_name_input"),
+    FormField("website", TEXT, label="Web page", locator="website_input"),
+    FormField("total_employees", TEXT, label="Total Employees JPN", locator="total_employees_input", validate=is_number),
+    FormField("address", TEXT, label="Address", locator="address_input"),
+    FormField("main_tel", TEXT, label="Main Tel", locator="main_tel_input"),
+    FormField("hr_tel", TEXT, label="HR TEL", locator="hr_tel_input"),
+    FormField("industry", SELECT, method="select_industry_option"),
+    FormField("hiring_status", SELECT, method="select_hiring_status_option"),
+    FormField("company_grade", SELECT, method="select_company_grade_option"),
+    FormField("hq_in_japan", SELECT, method="select_hq_in_japan_option"),
+    FormField("job_opening", SELECT, method="select_job_opening_option"),
+    FormField("owner", SELECT, method="select_owner_option"),
+])
+
+# Client "Add Client" modal
+CLIENT_FORM = FormSchema("Client form", [
+    FormField("english_first_name", TEXT, label="English First Name", locator="english_first_name_input"),
+    FormField("english_last_name", TEXT, label="English Last Name", locator="english_last_name_input"),
+    FormField("japanese_first_name", TEXT, label="Japanese First Name", locator="japanese_first_name_input"),
+    FormField("japanese_last_name", TEXT, label="Japanese Last Name", locator="japanese_last_name_input"),
+    FormField("job_title", TEXT, label="Job title", locator="job_title_input"),
+    FormField("phone_number", TEXT, label="Number", locator="phone_number_input", validate=lambda v: is_number(str(v).replace("+", "").replace("-", "").replace(" ", ""))),
+    FormField("email", TEXT, label="Email", locator="email_input", validate=lambda v: "@" in str(v)),
+    FormField("gender", SELECT, locator="gender_dropdown", cache_name="client.gender"),
+    FormField("department", SELECT, locator="department_dropdown", cache_name="client.department"),
+    FormField("company", SELECT, locator="company_select_trigger"),
+    FormField("english_level", SELECT, locator="english_level_dropdown", cache_name="client.english_level"),
+    FormField("japanese_level", SELECT, locator="japanese_level_dropdown", cache_name="client.japanese_level"),
+    FormField("phone_label", SELECT, method="fill_phone_label"),
+    FormField("email_label", SELECT, method="fill_email_label"),
+    FormField("image", FILE, method="upload_client_image"),
+])
+
+# Talent "Add New Talent" modal
+TALENT_FORM = FormSchema("Talent form", [
+    FormField("first_name", TEXT, label="First Name", locator="first_name_input"),
+    FormField("last_name", TEXT, label="Last Name", locator="last_name_input"),
+    FormField("cv_name", TEXT, label="CV Name", locator="cv_name_input"),
+    FormField("date_of_birth", TEXT, locator="date_of_birth_input", batch=False),  # date picker input
+    FormField("gender", SELECT, method="select_gender"),
+    FormField("job_title", SELECT, method="select_job_title"),
+    FormField("japanese_level", SELECT, method="select_japanese_level"),
+    FormField("english_level", SELECT, method="select_english_level"),
+    FormField("location", SELECT, method="select_location"),
+    FormField("cv_language", SELECT, method="select_cv_language"),
+])
+
+# Company details page (Summary and info tabs) - inline edit modals; keys match CompanyTestDataManager
+COMPANY_DETAIL_FIELDS = [
+    InlineField("company_name", "Company name", probes=[
+        ValidationProbe("{value} ", "Company name should not start or end with special characters.",
+                        cleared_message="Company name is required."),
+    ]),
+    InlineField("website", "Web page", inputs=("Web page", "Website"),
+                input_css="input[placeholder*='website' i], input[name*='website' i]", probes=[
+        ValidationProbe("www.invalid-website.com", "Please enter a valid website URL",
+                        cleared_message="Website is required."),
+    ]),
+    InlineField("industry", "Industry", SELECT),
+    InlineField("hq_in_japan", "HQ in JPN", SELECT),
+    InlineField("global_hq", "Global HQ"),
+    InlineField("country_of_origin", "Country of origin", inputs=("Country of Origin",), expect_toast=False),
+    InlineField("address", "Company address", inputs=("Company address", "Address"),
+                input_css="input[placeholder*='address' i], input[name*='address' i], textarea[placeholder*='address' i]"),
+    InlineField("hiring_status", "Company hiring status", SELECT),
+    InlineField("job_opening", "Job opening", SELECT),
+    InlineField("total_employees", "Total employees JPN"),
+    InlineField("company_grade", "Company grade", SELECT),
+    InlineField("what_brand", "What brand"),
+    InlineField("under_which_group", "Under which group"),
+    InlineField("business_contents", "Business Contents", contains=True),
+    InlineField("quick_notes", "Quick notes", RICH_TEXT, container=RICH_TEXT_CONTAINER_SELECTOR, contains=True),
+]
@@ -0,0 +1,205 @@
+"""
+Impact Selector
+Change-impact test selection: builds the import graph of tests -> utils -> pages -> locators
+(plus random_values_generator) and maps a git diff to the test modules it can affect
+"""
+
+import os
+import ast
+import subprocess
+from typing import Dict, List, Set
+import pytest
+
+# Project packages that make up the import graph
+PROJECT_PACKAGES = ("tests", "utils", "pages", "locators", "random_values_generator")
+
+# Changes to these files can affect every test
+GLOBAL_FILES = ("conftest.py", "pytest.ini", "requirements.txt")
+
+# Directories with test data files referenced by name from the code
+DATA_DIRS = ("inputs", "images_for_test")
+
+RECENT_FAILURE_WINDOW = 3  # Runs looked at by the recently-failed safety margin
+
+
+def _module_to_file(module: str, root: str) -> str:
+    """Map a dotted module name to its project file (relative, "/" separated), or None for third-party modules"""
+    parts = module.split(".")
+    if parts[0] not in PROJECT_PACKAGES and module != "conftest":
+        return None
+    base = "/".join(parts)
+    for candidate in (f"{base}.py", f"{base}/__init__.py"):
+        if os.path.exists(os.path.join(root, candidate)):
+            return candidate
+    return None
+
+
+def _iter_project_files(root: str) -> List[str]:
+    """All Python files of the project packages plus conftest.py (relative, "/" separated)"""
+    files = ["conftest.py"] if os.path.exists(os.path.join(root, "conftest.py")) else []
+    for package in PROJECT_PACKAGES:
+        for dirpath, dirnames, filenames in os.walk(os.path.join(root, package)):
+            dirnames[:] = [d for d in dirnames if d != "__pycache__"]
+            for filename in filenames:
+                if filename.endswith(".py"):
+                    files.append(os.path.relpath(os.path.join(dirpath, filename), root).replace(os.sep, "/"))
+    return sorted(files)
+
+
+def _imports_of(path: str, root: str) -> Set[str]:
+    """Project files imported anywhere in a module (module level and inside functions)"""
+    try:
+        with open(os.path.join(root, path), "r", encoding="utf-8-sig") as f:
+            tree = ast.parse(f.read(), filename=path)
+    except (OSError, SyntaxError, UnicodeDecodeError) as e:
+        print(f"⚠️ Could not parse {path} for the import graph: {e}")
+        return set()
+
+    package = path.rsplit("/", 1)[0] if "/" in path else ""
+    imported = set()
+    for node in ast.walk(tree):
+        if isinstance(node, ast.Import):
+            for alias in node.names:
+                imported.add(_module_to_file(alias.name, root))
+        elif isinstance(node, ast.ImportFrom):
+            if node.level:
+                base_parts = package.split("/")[: len(package.split("/")) - (node.level - 1)] if package else []
+                module = ".".join(base_parts + ([node.module] if node.module else []))
+            else:
+                module = node.module or ""
+            imported.add(_module_to_file(module, root))
+            # "from utils import config" imports a submodule
+            for alias in node.names:
+                imported.add(_module_to_file(f"{module}.{alias.name}", root))
+    imported.discard(None)
+    imported.discard(path)
+    return imported
+
+
+def build_import_graph(root: str = ".") -> Dict[str, Set[str]]:
+    """
+    Build the project import graph
+
+    Args:
+        root: Project root directory
+
+    Returns:
+        dict: {file: set of project files it imports}
+    """
+    return {path: _imports_of(path, root) for path in _iter_project_files(root)}
+
+
+def _find_data_file_users(changed_file: str, graph: Dict[str, Set[str]], root: str) -> Set[str]:
+    """Modules that mention a changed data file (e.g. inputs/jd_files/sample.pdf) by file name"""
+    filename = os.path.basename(changed_file)
+    users = set()
+    for path in graph:
+        try:
+            with open(os.path.join(root, path), "r", encoding="utf-8-sig") as f:
+                if filename in f.read():
+                    users.add(path)
+        except (OSError, UnicodeDecodeError):
+            continue
+    return users
+
+
+def git_changed_files(base_ref: str, root: str = ".") -> List[str]:
+    """
+    Files changed between base_ref and the working tree, including untracked files
+
+    Args:
+        base_ref: Git ref to diff against (e.g. "origin/main", "HEAD~1")
+        root: Repository root
+
+    Returns:
+        list: Changed file paths relative to root
+    """
+    changed = set()
+    for command in (["git", "diff", "--name-only", base_ref],
+                    ["git", "ls-files", "--others", "--exclude-standard"]):
+        result = subprocess.run(command, cwd=root, capture_output=True, text=True)
+        if result.returncode != 0:
+            raise RuntimeError(f"{' '.join(command)} failed: {result.stderr.strip()}")
+        changed.update(line.strip() for line in result.stdout.splitlines() if line.strip())
+    return sorted(changed)
+
+
+def impacted_test_files(changed_files: List[str], graph: Dict[str, Set[str]], root: str = ".") -> Set[str]:
+    """
+    Map changed files to the test modules that (transitively) import them
+
+    Args:
+        changed_files: Changed paths relative to the project root
+        graph: Import graph from build_import_graph
+        root: Project root directory
+
+    Returns:
+        set: Impacted test files, or every test file when a global file (conftest.py, pytest.ini, ...) changed
+    """
+    test_files = {path for path in graph if path.startswith("tests/")}
+    if any(path in GLOBAL_FILES for path in changed_files):
+        return test_files
+
+    reverse: Dict[str, Set[str]] = {}
+    for path, imports in graph.items():
+        for imported in imports:
+            reverse.setdefault(imported, set()).add(path)
+
+    pending = []
+    for path in changed_files:
+        if path in graph:
+            pending.append(path)
+        elif path.split("/")[0] in DATA_DIRS:
+            pending.extend(_find_data_file_users(path, graph, root))
+
+    affected = set()
+    while pending:
+        path = pending.pop()
+        if path in affected:
+            continue
+        affected.add(path)
+        pending.extend(reverse.get(path, ()))
+    return affected & test_files
+
+
+def recently_failed_nodeids(history: Dict[str, str], window: int = RECENT_FAILURE_WINDOW) -> Set[str]:
+    """Node ids that failed in any of their last `window` recorded runs (flaky tracker history)"""
+    return {nodeid for nodeid, outcomes in history.items() if "F" in outcomes[-window:]}
+
+
+def apply_impact_selection(config, items: list, history: Dict[str, str] = None):
+    """
+    Apply --impacted-since (and --impact-margin) to the collected items in place
+
+    Args:
+        config: pytest config
+        items: Collected pytest items (modified in place)
+        history: Per-test outcome history used for the recently-failed safety margin
+    """
+    base_ref = config.getoption("--impacted-since")
+    if not base_ref:
+        return
+
+    root = str(config.rootpath)
+    try:
+        changed = git_changed_files(base_ref, root)
+    except RuntimeError as e:
+        raise pytest.UsageError(f"--impacted-since: {e}")
+    impacted = impacted_test_files(changed, build_import_graph(root), root)
+    margin = recently_failed_nodeids(history or {}) if config.getoption("--impact-margin") else set()
+
+    selected = []
+    deselected = []
+    for item in items:
+        if item.nodeid.split("::")[0] in impacted or item.nodeid in margin:
+            selected.append(item)
+        else:
+            deselected.append(item)
+    if deselected:
+        config.hook.pytest_deselected(items=deselected)
+    items[:] = selected
+
+    margin_count = sum(1 for item in selected if item.nodeid in margin and item.nodeid.split("::")[0] not in impacted)
+    print(f"\n🎯 Impact selection since {base_ref}: {len(changed)} changed files -> "
+          f"{len(impacted)} test modules, {len(selected)} tests selected"
+          + (f" ({margin_count} recently failed)" if margin_count else ""))
@@ -0,0 +1,369 @@
+"""
+Inline Edit Engine
+Edits the company details fields (Summary and the info tabs) from a declarative field table: reveal the
+field's edit icon by hovering and waiting for it, open the edit modal, run the field's validation probes,
+enter the value (textbox, dropdown or rich text editor), save, and read every edited value back with a
+single DOM query. Records per-field timings.
+"""
+
+import time
+from dataclasses import dataclass, field
+from typing import Dict, List, Optional, Tuple
+from playwright.sync_api import Page, Locator, expect
+from utils.dropdown_driver import DropdownDriver
+from utils.enhanced_assertions import enhanced_assert_visible
+from utils.form_fill import TEXT, SELECT
+from utils.strategy_resolver import resolve_locator
+from utils.toast_recorder import expect_toast as expect_toast_message, mark_toasts
+
+RICH_TEXT = "rich_text"
+
+REVEAL_TIMEOUT = 5000   # Max wait for the edit icon after hovering a field
+MODAL_TIMEOUT = 10000   # Max wait for the edit modal (its Save button / input) to open or close
+SAVE_TIMEOUT = 10000    # Max wait for the save to be confirmed
+VERIFY_TIMEOUT = 10000  # Max wait for the page to show all edited values
+
+# A field on the details page: "<label>:<value>" plus a hover-only edit icon
+FIELD_CONTAINER_SELECTOR = "div.group_single_item.group"
+RICH_TEXT_CONTAINER_SELECTOR = "div.grid.gap-2.group"
+EDIT_ICON_SELECTOR = ".group_single_edit_icon"
+
+# Telephone modal rows
+TELEPHONE_DIVISION_SELECTOR = 'input[id*="telephones"][id*="division"]'
+TELEPHONE_NUMBER_SELECTOR = 'input[id*="telephones"][id*="telephone"]'
+
+# Reads all visible field containers at once: {label: value}; the first visible container of a label wins
+READ_FIELDS_SCRIPT = f"""
+() => {{
+    const values = {{}};
+    document.querySelectorAll('{FIELD_CONTAINER_SELECTOR}, {RICH_TEXT_CONTAINER_SELECTOR}').forEach((el) => {{
+        if (el.offsetParent === null) return;
+        const text = (el.textContent || '').replace(/\\s+/g, ' ').trim();
+        const colon = text.indexOf(':');
+        if (colon < 0) return;
+        const label = text.slice(0, colon).trim();
+        if (!(label in values)) values[label] = text.slice(colon + 1).trim();
+    }});
+    return values;
+}}
+"""
+
+# True once every expected [label, value, contains] is shown (a label also matches longer labels it starts)
+VERIFY_FIELDS_SCRIPT = """
+(expected) => {
+    const read = (""" + READ_FIELDS_SCRIPT + """)();
+    const norm = (s) => (s || '').replace(/\\s+/g, ' ').trim();
+    return expected.every(([label, value, contains]) => {
+        const shown = label in read ? read[label] : read[Object.keys(read).find((key) => key.startsWith(label))];
+        return shown !== undefined && (contains ? shown.includes(norm(value)) : shown === norm(value));
+    });
+}
+"""
+
+
+@dataclass
+class ValidationProbe:
+    """
+    Invalid input that must be rejected before the real value is saved
+
+    Attributes:
+        value: Invalid value; "{value}" is replaced with the value being saved
+        message: Validation message expected after clicking Save
+        cleared_message: Message expected once the input is cleared (e.g. "... is required.")
+    """
+    value: str
+    message: str
+    cleared_message: Optional[str] = None
+
+
+@dataclass
+class InlineField:
+    """
+    One editable field of the company details page
+
+    Attributes:
+        key: Data key (matches the company test data dictionaries)
+        label: Label shown on the page ("<label>:<value>")
+        kind: TEXT, SELECT or RICH_TEXT
+        inputs: Accessible names of the modal's textbox, tried in order (default: the label)
+        input_css: Last-resort CSS selector of the modal input
+        container: Selector of the field's container
+        probes: Validation probes run before the value is entered
+        contains: Read-back passes when the shown value contains the expected one (long texts)
+        expect_toast: Assert the "Company info updated" toast (False where the app does not reliably show it)
+    """
+    key: str
+    label: str
+    kind: str = TEXT
+    inputs: Tuple[str, ...] = ()
+    input_css: Optional[str] = None
+    container: str = FIELD_CONTAINER_SELECTOR
+    probes: List[ValidationProbe] = field(default_factory=list)
+    contains: bool = False
+    expect_toast: bool = True
+
+
+class InlineEditDriver:
+    """
+    Edits company detail fields through their inline edit modals
+    """
+
+    def __init__(self, page: Page, company_page, fields: List[InlineField] = None):
+        """
+        Initialize driver
+
+        Args:
+            page: Playwright page object (on the company details page)
+            company_page: CompanyPage instance
+            fields: Field table (default: form_schemas.COMPANY_DETAIL_FIELDS)
+        """
+        if fields is None:
+            from utils.form_schemas import COMPANY_DETAIL_FIELDS
+            fields = COMPANY_DETAIL_FIELDS
+        self.page = page
+        self.company_page = company_page
+        self.fields: Dict[str, InlineField] = {f.key: f for f in fields}
+        self.save_button = page.get_by_role("button", name="Save")
+        self.timings: List[Dict] = []
+
+    # ===== FIELD STEPS =====
+
+    def _container(self, label: str, current: Optional[str] = None,
+                   selector: str = FIELD_CONTAINER_SELECTOR) -> Locator:
+        """Container of a field, optionally pinned to its current value"""
+        text = f"{label}:{current}" if current is not None else label
+        return self.page.locator(selector).filter(has_text=text).first
+
+    def open(self, label: str, current: Optional[str] = None, selector: str = FIELD_CONTAINER_SELECTOR):
+        """Hover the field until its edit icon shows, click it and wait for the edit modal"""
+        container = self._container(label, current, selector)
+        expect(container).to_be_visible()
+        container.hover()
+        edit_icon = container.locator(EDIT_ICON_SELECTOR)
+        expect(edit_icon).to_be_visible(timeout=REVEAL_TIMEOUT)
+        edit_icon.click()
+        self.save_button.wait_for(state="visible", timeout=MODAL_TIMEOUT)
+
+    def _input(self, f: InlineField) -> Locator:
+        """Input of the open modal"""
+        if f.kind == RICH_TEXT:
+            return self.page.locator("[contenteditable='true']").or_(self.page.get_by_role("textbox")).first
+        names = f.inputs or (f.label,)
+        candidates = [(f"textbox:{name}", self.page.get_by_role("textbox", name=name)) for name in names]
+        if f.input_css:
+            candidates.append(("css", self.page.locator(f.input_css).first))
+        if len(candidates) == 1:
+            return candidates[0][1]
+        return resolve_locator(self.page, f"company.inline_edit.{f.key}", candidates)
+
+    def _enter(self, f: InlineField, value: str):
+        """Enter the value into the open modal"""
+        if f.kind == SELECT:
+            trigger = self.page.locator(".select-trigger").first
+            DropdownDriver(self.page).select(trigger, value, name=f"company.inline_edit.{f.key}")
+            return
+        box = self._input(f)
+        box.wait_for(state="visible", timeout=MODAL_TIMEOUT)
+        box.fill(value)
+
+    def _probe(self, f: InlineField, probe: ValidationProbe, value: str):
+        """Save an invalid value and assert the validation messages"""
+        box = self._input(f)
+        box.wait_for(state="visible", timeout=MODAL_TIMEOUT)
+        box.fill(probe.value.format(value=value))
+        self.save_button.click()
+        enhanced_assert_visible(self.page, self.page.get_by_text(probe.message),
+                                f"Validation error should appear: {probe.message}", f"validation_{f.key}")
+        print(f"✅ Validation error correctly appeared: {probe.message}")
+        if probe.cleared_message:
+            box.fill("")
+            expect(self.page.get_by_text(probe.cleared_message)).to_be_visible()
+
+    def save(self, name: str, expect_toast: bool = True, tolerate_failure: bool = False) -> bool:
+        """
+        Click Save and wait until the modal closes
+
+        Args:
+            name: Name used for screenshots and messages
+            expect_toast: Assert the "Company info updated" toast
+            tolerate_failure: Close the modal and return False instead of raising when the save is not confirmed
+
+        Returns:
+            bool: True when the save was confirmed
+        """
+        since = mark_toasts(self.page)
+        self.save_button.click()
+        try:
+            if expect_toast:
+                # Only a toast of this save counts, not the one left over from the previous field
+                expect_toast_message(self.page, "Company info updated successfully",
+                                     "Company info updated message should appear",
+                                     f"edit_{name}", since=since, timeout=SAVE_TIMEOUT)
+            # A confirmed save closes the modal
+            self.save_button.wait_for(state="hidden", timeout=MODAL_TIMEOUT)
+            return True
+        except Exception:
+            if not tolerate_failure:
+                raise
+            print(f"⚠️ Save of {name} was not confirmed - closing the modal and continuing")
+            self.close_modal()
+            return False
+
+    def close_modal(self):
+        """Close the open edit modal without saving"""
+        close_button = self.page.get_by_role("button", name="Close")
+        if close_button.count() and close_button.first.is_visible():
+            close_button.first.click()
+        else:
+            self.page.keyboard.press("Escape")
+        try:
+            self.save_button.wait_for(state="hidden", timeout=MODAL_TIMEOUT)
+            self.page.locator("div.modal-backdrop").wait_for(state="hidden", timeout=MODAL_TIMEOUT)
+        except Exception as e:
+            print(f"⚠️ Edit modal did not close: {e}")
+
+    # ===== EDITING =====
+
+    def edit(self, key: str, value: str, current: Optional[str] = None, tolerate_failure: bool = False) -> bool:
+        """
+        Edit one field
+
+        Args:
+            key: Field key of the field table
+            value: New value (option text for dropdowns)
+            current: Value the field must show before editing (None: not checked)
+            tolerate_failure: Continue when the save is not confirmed (see save)
+
+        Returns:
+            bool: True when the save was confirmed
+        """
+        f = self.fields[key]
+        print(f"🔧 Editing {f.label}" + (f" from '{current}'" if current is not None else "") + f" to '{value}'")
+        start = time.time()
+        self.open(f.label, current, f.container)
+        revealed = time.time()
+        for probe in f.probes:
+            self._probe(f, probe, value)
+        probed = time.time()
+        self._enter(f, value)
+        entered = time.time()
+        saved = self.save(f.key, f.expect_toast, tolerate_failure)
+        end = time.time()
+        self.timings.append({
+            "field": key,
+            "reveal_ms": round((revealed - start) * 1000),
+            "probe_ms": round((probed - revealed) * 1000),
+            "enter_ms": round((entered - probed) * 1000),
+            "save_ms": round((end - entered) * 1000),
+            "total_ms": round((end - start) * 1000),
+            "saved": saved,
+        })
+        return saved
+
+    def edit_all(self, values: Dict[str, str], current: Dict[str, str] = None) -> List[str]:
+        """
+        Edit several fields in order
+
+        Args:
+            values: {field key: new value}
+            current: {field key: value shown before editing} (keys missing here are not checked)
+
+        Returns:
+            list: Keys whose save was confirmed
+        """
+        current = current or {}
+        return [key for key, value in values.items() if self.edit(key, value, current.get(key))]
+
+    def edit_telephones(self, label: str, current: str, index: int, division: str, telephone: str,
+                        extra: Tuple[str, str] = None):
+        """
+        Edit a telephone row (Main TEL / HR TEL) through the telephone modal
+
+        Renames the row's division and changes its number, optionally adds an extra row, verifies both,
+        then removes the extra row again.
+
+        Args:
+            label: Current field label (e.g. "Main TEL")
+            current: Current number
+            index: Row of the telephone modal (0: Main TEL, 1: HR TEL)
+            division: New division name (the field is then shown as "<division> TEL")
+            telephone: New number
+            extra: (division, telephone) of a row to add and remove again
+        """
+        print(f"🔧 Editing {label} '{current}' to {division} TEL '{telephone}'")
+        start = time.time()
+        self.open(label, current)
+        division_inputs = self.page.locator(TELEPHONE_DIVISION_SELECTOR)
+        telephone_inputs = self.page.locator(TELEPHONE_NUMBER_SELECTOR)
+        division_inputs.nth(index).fill(division)
+        telephone_inputs.nth(index).fill(telephone)
+        if extra:
+            rows = division_inputs.count()
+            self.page.get_by_role("button", name="Add New").click()
+            expect(division_inputs).to_have_count(rows + 1, timeout=MODAL_TIMEOUT)
+            division_inputs.last.fill(extra[0])
+            telephone_inputs.last.fill(extra[1])
+        self.save(f"{label.lower().replace(' ', '_')}")
+        expected = {f"{division} TEL": telephone}
+        if extra:
+            expected[f"{extra[0]} TEL"] = extra[1]
+        self.verify(expected)
+
+        if extra:
+            print(f"🗑️ Removing the added {extra[0]} TEL row")
+            self.open(f"{division} TEL", telephone)
+            self.page.get_by_role("button", name="Remove").last.click()
+            self.save(f"{label.lower().replace(' ', '_')}_remove", expect_toast=False)
+            extra_container = self.page.locator(FIELD_CONTAINER_SELECTOR).filter(has_text=f"{extra[0]} TEL:{extra[1]}")
+            expect(extra_container).to_have_count(0, timeout=VERIFY_TIMEOUT)
+            self.verify({f"{division} TEL": telephone})
+        self.timings.append({"field": label, "total_ms": round((time.time() - start) * 1000), "saved": True})
+
+    # ===== READ-BACK =====
+
+    def read_values(self) -> Dict[str, str]:
+        """All visible field values in one DOM query: {label: value}"""
+        return self.page.evaluate(READ_FIELDS_SCRIPT)
+
+    def _expected(self, expected: Dict[str, str]) -> List[list]:
+        """[label, value, contains] triples; keys of the field table are mapped to their labels"""
+        rows = []
+        for key, value in expected.items():
+            f = self.fields.get(key)
+            rows.append([f.label if f else key, " ".join(str(value).split()), bool(f and f.contains)])
+        return rows
+
+    def verify(self, expected: Dict[str, str], timeout: int = VERIFY_TIMEOUT):
+        """
+        Assert that the page shows all expected values (checked together until they match or time out)
+
+        Args:
+            expected: {field key or label: value}
+
+        Raises:
+            AssertionError: Lists every field that does not show its expected value
+        """
+        rows = self._expected(expected)
+        try:
+            self.page.wait_for_function(VERIFY_FIELDS_SCRIPT, arg=rows, timeout=timeout)
+        except Exception:
+            read = self.read_values()
+            mismatches = []
+            for label, value, contains in rows:
+                shown = read.get(label, next((v for k, v in read.items() if k.startswith(label)), None))
+                if shown is None or (value not in shown if contains else shown != value):
+                    mismatches.append(f"{label}: expected '{value}', shown '{shown}'")
+            if mismatches:
+                raise AssertionError("Fields not updated: " + "; ".join(mismatches))
+        print(f"✅ Verified {len(rows)} field values")
+
+    def format_timings(self) -> str:
+        """Human-readable per-field timings"""
+        lines = ["⏱️ Inline edit timings",
+                 f"   {'field':<22}{'reveal':>8}{'probe':>8}{'enter':>8}{'save':>8}{'total':>8}"]
+        fmt = lambda value: f"{value}" if value is not None else "-"
+        for t in self.timings:
+            lines.append(f"   {t['field']:<22}{fmt(t.get('reveal_ms')):>8}{fmt(t.get('probe_ms')):>8}"
+                         f"{fmt(t.get('enter_ms')):>8}{fmt(t.get('save_ms')):>8}{t['total_ms']:>8}"
+                         + ("" if t["saved"] else "  (not saved)"))
+        return "\n".join(lines)
@@ -6,6 +6,7 @@ Contains utility functions for JD management tests including creation, editing,
 from playwright.sync_api import Page
 from utils.config import BASE_URL
 from utils.login_helper import do_login
+from utils.tenant_pool import current_tenant
 from conftest import wait_for_action_completion
 from utils.enhanced_assertions import (
     enhanced_assert_visible,
@@ -14,15 +15,15 @@ from utils.enhanced_assertions import (
 import time
 
 
-def do_jd_login(page: Page, email: str, password: str, agency_id: str = "174"):
+def do_jd_login(page: Page, email: str = None, password: str = None, agency_id: str = None):
     """
     Helper function to login and navigate to JD page for specified agency
 
     Args:
         page: Playwright page object
-        email: User email
-        password: User password
-        agency_id: Agency ID to navigate to (default: "174" for demo 06)
+        email: User email (default: the tenant's admin account)
+        password: User password (default: the tenant's admin password)
+        agency_id: Agency ID to navigate to (default: the tenant's JD agency)
 
     Returns:
         JDPage instance
@@ -30,12 +31,13 @@ def do_jd_login(page: Page, email: str, password: str, agency_id: str = "174"):
     from pages.jd_page import JDPage
 
     # Step 1: Login
-    do_login(page, email, password)
+    account = current_tenant().account("admin")
+    do_login(page, email or account["email"], password or account["password"])
     time.sleep(3)
 
     # Step 2: Initialize JD page and navigate directly to JD management
     jd_page = JDPage(page)
-    jd_page.navigate_to_jd_page(agency_id)
+    jd_page.navigate_to_jd_page(agency_id or current_tenant().agency("jd")["agency_id"])
     time.sleep(2)
 
     return jd_page
@@ -45,8 +47,8 @@ def do_create_jd(
     page: Page,
     jd_data: dict,
     agency_id: str,
-    email: str = "mi003b@onemail.host",
-    password: str = "Kabir123#",
+    email: str = None,
+    password: str = None,
 ):
     """
     Complete JD creation workflow with validation
@@ -55,8 +57,8 @@ def do_create_jd(
         page: Playwright page object
         jd_data: Dictionary containing JD data
         agency_id: Agency ID to create JD for
-        email: Login email
-        password: Login password
+        email: Login email (default: the tenant's admin account)
+        password: Login password (default: the tenant's admin password)
 
     Returns:
         tuple: (JDPage instance, success boolean)
@@ -967,8 +969,8 @@ def do_delete_jd(
     page: Page,
     jd_title: str,
     agency_id: str,
-    email: str = "mi003b@onemail.host",
-    password: str = "Kabir123#",
+    email: str = None,
+    password: str = None,
     from_detail_view: bool = False,
     confirm_deletion: bool = True
 ):
@@ -979,8 +981,8 @@ def do_delete_jd(
         page: Playwright page object
         jd_title: Title of JD to delete
         agency_id: Agency ID where JD exists
-        email: Login email
-        password: Login password
+        email: Login email (default: the tenant's admin account)
+        password: Login password (default: the tenant's admin password)
         from_detail_view: Whether to delete from detail view (True) or list view (False)
         confirm_deletion: Whether to confirm deletion (True) or cancel (False)
     
@@ -1011,8 +1013,8 @@ def do_bulk_delete_jds(
     page: Page,
     jd_titles: list,
     agency_id: str,
-    email: str = "mi003b@onemail.host",
-    password: str = "Kabir123#",
+    email: str = None,
+    password: str = None,
     confirm_deletion: bool = True,
     use_select_all: bool = False
 ):
@@ -1023,8 +1025,8 @@ def do_bulk_delete_jds(
         page: Playwright page object
         jd_titles: List of JD titles to delete
         agency_id: Agency ID where JDs exist
-        email: Login email
-        password: Login password
+        email: Login email (default: the tenant's admin account)
+        password: Login password (default: the tenant's admin password)
         confirm_deletion: Whether to confirm deletion (True) or cancel (False)
         use_select_all: Whether to use select all checkbox instead of individual selection
     
@@ -1062,8 +1064,8 @@ def do_test_jd_deletion_with_associated_data(
     page: Page,
     jd_title: str,
     agency_id: str,
-    email: str = "mi003b@onemail.host",
-    password: str = "Kabir123#",
+    email: str = None,
+    password: str = None,
     force_delete: bool = True
 ):
     """
@@ -1073,8 +1075,8 @@ def do_test_jd_deletion_with_associated_data(
         page: Playwright page object
         jd_title: Title of JD with associated data
         agency_id: Agency ID where JD exists
-        email: Login email
-        password: Login password
+        email: Login email (default: the tenant's admin account)
+        password: Login password (default: the tenant's admin password)
         force_delete: Whether to force delete despite associated data
     
     Returns:
@@ -1113,8 +1115,8 @@ def do_test_jd_deletion_error_scenarios(
     jd_title: str,
     agency_id: str,
     error_type: str,
-    email: str = "mi003b@onemail.host",
-    password: str = "Kabir123#"
+    email: str = None,
+    password: str = None
 ):
     """
     Test JD deletion error scenarios
@@ -1124,8 +1126,8 @@ def do_test_jd_deletion_error_scenarios(
         jd_title: Title of JD to test deletion for
         agency_id: Agency ID where JD exists
         error_type: Type of error to test ('network', 'permission', 'associated_data', 'general')
-        email: Login email
-        password: Login password
+        email: Login email (default: the tenant's admin account)
+        password: Login password (default: the tenant's admin password)
     
     Returns:
         tuple: (JDPage instance, success boolean)
@@ -1151,8 +1153,8 @@ def do_test_bulk_deletion_partial_failures(
     jd_titles: list,
     expected_failures: list,
     agency_id: str,
-    email: str = "mi003b@onemail.host",
-    password: str = "Kabir123#"
+    email: str = None,
+    password: str = None
 ):
     """
     Test bulk deletion with expected partial failures
@@ -1162,8 +1164,8 @@ def do_test_bulk_deletion_partial_failures(
         jd_titles: List of JD titles to attempt deletion
         expected_failures: List of JD titles expected to fail deletion
         agency_id: Agency ID where JDs exist
-        email: Login email
-        password: Login password
+        email: Login email (default: the tenant's admin account)
+        password: Login password (default: the tenant's admin password)
     
     Returns:
         tuple: (JDPage instance, results dict)
@@ -1333,8 +1335,8 @@ def do_edit_jd(
     jd_title: str,
     updated_data: dict,
     agency_id: str,
-    email: str = "mi003b@onemail.host",
-    password: str = "Kabir123#",
+    email: str = None,
+    password: str = None,
 ):
     """
     Complete JD edit workflow with validation
@@ -1344,8 +1346,8 @@ def do_edit_jd(
         jd_title: Title of JD to edit
         updated_data: Dictionary containing updated JD data
         agency_id: Agency ID where JD exists
-        email: Login email
-        password: Login password
+        email: Login email (default: the tenant's admin account)
+        password: Login password (default: the tenant's admin password)
 
     Returns:
         tuple: (JDPage instance, success boolean)
@@ -1767,8 +1769,8 @@ def do_bulk_jd_file_upload(
     page: Page,
     file_path: str,
     agency_id: str,
-    email: str = "mi003b@onemail.host",
-    password: str = "Kabir123#",
+    email: str = None,
+    password: str = None,
     expected_jd_count: int = None
 ):
     """
@@ -1778,8 +1780,8 @@ def do_bulk_jd_file_upload(
         page: Playwright page object
         file_path: Path to file to upload
         agency_id: Agency ID to upload JDs for
-        email: Login email
-        password: Login password
+        email: Login email (default: the tenant's admin account)
+        password: Login password (default: the tenant's admin password)
         expected_jd_count: Expected number of JDs to be imported (optional)
     
     Returns:
@@ -1815,8 +1817,8 @@ def do_test_file_format_validation(
     page: Page,
     test_files: dict,
     agency_id: str,
-    email: str = "mi003b@onemail.host",
-    password: str = "Kabir123#"
+    email: str = None,
+    password: str = None
 ):
     """
     Test file format validation with valid and invalid files
@@ -1829,8 +1831,8 @@ def do_test_file_format_validation(
                        'invalid': ['test.txt', 'test.jpg']
                    }
         agency_id: Agency ID
-        email: Login email
-        password: Login password
+        email: Login email (default: the tenant's admin account)
+        password: Login password (default: the tenant's admin password)
     
     Returns:
         tuple: (JDPage instance, validation results dict)
@@ -1876,8 +1878,8 @@ def do_test_file_size_validation(
     page: Page,
     oversized_file_path: str,
     agency_id: str,
-    email: str = "mi003b@onemail.host",
-    password: str = "Kabir123#"
+    email: str = None,
+    password: str = None
 ):
     """
     Test file size validation with oversized file
@@ -1886,8 +1888,8 @@ def do_test_file_size_validation(
         page: Playwright page object
         oversized_file_path: Path to file exceeding size limit
         agency_id: Agency ID
-        email: Login email
-        password: Login password
+        email: Login email (default: the tenant's admin account)
+        password: Login password (default: the tenant's admin password)
     
     Returns:
         tuple: (JDPage instance, validation success boolean)
@@ -1916,8 +1918,8 @@ def do_test_file_processing_error_handling(
     page: Page,
     invalid_data_file_path: str,
     agency_id: str,
-    email: str = "mi003b@onemail.host",
-    password: str = "Kabir123#"
+    email: str = None,
+    password: str = None
 ):
     """
     Test file processing error handling with invalid data
@@ -1926,8 +1928,8 @@ def do_test_file_processing_error_handling(
         page: Playwright page object
         invalid_data_file_path: Path to file with invalid data
         agency_id: Agency ID
-        email: Login email
-        password: Login password
+        email: Login email (default: the tenant's admin account)
+        password: Login password (default: the tenant's admin password)
     
     Returns:
         tuple: (JDPage instance, error handling results dict)
@@ -1963,8 +1965,8 @@ def do_test_network_timeout_handling(
     page: Page,
     large_file_path: str,
     agency_id: str,
-    email: str = "mi003b@onemail.host",
-    password: str = "Kabir123#"
+    email: str = None,
+    password: str = None
 ):
     """
     Test network timeout handling during file processing
@@ -1973,8 +1975,8 @@ def do_test_network_timeout_handling(
         page: Playwright page object
         large_file_path: Path to large file that may cause timeout
         agency_id: Agency ID
-        email: Login email
-        password: Login password
+        email: Login email (default: the tenant's admin account)
+        password: Login password (default: the tenant's admin password)
     
     Returns:
         tuple: (JDPage instance, timeout handling results dict)
@@ -2016,8 +2018,8 @@ def do_bulk_jd_selection(
     page: Page,
     jd_titles: list,
     agency_id: str,
-    email: str = "mi003b@onemail.host",
-    password: str = "Kabir123#"
+    email: str = None,
+    password: str = None
 ):
     """
     Select multiple JDs for bulk operations
@@ -2026,8 +2028,8 @@ def do_bulk_jd_selection(
         page: Playwright page object
         jd_titles: List of JD titles to select
         agency_id: Agency ID
-        email: Login email
-        password: Login password
+        email: Login email (default: the tenant's admin account)
+        password: Login password (default: the tenant's admin password)
     
     Returns:
         tuple: (JDPage instance, selected count)
@@ -2049,8 +2051,8 @@ def do_bulk_status_update(
     jd_titles: list,
     new_status: str,
     agency_id: str,
-    email: str = "mi003b@onemail.host",
-    password: str = "Kabir123#"
+    email: str = None,
+    password: str = None
 ):
     """
     Perform bulk status update on multiple JDs
@@ -2060,8 +2062,8 @@ def do_bulk_status_update(
         jd_titles: List of JD titles to update
         new_status: New status to apply
         agency_id: Agency ID
-        email: Login email
-        password: Login password
+        email: Login email (default: the tenant's admin account)
+        password: Login password (default: the tenant's admin password)
     
     Returns:
         tuple: (JDPage instance, success boolean)
@@ -2097,8 +2099,8 @@ def do_bulk_jd_deletion(
     page: Page,
     jd_titles: list,
     agency_id: str,
-    email: str = "mi003b@onemail.host",
-    password: str = "Kabir123#",
+    email: str = None,
+    password: str = None,
     confirm_deletion: bool = True
 ):
     """
@@ -2108,8 +2110,8 @@ def do_bulk_jd_deletion(
         page: Playwright page object
         jd_titles: List of JD titles to delete
         agency_id: Agency ID
-        email: Login email
-        password: Login password
+        email: Login email (default: the tenant's admin account)
+        password: Login password (default: the tenant's admin password)
         confirm_deletion: Whether to confirm the deletion
     
     Returns:
@@ -2168,8 +2170,8 @@ def do_test_bulk_operation_confirmation(
     operation_type: str,
     jd_titles: list,
     agency_id: str,
-    email: str = "mi003b@onemail.host",
-    password: str = "Kabir123#"
+    email: str = None,
+    password: str = None
 ):
     """
     Test bulk operation confirmation dialogs
@@ -2179,8 +2181,8 @@ def do_test_bulk_operation_confirmation(
         operation_type: Type of bulk operation ('delete', 'status_update')
         jd_titles: List of JD titles to select
         agency_id: Agency ID
-        email: Login email
-        password: Login password
+        email: Login email (default: the tenant's admin account)
+        password: Login password (default: the tenant's admin password)
     
     Returns:
         tuple: (JDPage instance, confirmation test results dict)
@@ -2228,8 +2230,8 @@ def do_test_mixed_bulk_operation_results(
     operation_type: str,
     mixed_jd_titles: list,
     agency_id: str,
-    email: str = "mi003b@onemail.host",
-    password: str = "Kabir123#"
+    email: str = None,
+    password: str = None
 ):
     """
     Test bulk operations with mixed success/failure scenarios
@@ -2239,8 +2241,8 @@ def do_test_mixed_bulk_operation_results(
         operation_type: Type of bulk operation
         mixed_jd_titles: List of JD titles (some may fail)
         agency_id: Agency ID
-        email: Login email
-        password: Login password
+        email: Login email (default: the tenant's admin account)
+        password: Login password (default: the tenant's admin password)
     
     Returns:
         tuple: (JDPage instance, mixed results dict)
@@ -2288,8 +2290,8 @@ def do_test_mixed_bulk_operation_results(
 def do_select_all_jds_test(
     page: Page,
     agency_id: str,
-    email: str = "mi003b@onemail.host",
-    password: str = "Kabir123#"
+    email: str = None,
+    password: str = None
 ):
     """
     Test select all JDs functionality
@@ -2297,8 +2299,8 @@ def do_select_all_jds_test(
     Args:
         page: Playwright page object
         agency_id: Agency ID
-        email: Login email
-        password: Login password
+        email: Login email (default: the tenant's admin account)
+        password: Login password (default: the tenant's admin password)
     
     Returns:
         tuple: (JDPage instance, select all results dict)
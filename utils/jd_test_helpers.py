@@ -32,12 +32,12 @@ class JDHelpers:
     """
     
     @staticmethod
-    def login(page: Page, email: str, password: str, agency_id: str):
+    def login(page: Page, email: str = None, password: str = None, agency_id: str = None):
         """Login and navigate to JD page"""
         return do_jd_login(page, email, password, agency_id)
     
     @staticmethod
-    def create_jd(page: Page, jd_data: dict, agency_id: str, email: str = "mi003b@onemail.host", password: str = "Kabir123#"):
+    def create_jd(page: Page, jd_data: dict, agency_id: str, email: str = None, password: str = None):
         """Create JD with provided data"""
         return do_create_jd(page, jd_data, agency_id, email, password)
     
@@ -52,7 +52,7 @@ class JDHelpers:
         return do_apply_jd_filters(page, filters)
     
     @staticmethod
-    def delete_jd(page: Page, jd_title: str, agency_id: str, email: str = "mi003b@onemail.host", password: str = "Kabir123#", from_detail_view: bool = False, confirm_deletion: bool = True):
+    def delete_jd(page: Page, jd_title: str, agency_id: str, email: str = None, password: str = None, from_detail_view: bool = False, confirm_deletion: bool = True):
         """Delete JD with confirmation"""
         return do_delete_jd(page, jd_title, agency_id, email, password, from_detail_view, confirm_deletion)
     
@@ -85,23 +85,23 @@ class JDHelpers:
     
     # File upload helpers
     @staticmethod
-    def bulk_file_upload(page: Page, file_path: str, agency_id: str, email: str = "mi003b@onemail.host", password: str = "Kabir123#"):
+    def bulk_file_upload(page: Page, file_path: str, agency_id: str, email: str = None, password: str = None):
         """Upload bulk JD file"""
         return do_bulk_jd_file_upload(page, file_path, agency_id, email, password)
     
     # Bulk operation helpers
     @staticmethod
-    def bulk_selection(page: Page, jd_titles: list, agency_id: str, email: str = "mi003b@onemail.host", password: str = "Kabir123#"):
+    def bulk_selection(page: Page, jd_titles: list, agency_id: str, email: str = None, password: str = None):
         """Select multiple JDs for bulk operations"""
         return do_bulk_jd_selection(page, jd_titles, agency_id, email, password)
     
     @staticmethod
-    def bulk_deletion(page: Page, jd_titles: list, agency_id: str, email: str = "mi003b@onemail.host", password: str = "Kabir123#"):
+    def bulk_deletion(page: Page, jd_titles: list, agency_id: str, email: str = None, password: str = None):
         """Delete multiple JDs in bulk"""
         return do_bulk_jd_deletion(page, jd_titles, agency_id, email, password)
     
     @staticmethod
-    def bulk_status_update(page: Page, jd_titles: list, new_status: str, agency_id: str, email: str = "mi003b@onemail.host", password: str = "Kabir123#"):
+    def bulk_status_update(page: Page, jd_titles: list, new_status: str, agency_id: str, email: str = None, password: str = None):
         """Update status of multiple JDs"""
         return do_bulk_status_update(page, jd_titles, new_status, agency_id, email, password)
     
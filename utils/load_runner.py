@@ -0,0 +1,310 @@
+"""
+Load Runner
+Replays existing flows as concurrent virtual users: every user gets its own browser context and drives the
+generated async page objects (async_pages/) on one event loop. Reports throughput and p50/p95/p99 per step.
+
+    python -m utils.load_runner jd_search --users 50 --duration 300
+    python -m utils.load_runner client_search --users 10 --iterations 20 --base-url http://localhost:3000
+"""
+
+import argparse
+import asyncio
+import itertools
+import json
+import os
+import time
+from contextlib import asynccontextmanager
+from dataclasses import dataclass, field
+from typing import Awaitable, Callable, Dict, List, Optional
+from utils import config
+from utils.config import LOAD_DEFAULT_USERS, LOAD_DEFAULT_ITERATIONS, LOAD_RAMP_UP, LOAD_MAX_PAGES
+from utils.metrics_export import get_metrics_path, summarize
+from utils.tenant_pool import current_tenant
+
+LOAD_REPORT_FILE = "load_{flow}.json"
+
+# Tenant account role and agency area each flow logs in with unless --accounts is given
+FLOW_ACCOUNTS = {
+    "jd": ("admin", "jd"),
+    "client": ("admin", "client"),
+    "company": ("company", None),
+}
+
+SEARCH_TERMS = ["Engineer", "Developer", "Manager", "QA", "Designer", "Analyst"]
+CLIENT_SEARCH_TERMS = ["Test", "Client", "Demo", "Corp"]
+COMPANY_SEARCH_TERMS = ["Test", "Company", "Tech", "Ltd"]
+
+
+def default_accounts(kind: str) -> List[Dict]:
+    """Login account of a flow kind from this process's tenant (virtual users share it round-robin)"""
+    role, area = FLOW_ACCOUNTS[kind]
+    tenant = current_tenant()
+    account = dict(tenant.account(role))
+    if area:
+        account["agency_id"] = tenant.agency(area)["agency_id"]
+    return [account]
+
+
+@dataclass
+class StepRecord:
+    """One timed step of one virtual user"""
+    step: str
+    user: int
+    started: float
+    duration_ms: float
+    ok: bool
+    error: str = None
+
+
+@dataclass
+class VirtualUser:
+    """State of one virtual user - the page, its account and whatever the flow's setup stored"""
+    index: int
+    page: object
+    account: Dict
+    records: List[StepRecord]
+    iteration: int = 0
+    state: Dict = field(default_factory=dict)
+
+    @asynccontextmanager
+    async def step(self, name: str):
+        """Time a step; a failing step is recorded and re-raised (the iteration is abandoned)"""
+        start = time.time()
+        try:
+            yield
+        except Exception as e:
+            self.records.append(StepRecord(name, self.index, start, (time.time() - start) * 1000, False, str(e)[:200]))
+            raise
+        self.records.append(StepRecord(name, self.index, start, (time.time() - start) * 1000, True))
+
+    def term(self, terms: List[str]) -> str:
+        """Search term for the current iteration (users start at different offsets)"""
+        return terms[(self.index + self.iteration) % len(terms)]
+
+
+@dataclass
+class LoadFlow:
+    """A flow: setup runs once per virtual user (login, navigation), iteration is repeated"""
+    name: str
+    accounts: str
+    setup: Callable[[VirtualUser], Awaitable]
+    iteration: Callable[[VirtualUser], Awaitable]
+    description: str = ""
+
+
+# ===== FLOWS =====
+
+async def _jd_setup(vu: VirtualUser):
+    from async_pages.utils.jd_helper import do_jd_login
+    async with vu.step("login"):
+        vu.state["jd_page"] = await do_jd_login(vu.page, vu.account["email"], vu.account["password"],
+                                                vu.account.get("agency_id"))
+
+
+async def _jd_search(vu: VirtualUser):
+    async with vu.step("jd_search"):
+        await vu.state["jd_page"].perform_search(vu.term(SEARCH_TERMS))
+
+
+async def _jd_pagination(vu: VirtualUser):
+    jd_page = vu.state["jd_page"]
+    async with vu.step("jd_list"):
+        await jd_page.navigate_to_jd_page(vu.account.get("agency_id") or current_tenant().agency("jd")["agency_id"])
+    for _ in range(LOAD_MAX_PAGES - 1):
+        async with vu.step("jd_next_page"):
+            moved = await jd_page.navigate_to_next_page()
+        if not moved:
+            break
+
+
+async def _client_setup(vu: VirtualUser):
+    from async_pages.utils.client_helper import do_client_login_and_navigate
+    async with vu.step("login"):
+        vu.state["client_page"] = await do_client_login_and_navigate(
+            vu.page, vu.account["email"], vu.account["password"], vu.account.get("agency_id"))
+
+
+async def _client_search(vu: VirtualUser):
+    async with vu.step("client_search"):
+        await vu.state["client_page"].search_for_client(vu.term(CLIENT_SEARCH_TERMS))
+
+
+async def _company_setup(vu: VirtualUser):
+    from async_pages.utils.company_helper import navigate_to_company_list
+    async with vu.step("login"):
+        vu.state["company_page"] = await navigate_to_company_list(vu.page, vu.account["email"], vu.account["password"])
+
+
+async def _company_search(vu: VirtualUser):
+    async with vu.step("company_search"):
+        await vu.state["company_page"].search_company(vu.term(COMPANY_SEARCH_TERMS))
+
+
+LOAD_FLOWS = {
+    flow.name: flow for flow in [
+        LoadFlow("jd_search", "jd", _jd_setup, _jd_search, "do_jd_login, then JDPage.perform_search"),
+        LoadFlow("jd_pagination", "jd", _jd_setup, _jd_pagination, "Walk the JD list pages"),
+        LoadFlow("client_search", "client", _client_setup, _client_search, "ClientPage.search_for_client"),
+        LoadFlow("company_search", "company", _company_setup, _company_search, "CompanyPage.search_company"),
+    ]
+}
+
+
+# ===== RUNNER =====
+
+class LoadRunner:
+    """
+    Runs a flow with N concurrent virtual users for a duration or an iteration count
+    """
+
+    def __init__(self, flow: LoadFlow, users: int = LOAD_DEFAULT_USERS, iterations: Optional[int] = None,
+                 duration: Optional[float] = None, ramp_up: float = LOAD_RAMP_UP, accounts: List[Dict] = None,
+                 headless: bool = True, browser_name: str = "chromium"):
+        """
+        Initialize runner
+
+        Args:
+            flow: Flow to replay
+            users: Number of concurrent virtual users
+            iterations: Iterations per user (default LOAD_DEFAULT_ITERATIONS when no duration is given)
+            duration: Seconds to keep iterating (users finish their current iteration)
+            ramp_up: Seconds over which the users are started
+            accounts: Login accounts, assigned round-robin (default: the flow's account of the current tenant)
+            headless: Run the browser headless
+            browser_name: chromium, firefox or webkit
+        """
+        self.flow = flow
+        self.users = users
+        self.duration = duration
+        self.iterations = iterations if iterations or duration else LOAD_DEFAULT_ITERATIONS
+        self.ramp_up = ramp_up
+        self.accounts = accounts or default_accounts(flow.accounts)
+        self.headless = headless
+        self.browser_name = browser_name
+        self.records: List[StepRecord] = []
+        self.failed_users = 0
+        self.started = None
+        self.finished = None
+
+    def _should_continue(self, vu: VirtualUser) -> bool:
+        if self.iterations and vu.iteration >= self.iterations:
+            return False
+        if self.duration and time.time() - self.started >= self.duration:
+            return False
+        return True
+
+    async def _run_user(self, browser, index: int, account: Dict):
+        await asyncio.sleep(self.ramp_up * index / max(self.users, 1))
+        context = await browser.new_context()
+        try:
+            vu = VirtualUser(index, await context.new_page(), account, self.records)
+            try:
+                await self.flow.setup(vu)
+            except Exception as e:
+                self.failed_users += 1
+                print(f"❌ Virtual user {index}: setup failed: {e}")
+                return
+            while self._should_continue(vu):
+                try:
+                    await self.flow.iteration(vu)
+                except Exception as e:
+                    print(f"⚠️ Virtual user {index}: iteration {vu.iteration + 1} failed: {e}")
+                vu.iteration += 1
+        finally:
+            await context.close()
+
+    async def run(self):
+        """Start the browser and all virtual users, wait until every user is done"""
+        from playwright.async_api import async_playwright
+
+        limit = f"{self.duration:.0f}s" if self.duration else f"{self.iterations} iterations"
+        print(f"🚦 Load run '{self.flow.name}': {self.users} users, {limit}, ramp-up {self.ramp_up:.0f}s")
+        accounts = itertools.cycle(self.accounts)
+        async with async_playwright() as p:
+            browser = await getattr(p, self.browser_name).launch(headless=self.headless)
+            self.started = time.time()
+            try:
+                await asyncio.gather(*(self._run_user(browser, i, next(accounts)) for i in range(self.users)))
+            finally:
+                self.finished = time.time()
+                await browser.close()
+        return self.results()
+
+    def results(self) -> Dict:
+        """
+        Throughput and latency per step
+
+        Returns:
+            dict: {"flow", "users", "elapsed_s", "failed_users", "steps": {step: {count, errors, throughput_per_s,
+                   latency_ms: {p50, p95, p99, ...}}}}
+        """
+        elapsed = (self.finished or time.time()) - (self.started or time.time())
+        steps = {}
+        for name in dict.fromkeys(record.step for record in self.records):
+            records = [record for record in self.records if record.step == name]
+            ok = [record.duration_ms for record in records if record.ok]
+            steps[name] = {
+                "count": len(records),
+                "errors": len(records) - len(ok),
+                "throughput_per_s": len(ok) / elapsed if elapsed > 0 else None,
+                "latency_ms": summarize(ok),
+            }
+        return {"flow": self.flow.name, "users": self.users, "elapsed_s": elapsed,
+                "failed_users": self.failed_users, "steps": steps}
+
+    def format_report(self) -> str:
+        """Human-readable report of the run"""
+        results = self.results()
+        lines = [f"🚦 Load run '{results['flow']}' - {results['users']} users, {results['elapsed_s']:.1f}s"
+                 + (f", {results['failed_users']} users failed setup" if results["failed_users"] else ""),
+                 f"   {'step':<16}{'count':>7}{'errors':>8}{'req/s':>8}{'p50 ms':>9}{'p95 ms':>9}{'p99 ms':>9}"]
+        for name, stats in results["steps"].items():
+            latency = stats["latency_ms"]
+            fmt = lambda value: f"{value:.0f}" if value is not None else "-"
+            throughput = f"{stats['throughput_per_s']:.2f}" if stats["throughput_per_s"] is not None else "-"
+            lines.append(f"   {name:<16}{stats['count']:>7}{stats['errors']:>8}{throughput:>8}"
+                         f"{fmt(latency['p50']):>9}{fmt(latency['p95']):>9}{fmt(latency['p99']):>9}")
+        return "\n".join(lines)
+
+    def export(self, export_dir: str = None) -> str:
+        """Write results and the raw step records to metrics/load_<flow>.json"""
+        path = get_metrics_path(LOAD_REPORT_FILE.format(flow=self.flow.name), export_dir)
+        results = self.results()
+        results["records"] = [record.__dict__ for record in self.records]
+        with open(path, "w", encoding="utf-8") as f:
+            json.dump(results, f, indent=2)
+        return path
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(description="Replay a flow with concurrent virtual users")
+    parser.add_argument("flow", choices=sorted(LOAD_FLOWS), help="Flow to replay")
+    parser.add_argument("--users", type=int, default=LOAD_DEFAULT_USERS, help="Concurrent virtual users")
+    parser.add_argument("--iterations", type=int, help="Iterations per user")
+    parser.add_argument("--duration", type=float, help="Seconds to run (instead of an iteration count)")
+    parser.add_argument("--ramp-up", type=float, default=LOAD_RAMP_UP, help="Seconds over which users start")
+    parser.add_argument("--base-url", help="Run against another server, e.g. a local stand-in")
+    parser.add_argument("--accounts", help="JSON file with a list of {email, password[, agency_id]}")
+    parser.add_argument("--browser", default="chromium", choices=["chromium", "firefox", "webkit"])
+    parser.add_argument("--headed", action="store_true", help="Show the browser windows")
+    args = parser.parse_args(argv)
+
+    if args.base_url:
+        # Page objects read BASE_URL when they are imported, and the flows import them lazily
+        config.BASE_URL = os.environ["BPRP_BASE_URL"] = args.base_url.rstrip("/")
+    accounts = None
+    if args.accounts:
+        with open(args.accounts, "r", encoding="utf-8") as f:
+            accounts = json.load(f)
+
+    runner = LoadRunner(LOAD_FLOWS[args.flow], users=args.users, iterations=args.iterations,
+                        duration=args.duration, ramp_up=args.ramp_up, accounts=accounts,
+                        headless=not args.headed, browser_name=args.browser)
+    asyncio.run(runner.run())
+    print(runner.format_report())
+    print(f"📊 Load report written to {runner.export()}")
+    return 1 if runner.failed_users == runner.users else 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,210 @@
+"""
+Locator Profiler
+Resolves every locator defined in locators/ on a representative page, measures resolution time and
+match counts, and reports slow, ambiguous (multi-match) and dead (no match) selectors
+"""
+
+import re
+import json
+import time
+import statistics
+from typing import Dict, List, Tuple
+from playwright.sync_api import Page, Locator
+from locators.loc_base import LocatorRegistry
+from utils.config import LOCATOR_PROFILE_ROUNDS, LOCATOR_SLOW_MS
+from utils.metrics_export import get_metrics_path
+
+PROFILE_JSON_FILE = "locator_profile.json"
+PROFILE_REPORT_FILE = "locator_profile.txt"
+
+BASELINE_SELECTOR = "html"  # Cheapest possible selector - its round trip is subtracted from every measurement
+
+_SELECTOR_PATTERN = re.compile(r"selector='(.*)'>$", re.DOTALL)
+
+# Selector constructs that make the engine scan the whole DOM or compare text of every candidate
+EXPENSIVE_PATTERNS = {
+    ":has-text(": "text match on every candidate (:has-text)",
+    ":has(": "subtree match on every candidate (:has)",
+    ":not(": "negated match (:not)",
+    "[class*=": "substring class match ([class*=])",
+    "text=": "text engine scan (text=)",
+    "xpath=//": "document-wide XPath (//)",
+}
+
+
+def _selector_of(locator: Locator) -> str:
+    """Selector string of a Locator (as shown by its repr)"""
+    match = _SELECTOR_PATTERN.search(repr(locator))
+    return match.group(1) if match else repr(locator)
+
+
+def _is_pinned(selector: str) -> bool:
+    """Whether the selector picks a single match itself (.first / .last / .nth())"""
+    last_part = selector.rsplit(" >> ", 1)[-1]
+    return last_part.startswith("nth=")
+
+
+def _expensive_hints(selector: str) -> List[str]:
+    """Expensive constructs used by a selector"""
+    hints = [hint for pattern, hint in EXPENSIVE_PATTERNS.items() if pattern in selector]
+    first_part = re.sub(r"\([^)]*\)|'[^']*'|\"[^\"]*\"", "", selector.split(" >> ", 1)[0])
+    if "," in first_part and not selector.startswith(("internal:", "text=", "xpath=")):
+        hints.append("selector list (a, b) - every alternative is evaluated")
+    return hints
+
+
+def collect_locators(locator_classes: List[type], page: Page) -> Dict[str, Locator]:
+    """
+    Instantiate locator classes on a page and collect their Locator attributes
+
+    Args:
+        locator_classes: Classes from locators/ (LocatorRegistry subclasses or classic __init__ classes)
+        page: Playwright page object
+
+    Returns:
+        dict: {"ClassName.attribute": Locator}; factories of parameterized locators are skipped
+    """
+    found = {}
+    for locator_class in locator_classes:
+        instance = locator_class(page)
+        if isinstance(instance, LocatorRegistry):
+            values = instance.resolve_all()
+        else:
+            values = vars(instance)
+        for name, value in values.items():
+            if isinstance(value, Locator):
+                found[f"{locator_class.__name__}.{name}"] = value
+    return found
+
+
+class LocatorProfiler:
+    """
+    Profiles locators on one or more pages and aggregates the results
+    """
+
+    def __init__(self, rounds: int = LOCATOR_PROFILE_ROUNDS, slow_ms: float = LOCATOR_SLOW_MS):
+        """
+        Initialize profiler
+
+        Args:
+            rounds: How often every selector is resolved per page (the median is used)
+            slow_ms: Resolution cost (above the baseline round trip) at which a selector is reported as slow
+        """
+        self.rounds = rounds
+        self.slow_ms = slow_ms
+        self.pages_profiled: List[str] = []
+        # {selector: {"names": set, "costs_ms": [per page], "counts": [per page]}}
+        self.selectors: Dict[str, Dict] = {}
+
+    def _time_count(self, locator: Locator) -> Tuple[float, int]:
+        """Median count() time in ms and the match count"""
+        durations = []
+        count = 0
+        for _ in range(self.rounds):
+            start = time.perf_counter()
+            count = locator.count()
+            durations.append((time.perf_counter() - start) * 1000)
+        return statistics.median(durations), count
+
+    def profile_page(self, page: Page, locator_classes: List[type], label: str = None) -> int:
+        """
+        Resolve every locator of the given classes on the current page
+
+        Args:
+            page: Playwright page positioned on a representative page
+            locator_classes: Locator classes to profile
+            label: Name of the page in the report (default: its URL)
+
+        Returns:
+            int: Number of distinct selectors profiled
+        """
+        label = label or page.url
+        baseline_ms, _ = self._time_count(page.locator(BASELINE_SELECTOR))
+        by_selector: Dict[str, List[str]] = {}
+        locators = collect_locators(locator_classes, page)
+        for name, locator in locators.items():
+            by_selector.setdefault(_selector_of(locator), []).append(name)
+
+        start = time.time()
+        for selector, names in by_selector.items():
+            locator = locators[names[0]]
+            try:
+                median_ms, count = self._time_count(locator)
+            except Exception as e:
+                print(f"⚠️ Could not resolve {names[0]} ({selector}): {e}")
+                continue
+            entry = self.selectors.setdefault(selector, {"names": set(), "costs_ms": [], "counts": []})
+            entry["names"].update(names)
+            entry["costs_ms"].append(max(0.0, median_ms - baseline_ms))
+            entry["counts"].append(count)
+
+        self.pages_profiled.append(label)
+        print(f"🔎 Profiled {len(by_selector)} selectors ({len(locators)} locators) on {label} "
+              f"in {time.time() - start:.1f}s (baseline round trip {baseline_ms:.1f}ms)")
+        return len(by_selector)
+
+    def results(self) -> List[Dict]:
+        """
+        Aggregated results ranked by resolution cost
+
+        Returns:
+            list: One dict per selector with names, cost, match counts, flags and expensive-pattern hints
+        """
+        rows = []
+        for selector, entry in self.selectors.items():
+            cost = max(entry["costs_ms"])
+            max_count = max(entry["counts"])
+            flags = []
+            if cost >= self.slow_ms:
+                flags.append("slow")
+            if max_count > 1 and not _is_pinned(selector):
+                flags.append("ambiguous")
+            # Dead only when none of the pages it was profiled on matched it
+            if max_count == 0:
+                flags.append("dead")
+            rows.append({
+                "selector": selector,
+                "names": sorted(entry["names"]),
+                "cost_ms": round(cost, 2),
+                "max_matches": max_count,
+                "flags": flags,
+                "hints": _expensive_hints(selector),
+            })
+        rows.sort(key=lambda row: row["cost_ms"], reverse=True)
+        return rows
+
+    def format_report(self, top: int = 20) -> str:
+        """Human-readable report: slowest selectors, then ambiguous and dead ones"""
+        rows = self.results()
+        lines = [f"Locator profile ({len(rows)} selectors on {len(self.pages_profiled)} pages, "
+                 f"{self.rounds} rounds, slow >= {self.slow_ms}ms)"]
+
+        lines.append("\nSlowest selectors:")
+        for row in rows[:top]:
+            hints = f"  [{'; '.join(row['hints'])}]" if row["hints"] else ""
+            lines.append(f"  {row['cost_ms']:>7.2f}ms  {row['max_matches']:>4}x  {row['names'][0]}: {row['selector']}{hints}")
+
+        for flag, title in (("ambiguous", "Ambiguous (multi-match, not pinned with .first/.nth)"),
+                            ("dead", "Dead (no match on any page it was profiled on)")):
+            flagged = [row for row in rows if flag in row["flags"]]
+            lines.append(f"\n{title}: {len(flagged)}")
+            for row in flagged:
+                lines.append(f"  {row['max_matches']:>4}x  {', '.join(row['names'])}: {row['selector']}")
+        return "\n".join(lines)
+
+    def export(self, export_dir: str = None) -> List[str]:
+        """
+        Write the JSON results and the text report to the metrics export directory
+
+        Returns:
+            list: Paths of the written files
+        """
+        json_path = get_metrics_path(PROFILE_JSON_FILE, export_dir)
+        with open(json_path, "w", encoding="utf-8") as f:
+            json.dump({"pages": self.pages_profiled, "rounds": self.rounds, "slow_ms": self.slow_ms,
+                       "selectors": self.results()}, f, indent=2)
+        report_path = get_metrics_path(PROFILE_REPORT_FILE, export_dir)
+        with open(report_path, "w", encoding="utf-8") as f:
+            f.write(self.format_report() + "\n")
+        print(f"📊 Locator profile exported: {json_path}, {report_path}")
+        return [json_path, report_path]
@@ -0,0 +1,291 @@
+"""
+Memory Watchdog
+Samples the resident memory of the browser's processes (browser, renderers, GPU, utilities) after every
+test, once its context is closed. Memory a test leaves behind is recorded per test, tests that retain more
+than MEMORY_LEAK_MB are flagged, and the browser is relaunched between tests when its total crosses
+MEMORY_RECYCLE_MB - so late tests of a long run do not slow down on a bloated renderer.
+Chromium reports its process ids over CDP; RSS comes from psutil when installed, else from /proc (Linux).
+Samples travel to the xdist controller in the test reports, which exports the run once for all workers.
+"""
+
+import os
+import time
+from datetime import datetime
+from typing import Callable, Dict, List, Optional
+from utils.browser_server import SharedBrowser
+from utils.config import MEMORY_RECYCLE_MB, MEMORY_LEAK_MB
+from utils.metrics_export import format_influx_line, append_influx_lines, write_prometheus_file
+
+try:
+    import psutil
+except ImportError:  # Optional - without it RSS is read from /proc for the process ids Chromium reports
+    psutil = None
+
+# Report property carrying a test's memory samples to the controller (xdist workers keep their own watchdog)
+MEMORY_PROPERTY = "memory_watchdog"
+
+
+def process_rss_mb(pid: int) -> Optional[float]:
+    """Resident memory of a process in MB, or None when it is gone or cannot be read"""
+    if psutil is not None:
+        try:
+            return psutil.Process(pid).memory_info().rss / (1024 * 1024)
+        except (psutil.Error, OSError):
+            return None
+    try:
+        with open(f"/proc/{pid}/status", "r", encoding="utf-8") as f:
+            for line in f:
+                if line.startswith("VmRSS:"):
+                    return int(line.split()[1]) / 1024
+    except (OSError, ValueError):
+        pass
+    return None
+
+
+class RecyclableBrowser:
+    """
+    Stands in for the Browser of the browser fixture so the watchdog can replace the browser between tests
+    """
+
+    def __init__(self, launch: Callable):
+        """
+        Initialize with the launch function of the browser fixture
+
+        Args:
+            launch: Returns a newly launched Browser
+        """
+        self._launch = launch
+        self.browser = launch()
+
+    def recycle(self):
+        """Close the browser and launch a fresh one (no context of this worker may be open)"""
+        try:
+            self.browser.close()
+        except Exception as e:
+            print(f"⚠️ Closing the browser before recycling failed: {e}")
+        self.browser = self._launch()
+
+    def new_context(self, **kwargs):
+        """New context of the current browser"""
+        return self.browser.new_context(**kwargs)
+
+    def __getattr__(self, name):
+        return getattr(self.browser, name)
+
+
+class MemoryWatchdog:
+    """
+    Samples browser memory between tests, flags leaking tests and recycles the browser over the threshold
+    """
+
+    def __init__(self, browser, recorder: "MemoryRecorder", recycle_mb: float = MEMORY_RECYCLE_MB,
+                 leak_mb: float = MEMORY_LEAK_MB):
+        """
+        Initialize watchdog and take the baseline sample
+
+        Args:
+            browser: Browser of the browser fixture (a RecyclableBrowser can be recycled, others are only watched)
+            recorder: Run-level recorder the samples are reported to
+            recycle_mb: Total browser RSS after a test that triggers a relaunch
+            leak_mb: Memory a test may leave behind before it is flagged
+        """
+        self.browser = browser
+        self.recorder = recorder
+        self.recycle_mb = recycle_mb
+        self.leak_mb = leak_mb
+        self.can_recycle = isinstance(browser, RecyclableBrowser)
+        # A shared browser also runs the other workers' tests, so its growth cannot be attributed to ours
+        self.attributes_leaks = not isinstance(browser, SharedBrowser)
+        self.worker = os.environ.get("PYTEST_XDIST_WORKER")
+        self.samples: List[Dict] = []
+        self.leaks: List[Dict] = []
+        self.recycles: List[Dict] = []
+        self._cdp = None
+        self.baseline = self.sample()
+        if self.baseline is None:
+            print("⚠️ Memory watchdog cannot read browser memory here (needs Chromium or psutil) - disabled")
+            return
+        self.baseline["delta_mb"] = 0.0
+        self.recorder.add_sample(self.baseline)
+        print(f"🧠 Memory watchdog: browser uses {self.baseline['total_mb']:.0f}MB at start "
+              f"(recycle at {self.recycle_mb:.0f}MB)")
+        if not self.attributes_leaks:
+            print("🧠 Shared browser: memory is sampled for the whole browser, leaks are not attributed to tests")
+
+    # ===== SAMPLING =====
+
+    def _cdp_processes(self) -> Optional[List[Dict]]:
+        """[{"type", "id"}] of the browser's processes from CDP SystemInfo (Chromium only)"""
+        try:
+            if self._cdp is None:
+                self._cdp = self.browser.new_browser_cdp_session()
+            return self._cdp.send("SystemInfo.getProcessInfo")["processInfo"]
+        except Exception:
+            self._cdp = None
+            return None
+
+    def _child_processes(self) -> Optional[List[Dict]]:
+        """Browser processes started by this worker's Playwright driver (psutil, any browser)"""
+        if psutil is None:
+            return None
+        processes = []
+        for child in psutil.Process(os.getpid()).children(recursive=True):
+            try:
+                if child.name().lower().startswith("node"):
+                    continue  # The Playwright driver, not the browser
+                kind = "renderer" if "--type=renderer" in " ".join(child.cmdline()) else "browser"
+                processes.append({"type": kind, "id": child.pid})
+            except psutil.Error:
+                continue
+        return processes
+
+    def sample(self, test: str = None) -> Optional[Dict]:
+        """
+        Current RSS of the browser's processes
+
+        Returns:
+            dict: {"test", "time", "total_mb", "renderer_mb", "processes"} (by process type in "by_type"),
+                  or None when memory cannot be read
+        """
+        processes = self._cdp_processes() or self._child_processes()
+        if not processes:
+            return None
+        by_type: Dict[str, float] = {}
+        for process in processes:
+            rss = process_rss_mb(process["id"])
+            if rss is not None:
+                by_type[process["type"]] = by_type.get(process["type"], 0.0) + rss
+        if not by_type:
+            return None
+        return {"test": test, "worker": self.worker, "time": time.time(), "total_mb": sum(by_type.values()),
+                "renderer_mb": by_type.get("renderer", 0.0), "processes": len(processes), "by_type": by_type}
+
+    def after_test(self, test: str):
+        """
+        Sample after a test closed its context; flag what it left behind and recycle over the threshold
+
+        Args:
+            test: Test node id
+        """
+        if self.baseline is None:
+            return
+        previous = self.samples[-1] if self.samples else self.baseline
+        current = self.sample(test)
+        if current is None:
+            return
+        current["delta_mb"] = current["total_mb"] - previous["total_mb"] if self.attributes_leaks else None
+        current["leak"] = self.attributes_leaks and current["delta_mb"] > self.leak_mb
+        self.samples.append(current)
+        self.recorder.add_sample(current)
+        if current["leak"]:
+            self.leaks.append(current)
+            print(f"\n🧠 {test} left {current['delta_mb']:.0f}MB in the browser "
+                  f"(now {current['total_mb']:.0f}MB, renderers {current['renderer_mb']:.0f}MB)")
+        if current["total_mb"] > self.recycle_mb:
+            self._recycle(current)
+
+    def _recycle(self, current: Dict):
+        """Relaunch the browser and start a new baseline"""
+        if not self.can_recycle:
+            print(f"\n⚠️ Browser uses {current['total_mb']:.0f}MB (> {self.recycle_mb:.0f}MB) - "
+                  f"recycling is not possible with a shared browser")
+            return
+        start = time.time()
+        self._cdp = None
+        self.browser.recycle()
+        baseline = self.sample(current["test"])
+        recycle = {"after": current["test"], "before_mb": current["total_mb"],
+                   "after_mb": baseline["total_mb"] if baseline else None, "ms": round((time.time() - start) * 1000)}
+        self.recycles.append(recycle)
+        self.recorder.add_recycle(recycle)
+        if baseline is not None:
+            baseline["delta_mb"] = 0.0  # New baseline - the next test is compared with the fresh browser
+            self.samples.append(baseline)
+            self.recorder.add_sample(baseline)
+            print(f"\n♻️ Recycled the browser after {current['test']}: {current['total_mb']:.0f}MB -> "
+                  f"{baseline['total_mb']:.0f}MB in {recycle['ms']}ms")
+        else:
+            print(f"\n♻️ Recycled the browser after {current['test']} in {recycle['ms']}ms")
+
+
+class MemoryRecorder:
+    """
+    Run-level memory samples of every worker's watchdog; exports the run on the xdist controller
+    """
+
+    def __init__(self, leak_mb: float = MEMORY_LEAK_MB):
+        """Initialize run-level recorder"""
+        self.leak_mb = leak_mb
+        self.run_id = datetime.now().strftime("%Y%m%d_%H%M%S")
+        self.samples: List[Dict] = []     # Samples of the run, merged from the test reports
+        self.recycles: List[Dict] = []
+        self._unreported: Dict[str, List[Dict]] = {"samples": [], "recycles": []}
+
+    def add_sample(self, sample: Dict):
+        """Report a sample of this process's watchdog"""
+        self._unreported["samples"].append(sample)
+
+    def add_recycle(self, recycle: Dict):
+        """Report a browser relaunch of this process's watchdog"""
+        self._unreported["recycles"].append(recycle)
+
+    def attach(self, report):
+        """Attach the samples taken since the previous report to a teardown report"""
+        if report.when != "teardown" or not (self._unreported["samples"] or self._unreported["recycles"]):
+            return
+        report.user_properties.append((MEMORY_PROPERTY, self._unreported))
+        self._unreported = {"samples": [], "recycles": []}
+
+    def collect(self, report):
+        """Merge the samples of a teardown report (called from pytest_runtest_logreport, on the xdist controller)"""
+        data = dict(report.user_properties).get(MEMORY_PROPERTY) if report.when == "teardown" else None
+        if data:
+            self.samples.extend(data["samples"])
+            self.recycles.extend(data["recycles"])
+
+    # ===== EXPORT =====
+
+    def export(self) -> List[str]:
+        """
+        Export per-test memory as InfluxDB line protocol (appended) and the run totals as Prometheus text
+
+        Returns:
+            list: Paths of the written files
+        """
+        if not self.samples:
+            return []
+        leaks = [sample for sample in self.samples if sample.get("leak")]
+        final = {}  # Last sample per worker (each worker's browser, or the shared one)
+        for sample in self.samples:
+            final[sample["worker"]] = sample
+        lines = [format_influx_line("browser_memory", {"test": sample["test"], "run": self.run_id,
+                                                       "worker": sample["worker"]}, {
+            "total_mb": round(sample["total_mb"], 1),
+            "renderer_mb": round(sample["renderer_mb"], 1),
+            "delta_mb": round(sample["delta_mb"], 1) if sample["delta_mb"] is not None else None,
+            "processes": sample["processes"],
+        }, int(sample["time"] * 1e9)) for sample in self.samples]
+        influx_path = append_influx_lines("browser_memory_influxDbData.txt", lines)
+
+        peak = max(sample["total_mb"] for sample in self.samples)
+        prometheus_path = write_prometheus_file("browser_memory_prometheusData.txt", [
+            ("browser_memory_peak_mb", {}, round(peak, 1)),
+        ] + [("browser_memory_final_mb", {"worker": worker} if worker else {}, round(sample["total_mb"], 1))
+             for worker, sample in sorted(final.items(), key=lambda entry: entry[0] or "")] + [
+            ("browser_memory_leaking_tests", {}, len(leaks)),
+            ("browser_recycle_count", {}, len(self.recycles)),
+        ] + [("browser_memory_test_delta_mb", {"test": sample["test"]}, round(sample["delta_mb"], 1))
+             for sample in leaks], {
+            "browser_memory_peak_mb": "Highest browser RSS after a test",
+            "browser_memory_final_mb": "Browser RSS after the last test (per xdist worker)",
+            "browser_memory_leaking_tests": f"Tests that left more than {self.leak_mb:.0f}MB behind",
+            "browser_recycle_count": "Browser relaunches because of memory",
+            "browser_memory_test_delta_mb": "Memory a flagged test left behind",
+        })
+
+        print(f"\n🧠 Browser memory: peak {peak:.0f}MB, {self.samples[-1]['total_mb']:.0f}MB after the last test, "
+              f"{len(self.samples)} samples, {len(self.recycles)} recycles, "
+              f"{len(leaks)} tests left more than {self.leak_mb:.0f}MB behind")
+        for sample in sorted(leaks, key=lambda entry: entry["delta_mb"], reverse=True)[:5]:
+            print(f"   +{sample['delta_mb']:.0f}MB  {sample['test']}")
+        return [influx_path, prometheus_path]
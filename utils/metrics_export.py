@@ -0,0 +1,210 @@
+"""
+Metrics Export Utilities
+Shared helpers for writing time-series metrics as InfluxDB line protocol and Prometheus text files,
+and for saving benchmark runs for comparison with the previous run
+"""
+
+import os
+import glob
+import json
+import math
+import time
+from datetime import datetime
+from typing import Dict, List, Optional, Tuple
+from utils.config import METRICS_EXPORT_DIR
+
+
+def get_metrics_path(filename: str, export_dir: str = None) -> str:
+    """
+    Build the path of a metrics export file, creating the export directory if needed
+
+    Args:
+        filename: Name of the export file
+        export_dir: Directory to write to (default: METRICS_EXPORT_DIR from config)
+
+    Returns:
+        str: Full path of the export file
+    """
+    export_dir = export_dir or METRICS_EXPORT_DIR
+    os.makedirs(export_dir, exist_ok=True)
+    return os.path.join(export_dir, filename)
+
+
+def _escape_influx(value) -> str:
+    """Escape commas, spaces and equals signs for InfluxDB tag keys/values and measurement names"""
+    return str(value).replace("\\", "\\\\").replace(",", "\\,").replace(" ", "\\ ").replace("=", "\\=")
+
+
+def format_influx_line(measurement: str, tags: Dict, fields: Dict, timestamp_ns: int) -> Optional[str]:
+    """
+    Format a single InfluxDB line protocol record
+
+    Args:
+        measurement: Measurement name (e.g. "web_perf")
+        tags: Tag set - empty/None values are dropped
+        fields: Field set - only numeric values are written, None values are dropped
+        timestamp_ns: Timestamp in nanoseconds (same precision as the Allure export)
+
+    Returns:
+        str: Line protocol record, or None when there are no numeric fields
+    """
+    field_parts = []
+    for key, value in fields.items():
+        if value is None or isinstance(value, bool):
+            continue
+        if isinstance(value, (int, float)) and not (isinstance(value, float) and math.isnan(value)):
+            field_parts.append(f"{_escape_influx(key)}={value}")
+    if not field_parts:
+        return None
+
+    tag_parts = [f"{_escape_influx(k)}={_escape_influx(v)}" for k, v in sorted(tags.items()) if v not in (None, "")]
+    head = _escape_influx(measurement)
+    if tag_parts:
+        head = f"{head},{','.join(tag_parts)}"
+    return f"{head} {','.join(field_parts)} {int(timestamp_ns)}"
+
+
+def append_influx_lines(filename: str, lines: List[str], export_dir: str = None) -> str:
+    """
+    Append line protocol records to an export file so consecutive runs build up a time series
+
+    Args:
+        filename: Export file name (e.g. "web_perf_influxDbData.txt")
+        lines: Records produced by format_influx_line (None entries are skipped)
+        export_dir: Directory to write to (default: METRICS_EXPORT_DIR)
+
+    Returns:
+        str: Path of the export file
+    """
+    path = get_metrics_path(filename, export_dir)
+    with open(path, "a", encoding="utf-8") as f:
+        for line in lines:
+            if line:
+                f.write(line + "\n")
+    return path
+
+
+def _format_prometheus_labels(labels: Dict) -> str:
+    """Format a Prometheus label set"""
+    if not labels:
+        return ""
+    parts = []
+    for key, value in sorted(labels.items()):
+        escaped = str(value).replace("\\", "\\\\").replace("\n", "\\n").replace('"', '\\"')
+        parts.append(f'{key}="{escaped}"')
+    return "{" + ",".join(parts) + "}"
+
+
+def write_prometheus_file(filename: str, samples: List[Tuple[str, Dict, float]], help_texts: Dict[str, str] = None,
+                          export_dir: str = None) -> str:
+    """
+    Write a Prometheus text exposition file (overwritten each run, like the Allure export)
+
+    Args:
+        filename: Export file name (e.g. "api_latency_prometheusData.txt")
+        samples: List of (metric_name, labels, value) tuples
+        help_texts: Optional {metric_name: help text} written as HELP/TYPE gauge headers
+        export_dir: Directory to write to (default: METRICS_EXPORT_DIR)
+
+    Returns:
+        str: Path of the export file
+    """
+    help_texts = help_texts or {}
+    path = get_metrics_path(filename, export_dir)
+    written_headers = set()
+    with open(path, "w", encoding="utf-8") as f:
+        for name, labels, value in samples:
+            if value is None:
+                continue
+            if name not in written_headers:
+                if name in help_texts:
+                    f.write(f"# HELP {name} {help_texts[name]}\n")
+                f.write(f"# TYPE {name} gauge\n")
+                written_headers.add(name)
+            f.write(f"{name}{_format_prometheus_labels(labels)} {value}\n")
+    return path
+
+
+def percentile(values: List[float], pct: float) -> Optional[float]:
+    """
+    Calculate a percentile using linear interpolation between closest ranks
+
+    Args:
+        values: Sample values
+        pct: Percentile between 0 and 100
+
+    Returns:
+        float: Percentile value, or None for an empty sample
+    """
+    if not values:
+        return None
+    ordered = sorted(values)
+    if len(ordered) == 1:
+        return float(ordered[0])
+    rank = (len(ordered) - 1) * (pct / 100.0)
+    lower = math.floor(rank)
+    upper = math.ceil(rank)
+    if lower == upper:
+        return float(ordered[int(rank)])
+    return ordered[lower] + (ordered[upper] - ordered[lower]) * (rank - lower)
+
+
+def summarize(values: List[float]) -> Dict[str, Optional[float]]:
+    """
+    Summarize a sample with count, min, max, mean and p50/p95/p99
+
+    Args:
+        values: Sample values
+
+    Returns:
+        dict: Summary statistics
+    """
+    if not values:
+        return {"count": 0, "min": None, "max": None, "mean": None, "p50": None, "p95": None, "p99": None}
+    return {
+        "count": len(values),
+        "min": min(values),
+        "max": max(values),
+        "mean": sum(values) / len(values),
+        "p50": percentile(values, 50),
+        "p95": percentile(values, 95),
+        "p99": percentile(values, 99),
+    }
+
+
+def save_benchmark_run(benchmark: str, data: Dict, export_dir: str = None) -> str:
+    """
+    Save one benchmark run as metrics/<benchmark>/run_<timestamp>.json
+
+    Args:
+        benchmark: Benchmark name (subdirectory of the export directory)
+        data: Run data (summary, samples, settings)
+        export_dir: Directory to write to (default: METRICS_EXPORT_DIR from config)
+
+    Returns:
+        str: Path of the saved run
+    """
+    directory = get_metrics_path(benchmark, export_dir)
+    os.makedirs(directory, exist_ok=True)
+    path = os.path.join(directory, f"run_{datetime.now().strftime('%Y%m%d_%H%M%S')}.json")
+    with open(path, "w", encoding="utf-8") as f:
+        json.dump(dict(data, created=time.time()), f, indent=2)
+    return path
+
+
+def load_latest_benchmark_run(benchmark: str, export_dir: str = None) -> Optional[Dict]:
+    """
+    Latest saved run of a benchmark (load it before saving the current one)
+
+    Args:
+        benchmark: Benchmark name
+        export_dir: Metrics directory (default: METRICS_EXPORT_DIR from config)
+
+    Returns:
+        dict: The saved run, or None when there is no earlier run
+    """
+    runs = sorted(glob.glob(os.path.join(get_metrics_path(benchmark, export_dir), "run_*.json")))
+    if not runs:
+        return None
+    with open(runs[-1], "r", encoding="utf-8") as f:
+        return json.load(f)
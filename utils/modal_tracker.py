@@ -0,0 +1,302 @@
+"""
+Modal Tracker
+Observes dialogs opening and closing in the page (role=dialog/alertdialog, aria-modal, .modal) and exposes
+the currently open modals plus waits that resolve on the actual open/close instead of fixed sleeps. Every
+open/close is kept with the latency from the user interaction that triggered it, and the run-level
+recorder exports open latency percentiles per modal.
+"""
+
+import time
+from datetime import datetime
+from typing import Dict, List, Optional
+from playwright.sync_api import Page
+from utils.config import MODAL_WAIT_TIMEOUT, MODAL_HISTORY_SIZE
+from utils.metrics_export import summarize, format_influx_line, append_influx_lines, write_prometheus_file
+from utils.page_scripts import install_init_script_once, wait_for_page_function
+
+# Elements recorded as modals (the outermost match counts, so dialog content and headers are not separate modals)
+MODAL_SELECTOR = "[role='dialog'], [role='alertdialog'], [aria-modal='true'], .modal, [data-modal]"
+
+# Observes modals of a document; open ones in window.__bprpModals.open, history in sessionStorage (idempotent)
+TRACKER_SCRIPT = """
+(() => {
+    if (window.__bprpModals) return;
+    const KEY = '__bprpModals', SELECTOR = "%s", LIMIT = %d;
+    let saved = [];
+    try { saved = JSON.parse(sessionStorage.getItem(KEY) || '[]'); } catch (e) {}
+    const tracker = { history: saved, seq: saved.reduce((max, entry) => Math.max(max, entry.id), 0),
+                      open: new Map(), lastInteraction: null };
+    window.__bprpModals = tracker;
+
+    const interact = () => { tracker.lastInteraction = performance.now(); };
+    ['pointerdown', 'keydown', 'submit'].forEach((type) => document.addEventListener(type, interact, true));
+    // Latency from the interaction that triggered the change; each interaction is attributed once
+    const latency = () => {
+        if (tracker.lastInteraction === null) return null;
+        const ms = Math.round(performance.now() - tracker.lastInteraction);
+        tracker.lastInteraction = null;
+        return ms;
+    };
+    const textOf = (element) => (element.innerText || element.textContent || '').replace(/\\s+/g, ' ').trim();
+    const nameOf = (element) => {
+        const labelledBy = element.getAttribute('aria-labelledby');
+        const label = element.getAttribute('aria-label')
+            || (labelledBy && document.getElementById(labelledBy) && textOf(document.getElementById(labelledBy)));
+        const heading = element.querySelector('h1, h2, h3, h4, h5, h6, [role="heading"]');
+        return label || (heading && textOf(heading)) || textOf(element).slice(0, 60);
+    };
+    const visible = (element) => element.isConnected && !!(element.offsetWidth || element.offsetHeight
+        || element.getClientRects().length) && getComputedStyle(element).visibility !== 'hidden';
+    const store = () => {
+        if (tracker.history.length > LIMIT) tracker.history.splice(0, tracker.history.length - LIMIT);
+        try { sessionStorage.setItem(KEY, JSON.stringify(tracker.history)); } catch (e) {}
+    };
+
+    const scan = () => {
+        let changed = false;
+        document.querySelectorAll(SELECTOR).forEach((element) => {
+            if (element.parentElement && element.parentElement.closest(SELECTOR)) return;
+            if (!visible(element)) return;
+            const entry = tracker.open.get(element);
+            const name = nameOf(element);
+            if (!entry) {
+                const opened = { id: ++tracker.seq, name, opened: Date.now(), open_ms: latency(),
+                                 closed: null, close_ms: null, url: location.href };
+                tracker.history.push(opened);
+                tracker.open.set(element, opened);
+                changed = true;
+            } else if (entry.name !== name && name) {
+                entry.name = name;  // Heading rendered after the dialog appeared
+                changed = true;
+            }
+        });
+        tracker.open.forEach((entry, element) => {
+            if (!visible(element)) {
+                entry.closed = Date.now();
+                entry.close_ms = latency();
+                tracker.open.delete(element);
+                changed = true;
+            }
+        });
+        if (changed) store();
+    };
+
+    const observe = () => {
+        new MutationObserver(scan).observe(document.documentElement,
+            { childList: true, subtree: true, attributes: true,
+              attributeFilter: ['class', 'style', 'hidden', 'open', 'aria-hidden', 'aria-modal', 'role'] });
+        scan();
+    };
+    if (document.documentElement) observe(); else document.addEventListener('DOMContentLoaded', observe);
+    window.addEventListener('pagehide', () => {
+        tracker.open.forEach((entry) => { entry.closed = Date.now(); });
+        store();
+    });
+})();
+""" % (MODAL_SELECTOR.replace('"', '\\"'), MODAL_HISTORY_SIZE)
+
+# Open modals after `since` whose name contains `name` (case-insensitive), oldest first
+_OPEN_FUNCTION = """
+    const openModals = ([name, since]) => {
+        const tracker = window.__bprpModals;
+        if (!tracker) return [];
+        return Array.from(tracker.open.values()).filter((entry) => entry.id > since
+            && (name === null || entry.name.toLowerCase().includes(name.toLowerCase())));
+    };
+"""
+
+OPEN_SCRIPT = "(arg) => {" + _OPEN_FUNCTION + "return openModals(arg); }"
+
+# [name, since, open]: true once a matching modal is open (open=true) / none is open (open=false)
+WAIT_SCRIPT = ("([name, since, open]) => { if (!window.__bprpModals) { " + TRACKER_SCRIPT.strip().rstrip(';')
+               + "; }" + _OPEN_FUNCTION + "return (openModals([name, since]).length > 0) === open; }")
+
+HISTORY_SCRIPT = "(since) => window.__bprpModals ? window.__bprpModals.history.filter((entry) => entry.id > since) : []"
+
+MARK_SCRIPT = "() => window.__bprpModals ? window.__bprpModals.seq : 0"
+
+
+def install_modal_tracker(context):
+    """
+    Inject the modal tracker into every document of a browser context
+
+    Call it right after the context is created (the context fixture does); on other pages the waits
+    install it on first use.
+    """
+    install_init_script_once(context, TRACKER_SCRIPT)
+
+
+def mark_modals(page: Page) -> int:
+    """Position in the modal history; pass it as `since` to only match modals opened after this point"""
+    try:
+        return page.evaluate(MARK_SCRIPT)
+    except Exception:
+        return 0
+
+
+def open_modals(page: Page, name: str = None) -> List[Dict]:
+    """
+    Modals currently open on the page, oldest first
+
+    Args:
+        page: Playwright page object
+        name: Only modals whose name (aria-label, labelling element or first heading) contains this text
+
+    Returns:
+        list: {"id", "name", "opened", "open_ms", "closed", "close_ms", "url"} per modal
+    """
+    try:
+        return page.evaluate(OPEN_SCRIPT, [name, 0])
+    except Exception:
+        return []
+
+
+def modal_history(page: Page, since: int = 0) -> List[Dict]:
+    """
+    Every modal opened in the current tab (closed ones included), oldest first
+
+    `opened`/`closed` are epoch ms; `open_ms`/`close_ms` are the latency from the triggering click or key
+    press, None when no interaction preceded the change.
+    """
+    try:
+        return page.evaluate(HISTORY_SCRIPT, since)
+    except Exception:
+        return []
+
+
+def _wait(page: Page, name: Optional[str], since: int, is_open: bool, timeout: int) -> bool:
+    """Wait until a matching modal is open / none is open; survives navigations"""
+    met = wait_for_page_function(page, WAIT_SCRIPT, [name, since, is_open], timeout)
+    return not is_open if met is None else met
+
+
+def wait_for_modal_open(page: Page, name: str = None, since: int = 0,
+                        timeout: int = MODAL_WAIT_TIMEOUT) -> Optional[Dict]:
+    """
+    Wait until a modal is open
+
+    Args:
+        page: Playwright page object
+        name: Text contained in the modal name (case-insensitive); None for any modal
+        since: Only modals opened after this mark (see mark_modals)
+        timeout: Max wait in ms
+
+    Returns:
+        dict: The open modal, or None when none opened within the timeout
+    """
+    if not _wait(page, name, since, True, timeout):
+        return None
+    modals = [modal for modal in open_modals(page, name) if modal["id"] > since]
+    return modals[0] if modals else None
+
+
+def wait_for_modal_closed(page: Page, name: str = None, timeout: int = MODAL_WAIT_TIMEOUT) -> bool:
+    """
+    Wait until no matching modal is open (returns at once when none is)
+
+    Args:
+        page: Playwright page object
+        name: Text contained in the modal name (case-insensitive); None for every modal
+        timeout: Max wait in ms
+
+    Returns:
+        bool: True when closed, False when a matching modal was still open at the timeout
+    """
+    return _wait(page, name, 0, False, timeout)
+
+
+# Report property carrying a test's modal records to the controller (xdist workers keep their own recorder)
+MODAL_LATENCY_PROPERTY = "modal_latency"
+
+
+class ModalLatencyRecorder:
+    """
+    Collects modal open/close records from every test of a run and exports open latency per modal
+
+    Each process adds its tests' records, which travel to the controller in the teardown reports (attach);
+    the controller merges them (collect) and exports the run, so the percentiles cover every xdist worker.
+    """
+
+    def __init__(self):
+        """Initialize run-level recorder"""
+        self.run_id = datetime.now().strftime("%Y%m%d_%H%M%S")
+        self.records: List[Dict] = []     # Records of the run, merged from the test reports
+        self._unreported: List[Dict] = []  # Records of this process not yet attached to a report
+
+    def collect_page(self, page: Page, test_name: str):
+        """Add the modal history of a finished test's page to the run"""
+        for record in modal_history(page):
+            self._unreported.append({"name": record["name"], "open_ms": record["open_ms"],
+                                     "close_ms": record["close_ms"], "test": test_name})
+
+    def attach(self, report):
+        """Attach the records added since the previous report to a teardown report"""
+        if report.when != "teardown" or not self._unreported:
+            return
+        report.user_properties.append((MODAL_LATENCY_PROPERTY, self._unreported))
+        self._unreported = []
+
+    def collect(self, report):
+        """Merge the records of a teardown report (called from pytest_runtest_logreport, on the xdist controller)"""
+        if report.when == "teardown":
+            self.records.extend(dict(report.user_properties).get(MODAL_LATENCY_PROPERTY) or [])
+
+    def aggregate(self) -> Dict[str, Dict]:
+        """
+        Aggregate latency per modal name
+
+        Returns:
+            dict: {name: {"open_ms": summary, "close_ms": summary, "count"}}
+        """
+        grouped: Dict[str, List[Dict]] = {}
+        for record in self.records:
+            grouped.setdefault(record["name"] or "<unnamed>", []).append(record)
+        return {
+            name: {
+                "open_ms": summarize([r["open_ms"] for r in records if r["open_ms"] is not None]),
+                "close_ms": summarize([r["close_ms"] for r in records if r["close_ms"] is not None]),
+                "count": len(records),
+            }
+            for name, records in grouped.items()
+        }
+
+    def export(self) -> List[str]:
+        """
+        Export per-modal aggregates as InfluxDB line protocol (appended) and Prometheus text (overwritten)
+
+        Returns:
+            list: Paths of the written files
+        """
+        modals = self.aggregate()
+        if not modals:
+            return []
+
+        timestamp_ns = time.time_ns()
+        lines = []
+        samples = []
+        for name, stats in modals.items():
+            opened = stats["open_ms"]
+            lines.append(format_influx_line("modal_latency", {"modal": name, "run": self.run_id}, {
+                "count": stats["count"],
+                "open_p50_ms": opened["p50"],
+                "open_p95_ms": opened["p95"],
+                "open_max_ms": opened["max"],
+                "close_p50_ms": stats["close_ms"]["p50"],
+            }, timestamp_ns))
+            for quantile, key in (("0.5", "p50"), ("0.95", "p95")):
+                samples.append(("modal_open_latency_ms", {"modal": name, "quantile": quantile}, opened[key]))
+            samples.append(("modal_open_count", {"modal": name}, stats["count"]))
+
+        influx_path = append_influx_lines("modal_latency_influxDbData.txt", lines)
+        prometheus_path = write_prometheus_file("modal_latency_prometheusData.txt", samples, {
+            "modal_open_latency_ms": "Time from the triggering interaction until the modal was visible",
+            "modal_open_count": "Number of times the modal was opened",
+        })
+
+        timed = [item for item in modals.items() if item[1]["open_ms"]["count"]]
+        slowest = sorted(timed, key=lambda item: item[1]["open_ms"]["p95"], reverse=True)[:5]
+        print(f"\n🪟 Modal open latency ({len(self.records)} opens, {len(modals)} modals) - slowest by p95:")
+        for name, stats in slowest:
+            opened = stats["open_ms"]
+            print(f"   {name}: p50={opened['p50']:.0f}ms p95={opened['p95']:.0f}ms (n={opened['count']})")
+        return [influx_path, prometheus_path]
@@ -0,0 +1,260 @@
+"""
+Network Observer
+Records every backend (XHR/fetch) request made by a browser context - method, route template, status,
+timing phases and payload size - and aggregates per-endpoint latency percentiles for the whole run
+"""
+
+import re
+import time
+from datetime import datetime
+from typing import Dict, List, Optional
+from urllib.parse import urlparse
+from playwright.sync_api import BrowserContext, Request
+from utils.metrics_export import summarize, format_influx_line, append_influx_lines, write_prometheus_file
+
+BACKEND_RESOURCE_TYPES = ("xhr", "fetch")
+
+# Report property carrying a test's request records to the controller (xdist workers keep their own recorder)
+API_LATENCY_PROPERTY = "api_latency"
+
+# Record fields the run aggregate needs
+_AGGREGATED_FIELDS = ("method", "route", "status", "failed", "duration_ms", "response_bytes")
+
+# Path segments that identify a record rather than a route (ids, uuids, hashes, emails)
+_ID_SEGMENT_PATTERNS = [
+    re.compile(r"^\d+$"),
+    re.compile(r"^[0-9a-fA-F]{8}-[0-9a-fA-F]{4}-[0-9a-fA-F]{4}-[0-9a-fA-F]{4}-[0-9a-fA-F]{12}$"),
+    re.compile(r"^[0-9a-fA-F]{16,}$"),
+    re.compile(r"^[^@/]+@[^@/]+\.[^@/]+$"),
+]
+
+
+def to_route_template(url: str) -> str:
+    """
+    Convert a request URL to a route template by dropping the query string and replacing id-like path segments
+
+    Example:
+        https://api.example/agency/174/jd/55?page=2 -> /agency/{id}/jd/{id}
+    """
+    path = urlparse(url).path or "/"
+    segments = []
+    for segment in path.split("/"):
+        if segment and any(pattern.match(segment) for pattern in _ID_SEGMENT_PATTERNS):
+            segments.append("{id}")
+        else:
+            segments.append(segment)
+    return "/".join(segments) or "/"
+
+
+def _phase(timing: Dict, start_key: str, end_key: str) -> Optional[float]:
+    """Duration between two Playwright resource timing marks (-1 means the phase did not happen)"""
+    start, end = timing.get(start_key, -1), timing.get(end_key, -1)
+    if start is None or end is None or start < 0 or end < 0:
+        return None
+    return round(end - start, 2)
+
+
+class NetworkObserver:
+    """
+    Observes backend requests of one browser context (one test)
+    """
+
+    def __init__(self, test_name: str = None):
+        """
+        Initialize observer
+
+        Args:
+            test_name: Test node id the requests are attributed to
+        """
+        self.test_name = test_name
+        self.started_at = time.time() * 1000
+        self._pending: List[tuple] = []
+        self.records: List[Dict] = []
+
+    def attach(self, context: BrowserContext):
+        """Start observing finished and failed requests on the context"""
+        context.on("requestfinished", lambda request: self._on_request(request, failed=False))
+        context.on("requestfailed", lambda request: self._on_request(request, failed=True))
+
+    def _on_request(self, request: Request, failed: bool):
+        """Event handler - only queues the request, details are resolved in collect()"""
+        if request.resource_type in BACKEND_RESOURCE_TYPES:
+            self._pending.append((request, failed))
+
+    def collect(self) -> List[Dict]:
+        """
+        Resolve status, timing phases and sizes of queued requests. Must run before the context closes.
+
+        Returns:
+            list: Request records for this test
+        """
+        while self._pending:
+            request, failed = self._pending.pop(0)
+            timing = request.timing or {}
+            record = {
+                "test": self.test_name,
+                "method": request.method,
+                "route": to_route_template(request.url),
+                "host": urlparse(request.url).netloc,
+                "status": None,
+                "failed": failed,
+                "failure": request.failure if failed else None,
+                "start_offset_ms": round(timing.get("startTime", self.started_at) - self.started_at, 2),
+                "dns_ms": _phase(timing, "domainLookupStart", "domainLookupEnd"),
+                "connect_ms": _phase(timing, "connectStart", "connectEnd"),
+                "wait_ms": _phase(timing, "requestStart", "responseStart"),
+                "receive_ms": _phase(timing, "responseStart", "responseEnd"),
+                "duration_ms": timing.get("responseEnd") if timing.get("responseEnd", -1) >= 0 else None,
+                "request_bytes": None,
+                "response_bytes": None,
+            }
+            try:
+                response = request.response()
+                if response is not None:
+                    record["status"] = response.status
+                sizes = request.sizes()
+                record["request_bytes"] = sizes.get("requestBodySize")
+                record["response_bytes"] = sizes.get("responseBodySize")
+            except Exception as e:
+                print(f"⚠️ Could not read response details for {request.url}: {e}")
+            self.records.append(record)
+        return self.records
+
+    def format_waterfall(self) -> str:
+        """
+        Render the test's backend requests as a text waterfall (one row per request, ordered by start time)
+
+        Returns:
+            str: Waterfall table
+        """
+        rows = sorted(self.records, key=lambda r: r["start_offset_ms"])
+        if not rows:
+            return "No backend requests recorded"
+
+        lines = [f"{'start(ms)':>10} {'dur(ms)':>9} {'wait':>7} {'recv':>7} {'status':>6} {'bytes':>9}  request"]
+        for r in rows:
+            status = "FAIL" if r["failed"] else (r["status"] or "-")
+            duration = r["duration_ms"] or 0
+            bar = "#" * max(1, int(duration / 100))
+            lines.append(
+                f"{r['start_offset_ms']:>10.0f} {duration:>9.0f} {r['wait_ms'] or 0:>7.0f} {r['receive_ms'] or 0:>7.0f} "
+                f"{status:>6} {r['response_bytes'] or 0:>9}  {r['method']} {r['route']} {bar}"
+            )
+        return "\n".join(lines)
+
+
+class ApiLatencyRecorder:
+    """
+    Collects request records from every test of a run and exports per-endpoint latency percentiles
+
+    Each process adds its tests' records, which travel to the controller in the teardown reports (attach);
+    the controller merges them (collect) and exports the run, so the percentiles cover every xdist worker.
+    """
+
+    def __init__(self):
+        """Initialize run-level recorder"""
+        self.run_id = datetime.now().strftime("%Y%m%d_%H%M%S")
+        self.records: List[Dict] = []     # Records of the run, merged from the test reports
+        self._unreported: List[Dict] = []  # Records of this process not yet attached to a report
+
+    def create_observer(self, context: BrowserContext, test_name: str) -> NetworkObserver:
+        """
+        Create and attach a network observer for one test's context
+
+        Args:
+            context: Browser context of the test
+            test_name: Test node id
+
+        Returns:
+            NetworkObserver: Attached observer
+        """
+        observer = NetworkObserver(test_name)
+        observer.attach(context)
+        return observer
+
+    def add(self, observer: NetworkObserver):
+        """Add a finished test's records to the run"""
+        self._unreported.extend({key: record[key] for key in _AGGREGATED_FIELDS} for record in observer.collect())
+
+    def attach(self, report):
+        """Attach the records added since the previous report to a teardown report"""
+        if report.when != "teardown" or not self._unreported:
+            return
+        report.user_properties.append((API_LATENCY_PROPERTY, self._unreported))
+        self._unreported = []
+
+    def collect(self, report):
+        """Merge the records of a teardown report (called from pytest_runtest_logreport, on the xdist controller)"""
+        if report.when == "teardown":
+            self.records.extend(dict(report.user_properties).get(API_LATENCY_PROPERTY) or [])
+
+    def aggregate(self) -> Dict[str, Dict]:
+        """
+        Aggregate latency and payload statistics per endpoint ("METHOD /route/template")
+
+        Returns:
+            dict: {endpoint: {"method", "route", "latency": summary, "response_bytes": summary, "errors"}}
+        """
+        grouped: Dict[str, List[Dict]] = {}
+        for record in self.records:
+            grouped.setdefault(f"{record['method']} {record['route']}", []).append(record)
+
+        endpoints = {}
+        for endpoint, records in grouped.items():
+            endpoints[endpoint] = {
+                "method": records[0]["method"],
+                "route": records[0]["route"],
+                "latency": summarize([r["duration_ms"] for r in records if r["duration_ms"] is not None]),
+                "response_bytes": summarize([r["response_bytes"] for r in records if r["response_bytes"] is not None]),
+                "errors": sum(1 for r in records if r["failed"] or (r["status"] or 0) >= 400),
+            }
+        return endpoints
+
+    def export(self) -> List[str]:
+        """
+        Export per-endpoint aggregates as InfluxDB line protocol (appended) and Prometheus text (overwritten)
+
+        Returns:
+            list: Paths of the written files
+        """
+        endpoints = self.aggregate()
+        if not endpoints:
+            return []
+
+        timestamp_ns = time.time_ns()
+        lines = []
+        samples = []
+        for endpoint, stats in endpoints.items():
+            latency = stats["latency"]
+            tags = {"endpoint": stats["route"], "method": stats["method"], "run": self.run_id}
+            lines.append(format_influx_line("api_latency", tags, {
+                "count": latency["count"],
+                "mean_ms": latency["mean"],
+                "p50_ms": latency["p50"],
+                "p95_ms": latency["p95"],
+                "p99_ms": latency["p99"],
+                "max_ms": latency["max"],
+                "errors": stats["errors"],
+                "response_bytes_p95": stats["response_bytes"]["p95"],
+            }, timestamp_ns))
+
+            labels = {"endpoint": stats["route"], "method": stats["method"]}
+            for quantile, key in (("0.5", "p50"), ("0.95", "p95"), ("0.99", "p99")):
+                samples.append(("api_request_duration_ms", {**labels, "quantile": quantile}, latency[key]))
+            samples.append(("api_request_count", labels, latency["count"]))
+            samples.append(("api_request_errors", labels, stats["errors"]))
+
+        influx_path = append_influx_lines("api_latency_influxDbData.txt", lines)
+        prometheus_path = write_prometheus_file("api_latency_prometheusData.txt", samples, {
+            "api_request_duration_ms": "Backend request duration per endpoint in milliseconds",
+            "api_request_count": "Number of backend requests per endpoint",
+            "api_request_errors": "Failed or 4xx/5xx backend requests per endpoint",
+        })
+
+        timed = [item for item in endpoints.items() if item[1]["latency"]["count"]]
+        slowest = sorted(timed, key=lambda item: item[1]["latency"]["p95"], reverse=True)[:5]
+        print(f"\n🌐 API latency ({len(self.records)} requests, {len(endpoints)} endpoints) - slowest by p95:")
+        for endpoint, stats in slowest:
+            latency = stats["latency"]
+            print(f"   {endpoint}: p50={latency['p50']:.0f}ms p95={latency['p95']:.0f}ms p99={latency['p99']:.0f}ms (n={latency['count']})")
+        return [influx_path, prometheus_path]
@@ -0,0 +1,169 @@
+"""
+OTP Driver
+Enters one-time codes into the verification widget in one operation: the widget type (digit boxes or a
+single input) is detected once, the whole code is pasted (or typed as one keyboard sequence the widget
+distributes over its boxes), all boxes are verified with a single read, and clearing is one operation
+"""
+
+import time
+from typing import List, Tuple
+from playwright.sync_api import Page, Locator
+from utils.strategy_resolver import StrategyResolutionError, resolve_locator, run_strategies
+
+OTP_LENGTH = 6
+OTP_WIDGET_TIMEOUT = 10000  # Max wait for the OTP widget to render
+
+# Pastes the code into the first box like a user pasting from the clipboard (the widget spreads it over its boxes)
+PASTE_SCRIPT = """
+(box, code) => {
+    box.focus();
+    const data = new DataTransfer();
+    data.setData('text/plain', code);
+    box.dispatchEvent(new ClipboardEvent('paste', { clipboardData: data, bubbles: true, cancelable: true }));
+}
+"""
+
+# Sets every box through the native value setter so the widget's state updates (one box per character)
+SET_BOXES_SCRIPT = """
+(boxes, [code, length]) => {
+    const setter = Object.getOwnPropertyDescriptor(HTMLInputElement.prototype, 'value').set;
+    boxes.slice(0, length).forEach((box, i) => {
+        setter.call(box, code[i] || '');
+        box.dispatchEvent(new Event('input', { bubbles: true }));
+        box.dispatchEvent(new Event('change', { bubbles: true }));
+    });
+}
+"""
+
+READ_SCRIPT = "(boxes, length) => boxes.slice(0, length).map((box) => box.value || '').join('')"
+
+
+class OtpEntryError(Exception):
+    """Raised when the OTP widget did not take the code"""
+
+
+class OtpDriver:
+    """
+    Drives an OTP widget made of digit boxes (or a single OTP input)
+    """
+
+    def __init__(self, page: Page, candidates: List[Tuple[str, Locator]], single_input: Locator = None,
+                 name: str = "otp", length: int = OTP_LENGTH):
+        """
+        Initialize driver
+
+        Args:
+            page: Playwright page object
+            candidates: Ordered (widget kind, Locator) pairs of digit-box groups, e.g. spinbuttons / digit inputs
+            single_input: Single OTP textbox for widgets without boxes (tried last)
+            name: Interaction name used for memoizing the widget kind and the entry method
+            length: Number of digits
+        """
+        self.page = page
+        self.candidates = list(candidates) + ([("single_input", single_input)] if single_input is not None else [])
+        self.single_input = single_input
+        self.name = name
+        self.length = length
+        self._boxes = None
+
+    @property
+    def boxes(self) -> Locator:
+        """The widget's inputs - detected once per driver (and memoized per route by the strategy resolver)"""
+        if self._boxes is None:
+            self._boxes = resolve_locator(
+                self.page, f"{self.name}.widget", self.candidates,
+                accept=lambda boxes: boxes.count() >= self.length or (boxes is self.single_input and boxes.count() == 1),
+                timeout=OTP_WIDGET_TIMEOUT)
+        return self._boxes
+
+    def _is_single_input(self) -> bool:
+        return self.boxes is self.single_input
+
+    def read(self) -> str:
+        """Current code shown by the widget (all boxes in one read)"""
+        return self.boxes.evaluate_all(READ_SCRIPT, self.length)
+
+    def _expect_value(self, expected: str):
+        """Raise when the widget does not show the expected value"""
+        actual = self.read()
+        if actual != expected:
+            raise OtpEntryError(f"OTP widget shows '{actual}', expected '{expected}'")
+
+    def _empty_boxes(self):
+        """Empty all boxes at once, so a strategy never types into boxes a failed one partly filled"""
+        self.boxes.evaluate_all(SET_BOXES_SCRIPT, ["", self.length])
+
+    def enter(self, code: str):
+        """
+        Enter the whole code in one operation (paste, keyboard sequence, or setting all boxes at once)
+
+        Args:
+            code: The code; only the first `length` characters are used for digit boxes
+
+        Raises:
+            OtpEntryError: The widget does not show the code afterwards
+        """
+        start = time.time()
+        boxes = self.boxes
+        if self._is_single_input():
+            boxes.fill(code)
+            self._expect_value(code)
+            return
+
+        code = code[:self.length]
+
+        def paste():
+            self._empty_boxes()
+            boxes.first.evaluate(PASTE_SCRIPT, code)
+            self._expect_value(code)
+
+        def keyboard_sequence():
+            self._empty_boxes()
+            boxes.first.click()
+            self.page.keyboard.type(code)
+            self._expect_value(code)
+
+        def set_all_boxes():
+            boxes.evaluate_all(SET_BOXES_SCRIPT, [code, self.length])
+            self._expect_value(code)
+
+        try:
+            run_strategies(self.page, f"{self.name}.entry", [
+                ("paste", paste),
+                ("keyboard_sequence", keyboard_sequence),
+                ("set_all_boxes", set_all_boxes),
+            ])
+        except StrategyResolutionError as e:
+            raise OtpEntryError(f"OTP widget did not take the code: {e.__cause__}") from e
+        print(f"🔢 OTP entered in {time.time() - start:.2f}s")
+
+    def clear(self):
+        """
+        Clear all boxes in one operation
+
+        Raises:
+            OtpEntryError: The widget is not empty afterwards
+        """
+        boxes = self.boxes
+        if self._is_single_input():
+            boxes.fill("")
+            self._expect_value("")
+            return
+
+        def set_all_empty():
+            self._empty_boxes()
+            self._expect_value("")
+
+        def backspace_sequence():
+            boxes.last.click()
+            for _ in range(self.length):
+                self.page.keyboard.press("Backspace")
+            self._expect_value("")
+
+        try:
+            run_strategies(self.page, f"{self.name}.clear", [
+                ("set_all_empty", set_all_empty),
+                ("backspace_sequence", backspace_sequence),
+            ])
+        except StrategyResolutionError as e:
+            raise OtpEntryError(f"OTP fields could not be cleared: {e.__cause__}") from e
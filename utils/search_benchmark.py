@@ -0,0 +1,245 @@
+"""
+Search Benchmark
+Measures search latency the way a user feels it: from the last keystroke to the results being rendered.
+Timestamps are taken inside the page (keyboard/input events, a MutationObserver on the results and the
+Resource Timing entry of the matching API request), so Playwright round trips and slow_mo do not count.
+Runs are saved under metrics/search_benchmark/ and compared with the previous run.
+"""
+
+import re
+from dataclasses import dataclass
+from typing import Callable, Dict, List, Optional
+from urllib.parse import unquote_plus
+from playwright.sync_api import Page, Locator
+from utils.config import (SEARCH_BENCH_TRIALS, SEARCH_BENCH_QUIET_MS, SEARCH_BENCH_TIMEOUT, SEARCH_BENCH_KEY_DELAY,
+                          SEARCH_BENCH_REGRESSION)
+from utils.metrics_export import summarize, save_benchmark_run, load_latest_benchmark_run
+
+SEARCH_BENCH_DIR = "search_benchmark"
+
+# Term that no search should match
+NO_HIT_TERM = "zqxjvw"
+
+# Starts a measurement: records the last keyboard/input/click event and every DOM mutation (page clock)
+INSTALL_SCRIPT = """
+() => {
+    const previous = window.__searchBench;
+    if (previous) {
+        previous.observer.disconnect();
+        ['keydown', 'input', 'click'].forEach((type) => document.removeEventListener(type, previous.onEvent, true));
+    }
+    const bench = { lastEvent: null, mutations: [] };
+    bench.observer = new MutationObserver(() => bench.mutations.push(performance.now()));
+    bench.observer.observe(document.body, { childList: true, subtree: true, characterData: true });
+    bench.onEvent = () => { bench.lastEvent = performance.now(); bench.mutations = []; };
+    ['keydown', 'input', 'click'].forEach((type) => document.addEventListener(type, bench.onEvent, true));
+    performance.clearResourceTimings();
+    window.__searchBench = bench;
+}
+"""
+
+# True once the DOM has been quiet for `quiet` ms after a mutation that followed the last event
+SETTLED_SCRIPT = """
+(quiet) => {
+    const bench = window.__searchBench;
+    if (!bench || bench.lastEvent === null || !bench.mutations.length) return false;
+    return performance.now() - bench.mutations[bench.mutations.length - 1] >= quiet;
+}
+"""
+
+READ_SCRIPT = """
+() => {
+    const bench = window.__searchBench;
+    const resources = performance.getEntriesByType('resource')
+        .filter((entry) => ['fetch', 'xmlhttprequest'].includes(entry.initiatorType))
+        .map((entry) => ({ name: entry.name, start: entry.startTime, end: entry.responseEnd }));
+    return { lastEvent: bench.lastEvent, mutations: bench.mutations, resources };
+}
+"""
+
+
+@dataclass
+class SearchTarget:
+    """A search box to benchmark and how to read its result count"""
+    name: str
+    search_input: Locator
+    results: Locator
+    submit: Optional[Callable[[], None]] = None  # None: search-as-you-type (debounced)
+
+
+def _term_variants(hit_term: str) -> List[Dict]:
+    """Hit terms of increasing length (prefixes of a known hit) plus a no-hit term"""
+    lengths = sorted({1, 3, len(hit_term)} & set(range(1, len(hit_term) + 1)))
+    return ([{"term": hit_term[:length], "kind": "hit"} for length in lengths]
+            + [{"term": NO_HIT_TERM, "kind": "no_hit"}])
+
+
+def pick_hit_term(results: Locator, min_length: int = 4) -> Optional[str]:
+    """A term that matches: the first word of the first result with at least `min_length` letters"""
+    if results.count() == 0:
+        return None
+    words = re.findall(rf"[A-Za-z]{{{min_length},}}", results.first.inner_text())
+    return words[0] if words else None
+
+
+class SearchBenchmark:
+    """
+    Repeated search trials with statistical summaries per target, dataset, term kind and term length
+    """
+
+    def __init__(self, trials: int = SEARCH_BENCH_TRIALS, quiet_ms: int = SEARCH_BENCH_QUIET_MS,
+                 timeout: int = SEARCH_BENCH_TIMEOUT):
+        """
+        Initialize benchmark
+
+        Args:
+            trials: Trials per term
+            quiet_ms: DOM quiet window after which results count as rendered
+            timeout: Max wait in ms for results to render
+        """
+        self.trials = trials
+        self.quiet_ms = quiet_ms
+        self.timeout = timeout
+        self.samples: List[Dict] = []
+
+    def _clear(self, page: Page, target: SearchTarget):
+        """Empty the search box and let the unfiltered list settle"""
+        if not target.search_input.input_value():
+            return
+        page.evaluate(INSTALL_SCRIPT)
+        target.search_input.fill("")
+        if target.submit:
+            target.submit()
+        try:
+            page.wait_for_function(SETTLED_SCRIPT, arg=self.quiet_ms, timeout=self.timeout)
+        except Exception:
+            pass  # Nothing re-rendered
+
+    def measure(self, page: Page, target: SearchTarget, term: str) -> Dict:
+        """
+        One trial: type the term, wait until the results settle and read the in-page timestamps
+
+        Returns:
+            dict: render_ms (last event -> results rendered), api_wait_ms (last event -> matching request start,
+                  i.e. the debounce), api_ms (matching request duration), render_after_api_ms, results
+        """
+        self._clear(page, target)
+        page.evaluate(INSTALL_SCRIPT)
+        target.search_input.press_sequentially(term, delay=SEARCH_BENCH_KEY_DELAY)
+        if target.submit:
+            target.submit()
+
+        timed_out = False
+        try:
+            page.wait_for_function(SETTLED_SCRIPT, arg=self.quiet_ms, timeout=self.timeout)
+        except Exception:
+            timed_out = True
+        data = page.evaluate(READ_SCRIPT)
+
+        last_event = data["lastEvent"]
+        matching = [r for r in data["resources"] if last_event is not None and r["start"] >= last_event
+                    and term.lower() in unquote_plus(r["name"]).lower()]
+        api = matching[0] if matching else None
+        mutations = [t for t in data["mutations"] if api is None or t >= api["end"]]
+        render = mutations[-1] if mutations and not timed_out else None
+        return {
+            "render_ms": round(render - last_event, 1) if render is not None else None,
+            "api_wait_ms": round(api["start"] - last_event, 1) if api else None,
+            "api_ms": round(api["end"] - api["start"], 1) if api else None,
+            "render_after_api_ms": round(render - api["end"], 1) if api and render is not None else None,
+            "results": target.results.count(),
+            "timed_out": timed_out,
+        }
+
+    def run_target(self, page: Page, target: SearchTarget, hit_term: str, dataset: str = "default") -> List[Dict]:
+        """
+        Benchmark one search box: prefixes of a known hit term and a no-hit term, `trials` times each
+
+        Args:
+            page: Playwright page object (already on the list page)
+            target: Search box to benchmark
+            hit_term: A term known to match at least one record
+            dataset: Label of the data set (e.g. the agency); the unfiltered result count is recorded as its size
+
+        Returns:
+            list: Samples of this target
+        """
+        self._clear(page, target)
+        dataset_size = target.results.count()
+        samples = []
+        for variant in _term_variants(hit_term):
+            for trial in range(self.trials):
+                sample = self.measure(page, target, variant["term"])
+                sample.update({"target": target.name, "dataset": dataset, "dataset_size": dataset_size,
+                               "term": variant["term"], "kind": variant["kind"],
+                               "term_length": len(variant["term"]), "trial": trial})
+                samples.append(sample)
+        self._clear(page, target)
+        self.samples.extend(samples)
+        rendered = [s["render_ms"] for s in samples if s["render_ms"] is not None]
+        print(f"⏱️ {target.name} ({dataset}, {dataset_size} rows): {len(samples)} trials, "
+              f"median render {summarize(rendered)['p50'] or 0:.0f}ms")
+        return samples
+
+    def summary(self) -> Dict[str, Dict]:
+        """
+        Statistics per target/dataset/kind/term length
+
+        Returns:
+            dict: {"target|dataset|kind|length": {"render_ms": {...}, "api_wait_ms": {...}, "api_ms": {...},
+                   "timeouts": n, "unexpected_results": n}}
+        """
+        groups: Dict[str, List[Dict]] = {}
+        for sample in self.samples:
+            key = f"{sample['target']}|{sample['dataset']}|{sample['kind']}|{sample['term_length']}"
+            groups.setdefault(key, []).append(sample)
+        summary = {}
+        for key, samples in groups.items():
+            summary[key] = {
+                metric: summarize([s[metric] for s in samples if s[metric] is not None])
+                for metric in ("render_ms", "api_wait_ms", "api_ms", "render_after_api_ms")
+            }
+            summary[key]["timeouts"] = sum(1 for s in samples if s["timed_out"])
+            summary[key]["unexpected_results"] = sum(
+                1 for s in samples if (s["kind"] == "hit") != (s["results"] > 0))
+        return summary
+
+    def save(self, export_dir: str = None) -> str:
+        """Save this run (samples and summary) as metrics/search_benchmark/run_<timestamp>.json"""
+        return save_benchmark_run(SEARCH_BENCH_DIR, {"trials": self.trials, "quiet_ms": self.quiet_ms,
+                                                     "summary": self.summary(), "samples": self.samples}, export_dir)
+
+    def compare(self, baseline: Dict, threshold: float = SEARCH_BENCH_REGRESSION) -> List[str]:
+        """
+        Compare median render time with a previous run
+
+        Args:
+            baseline: A saved run (see load_previous_run)
+            threshold: Relative increase of the median reported as a regression (0.2 = 20%)
+
+        Returns:
+            list: Regression descriptions
+        """
+        regressions = []
+        for key, stats in self.summary().items():
+            before = baseline.get("summary", {}).get(key, {}).get("render_ms", {}).get("p50")
+            now = stats["render_ms"]["p50"]
+            if before and now and now > before * (1 + threshold):
+                regressions.append(f"{key}: median render {before:.0f}ms -> {now:.0f}ms (+{(now / before - 1) * 100:.0f}%)")
+        return regressions
+
+    def format_report(self) -> str:
+        """Human-readable summary of the run"""
+        lines = ["⏱️ Search latency (last keystroke -> results rendered)",
+                 f"   {'target|dataset|kind|length':<44}{'p50':>7}{'p95':>7}{'p99':>7}{'debounce':>10}{'api':>7}{'t/o':>5}"]
+        fmt = lambda value: f"{value:.0f}" if value is not None else "-"
+        for key, stats in sorted(self.summary().items()):
+            render = stats["render_ms"]
+            lines.append(f"   {key:<44}{fmt(render['p50']):>7}{fmt(render['p95']):>7}{fmt(render['p99']):>7}"
+                         f"{fmt(stats['api_wait_ms']['p50']):>10}{fmt(stats['api_ms']['p50']):>7}{stats['timeouts']:>5}")
+        return "\n".join(lines)
+
+
+def load_previous_run(export_dir: str = None) -> Optional[Dict]:
+    """Latest saved search benchmark run, or None (load it before saving the current one)"""
+    return load_latest_benchmark_run(SEARCH_BENCH_DIR, export_dir)
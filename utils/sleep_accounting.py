@@ -0,0 +1,252 @@
+"""
+Sleep Accounting
+Intercepts time.sleep and Page/Frame.wait_for_timeout, attributes every slept millisecond to the calling
+site (file, line, function) and the running test, reports the top sleep sites per run and enforces a
+per-test sleep budget. Each run is saved to metrics/sleep_accounting.json and compared with the previous
+run, so removed dead time shows up as a shrinking total.
+"""
+
+import json
+import os
+import sys
+import time
+from typing import Dict, List, Optional
+from utils.config import SLEEP_REPORT_TOP
+from utils.metrics_export import get_metrics_path
+
+SLEEP_REPORT_FILE = "sleep_accounting.json"
+
+# Key of the per-test sleep data attached to the teardown report (travels from xdist workers to the controller)
+SLEEP_PROPERTY = "sleep_accounting"
+
+# Sleeps outside a test (collection, session fixtures)
+SESSION = "<session>"
+
+_original_sleep = time.sleep
+
+
+class SleepBudgetExceeded(AssertionError):
+    """Failure reason of a test that slept longer than its budget"""
+
+
+def _caller_site() -> str:
+    """First frame outside this module and Playwright, as "path:line in function" relative to the working dir"""
+    frame = sys._getframe(2)
+    while frame is not None:
+        filename = frame.f_code.co_filename
+        if filename != __file__ and f"{os.sep}playwright{os.sep}" not in filename:
+            break
+        frame = frame.f_back
+    if frame is None:
+        return "<unknown>"
+    path = os.path.relpath(frame.f_code.co_filename)
+    if path.startswith(".."):
+        path = frame.f_code.co_filename
+    return f"{path.replace(os.sep, '/')}:{frame.f_lineno} in {frame.f_code.co_name}"
+
+
+class SleepAccountant:
+    """
+    Records sleeps of the current process per test and site, and aggregates the per-test reports of the run
+    """
+
+    def __init__(self, budget: Optional[float] = None, mode: str = "warn"):
+        """
+        Initialize accountant
+
+        Args:
+            budget: Default per-test sleep budget in seconds (None: no budget, only reporting)
+            mode: "warn" reports tests over budget, "fail" fails them
+        """
+        self.budget = budget
+        self.mode = mode
+        self.current = SESSION
+        self._recorded: Dict[str, Dict[str, List]] = {}  # {nodeid: {site: [count, ms]}} of this process
+        self.tests: Dict[str, float] = {}                # {nodeid: slept ms} of the whole run
+        self.sites: Dict[str, Dict] = {}                 # {site: {"count", "ms", "tests"}} of the whole run
+        self.over_budget: List[tuple] = []               # (nodeid, slept ms, budget ms)
+        self._patched = []
+
+    # ===== INTERCEPTION =====
+
+    def install(self):
+        """Patch time.sleep and Page/Frame.wait_for_timeout"""
+        if self._patched:
+            return
+        from playwright.sync_api import Page, Frame
+        accountant = self
+
+        def sleep(seconds):
+            accountant.record(seconds * 1000, "time.sleep")
+            return _original_sleep(seconds)
+
+        time.sleep = sleep
+        self._patched.append((time, "sleep", _original_sleep))
+        for cls in (Page, Frame):
+            original = cls.wait_for_timeout
+
+            def wait_for_timeout(page_or_frame, timeout, _original=original):
+                accountant.record(timeout, "wait_for_timeout")
+                return _original(page_or_frame, timeout)
+
+            cls.wait_for_timeout = wait_for_timeout
+            self._patched.append((cls, "wait_for_timeout", original))
+
+    def uninstall(self):
+        """Restore the original functions"""
+        for owner, name, original in reversed(self._patched):
+            setattr(owner, name, original)
+        self._patched.clear()
+
+    def record(self, ms: float, kind: str):
+        """Attribute a sleep to the calling site and the current test"""
+        if ms <= 0:
+            return
+        site = f"{_caller_site()} [{kind}]"
+        entry = self._recorded.setdefault(self.current, {}).setdefault(site, [0, 0.0])
+        entry[0] += 1
+        entry[1] += ms
+
+    # ===== PER TEST =====
+
+    def start_test(self, nodeid: str):
+        """Attribute following sleeps to a test"""
+        self.current = nodeid
+
+    def finish_test(self):
+        """Attribute following sleeps to the session again"""
+        self.current = SESSION
+
+    def slept_ms(self, nodeid: str) -> float:
+        """Sleep recorded for a test so far in this process"""
+        return sum(ms for _, ms in self._recorded.get(nodeid, {}).values())
+
+    def budget_ms(self, item) -> Optional[float]:
+        """Budget of a test: its sleep_budget(seconds) marker, else the default budget"""
+        marker = item.get_closest_marker("sleep_budget")
+        budget = marker.args[0] if marker and marker.args else self.budget
+        return budget * 1000 if budget is not None else None
+
+    def check_budget(self, item, report):
+        """
+        Check the sleep of a test (setup + call) against its budget when the call report is made
+
+        In "fail" mode a passed test over budget is turned into a failure.
+        """
+        if report.when != "call":
+            return
+        budget = self.budget_ms(item)
+        slept = self.slept_ms(item.nodeid)
+        if budget is None or slept <= budget:
+            return
+        message = f"slept {slept / 1000:.1f}s, budget {budget / 1000:.1f}s"
+        if self.mode == "fail" and report.passed:
+            report.outcome = "failed"
+            report.longrepr = f"{SleepBudgetExceeded.__name__}: {item.nodeid} {message}\n{self.format_test_sites(item.nodeid)}"
+        else:
+            print(f"\n⚠️ Sleep budget exceeded: {item.nodeid} {message}")
+
+    def attach(self, item, report):
+        """Attach the test's sleep data to its teardown report"""
+        if report.when != "teardown":
+            return
+        sites = self._recorded.pop(item.nodeid, {})
+        report.user_properties.append((SLEEP_PROPERTY, {"budget_ms": self.budget_ms(item), "sites": sites}))
+
+    def format_test_sites(self, nodeid: str, limit: int = 5) -> str:
+        """Top sleep sites of one test (this process)"""
+        sites = sorted(self._recorded.get(nodeid, {}).items(), key=lambda entry: entry[1][1], reverse=True)
+        return "\n".join(f"   {ms / 1000:7.1f}s {count:>4}x  {site}" for site, (count, ms) in sites[:limit])
+
+    # ===== RUN =====
+
+    def collect(self, report):
+        """Aggregate the sleep data of a teardown report (called from pytest_runtest_logreport)"""
+        data = dict(report.user_properties).get(SLEEP_PROPERTY) if report.when == "teardown" else None
+        if data is None:
+            return
+        total = 0.0
+        for site, (count, ms) in data["sites"].items():
+            entry = self.sites.setdefault(site, {"count": 0, "ms": 0.0, "tests": set()})
+            entry["count"] += count
+            entry["ms"] += ms
+            entry["tests"].add(report.nodeid)
+            total += ms
+        self.tests[report.nodeid] = total
+        if data["budget_ms"] is not None and total > data["budget_ms"]:
+            self.over_budget.append((report.nodeid, total, data["budget_ms"]))
+
+    def total_ms(self) -> float:
+        """Sleep of all tests of the run"""
+        return sum(self.tests.values())
+
+    def top_sites(self, limit: int = SLEEP_REPORT_TOP) -> List[tuple]:
+        """Sites with the most slept time as (site, entry)"""
+        return sorted(self.sites.items(), key=lambda entry: entry[1]["ms"], reverse=True)[:limit]
+
+    def top_tests(self, limit: int = SLEEP_REPORT_TOP) -> List[tuple]:
+        """Tests with the most slept time as (nodeid, ms)"""
+        return sorted(self.tests.items(), key=lambda entry: entry[1], reverse=True)[:limit]
+
+    def save(self, export_dir: str = None) -> str:
+        """Write this run to metrics/sleep_accounting.json (replacing the previous run)"""
+        path = get_metrics_path(SLEEP_REPORT_FILE, export_dir)
+        data = {
+            "timestamp": time.time(),
+            "total_ms": round(self.total_ms()),
+            "tests": {nodeid: round(ms) for nodeid, ms in self.tests.items()},
+            "sites": {site: {"count": entry["count"], "ms": round(entry["ms"]), "tests": len(entry["tests"])}
+                      for site, entry in self.sites.items()},
+        }
+        with open(path, "w", encoding="utf-8") as f:
+            json.dump(data, f, indent=1, sort_keys=True)
+        return path
+
+
+def load_previous_run(export_dir: str = None) -> Optional[Dict]:
+    """Last saved sleep accounting run, or None"""
+    path = get_metrics_path(SLEEP_REPORT_FILE, export_dir)
+    if not os.path.exists(path):
+        return None
+    try:
+        with open(path, "r", encoding="utf-8") as f:
+            return json.load(f)
+    except (OSError, ValueError) as e:
+        print(f"⚠️ Could not read previous sleep accounting {path}: {e}")
+        return None
+
+
+def create_sleep_accountant(config) -> Optional[SleepAccountant]:
+    """Accountant for --sleep-report / --sleep-budget (installed), or None when neither is given"""
+    budget = config.getoption("--sleep-budget")
+    if not config.getoption("--sleep-report") and budget is None:
+        return None
+    accountant = SleepAccountant(budget=budget, mode=config.getoption("--sleep-budget-mode"))
+    accountant.install()
+    return accountant
+
+
+def print_sleep_summary(terminalreporter, accountant: Optional[SleepAccountant]):
+    """Terminal summary: total sleep vs the previous run, top sites, top tests, tests over budget"""
+    if accountant is None or not accountant.tests:
+        return
+    previous = load_previous_run()
+    total = accountant.total_ms()
+    terminalreporter.write_sep("=", "Sleep accounting")
+    line = f"Total sleep: {total / 1000:.1f}s in {len(accountant.tests)} tests"
+    if previous and previous.get("total_ms"):
+        delta = total - previous["total_ms"]
+        line += f" ({'+' if delta >= 0 else '-'}{abs(delta) / 1000:.1f}s vs previous run)"
+    terminalreporter.write_line(line)
+    terminalreporter.write_line("Top sleep sites:")
+    for site, entry in accountant.top_sites():
+        terminalreporter.write_line(f"   {entry['ms'] / 1000:8.1f}s {entry['count']:>5}x {len(entry['tests']):>4} tests  {site}")
+    terminalreporter.write_line("Top sleeping tests:")
+    for nodeid, ms in accountant.top_tests(10):
+        terminalreporter.write_line(f"   {ms / 1000:8.1f}s  {nodeid}")
+    if accountant.over_budget:
+        verb = "failed" if accountant.mode == "fail" else "warned"
+        terminalreporter.write_line(f"Over sleep budget ({verb}):")
+        for nodeid, slept, budget in accountant.over_budget:
+            terminalreporter.write_line(f"   {slept / 1000:8.1f}s > {budget / 1000:.1f}s  {nodeid}")
+    terminalreporter.write_line(f"📊 Sleep accounting written to {accountant.save()}")
@@ -0,0 +1,174 @@
+"""
+Step Checkpoints
+Long multi-step tests declare named steps; after every completed step the flow saves a checkpoint (the
+test's JSON state, the browser storage state and the page URL) under metrics/step_checkpoints/. A retry of
+the failed test - a --flaky-reruns attempt or the next run - skips the completed steps, restores the session
+and URL of the last good checkpoint and continues from the failed step instead of from login.
+"""
+
+import copy
+import json
+import os
+import re
+import time
+from typing import Callable, Dict, List, Optional
+from playwright.sync_api import Page
+from utils.config import STEP_CHECKPOINT_DIR, STEP_CHECKPOINT_TTL
+from utils.metrics_export import get_metrics_path
+
+# Restores localStorage of the checkpoint's origins once per tab (the app keeps writing it afterwards)
+RESTORE_STORAGE_SCRIPT = """
+(origins) => {
+    if (sessionStorage.getItem('__bprpRestored')) return;
+    const origin = origins.find((entry) => entry.origin === location.origin);
+    if (!origin) return;
+    origin.localStorage.forEach(({ name, value }) => localStorage.setItem(name, value));
+    sessionStorage.setItem('__bprpRestored', '1');
+}
+"""
+
+
+def checkpoint_path(test_id: str, checkpoint_dir: str = None) -> str:
+    """Checkpoint file of a test (node id reduced to a file name)"""
+    directory = checkpoint_dir or get_metrics_path(STEP_CHECKPOINT_DIR)
+    os.makedirs(directory, exist_ok=True)
+    return os.path.join(directory, re.sub(r"[^A-Za-z0-9_.-]+", "_", test_id) + ".json")
+
+
+class StepFlow:
+    """
+    Runs the named steps of one test and resumes a retry after the last completed step
+    """
+
+    def __init__(self, page: Page, test_id: str, resume: bool = True, checkpoint_dir: str = None):
+        """
+        Initialize flow
+
+        Args:
+            page: Playwright page object
+            test_id: Test node id (one checkpoint per test)
+            resume: Resume from a checkpoint left by a failed attempt (False: start over)
+            checkpoint_dir: Directory of the checkpoint files (default metrics/step_checkpoints)
+        """
+        self.page = page
+        self.path = checkpoint_path(test_id, checkpoint_dir)
+        self.state: Dict = {}
+        self.completed: List[Dict] = []       # {"name", "ms"} of the steps done so far
+        self._resumed: List[Dict] = []        # Completed steps of the checkpoint not yet passed again
+        self.failed_before: Optional[str] = None
+        self.retrying = False                 # True while running the step that failed in the previous attempt
+        self._checkpoint: Optional[Dict] = None
+        self._restore_pending = False
+        if resume:
+            self._load()
+        elif os.path.exists(self.path):
+            os.remove(self.path)
+
+    def _load(self):
+        """Read a fresh checkpoint of an earlier failed attempt"""
+        if not os.path.exists(self.path):
+            return
+        try:
+            with open(self.path, "r", encoding="utf-8") as f:
+                checkpoint = json.load(f)
+        except (OSError, ValueError) as e:
+            print(f"⚠️ Ignoring unreadable step checkpoint {self.path}: {e}")
+            return
+        if time.time() - checkpoint.get("time", 0) > STEP_CHECKPOINT_TTL:
+            print(f"⚠️ Ignoring step checkpoint older than {STEP_CHECKPOINT_TTL}s - starting over")
+            return
+        self._checkpoint = checkpoint
+        self._resumed = list(checkpoint["completed"])
+        self.failed_before = checkpoint.get("failed")
+
+    def _restore(self):
+        """Bring the browser back to the last checkpoint: cookies, localStorage and URL"""
+        checkpoint = self._checkpoint
+        storage = checkpoint.get("storage_state") or {}
+        if storage.get("cookies"):
+            self.page.context.add_cookies(storage["cookies"])
+        if storage.get("origins"):
+            self.page.context.add_init_script(f"({RESTORE_STORAGE_SCRIPT.strip()})({json.dumps(storage['origins'])})")
+        if checkpoint.get("url"):
+            self.page.goto(checkpoint["url"])
+        saved_ms = sum(step["ms"] for step in self.completed)
+        print(f"⏭️ Resumed after step '{self.completed[-1]['name']}' - skipped {len(self.completed)} steps "
+              f"(~{saved_ms / 1000:.0f}s)")
+
+    def _save(self):
+        """Write the checkpoint after the last completed step"""
+        checkpoint = {"time": time.time(), "completed": list(self.completed), "failed": None,
+                      "state": copy.deepcopy(self.state),
+                      "storage_state": self.page.context.storage_state(), "url": self.page.url}
+        with open(self.path, "w", encoding="utf-8") as f:
+            json.dump(checkpoint, f, indent=1)
+        self._checkpoint = checkpoint
+
+    def _save_failure(self, name: str):
+        """Record the failed step in the checkpoint; session and URL stay those of the last good step"""
+        if not self._checkpoint:
+            return  # First step failed - nothing to resume from
+        self._checkpoint["failed"] = name
+        self._checkpoint["time"] = time.time()
+        with open(self.path, "w", encoding="utf-8") as f:
+            json.dump(self._checkpoint, f, indent=1)
+
+    def run(self, name: str, action: Callable[[Dict], Optional[Dict]]) -> bool:
+        """
+        Run a step, or skip it when a checkpoint shows it completed in an earlier attempt
+
+        Args:
+            name: Step name (unique within the test; resuming matches steps by name and order)
+            action: Called with the flow state; returns updates of the state (JSON serialisable) or None
+
+        Returns:
+            bool: True when the step ran, False when it was skipped
+        """
+        if self._resumed:
+            if self._resumed[0]["name"] == name:
+                self.completed.append(self._resumed.pop(0))
+                if not self._resumed:
+                    self.state = dict(self._checkpoint.get("state") or {})
+                    self._restore_pending = True
+                return False
+            skipped = bool(self.completed)
+            self.clear()
+            self._resumed, self._checkpoint, self.failed_before = [], None, None
+            if skipped:
+                raise RuntimeError(f"Steps changed since the checkpoint (got '{name}' after "
+                                   f"'{self.completed[-1]['name']}') - checkpoint deleted, re-run to start over")
+            print("⚠️ Steps changed since the checkpoint - starting over")
+        if self._restore_pending:
+            self._restore()
+            self._restore_pending = False
+
+        self.retrying = name == self.failed_before
+        print(f"▶️ Step: {name}" + (" (failed in the previous attempt)" if self.retrying else ""))
+        start = time.time()
+        try:
+            updates = action(self.state)
+            if updates:
+                try:
+                    json.dumps(updates)
+                except TypeError as e:
+                    raise TypeError(f"State of step '{name}' must be JSON serialisable: {e}") from e
+                self.state.update(updates)
+        except BaseException:
+            self._save_failure(name)
+            raise
+        self.completed.append({"name": name, "ms": round((time.time() - start) * 1000)})
+        self.retrying = False
+        self._save()
+        return True
+
+    def clear(self):
+        """Delete the checkpoint (the test passed)"""
+        if os.path.exists(self.path):
+            os.remove(self.path)
+
+    def format_timings(self) -> str:
+        """Human-readable per-step timings"""
+        lines = ["⏱️ Step timings"]
+        for step in self.completed:
+            lines.append(f"   {step['name']:<32}{step['ms']:>8}ms")
+        return "\n".join(lines)
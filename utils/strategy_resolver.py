@@ -0,0 +1,217 @@
+"""
+Strategy Resolver
+Interactions declare their ordered fallback strategies once; the first strategy that works is memoized per
+interaction and route for the run, so later calls go straight to it instead of paying the timeouts of the
+strategies that never work. Records which fallbacks are ever used.
+"""
+
+import time
+from functools import reduce
+from typing import Callable, Dict, List, Tuple
+from playwright.sync_api import Page, Locator
+from utils.network_observer import to_route_template
+
+RESOLVE_TIMEOUT = 5000  # Max wait for any candidate of a locator chain to become usable
+
+# Winning strategy per (interaction, route): {(interaction, route): strategy name}
+_resolved: Dict[Tuple[str, str], str] = {}
+
+# Usage statistics: {interaction: {strategy name: {"used": n, "failed": n}}}
+_stats: Dict[str, Dict[str, Dict[str, int]]] = {}
+
+# Declared strategy order per interaction (first one is the primary)
+_declared: Dict[str, List[str]] = {}
+
+# Report property carrying a test's statistics to the controller (xdist workers keep their own module state)
+STRATEGY_PROPERTY = "strategy_resolver"
+
+# Usage statistics not yet attached to a test report (shape of _stats)
+_unreported: Dict[str, Dict[str, Dict[str, int]]] = {}
+
+# Statistics merged from the reports of all workers (shape of get_strategy_stats)
+_collected: Dict[str, Dict] = {}
+
+
+class StrategyResolutionError(Exception):
+    """Raised when none of an interaction's strategies works"""
+
+
+def _route(page: Page) -> str:
+    """Route template of the page's current URL (ids collapsed, so all detail pages share an entry)"""
+    return to_route_template(page.url)
+
+
+def _count(interaction: str, strategy: str, outcome: str):
+    """Update the usage statistics"""
+    for stats in (_stats, _unreported):
+        stats.setdefault(interaction, {}).setdefault(strategy, {"used": 0, "failed": 0})[outcome] += 1
+
+
+def run_strategies(page: Page, interaction: str, strategies: List[Tuple[str, Callable]]):
+    """
+    Run an interaction with ordered fallbacks, starting with the strategy memoized for this route
+
+    Args:
+        page: Playwright page object (its route scopes the memo)
+        interaction: Name of the interaction (e.g. "jd.upload_jd_file")
+        strategies: Ordered (name, callable) pairs; a strategy fails by raising
+
+    Returns:
+        Result of the first strategy that succeeded
+
+    Raises:
+        StrategyResolutionError: Every strategy failed (chained to the last error)
+    """
+    _declared.setdefault(interaction, [name for name, _ in strategies])
+    key = (interaction, _route(page))
+    memoized = _resolved.get(key)
+    ordered = sorted(strategies, key=lambda s: s[0] != memoized) if memoized else list(strategies)
+
+    last_error = None
+    for name, strategy in ordered:
+        try:
+            result = strategy()
+        except Exception as e:
+            last_error = e
+            _count(interaction, name, "failed")
+            if name == memoized:
+                print(f"⚠️ Memoized strategy '{name}' of {interaction} stopped working, re-resolving")
+                _resolved.pop(key, None)
+            continue
+        _count(interaction, name, "used")
+        if name != memoized:
+            _resolved[key] = name
+        return result
+    raise StrategyResolutionError(f"No strategy of {interaction} worked on {key[1]}") from last_error
+
+
+def resolve_locator(page: Page, interaction: str, candidates: List[Tuple[str, Locator]],
+                    accept: Callable[[Locator], bool] = None, timeout: int = RESOLVE_TIMEOUT) -> Locator:
+    """
+    Pick the first usable locator of an ordered candidate list, memoized per route
+
+    The first resolution waits once for any candidate (instead of one timeout per candidate), then takes the
+    first candidate in declared order that is accepted.
+
+    Args:
+        page: Playwright page object
+        interaction: Name of the interaction (e.g. "company.website_input")
+        candidates: Ordered (name, Locator) pairs
+        accept: Check of a candidate (default: its first match is visible)
+        timeout: Max wait in ms for a candidate to appear
+
+    Returns:
+        Locator: The chosen candidate
+
+    Raises:
+        StrategyResolutionError: No candidate became usable within the timeout
+    """
+    accept = accept or (lambda locator: locator.first.is_visible())
+    _declared.setdefault(interaction, [name for name, _ in candidates])
+    key = (interaction, _route(page))
+    by_name = dict(candidates)
+
+    memoized = _resolved.get(key)
+    if memoized in by_name:
+        locator = by_name[memoized]
+        try:
+            locator.first.wait_for(state="visible", timeout=timeout)
+            if accept(locator):
+                _count(interaction, memoized, "used")
+                return locator
+        except Exception:
+            pass
+        _count(interaction, memoized, "failed")
+        _resolved.pop(key, None)
+        print(f"⚠️ Memoized locator '{memoized}' of {interaction} stopped working, re-resolving")
+
+    start = time.time()
+    any_candidate = reduce(lambda a, b: a.or_(b), [locator for _, locator in candidates])
+    try:
+        any_candidate.first.wait_for(state="visible", timeout=timeout)
+    except Exception as e:
+        raise StrategyResolutionError(f"No candidate of {interaction} became visible within {timeout}ms") from e
+
+    for name, locator in candidates:
+        try:
+            if accept(locator):
+                _resolved[key] = name
+                _count(interaction, name, "used")
+                print(f"🧭 {interaction}: using '{name}' on {key[1]} (resolved in {time.time() - start:.2f}s)")
+                return locator
+        except Exception:
+            pass
+        _count(interaction, name, "failed")
+    raise StrategyResolutionError(f"No candidate of {interaction} was accepted on {key[1]}")
+
+
+def get_strategy_stats() -> Dict[str, Dict]:
+    """
+    Usage statistics per interaction
+
+    Returns:
+        dict: {interaction: {"declared": [names], "strategies": {name: {"used", "failed"}}, "routes": {route: winner}}}
+    """
+    stats = {}
+    for interaction, strategies in _stats.items():
+        stats[interaction] = {
+            "declared": list(_declared.get(interaction, [])),
+            "strategies": {name: dict(counts) for name, counts in strategies.items()},
+            "routes": {route: name for (key, route), name in _resolved.items() if key == interaction},
+        }
+    return stats
+
+
+def attach_strategy_stats(report):
+    """Attach the statistics recorded since the previous test to a teardown report"""
+    if report.when != "teardown" or not _unreported:
+        return
+    report.user_properties.append((STRATEGY_PROPERTY, {
+        interaction: {
+            "declared": list(_declared.get(interaction, [])),
+            "strategies": strategies,
+            "routes": {route: name for (key, route), name in _resolved.items() if key == interaction},
+        } for interaction, strategies in _unreported.items()
+    }))
+    _unreported.clear()
+
+
+def collect_strategy_stats(report):
+    """Merge the statistics of a teardown report (called from pytest_runtest_logreport, on the xdist controller)"""
+    data = dict(report.user_properties).get(STRATEGY_PROPERTY) if report.when == "teardown" else None
+    if not data:
+        return
+    for interaction, reported in data.items():
+        stats = _collected.setdefault(interaction, {"declared": reported["declared"], "strategies": {}, "routes": {}})
+        for name, counts in reported["strategies"].items():
+            merged = stats["strategies"].setdefault(name, {"used": 0, "failed": 0})
+            for outcome, count in counts.items():
+                merged[outcome] += count
+        stats["routes"].update(reported["routes"])
+
+
+def print_strategy_summary(terminalreporter):
+    """Terminal summary of interactions whose primary strategy failed or whose fallbacks were used (all workers)"""
+    lines = []
+    for interaction, stats in sorted(_collected.items()):
+        primary = stats["declared"][0] if stats["declared"] else None
+        fallbacks = {name: counts for name, counts in stats["strategies"].items()
+                     if name != primary and counts["used"]}
+        primary_failed = stats["strategies"].get(primary, {}).get("failed", 0)
+        if not fallbacks and not primary_failed:
+            continue
+        used = ", ".join(f"{name} x{counts['used']}" for name, counts in fallbacks.items()) or "none"
+        lines.append(f"{interaction}: primary '{primary}' failed {primary_failed}x, fallbacks used: {used}")
+    if lines:
+        terminalreporter.write_sep("=", "Fallback strategies")
+        for line in lines:
+            terminalreporter.write_line(line)
+
+
+def reset_strategies():
+    """Forget memoized strategies and statistics"""
+    _resolved.clear()
+    _stats.clear()
+    _declared.clear()
+    _unreported.clear()
+    _collected.clear()
@@ -9,17 +9,21 @@ import re
 from playwright.sync_api import Page
 from pages.talent_page import TalentPage
 from utils.login_helper import do_login
+from utils.tenant_pool import current_tenant
 from utils.enhanced_assertions import enhanced_assert_visible
+from utils.form_fill import FormFiller
+from utils.form_schemas import TALENT_FORM
 
 class TalentHelper:
     def __init__(self, page: Page):
         self.page = page
         self.talent_page = TalentPage(page)
     
-    def do_talent_login(self, email: str, password: str):
-        """Login and navigate to talent section."""
+    def do_talent_login(self, email: str = None, password: str = None):
+        """Login and navigate to talent section (default: the tenant's company account)."""
         # Use existing login helper
-        do_login(self.page, email, password)
+        account = current_tenant().account("company")
+        do_login(self.page, email or account["email"], password or account["password"])
         time.sleep(3)
         
         # Click on "For Talent Only" agency card
@@ -148,17 +152,8 @@ class TalentHelper:
         # Open create talent modal
         self.talent_page.click_add_new_talent()
         
-        # Fill required fields
-        self.talent_page.fill_first_name(talent_data['first_name'])
-        self.talent_page.fill_last_name(talent_data['last_name'])
-        self.talent_page.select_gender(talent_data['gender'])
-        self.talent_page.select_job_title(talent_data['job_title'])
-        self.talent_page.fill_date_of_birth(talent_data['date_of_birth'])
-        self.talent_page.select_japanese_level(talent_data['japanese_level'])
-        self.talent_page.select_english_level(talent_data['english_level'])
-        self.talent_page.select_location(talent_data['location'])
-        self.talent_page.fill_cv_name(talent_data['cv_name'])
-        self.talent_page.select_cv_language(talent_data['cv_language'])
+        # Fill required fields (text in one batch, then dropdowns)
+        FormFiller(self.talent_page).fill(TALENT_FORM, talent_data)
         
         # Save talent
         self.talent_page.click_save_button()
@@ -403,9 +398,10 @@ class TalentHelper:
         
         return False
     
-    def do_comprehensive_talent_creation_with_dropdowns_and_files(self, email: str = "nua26i@onemail.host", password: str = "Kabir123#"):
+    def do_comprehensive_talent_creation_with_dropdowns_and_files(self, email: str = None, password: str = None):
         """
         Create talent with comprehensive dropdown values and file uploads.
+        Logs in with the tenant's company account unless email/password are given.
         
         Returns:
             dict: Created talent data for verification
@@ -433,6 +429,9 @@ class TalentHelper:
         talent_data['cv_name'] = f"{talent_data['first_name']} {talent_data['last_name']} CV"
         talent_data['full_name'] = f"{talent_data['first_name']} {talent_data['last_name']}"
         
+        account = current_tenant().account("company")
+        email, password = email or account["email"], password or account["password"]
+        
         # Check if we're already logged in and on the right page
         current_url = self.page.url
         if "bprp-qa.shadhinlab.xyz" not in current_url or "login" in current_url:
@@ -695,7 +694,7 @@ class TalentHelper:
         Complete validation workflow for both first name and last name character limits.
         """
         # Navigate and open form
-        self.talent_page = self.do_talent_login("nua26i@onemail.host", "Kabir123#")
+        self.talent_page = self.do_talent_login()
         self.talent_page.click_add_new_talent()
         
         # Validate first name field
@@ -713,7 +712,7 @@ class TalentHelper:
         Complete validation workflow for valid age range (18-70).
         """
         # Navigate and open form
-        self.talent_page = self.do_talent_login("nua26i@onemail.host", "Kabir123#")
+        self.talent_page = self.do_talent_login()
         self.talent_page.click_add_new_talent()
         
         # Test valid age by filling date of birth
@@ -0,0 +1,282 @@
+"""
+Tenant Pool
+Leases a dedicated tenant - accounts plus agencies - to every pytest worker, so parallel workers never look at
+each other's data in empty-state and count assertions. Tenants are read from tenants.json (TENANT_POOL_FILE,
+or the path in BPRP_TENANTS); agencies a tenant does not configure are created for it once and reused, and
+recreated empty with --tenant-reset. Leases are lock files under metrics/tenant_leases/, released when the
+worker finishes. Without a pool every worker gets the shared default tenant (the previous fixed accounts).
+"""
+
+import json
+import os
+import time
+from dataclasses import dataclass, field
+from typing import Dict, List, Optional
+from playwright.sync_api import Page
+from utils.config import (TENANT_POOL_FILE, TENANT_LEASE_DIR, TENANT_LEASE_TTL, TENANT_AGENCY_PREFIX,
+                          TENANT_AGENCY_AREAS, TENANT_DEDICATED_AREAS, TENANT_COMPANY_AREAS, DEFAULT_TENANT)
+from utils.metrics_export import get_metrics_path
+
+TENANT_POOL_ENV = "BPRP_TENANTS"
+
+
+class TenantPoolExhausted(RuntimeError):
+    """More workers than tenants: a worker would have to share a tenant"""
+
+
+class TenantConfigError(ValueError):
+    """A tenants.json entry lacks data the tests need"""
+
+
+@dataclass
+class Tenant:
+    """
+    Accounts by role ("admin", "company", "agency") and agencies by area ("jd", "empty", "client", "bulk_benchmark")
+    """
+    key: str
+    accounts: Dict[str, Dict] = field(default_factory=dict)
+    agencies: Dict[str, Dict] = field(default_factory=dict)
+    provisioned: Dict[str, Dict] = field(default_factory=dict)  # Agencies created for this tenant, by area
+
+    @classmethod
+    def from_dict(cls, data: Dict) -> "Tenant":
+        """
+        Tenant from a tenants.json entry
+
+        The shorthand {"key", "email", "password", "agency_id", "company_name"} is one admin account with one
+        agency for every area.
+        """
+        accounts = dict(data.get("accounts", {}))
+        agencies = dict(data.get("agencies", {}))
+        if "email" in data:
+            accounts.setdefault("admin", {"email": data["email"], "password": data["password"]})
+        if "agency_id" in data:
+            agencies.setdefault("default", {"agency_id": data["agency_id"], "agency_name": data.get("agency_name"),
+                                            "company_name": data.get("company_name")})
+        return cls(key=data["key"], accounts=accounts, agencies=agencies)
+
+    def account(self, role: str = "admin") -> Dict:
+        """{"email", "password"} of a role (falls back to the admin account)"""
+        return self.accounts.get(role) or self.accounts["admin"]
+
+    def _configured(self, area: str) -> Optional[Dict]:
+        """Configured agency of an area; dedicated areas do not fall back to the "default" agency"""
+        if area in TENANT_DEDICATED_AREAS:
+            return self.agencies.get(area)
+        return self.agencies.get(area) or self.agencies.get("default")
+
+    def agency(self, area: str) -> Dict:
+        """{"agency_id", "agency_name", ...} of an area (provisioned, configured, else the "default" agency; {} if none)"""
+        return self.provisioned.get(area) or self._configured(area) or {}
+
+    def missing_areas(self) -> List[str]:
+        """Areas without a configured agency - provisioned for the tenant"""
+        return [area for area in TENANT_AGENCY_AREAS if not self._configured(area)]
+
+    def needs_provisioning(self) -> bool:
+        """True while an area has neither a configured nor a created agency (with its company, if it needs one)"""
+        return any(_incomplete(area, self.provisioned.get(area)) for area in self.missing_areas())
+
+    def config_errors(self) -> List[str]:
+        """Configured agencies without the data the tests need (e.g. the "jd" agency without its company)"""
+        errors = []
+        for area in TENANT_COMPANY_AREAS:
+            agency = self._configured(area)
+            if agency and not agency.get("company_name"):
+                errors.append(f"tenant {self.key}: agency {agency.get('agency_id')} of area '{area}' has no "
+                              f"\"company_name\" (the client company its tests select)")
+        return errors
+
+
+def _incomplete(area: str, agency: Optional[Dict]) -> bool:
+    """True when a created agency is missing, or lacks the company its area needs"""
+    return not agency or (area in TENANT_COMPANY_AREAS and not agency.get("company_name"))
+
+
+DEFAULT = Tenant.from_dict(DEFAULT_TENANT)
+
+# Tenant of this process (one xdist worker = one process); helpers default to it
+_current: Optional[Tenant] = None
+
+
+def current_tenant() -> Tenant:
+    """Tenant leased by this worker, or the shared default tenant"""
+    return _current or DEFAULT
+
+
+def set_current_tenant(tenant: Optional[Tenant]):
+    """Make `tenant` the default of login helpers in this process (None: back to the shared default)"""
+    global _current
+    _current = tenant
+
+
+class TenantPool:
+    """
+    Hands out one tenant per worker through lock files, so concurrent workers and runs never share one
+    """
+
+    def __init__(self, tenants: List[Tenant], lease_dir: str = None):
+        """
+        Initialize pool
+
+        Args:
+            tenants: Configured tenants (empty: every worker shares the default tenant)
+            lease_dir: Directory of the lease files (default metrics/tenant_leases)
+        """
+        self.tenants = tenants
+        self.lease_dir = lease_dir or get_metrics_path(TENANT_LEASE_DIR)
+        os.makedirs(self.lease_dir, exist_ok=True)
+        self.leased: Optional[Tenant] = None
+
+    def _lease_path(self, tenant: Tenant) -> str:
+        return os.path.join(self.lease_dir, f"{tenant.key}.lease")
+
+    def _provisioned_path(self, tenant: Tenant) -> str:
+        return os.path.join(self.lease_dir, f"{tenant.key}.provisioned.json")
+
+    def _try_lock(self, tenant: Tenant, worker: str) -> bool:
+        """Create the tenant's lease file; takes over leases older than TENANT_LEASE_TTL"""
+        path = self._lease_path(tenant)
+        try:
+            if time.time() - os.path.getmtime(path) > TENANT_LEASE_TTL:
+                print(f"⚠️ Taking over stale lease of tenant {tenant.key}")
+                os.remove(path)
+        except OSError:
+            pass  # No lease yet
+        try:
+            fd = os.open(path, os.O_CREAT | os.O_EXCL | os.O_WRONLY)
+        except FileExistsError:
+            return False
+        with os.fdopen(fd, "w", encoding="utf-8") as f:
+            json.dump({"worker": worker, "pid": os.getpid(), "time": time.time()}, f)
+        return True
+
+    def lease(self, worker: str) -> Tenant:
+        """
+        Lease a free tenant for a worker
+
+        Args:
+            worker: Worker id ("gw0", ... or "master")
+
+        Returns:
+            Tenant: The leased tenant (the shared default tenant when no pool is configured)
+        """
+        if not self.tenants:
+            if worker != "master":
+                print(f"⚠️ No tenant pool configured ({TENANT_POOL_FILE}) - worker {worker} shares the default accounts")
+            return DEFAULT
+        errors = [error for tenant in self.tenants for error in tenant.config_errors()]
+        if errors:
+            raise TenantConfigError(f"Invalid tenants in {TENANT_POOL_FILE}: " + "; ".join(errors)
+                                    + " - add it, or drop the agency so it is provisioned with a company")
+        for tenant in self.tenants:
+            if self._try_lock(tenant, worker):
+                tenant.provisioned = self.load_provisioned(tenant)
+                self.leased = tenant
+                print(f"🔐 Worker {worker} leased tenant {tenant.key}")
+                return tenant
+        raise TenantPoolExhausted(f"All {len(self.tenants)} tenants are leased - add tenants to {TENANT_POOL_FILE} "
+                                  f"or run fewer workers")
+
+    def release(self):
+        """Release the leased tenant"""
+        if self.leased is None:
+            return
+        try:
+            os.remove(self._lease_path(self.leased))
+        except OSError:
+            pass
+        self.leased = None
+
+    def load_provisioned(self, tenant: Tenant) -> Dict[str, Dict]:
+        """Agencies created for the tenant by an earlier run"""
+        try:
+            with open(self._provisioned_path(tenant), "r", encoding="utf-8") as f:
+                return json.load(f)
+        except (OSError, ValueError):
+            return {}
+
+    def save_provisioned(self, tenant: Tenant):
+        """Remember the agencies created for the tenant"""
+        with open(self._provisioned_path(tenant), "w", encoding="utf-8") as f:
+            json.dump(tenant.provisioned, f, indent=1, sort_keys=True)
+
+
+def load_tenant_pool(path: str = None) -> TenantPool:
+    """
+    Pool of the tenants in tenants.json (or BPRP_TENANTS)
+
+    File format: {"tenants": [{"key": "w1", "accounts": {"admin": {"email", "password"}, ...},
+                               "agencies": {"jd": {"agency_id", "agency_name", "company_name"}, ...}}, ...]}
+    """
+    path = path or os.environ.get(TENANT_POOL_ENV, TENANT_POOL_FILE)
+    if not os.path.exists(path):
+        return TenantPool([])
+    with open(path, "r", encoding="utf-8") as f:
+        data = json.load(f)
+    return TenantPool([Tenant.from_dict(entry) for entry in data.get("tenants", [])])
+
+
+def _agency_name(tenant: Tenant, area: str) -> str:
+    return f"{TENANT_AGENCY_PREFIX}-{tenant.key}-{area}"
+
+
+def _open_agency(page: Page, agency_page, name: str) -> str:
+    """Open an agency from the agency list and return its id (from the URL)"""
+    agency_page.page.goto(agency_page.locators.agency_page_url)
+    agency_page.get_agency_by_name(name).first.click()
+    page.wait_for_url("**/agency/*/**")
+    return page.url.split("/agency/")[1].split("/")[0]
+
+
+def _create_company(page: Page, name: str):
+    """Create a client company in the agency open on the page"""
+    from pages.company_page import CompanyPage
+    company_page = CompanyPage(page)
+    company_page.click_company_tab()
+    company_page.click_add_new_company_button()
+    company_page.fill_company_name_input(name)
+    company_page.select_industry_option("Finance")
+    company_page.click_create_button()
+    company_page.expect_company_created_successfully_message("provision_tenant")
+
+
+def provision_tenant(page: Page, pool: TenantPool, tenant: Tenant, reset: bool = False):
+    """
+    Create the agencies a tenant does not configure (once; reused by later runs), with a client company in
+    the areas that need one (TENANT_COMPANY_AREAS)
+
+    Args:
+        page: Playwright page object (a throwaway page of its own context)
+        pool: Pool that leased the tenant (stores the created agencies)
+        tenant: Leased tenant
+        reset: Delete and recreate the tenant's created agencies, so the run starts from empty agencies
+    """
+    from utils.agency_helper import do_agency_login, do_create_agency
+    account = tenant.account("agency")
+
+    if reset and tenant.provisioned:
+        agency_page = do_agency_login(page, account["email"], account["password"])
+        for area, agency in list(tenant.provisioned.items()):
+            print(f"🧹 Resetting agency {agency['agency_name']} of tenant {tenant.key}")
+            agency_page.delete_agency_by_name(agency["agency_name"])
+            del tenant.provisioned[area]
+        pool.save_provisioned(tenant)
+
+    for area in tenant.missing_areas():
+        agency = tenant.provisioned.get(area)
+        if not _incomplete(area, agency):
+            continue
+        name = _agency_name(tenant, area)
+        if agency is None:
+            agency_page = do_create_agency(page, name, email=account["email"], password=account["password"])
+            agency = {"agency_id": _open_agency(page, agency_page, name), "agency_name": name}
+            print(f"🏢 Provisioned agency {name} ({agency['agency_id']}) for tenant {tenant.key}")
+        else:
+            _open_agency(page, do_agency_login(page, account["email"], account["password"]), name)
+        if area in TENANT_COMPANY_AREAS:
+            agency["company_name"] = f"{name}-company"
+            _create_company(page, agency["company_name"])
+            print(f"🏢 Created company {agency['company_name']} in agency {name}")
+        tenant.provisioned[area] = agency
+        pool.save_provisioned(tenant)
@@ -0,0 +1,192 @@
+"""
+Test Scheduler
+Duration-aware ordering and sharding of collected tests using Allure history
+(allure-report/history/history.json - allure-results/ is emptied by --clean-alluredir before collection)
+"""
+
+import os
+import json
+import hashlib
+import statistics
+from typing import Dict, List, Optional
+import pytest
+from utils.coupling_analyzer import CouplingAnalyzer, unit_name
+
+ALLURE_HISTORY_FILE = os.path.join("allure-report", "history", "history.json")
+DEFAULT_TEST_DURATION_MS = 30000  # Used when no test in the run has any history
+
+
+def allure_full_name(item) -> str:
+    """
+    Build the Allure fullName of a test item, e.g. "tests.test_client#test_TC_25"
+    (same format allure-pytest uses, so it can be matched against stored results)
+    """
+    path = item.nodeid.split("::")[0].rsplit(".", 1)[0]
+    package = path.replace("/", ".")
+    test_name = getattr(item, "originalname", None) or item.name.split("[")[0]
+    return f"{package}#{test_name}"
+
+
+def allure_history_id(item) -> str:
+    """History id Allure assigns to a non-parametrized test (md5 of its fullName)"""
+    return hashlib.md5(allure_full_name(item).encode("utf-8")).hexdigest()
+
+
+def load_allure_durations(history_file: str = ALLURE_HISTORY_FILE) -> Dict[str, List[int]]:
+    """
+    Load historical test durations from Allure history
+
+    Args:
+        history_file: Path of Allure's history.json
+
+    Returns:
+        dict: {history_id: [duration_ms, ...]}
+    """
+    durations: Dict[str, List[int]] = {}
+
+    if os.path.exists(history_file):
+        try:
+            with open(history_file, "r", encoding="utf-8") as f:
+                history = json.load(f)
+            for history_id, entry in history.items():
+                for run in entry.get("items", []):
+                    duration = run.get("time", {}).get("duration")
+                    if duration is not None:
+                        durations.setdefault(history_id, []).append(duration)
+        except (OSError, ValueError) as e:
+            print(f"⚠️ Could not read Allure history {history_file}: {e}")
+
+    return durations
+
+
+def estimate_duration(item, durations: Dict[str, List[int]]) -> Optional[float]:
+    """Median historical duration of a test item in milliseconds, or None when it has no history"""
+    for key in (allure_history_id(item), allure_full_name(item)):
+        if key in durations:
+            return statistics.median(durations[key])
+    return None
+
+
+class TestScheduler:
+    """
+    Orders scheduling units (coupled test groups) longest-first and splits them into balanced shards
+    """
+    __test__ = False  # Not a test class despite the name
+
+    def __init__(self, items: list, durations: Dict[str, List[int]] = None, groups: List[List] = None):
+        """
+        Initialize scheduler
+
+        Args:
+            items: Collected pytest items
+            durations: Historical durations (default: loaded from Allure)
+            groups: Pre-computed scheduling units (default: units of the CouplingAnalyzer)
+        """
+        self.items = items
+        self.durations = durations if durations is not None else load_allure_durations()
+        self.groups = groups if groups is not None else CouplingAnalyzer(items).units()
+
+        known = [d for d in (estimate_duration(item, self.durations) for item in items) if d is not None]
+        self.default_duration = statistics.median(known) if known else DEFAULT_TEST_DURATION_MS
+
+    def item_duration(self, item) -> float:
+        """Estimated duration of one test (history median, or the run's median for new tests)"""
+        duration = estimate_duration(item, self.durations)
+        return duration if duration is not None else self.default_duration
+
+    def group_duration(self, group: list) -> float:
+        """Estimated duration of a scheduling unit"""
+        return sum(self.item_duration(item) for item in group)
+
+    def ordered_groups(self) -> List[List]:
+        """Scheduling units sorted longest-first (stable for equal durations)"""
+        return sorted(self.groups, key=self.group_duration, reverse=True)
+
+    def ordered_items(self) -> list:
+        """All items, longest unit first; tests inside a unit keep their original order"""
+        return [item for group in self.ordered_groups() for item in group]
+
+    def shards(self, num_shards: int) -> List[List]:
+        """
+        Split units into balanced shards with the longest-processing-time-first heuristic
+
+        Args:
+            num_shards: Number of shards (CI jobs or workers)
+
+        Returns:
+            list: num_shards lists of items
+        """
+        shard_items: List[list] = [[] for _ in range(num_shards)]
+        shard_totals = [0.0] * num_shards
+        for group in self.ordered_groups():
+            target = shard_totals.index(min(shard_totals))
+            shard_items[target].extend(group)
+            shard_totals[target] += self.group_duration(group)
+        self.shard_totals = shard_totals
+        return shard_items
+
+    def mark_xdist_groups(self):
+        """Add xdist_group marks so `pytest -n N --dist loadgroup` keeps each coupled unit on one worker"""
+        for group in self.groups:
+            if len(group) < 2:
+                continue
+            for item in group:
+                item.add_marker(pytest.mark.xdist_group(name=unit_name(group)))
+
+
+def runs_in_parallel(config) -> bool:
+    """True on an xdist worker or a controller started with -n"""
+    return hasattr(config, "workerinput") or bool(config.getoption("numprocesses", None))
+
+
+def check_dist_mode(config):
+    """Warn when -n runs without --dist loadgroup, which ignores the xdist_group marks of coupled units"""
+    if hasattr(config, "workerinput") or not config.getoption("numprocesses", None):
+        return
+    if config.getoption("dist", None) != "loadgroup":
+        print(f"\n⚠️ --dist {config.getoption('dist', None)} may split coupled tests across workers - "
+              f"use --dist loadgroup")
+
+
+def apply_schedule(config, items: list):
+    """
+    Keep coupled tests together on xdist workers and apply --duration-order and --num-shards/--shard-id
+    to the collected items in place
+
+    Args:
+        config: pytest config
+        items: Collected pytest items (modified in place)
+    """
+    duration_order = config.getoption("--duration-order")
+    num_shards = config.getoption("--num-shards")
+    shard_id = config.getoption("--shard-id")
+    parallel = runs_in_parallel(config)
+    coupling_report = config.getoption("--coupling-report")
+    if not duration_order and not num_shards and not parallel and not coupling_report:
+        return
+
+    analyzer = CouplingAnalyzer(items)
+    if coupling_report:
+        print("\n" + "\n".join(analyzer.report_lines()))
+    scheduler = TestScheduler(items, groups=analyzer.units())
+    if parallel:
+        scheduler.mark_xdist_groups()
+    if not duration_order and not num_shards:
+        return
+
+    if num_shards:
+        if shard_id is None or not 0 <= shard_id < num_shards:
+            raise pytest.UsageError(f"--shard-id must be between 0 and {num_shards - 1} when --num-shards is used")
+        shards = scheduler.shards(num_shards)
+        selected = shards[shard_id]
+        selected_ids = {id(item) for item in selected}
+        deselected = [item for item in items if id(item) not in selected_ids]
+        if deselected:
+            config.hook.pytest_deselected(items=deselected)
+        items[:] = selected if duration_order else [item for item in items if id(item) in selected_ids]
+        print(f"\n🧩 Shard {shard_id + 1}/{num_shards}: {len(selected)} tests, "
+              f"estimated {scheduler.shard_totals[shard_id] / 1000:.0f}s "
+              f"(all shards: {', '.join(f'{total / 1000:.0f}s' for total in scheduler.shard_totals)})")
+    else:
+        items[:] = scheduler.ordered_items()
+        print(f"\n⏱️ Ordered {len(items)} tests longest-first from Allure history")
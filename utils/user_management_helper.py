@@ -6,19 +6,26 @@ Contains utility functions for user management tests including roles & access an
 from playwright.sync_api import Page
 from utils.config import BASE_URL
 from utils.login_helper import do_login
+from utils.tenant_pool import current_tenant
 from conftest import wait_for_action_completion
 from utils.enhanced_assertions import enhanced_assert_visible, enhanced_assert_not_visible
 import time
 
 
-def do_user_management_login(page: Page, email: str, password: str):
+def _admin_account(email: str = None, password: str = None):
+    """Fill missing login values from this worker's tenant (admin account)"""
+    account = current_tenant().account("admin")
+    return email or account["email"], password or account["password"]
+
+
+def do_user_management_login(page: Page, email: str = None, password: str = None):
     """
-    Helper function to login, select demo 06 agency, and navigate to user management
+    Helper function to login, select the tenant's JD agency ("demo 06" by default), and navigate to user management
     
     Args:
         page: Playwright page object
-        email: User email
-        password: User password
+        email: User email (default: the tenant's admin account)
+        password: User password (default: the tenant's admin password)
     
     Returns:
         UserManagementPage instance
@@ -26,11 +33,11 @@ def do_user_management_login(page: Page, email: str, password: str):
     from pages.user_management_page import UserManagementPage
     
     # Step 1: Login
-    do_login(page, email, password)
+    do_login(page, *_admin_account(email, password))
     time.sleep(3)
     
-    # Step 2: Click on "demo 06" agency to access it
-    demo_agency = page.get_by_text("demo 06", exact=True).first
+    # Step 2: Click on the tenant's JD agency to access it
+    demo_agency = page.get_by_text(current_tenant().agency("jd")["agency_name"], exact=True).first
     demo_agency.wait_for(state="visible", timeout=10000)
     demo_agency.click()
     time.sleep(3)
@@ -47,14 +54,14 @@ def do_user_management_login(page: Page, email: str, password: str):
     return user_mgmt_page
 
 
-def setup_demo_agency_access(page: Page, email: str, password: str):
+def setup_demo_agency_access(page: Page, email: str = None, password: str = None):
     """
     Complete setup for demo agency access in user management
     
     Args:
         page: Playwright page object
-        email: User email
-        password: User password
+        email: User email (default: the tenant's admin account)
+        password: User password (default: the tenant's admin password)
         
     Returns:
         UserManagementPage instance
@@ -83,13 +90,13 @@ class UserManagementTestHelper:
         self.page = page
         self.user_mgmt_page = None
     
-    def setup_user_management(self, email: str, password: str):
+    def setup_user_management(self, email: str = None, password: str = None):
         """
         Complete setup: Login and navigate to user management
         
         Args:
-            email: User email
-            password: User password
+            email: User email (default: the tenant's admin account)
+            password: User password (default: the tenant's admin password)
             
         Returns:
             UserManagementPage instance
@@ -97,7 +104,7 @@ class UserManagementTestHelper:
         from pages.user_management_page import UserManagementPage
         
         # Login first
-        do_login(self.page, email, password)
+        do_login(self.page, *_admin_account(email, password))
         time.sleep(3)
         
         # Initialize user management page
@@ -332,7 +339,7 @@ class UserManagementTestHelper:
 
 
 # Legacy function wrappers for backward compatibility
-def do_optimized_user_management_setup(page: Page, email: str, password: str):
+def do_optimized_user_management_setup(page: Page, email: str = None, password: str = None):
     """Legacy wrapper - use UserManagementTestHelper class instead"""
     helper = UserManagementTestHelper(page)
     return helper.setup_user_management(email, password)
@@ -386,7 +393,7 @@ def setup_demo_agency_access(page: Page, email: str, password: str):
 
 
 def create_test_role(page: Page, role_name: str, permissions: list, 
-                    email: str = "mi003b@onemail.host", password: str = "Kabir123#"):
+                    email: str = None, password: str = None):
     """
     Helper function to create a test role with specific permissions
     
@@ -394,8 +401,8 @@ def create_test_role(page: Page, role_name: str, permissions: list,
         page: Playwright page object
         role_name: Name of the role to create
         permissions: List of permissions to assign to the role
-        email: Login email
-        password: Login password
+        email: Login email (default: the tenant's admin account)
+        password: Login password (default: the tenant's admin password)
     
     Returns:
         tuple: (UserManagementPage instance, success boolean)
@@ -421,7 +428,7 @@ def create_test_role(page: Page, role_name: str, permissions: list,
 
 
 def invite_test_user(page: Page, user_name: str, user_email: str, role_name: str,
-                    login_email: str = "mi003b@onemail.host", password: str = "Kabir123#"):
+                    login_email: str = None, password: str = None):
     """
     Helper function to invite a test user with specific role
     
@@ -430,8 +437,8 @@ def invite_test_user(page: Page, user_name: str, user_email: str, role_name: str
         user_name: Name of the user to invite
         user_email: Email of the user to invite
         role_name: Role to assign to the user
-        login_email: Login email for admin
-        password: Login password for admin
+        login_email: Login email for admin (default: the tenant's admin account)
+        password: Login password for admin (default: the tenant's admin password)
     
     Returns:
         tuple: (UserManagementPage instance, success boolean)
@@ -457,15 +464,15 @@ def invite_test_user(page: Page, user_name: str, user_email: str, role_name: str
 
 
 def perform_role_crud_operations(page: Page, base_role_name: str = "Test CRUD Role",
-                                email: str = "mi003b@onemail.host", password: str = "Kabir123#"):
+                                email: str = None, password: str = None):
     """
     Helper function to perform complete CRUD operations on roles
     
     Args:
         page: Playwright page object
         base_role_name: Base name for the test role
-        email: Login email
-        password: Login password
+        email: Login email (default: the tenant's admin account)
+        password: Login password (default: the tenant's admin password)
     
     Returns:
         dict: Results of CRUD operations
@@ -520,7 +527,7 @@ def perform_role_crud_operations(page: Page, base_role_name: str = "Test CRUD Ro
 def perform_user_crud_operations(page: Page, test_user_name: str = "Test CRUD User",
                                 test_user_email: str = "testcrud@example.com",
                                 role_name: str = "Test Role",
-                                email: str = "mi003b@onemail.host", password: str = "Kabir123#"):
+                                email: str = None, password: str = None):
     """
     Helper function to perform complete CRUD operations on users
     
@@ -529,8 +536,8 @@ def perform_user_crud_operations(page: Page, test_user_name: str = "Test CRUD Us
         test_user_name: Name of the test user
         test_user_email: Email of the test user
         role_name: Role to assign to the user
-        email: Login email
-        password: Login password
+        email: Login email (default: the tenant's admin account)
+        password: Login password (default: the tenant's admin password)
     
     Returns:
         dict: Results of CRUD operations
@@ -764,7 +771,7 @@ def generate_test_user_data():
 
 # ===== CLEANUP UTILITIES =====
 
-def cleanup_test_data(page: Page, email: str = "mi003b@onemail.host", password: str = "Kabir123#"):
+def cleanup_test_data(page: Page, email: str = None, password: str = None):
     """Clean up all test data (roles and users)"""
     user_mgmt_page = setup_demo_agency_access(page, email, password)
     
@@ -784,7 +791,7 @@ def cleanup_test_data(page: Page, email: str = "mi003b@onemail.host", password:
 
 
 def validate_user_management_permissions(page: Page, role_name: str, expected_permissions: list,
-                                       email: str = "mi003b@onemail.host", password: str = "Kabir123#"):
+                                       email: str = None, password: str = None):
     """
     Validate that a role has the correct permissions assigned
     
@@ -792,8 +799,8 @@ def validate_user_management_permissions(page: Page, role_name: str, expected_pe
         page: Playwright page object
         role_name: Name of the role to validate
         expected_permissions: List of expected permissions
-        email: Login email
-        password: Login password
+        email: Login email (default: the tenant's admin account)
+        password: Login password (default: the tenant's admin password)
     
     Returns:
         bool: True if permissions match, False otherwise
@@ -832,7 +839,7 @@ def validate_user_management_permissions(page: Page, role_name: str, expected_pe
 
 # ===== OPTIMIZED TC HELPER FUNCTIONS =====
 
-def do_optimized_user_management_setup(page: Page, email: str = "mi003b@onemail.host", password: str = "Kabir123#"):
+def do_optimized_user_management_setup(page: Page, email: str = None, password: str = None):
     """
     Optimized single function to handle login and navigation to user management
     Used across TC_01, TC_02, TC_03, TC_04
@@ -0,0 +1,199 @@
+"""
+Web Performance Collector
+Opt-in capture of browser-side performance metrics after page navigations: Navigation Timing,
+paint/LCP/CLS entries, long tasks, JS heap size and (chromium only) CDP Performance.getMetrics
+"""
+
+import json
+import os
+import time
+from datetime import datetime
+from typing import Dict, List, Optional
+from playwright.sync_api import Page, BrowserContext
+from utils.config import BROWSER_NAME
+from utils.metrics_export import format_influx_line, append_influx_lines, get_metrics_path
+
+# Installed on every new document so LCP, CLS and long tasks are buffered from the first paint
+PERF_OBSERVER_SCRIPT = """
+(() => {
+    if (window.__bprpPerf) return;
+    const perf = window.__bprpPerf = { lcp: null, cls: 0, longTasks: [] };
+    const observe = (type, callback) => {
+        try {
+            new PerformanceObserver((list) => list.getEntries().forEach(callback)).observe({ type: type, buffered: true });
+        } catch (e) { /* entry type not supported by this browser */ }
+    };
+    observe('largest-contentful-paint', (entry) => { perf.lcp = entry.startTime; });
+    observe('layout-shift', (entry) => { if (!entry.hadRecentInput) perf.cls += entry.value; });
+    observe('longtask', (entry) => { perf.longTasks.push({ start: entry.startTime, duration: entry.duration }); });
+})();
+"""
+
+# Reads the buffered entries; long tasks are drained so each sample only covers its own navigation
+COLLECT_SCRIPT = """
+() => {
+    const nav = performance.getEntriesByType('navigation')[0];
+    const paint = {};
+    performance.getEntriesByType('paint').forEach((entry) => { paint[entry.name] = entry.startTime; });
+    const perf = window.__bprpPerf || { lcp: null, cls: 0, longTasks: [] };
+    const longTasks = perf.longTasks.splice(0, perf.longTasks.length);
+    const memory = performance.memory;
+    return {
+        url: location.href,
+        navigation: nav ? {
+            type: nav.type,
+            dns_ms: nav.domainLookupEnd - nav.domainLookupStart,
+            connect_ms: nav.connectEnd - nav.connectStart,
+            ttfb_ms: nav.responseStart - nav.requestStart,
+            response_ms: nav.responseEnd - nav.responseStart,
+            dom_interactive_ms: nav.domInteractive,
+            dom_content_loaded_ms: nav.domContentLoadedEventEnd,
+            load_event_ms: nav.loadEventEnd,
+            transfer_size: nav.transferSize,
+        } : null,
+        first_paint_ms: paint['first-paint'] !== undefined ? paint['first-paint'] : null,
+        first_contentful_paint_ms: paint['first-contentful-paint'] !== undefined ? paint['first-contentful-paint'] : null,
+        lcp_ms: perf.lcp,
+        cls: perf.cls,
+        long_task_count: longTasks.length,
+        long_task_total_ms: longTasks.reduce((total, task) => total + task.duration, 0),
+        js_heap_used: memory ? memory.usedJSHeapSize : null,
+        js_heap_total: memory ? memory.totalJSHeapSize : null,
+    };
+}
+"""
+
+# CDP Performance.getMetrics values worth keeping as time series
+CDP_METRIC_NAMES = [
+    "Documents", "Nodes", "JSEventListeners", "LayoutCount", "RecalcStyleCount",
+    "LayoutDuration", "RecalcStyleDuration", "ScriptDuration", "TaskDuration",
+    "JSHeapUsedSize", "JSHeapTotalSize",
+]
+
+
+class WebPerfCollector:
+    """
+    Collects web performance samples for every recorded navigation and exports them as time series
+    """
+
+    def __init__(self, browser_name: str = BROWSER_NAME):
+        """
+        Initialize the collector
+
+        Args:
+            browser_name: Browser in use - CDP metrics are only collected for chromium
+        """
+        self.browser_name = browser_name
+        self.run_id = datetime.now().strftime("%Y%m%d_%H%M%S")
+        self.worker = os.environ.get("PYTEST_XDIST_WORKER")  # xdist workers of one run share the run id
+        self.current_test = None
+        self.samples: List[Dict] = []
+
+    def install(self, context: BrowserContext):
+        """Register the performance observers on a context before any page is created"""
+        context.add_init_script(PERF_OBSERVER_SCRIPT)
+
+    def attach(self, page: Page, test_name: str = None):
+        """
+        Attach the collector to a page so page objects can record navigations
+
+        Args:
+            page: Playwright page object
+            test_name: Test node id the samples are tagged with
+        """
+        page._perf_collector = self
+        self.current_test = test_name
+
+    def record(self, page: Page, page_name: str) -> Optional[Dict]:
+        """
+        Record one performance sample for the page's current document
+
+        Args:
+            page: Playwright page object
+            page_name: Logical page name used as a tag (e.g. "jd_list")
+
+        Returns:
+            dict: The recorded sample, or None if collection failed
+        """
+        try:
+            metrics = page.evaluate(COLLECT_SCRIPT)
+        except Exception as e:
+            print(f"⚠️ Could not collect web performance metrics for {page_name}: {e}")
+            return None
+
+        navigation = metrics.pop("navigation") or {}
+        sample = {
+            "timestamp_ns": time.time_ns(),
+            "page": page_name,
+            "test": self.current_test,
+            "browser": self.browser_name,
+            **metrics,
+            **{f"nav_{key}": value for key, value in navigation.items()},
+        }
+        if self.browser_name == "chromium":
+            sample.update(self._get_cdp_metrics(page))
+
+        self.samples.append(sample)
+        return sample
+
+    def _get_cdp_metrics(self, page: Page) -> Dict:
+        """Read CDP Performance.getMetrics, reusing one CDP session per page"""
+        try:
+            cdp_session = getattr(page, "_perf_cdp_session", None)
+            if cdp_session is None:
+                cdp_session = page.context.new_cdp_session(page)
+                cdp_session.send("Performance.enable")
+                page._perf_cdp_session = cdp_session
+            result = cdp_session.send("Performance.getMetrics")
+            return {
+                f"cdp_{metric['name']}": metric["value"]
+                for metric in result.get("metrics", [])
+                if metric["name"] in CDP_METRIC_NAMES
+            }
+        except Exception as e:
+            print(f"⚠️ Could not read CDP performance metrics: {e}")
+            return {}
+
+    def export(self) -> List[str]:
+        """
+        Export recorded samples as JSON lines (full detail) and InfluxDB line protocol (time series)
+
+        Returns:
+            list: Paths of the written files
+        """
+        if not self.samples:
+            return []
+
+        suffix = f"_{self.worker}" if self.worker else ""
+        jsonl_path = get_metrics_path(f"web_perf_{self.run_id}{suffix}.jsonl")
+        with open(jsonl_path, "w", encoding="utf-8") as f:
+            for sample in self.samples:
+                f.write(json.dumps(sample) + "\n")
+
+        lines = []
+        for sample in self.samples:
+            tags = {"page": sample["page"], "test": sample["test"], "browser": sample["browser"], "run": self.run_id,
+                    "worker": self.worker}
+            fields = {key: value for key, value in sample.items() if key not in ("timestamp_ns", "page", "test", "browser", "url")}
+            lines.append(format_influx_line("web_perf", tags, fields, sample["timestamp_ns"]))
+        influx_path = append_influx_lines("web_perf_influxDbData.txt", lines)
+
+        print(f"📈 Web performance metrics exported: {len(self.samples)} samples -> {jsonl_path}, {influx_path}")
+        return [jsonl_path, influx_path]
+
+
+def record_navigation(page: Page, page_name: str) -> Optional[Dict]:
+    """
+    Record a web performance sample if a collector is attached to the page (no-op otherwise)
+
+    Args:
+        page: Playwright page object
+        page_name: Logical page name used as a tag
+
+    Returns:
+        dict: The recorded sample, or None when collection is disabled
+    """
+    collector = getattr(page, "_perf_collector", None)
+    if collector is None:
+        return None
+    return collector.record(page, page_name)